@@ -1,4 +1,5 @@
-import math
+import numpy as np
+import pandas as pd
 
 from algomancy_scenario import ImprovementDirection, BaseKPI
 from algomancy_utils import QUANTITIES, BaseMeasurement
@@ -6,8 +7,43 @@ from algomancy_utils import QUANTITIES, BaseMeasurement
 from example.data_handling.results import WarehouseAllocationResult
 
 
-def _dist(x1: float, y1: float, x2: float, y2: float) -> float:
-    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+def _allocated_items(result: WarehouseAllocationResult) -> pd.DataFrame:
+    """One row per SKU with its daily picks, current slot and proposed slot.
+
+    Shared by the warehouse KPIs through ``BaseKPI.context``, so it is built
+    once per result however many of these KPIs are evaluated.
+    """
+    sku = result.sku_data
+    if sku.empty:
+        return pd.DataFrame(columns=["daily_picks", "currentslot", "slotid"])
+    items = pd.DataFrame(
+        {
+            "daily_picks": sku["daily_picks"].astype(float),
+            "currentslot": sku["currentslot"].astype(str),
+            "slotid": sku["itemid"].astype(str).map(result.allocation),
+        }
+    )
+    return items[items["slotid"].notna()]
+
+
+def _placed_items(
+    result: WarehouseAllocationResult, items: pd.DataFrame
+) -> pd.DataFrame:
+    """Allocated SKUs whose proposed slot exists, with the slot's x, y and zone."""
+    layout = result.layout_data.drop_duplicates("slotid", keep="last").set_index(
+        "slotid"
+    )
+    placed = items[items["slotid"].isin(layout.index)]
+    return placed.join(layout[["x", "y", "zone"]], on="slotid")
+
+
+def _shared_items(kpi: BaseKPI) -> pd.DataFrame:
+    return kpi.context.get("warehouse.allocated_items", _allocated_items)
+
+
+def _shared_placed(kpi: BaseKPI) -> pd.DataFrame:
+    items = _shared_items(kpi)
+    return kpi.context.get("warehouse.placed_items", lambda r: _placed_items(r, items))
 
 
 class WarehouseTravelKPI(BaseKPI):
@@ -28,17 +64,12 @@ class WarehouseTravelKPI(BaseKPI):
     def compute(self, result: WarehouseAllocationResult) -> float:
         if not isinstance(result, WarehouseAllocationResult):
             return float("nan")
-        layout = result.layout_data.set_index("slotid")[["x", "y"]].to_dict("index")
-        total = 0.0
-        for _, row in result.sku_data.iterrows():
-            slotid = result.allocation.get(str(row["itemid"]))
-            if slotid is None or slotid not in layout:
-                continue
-            pos = layout[slotid]
-            total += float(row["daily_picks"]) * _dist(
-                pos["x"], pos["y"], result.depot_x, result.depot_y
-            )
-        return total
+        placed = _shared_placed(self)
+        dist = np.hypot(
+            placed["x"].astype(float) - result.depot_x,
+            placed["y"].astype(float) - result.depot_y,
+        )
+        return float((placed["daily_picks"] * dist).sum())
 
 
 class WarehouseZoneBalanceKPI(BaseKPI):
@@ -59,27 +90,12 @@ class WarehouseZoneBalanceKPI(BaseKPI):
     def compute(self, result: WarehouseAllocationResult) -> float:
         if not isinstance(result, WarehouseAllocationResult):
             return float("nan")
-        zone_map = result.layout_data.set_index("slotid")["zone"].to_dict()
-        picks_by_zone: dict[str, float] = {}
-
-        for _, row in result.sku_data.iterrows():
-            slotid = result.allocation.get(str(row["itemid"]))
-            if slotid is None:
-                continue
-            zone = zone_map.get(slotid)
-            if zone is None:
-                continue
-            picks_by_zone[zone] = picks_by_zone.get(zone, 0.0) + float(
-                row["daily_picks"]
-            )
-
-        if not picks_by_zone:
+        placed = _shared_placed(self)
+        picks_by_zone = placed.groupby("zone")["daily_picks"].sum()
+        if picks_by_zone.empty:
             return 0.0
-
-        values = list(picks_by_zone.values())
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        return math.sqrt(variance)
+        # Population std-dev (ddof=0) across zones.
+        return float(picks_by_zone.std(ddof=0))
 
 
 class WarehouseReslotCostKPI(BaseKPI):
@@ -100,11 +116,5 @@ class WarehouseReslotCostKPI(BaseKPI):
     def compute(self, result: WarehouseAllocationResult) -> float:
         if not isinstance(result, WarehouseAllocationResult):
             return float("nan")
-        moves = 0
-        for _, row in result.sku_data.iterrows():
-            iid = str(row["itemid"])
-            proposed = result.allocation.get(iid)
-            current = str(row["currentslot"])
-            if proposed is not None and proposed != current:
-                moves += 1
-        return float(moves)
+        items = _shared_items(self)
+        return float((items["slotid"] != items["currentslot"]).sum())
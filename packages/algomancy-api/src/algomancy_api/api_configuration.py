@@ -9,7 +9,9 @@ class ApiConfiguration(CoreConfig):
     """Configuration for the HTTP API server.
 
     Extends :class:`CoreConfig` with HTTP-specific options: bind host/port,
-    URL prefix, CORS origins, and session-creation policy.
+    URL prefix, CORS origins, session-creation policy, whether to serve
+    Prometheus metrics at ``/metrics``, and the most scenarios one
+    ``POST .../scenarios:batch`` request may create.
     """
 
     def __init__(
@@ -35,6 +37,8 @@ class ApiConfiguration(CoreConfig):
         cors_origins: List[str] | None = None,
         allow_session_create: bool = True,
         forwarded_allow_ips: Union[str, List[str], None] = None,
+        enable_metrics: bool = True,
+        max_batch_size: int = 1000,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -61,6 +65,8 @@ class ApiConfiguration(CoreConfig):
         self.forwarded_allow_ips = self._normalize_forwarded_allow_ips(
             forwarded_allow_ips
         )
+        self.enable_metrics = enable_metrics
+        self.max_batch_size = max_batch_size
         self._validate_api()
 
     def as_dict(self) -> Dict[str, Any]:
@@ -73,6 +79,8 @@ class ApiConfiguration(CoreConfig):
                 "cors_origins": list(self.cors_origins),
                 "allow_session_create": self.allow_session_create,
                 "forwarded_allow_ips": self.forwarded_allow_ips,
+                "enable_metrics": self.enable_metrics,
+                "max_batch_size": self.max_batch_size,
             }
         )
         return base
@@ -102,6 +110,14 @@ class ApiConfiguration(CoreConfig):
             raise ValueError("cors_origins entries must be non-empty strings")
         if not isinstance(self.allow_session_create, bool):
             raise ValueError("allow_session_create must be a bool")
+        if not isinstance(self.enable_metrics, bool):
+            raise ValueError("enable_metrics must be a bool")
+        if (
+            not isinstance(self.max_batch_size, int)
+            or isinstance(self.max_batch_size, bool)
+            or self.max_batch_size < 1
+        ):
+            raise ValueError("max_batch_size must be a positive integer")
         if self.forwarded_allow_ips is not None:
             if isinstance(self.forwarded_allow_ips, str):
                 if not self.forwarded_allow_ips.strip():
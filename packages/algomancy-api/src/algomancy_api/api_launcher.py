@@ -3,12 +3,15 @@ from __future__ import annotations
 from typing import Any, Dict, Union
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from algomancy_scenario import SessionManager
 from algomancy_scenario.core_configuration import CoreConfig
+from algomancy_utils.metrics import CONTENT_TYPE
 
 from .api_configuration import ApiConfiguration
 from .errors import install_exception_handlers
+from .metrics import record_request_latency, render_metrics
 from .routers import algorithms as algorithms_router
 from .routers import data as data_router
 from .routers import scenarios as scenarios_router
@@ -85,6 +88,9 @@ class ApiLauncher:
 
     @staticmethod
     def _install_middleware(app: FastAPI, cfg: ApiConfiguration) -> None:
+        if cfg.enable_metrics:
+            app.middleware("http")(record_request_latency)
+
         if cfg.forwarded_allow_ips is not None:
             # Applied at the ASGI-app level, so windows and linux deployers get the same behavior. Set when the app is
             # only reachable through a trusted reverse proxy that terminates TLS, like Azure Container Apps.
@@ -117,6 +123,15 @@ class ApiLauncher:
                 "sessions": sm.list_sessions(),
             }
 
+        if cfg.enable_metrics:
+
+            @app.get("/metrics", tags=["meta"], response_class=PlainTextResponse)
+            def metrics() -> PlainTextResponse:
+                return PlainTextResponse(
+                    render_metrics(app.state.session_manager),
+                    media_type=CONTENT_TYPE,
+                )
+
         app.include_router(sessions_router.router, prefix=cfg.prefix)
         app.include_router(algorithms_router.router, prefix=cfg.prefix)
         app.include_router(scenarios_router.router, prefix=cfg.prefix)
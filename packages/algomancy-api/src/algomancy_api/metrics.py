@@ -0,0 +1,93 @@
+"""Prometheus metrics for the HTTP API.
+
+``GET /metrics`` renders everything recorded in
+:data:`algomancy_utils.metrics.REGISTRY` — scenario runs per algorithm, run
+durations, hydration-cache hits/misses/evictions and ETL stage durations —
+plus two families of metrics built at scrape time:
+
+* per-session queue figures read from the ``SessionManager`` (queued and
+  running scenarios, and durable jobs when the database job queue is on), and
+* request latency per router, recorded by :func:`record_request_latency`.
+
+Everything is plain text in the Prometheus exposition format; no exporter
+process or client library is needed.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Awaitable, Callable, List
+
+from fastapi import Request, Response
+
+from algomancy_scenario import SessionManager
+from algomancy_utils.metrics import REGISTRY, Gauge, Metric
+
+_REQUEST_LATENCY = REGISTRY.histogram(
+    "algomancy_http_request_duration_seconds",
+    "HTTP request latency.",
+    ["router", "method", "status"],
+)
+
+
+def _router_label(request: Request) -> str:
+    """The matched router's tag; bounded cardinality, unlike raw paths."""
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    tags = getattr(route, "tags", None)
+    return str(tags[0]) if tags else "other"
+
+
+async def record_request_latency(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """HTTP middleware: observe each request's latency per router."""
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        _REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            router=_router_label(request),
+            method=request.method,
+            status=str(status_code),
+        )
+
+
+def session_metrics(session_manager: SessionManager) -> List[Metric]:
+    """Queue figures of every session, read now."""
+    queued = Gauge(
+        "algomancy_queue_depth",
+        "Scenarios waiting to start.",
+        ["session"],
+    )
+    running = Gauge(
+        "algomancy_runs_in_progress",
+        "Scenarios currently processing.",
+        ["session"],
+    )
+    metrics: List[Metric] = [queued, running]
+    job_runner = session_manager.job_runner
+    durable = None
+    if job_runner is not None:
+        durable = Gauge(
+            "algomancy_durable_jobs",
+            "Jobs in the database job queue (queued or leased).",
+            ["session"],
+        )
+        metrics.append(durable)
+    for session_id in session_manager.session_ids:
+        sm = session_manager.get_scenario_manager(session_id)
+        queued.set(sm.queue_depth, session=session_id)
+        running.set(len(sm.processing), session=session_id)
+        if durable is not None:
+            durable.set(job_runner.queue.depth(session_id), session=session_id)
+    return metrics
+
+
+def render_metrics(session_manager: SessionManager) -> str:
+    return REGISTRY.render(extra=session_metrics(session_manager))
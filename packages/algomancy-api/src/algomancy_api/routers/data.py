@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 import tempfile
 from typing import Any, Dict, List
 
@@ -23,8 +24,9 @@ from fastapi import (
     UploadFile,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
 
-from algomancy_data import CSVFile, JSONFile, XLSXFile
+from algomancy_data import CSVFile, DataLoadError, JSONFile, XLSXFile
 from algomancy_data.file import File as AlgomancyFile
 from algomancy_scenario import ScenarioManager
 
@@ -66,6 +68,16 @@ def _build_algomancy_file(logical_name: str, on_disk_path: str) -> AlgomancyFile
     return file_cls(name=logical_name, path=on_disk_path)
 
 
+def _dataset_unavailable(data_key: str, exc: Exception) -> HTTPException:
+    """404 for a listed dataset that is gone or failed to load on request."""
+    detail = (
+        str(exc)
+        if isinstance(exc, DataLoadError)
+        else f"Dataset '{data_key}' not found"
+    )
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
 @router.get(
     "/data",
     response_model=DataKeysResponse,
@@ -92,7 +104,10 @@ def get_data(
         )
     # ScenarioManager hands back a JSON STRING; parse before returning so the
     # response is a proper JSON object rather than a string-encoded blob.
-    return json.loads(sm.get_data_as_json(data_key))
+    try:
+        return json.loads(sm.get_data_as_json(data_key))
+    except (KeyError, DataLoadError) as exc:
+        raise _dataset_unavailable(data_key, exc) from exc
 
 
 @router.get(
@@ -109,7 +124,10 @@ def get_data_parameters(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Dataset '{data_key}' not found",
         )
-    params = sm.get_data_parameters(data_key)
+    try:
+        params = sm.get_data_parameters(data_key)
+    except (KeyError, DataLoadError) as exc:
+        raise _dataset_unavailable(data_key, exc) from exc
     return describe_parameter_set(params)
 
 
@@ -154,7 +172,10 @@ def derive_data(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Dataset '{body.new_key}' already exists",
         )
-    sm.derive_data(data_key, body.new_key)
+    try:
+        sm.derive_data(data_key, body.new_key)
+    except DataLoadError as exc:
+        raise _dataset_unavailable(data_key, exc) from exc
     return DataKeysResponse(keys=list(sm.get_data_keys()))
 
 
@@ -209,8 +230,10 @@ async def run_etl(
         )
 
     # Stage all uploads to a temp directory, then build File wrappers that the
-    # ETL factory consumes. The temp dir lives only for the duration of this
-    # call — the framework reads contents eagerly in the File constructor.
+    # ETL factory consumes. Uploads are copied in chunks rather than read into
+    # memory, on a worker thread so the copy does not block the event loop,
+    # and CSV files are parsed straight from the staged path, so the
+    # temp dir must outlive ``etl_data``.
     # ``ignore_cleanup_errors`` covers Windows where pandas/openpyxl may hold
     # the file briefly past close.
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
@@ -224,7 +247,7 @@ async def run_etl(
             logical_name = os.path.splitext(upload.filename)[0]
             staged_path = os.path.join(tmpdir, upload.filename)
             with open(staged_path, "wb") as out:
-                out.write(await upload.read())
+                await run_in_threadpool(shutil.copyfileobj, upload.file, out)
             file_map[logical_name] = _build_algomancy_file(logical_name, staged_path)
 
         result = sm.etl_data(file_map, dataset_name)
@@ -11,28 +11,49 @@ Error mapping notes:
   the response semantically distinguishes "you referenced something that
   doesn't exist" from "you referenced something that exists but is in a
   conflicting state" (409).
-* Duplicate tag → 409 (ValueError from ``create_scenario``).
+* Duplicate tag → 409 (ValueError from ``create_scenario`` /
+  ``create_scenarios_batch``).
 * Bad parameter values → 400 (``ParameterError`` from BaseParameterSet, which
   is not a ValueError so it doesn't hit the global handler).
+* A batch larger than ``ApiConfiguration.max_batch_size`` → 400, checked on
+  the size of a sweep's grid before it is expanded.
+
+``GET .../metrics`` returns the timings, peak memory and (when requested with
+``POST .../run?profile=true``) the cProfile report of a scenario's latest run.
+
+``GET /events`` streams status and progress changes as Server-Sent Events, so
+clients can follow runs without polling ``/status``.
 """
 
 from __future__ import annotations
 
-from typing import List
+import json
+import math
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from algomancy_scenario import ScenarioManager, ScenarioStatus
+from algomancy_scenario.progressbus import ProgressSubscription
+from algomancy_scenario.records import ScenarioRecord
 from algomancy_utils.baseparameterset import ParameterError
 
 from ..dependencies import get_scenario_manager
 from ..schemas import (
     CreateScenarioRequest,
+    CreateScenariosBatchRequest,
+    RunMetricsResponse,
     ScenarioStatusResponse,
     ScenarioSummary,
 )
 
 
+# A comment line is sent when no event arrived for this long, so proxies keep
+# idle streams open.
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
 router = APIRouter(
     prefix="/sessions/{session_id}",
     tags=["scenarios"],
@@ -99,6 +120,76 @@ def create_scenario(
     return scenario.to_dict()
 
 
+@router.post(
+    "/scenarios:batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=List[ScenarioSummary],
+    summary="Create many scenarios (explicit list or parameter sweep)",
+)
+def create_scenarios_batch(
+    body: CreateScenariosBatchRequest,
+    request: Request,
+    sm: ScenarioManager = Depends(get_scenario_manager),
+) -> List[dict]:
+    if body.sweep is not None:
+        size = math.prod(len(values) for values in body.sweep.grid.values())
+    else:
+        size = len(body.scenarios)
+    max_size = getattr(
+        getattr(request.app.state, "config", None), "max_batch_size", None
+    )
+    if max_size is not None and size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch of {size} scenarios exceeds the limit of {max_size}",
+        )
+
+    # All-or-nothing: every spec is validated before any scenario is stored,
+    # with the same error mapping as the single-create endpoint.
+    if body.sweep is not None:
+        algo_names = {body.sweep.algo_name}
+        dataset_keys = {body.sweep.dataset_key}
+    else:
+        algo_names = {spec.algo_name for spec in body.scenarios}
+        dataset_keys = {spec.dataset_key for spec in body.scenarios}
+    missing_algorithms = sorted(algo_names - set(sm.available_algorithms))
+    if missing_algorithms:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Algorithm '{missing_algorithms[0]}' not found",
+        )
+    missing_datasets = sorted(dataset_keys - set(sm.get_data_keys()))
+    if missing_datasets:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset '{missing_datasets[0]}' not found",
+        )
+
+    try:
+        if body.sweep is not None:
+            scenarios = sm.create_parameter_sweep(
+                algo_name=body.sweep.algo_name,
+                dataset_key=body.sweep.dataset_key,
+                grid=body.sweep.grid,
+                tag_prefix=body.sweep.tag_prefix,
+                algo_params=body.sweep.algo_params or {},
+                data_params=body.sweep.data_params or {},
+                enqueue=body.enqueue,
+            )
+        else:
+            scenarios = sm.create_scenarios_batch(
+                [spec.model_dump() for spec in body.scenarios],
+                enqueue=body.enqueue,
+            )
+    except ValueError as exc:
+        # Duplicate tag(s), within the batch or against existing scenarios.
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    except ParameterError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    return [ScenarioRecord.from_scenario(s).to_summary_dict() for s in scenarios]
+
+
 @router.get("/scenarios/{scenario_id}", summary="Get one scenario by id")
 def get_scenario(
     scenario_id: str,
@@ -131,6 +222,12 @@ def delete_scenario(
 )
 def run_scenario(
     scenario_id: str,
+    profile: bool = Query(
+        default=False, description="Capture a cProfile report of the run."
+    ),
+    trace_memory: bool = Query(
+        default=False, description="Record the peak memory traced by tracemalloc."
+    ),
     sm: ScenarioManager = Depends(get_scenario_manager),
 ) -> dict:
     scenario = _resolve_scenario_or_404(sm, scenario_id)
@@ -142,10 +239,37 @@ def run_scenario(
                 f"'{scenario.status}'. Reset it first to re-run."
             ),
         )
+    scenario.set_profiling(cpu=profile, memory=trace_memory)
     sm.process_scenario_async(scenario)
     return scenario.to_dict()
 
 
+@router.get(
+    "/scenarios/{scenario_id}/metrics",
+    response_model=RunMetricsResponse,
+    summary="Timings, peak memory and profile of the latest run",
+)
+def scenario_metrics(
+    scenario_id: str,
+    sm: ScenarioManager = Depends(get_scenario_manager),
+) -> RunMetricsResponse:
+    # Metadata-only, like /status.
+    record = sm.get_record(scenario_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scenario '{scenario_id}' not found",
+        )
+    if record.run_metrics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scenario '{scenario_id}' has no recorded run",
+        )
+    return RunMetricsResponse(
+        id=record.id, tag=record.tag, **record.run_metrics.to_dict()
+    )
+
+
 @router.post(
     "/scenarios/{scenario_id}/reset",
     summary="Reset a scenario's status and clear its result",
@@ -167,6 +291,27 @@ def reset_scenario(
     return scenario.to_dict()
 
 
+@router.post(
+    "/scenarios/{scenario_id}/cancel",
+    summary="Cancel a queued or running scenario",
+)
+def cancel_scenario(
+    scenario_id: str,
+    sm: ScenarioManager = Depends(get_scenario_manager),
+) -> dict:
+    scenario = _resolve_scenario_or_404(sm, scenario_id)
+    if scenario.status not in (ScenarioStatus.QUEUED, ScenarioStatus.PROCESSING):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Scenario '{scenario_id}' cannot be cancelled from status "
+                f"'{scenario.status}'."
+            ),
+        )
+    sm.cancel_scenario(scenario_id)
+    return scenario.to_dict()
+
+
 @router.get(
     "/scenarios/{scenario_id}/status",
     response_model=ScenarioStatusResponse,
@@ -187,6 +332,64 @@ def scenario_status(
     return ScenarioStatusResponse(**info)
 
 
+def _sse_message(payload: dict) -> str:
+    return f"event: progress\ndata: {json.dumps(payload)}\n\n"
+
+
+async def _event_stream(
+    subscription: ProgressSubscription, initial: List[dict]
+) -> AsyncIterator[str]:
+    try:
+        for payload in initial:
+            yield _sse_message(payload)
+        while True:
+            # Awaited on the event loop, so an open stream holds no worker
+            # thread; closing the subscription (client gone, bus closed) wakes
+            # it up once the events buffered so far have been sent.
+            event = await subscription.get_async(SSE_KEEPALIVE_SECONDS)
+            if event is not None:
+                yield _sse_message(event.to_dict())
+            elif subscription.closed:
+                break
+            else:
+                yield ": keepalive\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get(
+    "/events",
+    summary="Stream status and progress changes (Server-Sent Events)",
+    response_class=StreamingResponse,
+)
+def scenario_events(
+    scenario_id: Optional[str] = Query(
+        None, description="Only stream events of this scenario"
+    ),
+    sm: ScenarioManager = Depends(get_scenario_manager),
+) -> StreamingResponse:
+    # Each ``progress`` event carries the ``/status`` payload plus
+    # ``session_id`` and ``timestamp``. With ``scenario_id`` the stream opens
+    # with that scenario's current status.
+    initial: List[dict] = []
+    if scenario_id is not None:
+        info = sm.get_status(scenario_id)
+        if info is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Scenario '{scenario_id}' not found",
+            )
+        initial.append(info)
+    subscription = sm.event_bus.subscribe(
+        session_id=sm.session_key, scenario_id=scenario_id
+    )
+    return StreamingResponse(
+        _event_stream(subscription, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/processing",
     summary="The scenario currently being processed (or null if idle)",
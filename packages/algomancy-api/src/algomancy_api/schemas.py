@@ -11,7 +11,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # ---- Sessions --------------------------------------------------------------
@@ -83,6 +83,50 @@ class CreateScenarioRequest(BaseModel):
     )
 
 
+class ParameterSweepRequest(BaseModel):
+    algo_name: str = Field(..., min_length=1, description="Algorithm template name")
+    dataset_key: str = Field(..., min_length=1, description="Input dataset key")
+    grid: Dict[str, List[Any]] = Field(
+        ...,
+        description="Algorithm parameter name → values to sweep. One scenario "
+        "is created per point of the cartesian product.",
+    )
+    tag_prefix: Optional[str] = Field(
+        default=None,
+        description="Prefix for the generated tags "
+        "(``'<prefix> [name=value, ...]'``). Defaults to the algorithm name.",
+    )
+    algo_params: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Fixed values for the parameters that are not swept.",
+    )
+    data_params: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Data parameter values shared by every scenario in the sweep.",
+    )
+
+
+class CreateScenariosBatchRequest(BaseModel):
+    """Either an explicit list of scenarios or a parameter sweep — not both."""
+
+    scenarios: Optional[List[CreateScenarioRequest]] = Field(
+        default=None, description="Scenarios to create, in order."
+    )
+    sweep: Optional[ParameterSweepRequest] = Field(
+        default=None, description="Parameter grid to expand into scenarios."
+    )
+    enqueue: bool = Field(
+        default=False,
+        description="Queue every created scenario for processing.",
+    )
+
+    @model_validator(mode="after")
+    def _exactly_one_source(self) -> "CreateScenariosBatchRequest":
+        if (self.scenarios is None) == (self.sweep is None):
+            raise ValueError("Provide exactly one of 'scenarios' or 'sweep'.")
+        return self
+
+
 class ScenarioStatusResponse(BaseModel):
     """Lightweight status shape for high-frequency polling.
 
@@ -115,6 +159,30 @@ class AlgorithmSummary(BaseModel):
     parameters: Dict[str, Any] = Field(default_factory=dict)
 
 
+class RunMetricsSummary(BaseModel):
+    """Timings and memory of a scenario's latest run.
+
+    Mirrors ``RunMetrics.to_dict()``. ``phases`` maps ``set_data_params``,
+    ``run``, ``compute_kpis`` and (database backend) ``persist`` to seconds.
+    """
+
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration: Optional[float] = None
+    phases: Dict[str, float] = Field(default_factory=dict)
+    process_peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+    cached: bool = False
+
+
+class RunMetricsResponse(RunMetricsSummary):
+    """Run metrics of one scenario, including the cProfile report if captured."""
+
+    id: str
+    tag: str
+    profile: Optional[str] = None
+
+
 class ScenarioSummary(BaseModel):
     """Lightweight scenario metadata for the list view.
 
@@ -135,6 +203,7 @@ class ScenarioSummary(BaseModel):
     run_finished_at: Optional[datetime] = None
     result_available: bool = False
     kpis: Dict[str, KpiSummary] = Field(default_factory=dict)
+    run_metrics: Optional[RunMetricsSummary] = None
 
 
 # ---- Data management -------------------------------------------------------
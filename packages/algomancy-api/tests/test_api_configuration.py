@@ -12,6 +12,14 @@ def test_defaults(api_core_kwargs):
     assert cfg.prefix == "/api/v1"
     assert cfg.cors_origins == []
     assert cfg.allow_session_create is True
+    assert cfg.enable_metrics is True
+    assert cfg.max_batch_size == 1000
+
+
+@pytest.mark.parametrize("bad", [0, -1, 2.5, True])
+def test_max_batch_size_rejects_invalid(api_core_kwargs, bad):
+    with pytest.raises(ValueError, match="max_batch_size"):
+        ApiConfiguration(max_batch_size=bad, **api_core_kwargs)
 
 
 def test_hydrated_cache_size_defaults_none(api_core_kwargs):
@@ -57,6 +65,8 @@ def test_as_dict_includes_api_fields(api_core_kwargs):
     assert d["cors_origins"] == []
     assert d["allow_session_create"] is True
     assert d["forwarded_allow_ips"] is None
+    assert d["enable_metrics"] is True
+    assert d["max_batch_size"] == 1000
 
 
 def test_forwarded_allow_ips_accepts_string(api_core_kwargs):
@@ -99,6 +109,7 @@ def test_allow_session_create_can_be_disabled(api_core_kwargs):
         {"forwarded_allow_ips": [""]},
         {"forwarded_allow_ips": [42]},
         {"forwarded_allow_ips": 42},
+        {"enable_metrics": "yes"},
     ],
 )
 def test_invalid_api_fields_rejected(api_core_kwargs, kwarg):
@@ -59,6 +59,27 @@ def test_health_endpoint(client: TestClient):
     assert "use_sessions" not in body
 
 
+def test_metrics_endpoint_exposes_prometheus_text(client: TestClient):
+    client.get("/health")
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = r.text
+    assert "# TYPE algomancy_http_request_duration_seconds histogram" in body
+    assert (
+        'algomancy_http_request_duration_seconds_count{router="meta",method="GET",status="200"}'
+        in body
+    )
+    main_id = client.app.state.session_manager.start_session_id
+    assert f'algomancy_queue_depth{{session="{main_id}"}} 0.0' in body
+    assert f'algomancy_runs_in_progress{{session="{main_id}"}} 0.0' in body
+
+
+def test_metrics_endpoint_can_be_disabled(api_core_kwargs):
+    app = ApiLauncher.build(ApiConfiguration(enable_metrics=False, **api_core_kwargs))
+    assert TestClient(app).get("/metrics").status_code == 404
+
+
 def test_openapi_docs_available(client: TestClient):
     r = client.get("/openapi.json")
     assert r.status_code == 200
@@ -100,6 +100,20 @@ def test_get_data_unknown_returns_404(client_with_data):
     assert "nope" in r.json()["detail"]
 
 
+def test_get_data_that_fails_to_load_returns_404(api_core_kwargs, isolated_data_path):
+    (isolated_data_path / "main").mkdir()
+    (isolated_data_path / "main" / "broken.json").write_text("not valid json")
+    kwargs = dict(api_core_kwargs, data_path=str(isolated_data_path))
+    client = TestClient(
+        ApiLauncher.build(ApiConfiguration(**kwargs, lazy_data_loading=True))
+    )
+    assert "broken" in client.get("/api/v1/sessions/main/data").json()["keys"]
+
+    r = client.get("/api/v1/sessions/main/data/broken")
+    assert r.status_code == 404
+    assert "could not be loaded" in r.json()["detail"]
+
+
 def test_get_data_parameters_returns_descriptor(client_with_data):
     """Plain ``DataSource`` declares no params — the endpoint still returns 200
     with an empty parameter list."""
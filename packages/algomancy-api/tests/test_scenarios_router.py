@@ -6,8 +6,10 @@ KPI was computed -> delete.
 
 from __future__ import annotations
 
+import json
 import pathlib
 import shutil
+import threading
 import time
 
 import pytest
@@ -93,8 +95,10 @@ def test_list_returns_lightweight_summaries(client):
         "run_finished_at",
         "result_available",
         "kpis",
+        "run_metrics",
     }
     assert item["tag"] == "summary"
+    assert item["run_metrics"] is None
     assert item["input_data_key"] == DATASET_KEY
     assert item["algorithm"]["name"] == "Slow"
     assert item["algorithm"]["parameters"]["duration"] == 1
@@ -227,6 +231,71 @@ def test_create_scenario_missing_required_field_returns_422(client):
 # ---- Get / delete --------------------------------------------------------
 
 
+def test_batch_sweep_creates_all_points(client):
+    r = client.post(
+        "/api/v1/sessions/main/scenarios:batch",
+        json={
+            "sweep": {
+                "algo_name": "Slow",
+                "dataset_key": DATASET_KEY,
+                "grid": {"duration": [1, 2]},
+                "tag_prefix": "sweep",
+            }
+        },
+    )
+    assert r.status_code == 201, r.text
+    assert [s["tag"] for s in r.json()] == ["sweep [duration=1]", "sweep [duration=2]"]
+
+    listed = client.get("/api/v1/sessions/main/scenarios").json()
+    assert {s["tag"] for s in listed} == {"sweep [duration=1]", "sweep [duration=2]"}
+
+
+def test_batch_is_all_or_nothing(client):
+    r = client.post(
+        "/api/v1/sessions/main/scenarios:batch",
+        json={
+            "scenarios": [
+                {
+                    "tag": "fine",
+                    "dataset_key": DATASET_KEY,
+                    "algo_name": "Slow",
+                    "algo_params": {"duration": 1},
+                },
+                {
+                    "tag": "broken",
+                    "dataset_key": DATASET_KEY,
+                    "algo_name": "Slow",
+                    "algo_params": {"duration": "not-an-int"},
+                },
+            ]
+        },
+    )
+    assert r.status_code == 400
+    assert client.get("/api/v1/sessions/main/scenarios").json() == []
+
+
+def test_batch_larger_than_the_limit_is_rejected(client):
+    client.app.state.config.max_batch_size = 4
+    r = client.post(
+        "/api/v1/sessions/main/scenarios:batch",
+        json={
+            "sweep": {
+                "algo_name": "Slow",
+                "dataset_key": DATASET_KEY,
+                "grid": {"duration": [1, 2, 3], "other": [1, 2]},
+            }
+        },
+    )
+    assert r.status_code == 400
+    assert "6 scenarios exceeds the limit of 4" in r.json()["detail"]
+    assert client.get("/api/v1/sessions/main/scenarios").json() == []
+
+
+def test_batch_requires_exactly_one_source(client):
+    r = client.post("/api/v1/sessions/main/scenarios:batch", json={})
+    assert r.status_code == 422
+
+
 def test_get_scenario_by_id(client):
     create = client.post(
         "/api/v1/sessions/main/scenarios",
@@ -325,6 +394,45 @@ def test_run_then_poll_to_completion(client):
     assert full["kpis"]["Delay"]["value"] is not None
 
 
+def test_metrics_report_phase_timings_and_profile(client):
+    sid = client.post(
+        "/api/v1/sessions/main/scenarios",
+        json={
+            "tag": "metrics",
+            "dataset_key": DATASET_KEY,
+            "algo_name": "Slow",
+            "algo_params": {"duration": 1},
+        },
+    ).json()["id"]
+    assert (
+        client.get(f"/api/v1/sessions/main/scenarios/{sid}/metrics").status_code == 404
+    )
+
+    r = client.post(f"/api/v1/sessions/main/scenarios/{sid}/run?profile=true")
+    assert r.status_code == 202
+    assert _poll_until_terminal(client, "main", sid)["status"] == "complete"
+
+    r = client.get(f"/api/v1/sessions/main/scenarios/{sid}/metrics")
+    assert r.status_code == 200
+    metrics = r.json()
+    assert metrics["id"] == sid
+    assert {"set_data_params", "run", "compute_kpis"} <= set(metrics["phases"])
+    # The Slow algorithm sleeps for one second.
+    assert metrics["phases"]["run"] >= 1.0
+    assert metrics["duration"] >= metrics["phases"]["run"]
+    assert metrics["started_at"] < metrics["finished_at"]
+    assert "cumulative" in metrics["profile"]
+
+    summary = client.get("/api/v1/sessions/main/scenarios").json()[0]
+    assert summary["run_started_at"] is not None
+    assert summary["run_metrics"]["phases"] == metrics["phases"]
+
+
+def test_metrics_unknown_scenario_returns_404(client):
+    r = client.get("/api/v1/sessions/main/scenarios/nope/metrics")
+    assert r.status_code == 404
+
+
 def test_run_unknown_scenario_returns_404(client):
     r = client.post("/api/v1/sessions/main/scenarios/nope/run")
     assert r.status_code == 404
@@ -429,6 +537,88 @@ def test_reset_rejects_when_in_flight(client):
     assert r.status_code == 409
 
 
+def test_cancel_stops_running_scenario(client):
+    create = client.post(
+        "/api/v1/sessions/main/scenarios",
+        json={
+            "tag": "cancel-while-running",
+            "dataset_key": DATASET_KEY,
+            "algo_name": "Slow",
+            "algo_params": {"duration": 3},
+        },
+    ).json()
+    sid = create["id"]
+
+    assert client.post(f"/api/v1/sessions/main/scenarios/{sid}/run").status_code == 202
+
+    r = client.post(f"/api/v1/sessions/main/scenarios/{sid}/cancel")
+    assert r.status_code == 200
+    final = _poll_until_terminal(client, "main", sid)
+    assert final["status"] == "failed"
+
+
+def test_cancel_rejects_when_not_in_flight(client):
+    create = client.post(
+        "/api/v1/sessions/main/scenarios",
+        json={
+            "tag": "cancel-idle",
+            "dataset_key": DATASET_KEY,
+            "algo_name": "Slow",
+            "algo_params": {"duration": 1},
+        },
+    ).json()
+
+    r = client.post(f"/api/v1/sessions/main/scenarios/{create['id']}/cancel")
+    assert r.status_code == 409
+    assert "created" in r.json()["detail"]
+
+
+def test_events_stream_pushes_scenario_lifecycle(client):
+    sid = client.post(
+        "/api/v1/sessions/main/scenarios",
+        json={
+            "tag": "streamed",
+            "dataset_key": DATASET_KEY,
+            "algo_name": "Slow",
+            "algo_params": {"duration": 1},
+        },
+    ).json()["id"]
+    sm = client.app.state.session_manager.get_scenario_manager("main")
+    bus = sm.event_bus
+
+    def run_then_close():
+        # Run once the stream has subscribed, then end it by closing the bus.
+        deadline = time.monotonic() + 10
+        while bus.subscriber_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sm.process_scenario_async(sm.get_by_id(sid))
+        sm.wait_for_processing()
+        bus.close()
+
+    runner = threading.Thread(target=run_then_close)
+    runner.start()
+    r = client.get(f"/api/v1/sessions/main/events?scenario_id={sid}")
+    runner.join(timeout=10)
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in r.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    statuses = [e["status"] for e in events]
+    assert statuses[0] == "created"  # current state first
+    assert statuses[1] == "queued"
+    assert statuses[-1] == "complete"
+    assert all(e["id"] == sid for e in events)
+
+
+def test_events_stream_unknown_scenario_returns_404(client):
+    r = client.get("/api/v1/sessions/main/events?scenario_id=nope")
+    assert r.status_code == 404
+
+
 def test_currently_processing_when_idle(client):
     r = client.get("/api/v1/sessions/main/processing")
     assert r.status_code == 200
@@ -495,5 +685,7 @@ def test_openapi_lists_scenario_routes(client):
     assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}" in paths
     assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}/run" in paths
     assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}/reset" in paths
+    assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}/cancel" in paths
     assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}/status" in paths
+    assert "/api/v1/sessions/{session_id}/scenarios/{scenario_id}/metrics" in paths
     assert "/api/v1/sessions/{session_id}/processing" in paths
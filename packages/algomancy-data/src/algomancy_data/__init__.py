@@ -15,7 +15,12 @@ Public classes are re-exported at the package level for convenience, so you
 can import most types via ``from algomancy_data import ...``.
 """
 
-from .datamanager import DataManager, StatelessDataManager, StatefulDataManager
+from .datamanager import (
+    DataLoadError,
+    DataManager,
+    StatelessDataManager,
+    StatefulDataManager,
+)
 from .datasource import BaseDataSource, DataSource, DataClassification, BASEDATASOURCE
 from .schema import Schema, DataType, FileExtension, SchemaType, Column, ColumnGroup
 from .etl import (
@@ -75,6 +80,7 @@ _populate_registry_defaults()
 
 __all__ = [
     "DataManager",
+    "DataLoadError",
     "StatefulDataManager",
     "StatelessDataManager",
     "BaseDataSource",
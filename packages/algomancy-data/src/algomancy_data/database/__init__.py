@@ -1,10 +1,29 @@
+from .bulk_writer import (
+    BULK_WRITE_METHODS,
+    BulkWriter,
+    ExecutemanyWriter,
+    MultiRowInsertWriter,
+    PostgresCopyWriter,
+    get_bulk_writer,
+)
 from .database_manager import DatabaseDataManager
+from .lazy_tables import LazySqlTables
+from .migrations import Migration, MigrationRunner
 from .protocols import SqlTableLayout
 from .schema_translator import column_to_sa, dtype_to_sa_type
 
 __all__ = [
+    "BULK_WRITE_METHODS",
+    "BulkWriter",
     "DatabaseDataManager",
+    "ExecutemanyWriter",
+    "LazySqlTables",
+    "Migration",
+    "MigrationRunner",
+    "MultiRowInsertWriter",
+    "PostgresCopyWriter",
     "SqlTableLayout",
     "column_to_sa",
     "dtype_to_sa_type",
+    "get_bulk_writer",
 ]
@@ -0,0 +1,321 @@
+"""Bulk appends of DataFrames to the shared per-sub-table SQL tables.
+
+``DatabaseDataManager`` and ``SqlScenarioRepository`` append every dataset
+and result table to a shared physical table, with discriminator columns in
+front. Pandas' default ``to_sql`` insert hands the rows to the driver's
+``executemany``, which for Postgres drivers means one round trip per row. A
+:class:`BulkWriter` picks the insert strategy instead:
+
+=================  ==========================================================
+``"pandas"``       Pandas' default insert (the behaviour before bulk writers).
+``"multirow"``     Chunked multi-row ``INSERT ... VALUES (...), (...)``
+                   statements, sized to stay under the driver's parameter
+                   limit. Works on every dialect.
+``"executemany"``  One ``executemany`` of positional rows on the raw DBAPI
+                   cursor, inside the caller's transaction (SQLite).
+``"copy"``         ``COPY ... FROM STDIN`` in CSV format (Postgres with
+                   psycopg2 or psycopg 3).
+``"auto"``         ``"copy"`` on Postgres, ``"executemany"`` on SQLite and
+                   ``"multirow"`` elsewhere.
+=================  ==========================================================
+
+All strategies plug into the ``method`` hook of ``DataFrame.to_sql``, so
+pandas still creates missing tables and converts values (``NaN`` to ``NULL``,
+timestamps to ``datetime``) exactly as before. The discriminator columns are
+added to a new frame that shares the caller's column data rather than to a
+copy of it. Custom strategies subclass :class:`BulkWriter` and override
+:meth:`BulkWriter.insert`.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+#: Names accepted by :func:`get_bulk_writer`.
+BULK_WRITE_METHODS = ("auto", "pandas", "multirow", "executemany", "copy")
+
+
+def with_discriminators(
+    df: pd.DataFrame, discriminators: Optional[Dict[str, str]]
+) -> pd.DataFrame:
+    """``df`` with constant ``discriminators`` columns in front, without copying ``df``."""
+    if not discriminators:
+        return df
+    columns: Dict[str, object] = {
+        name: np.full(len(df), value, dtype=object)
+        for name, value in discriminators.items()
+    }
+    columns.update(df.items())
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class BulkWriter:
+    """Appends DataFrames to SQL tables with pandas' default insert.
+
+    Subclasses change how the rows of one chunk reach the database by
+    overriding :meth:`insert`, which has the signature of the ``method``
+    argument of ``DataFrame.to_sql``.
+
+    Args:
+        chunk_size: Rows handed to :meth:`insert` at a time. ``None`` writes
+            the whole frame as one chunk.
+    """
+
+    name = "pandas"
+
+    def __init__(self, chunk_size: int | None = None) -> None:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1; got {chunk_size!r}")
+        self.chunk_size = chunk_size
+
+    def supports(self, dialect) -> bool:
+        """True if this writer can write through ``dialect``."""
+        return True
+
+    def append(
+        self,
+        conn,
+        table_name: str,
+        df: pd.DataFrame,
+        discriminators: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Append the rows of ``df`` to ``table_name``, creating it if needed.
+
+        ``discriminators`` maps column names to a value written on every row,
+        ahead of the columns of ``df``.
+        """
+        if not self.supports(conn.dialect):
+            raise ValueError(
+                f"Bulk writer {self.name!r} does not support the "
+                f"{conn.dialect.name!r} dialect ({conn.dialect.driver})."
+            )
+        frame = with_discriminators(df, discriminators)
+        frame.to_sql(
+            table_name,
+            conn,
+            if_exists="append",
+            index=False,
+            chunksize=self._chunk_size_for(frame),
+            method=self._method(),
+        )
+
+    def insert(self, table, conn, keys: List[str], data_iter: Iterable[tuple]):
+        """Write one chunk of rows; the ``DataFrame.to_sql`` ``method`` hook."""
+        raise NotImplementedError
+
+    def _method(self) -> Optional[Callable]:
+        return None if type(self).insert is BulkWriter.insert else self.insert
+
+    def _chunk_size_for(self, frame: pd.DataFrame) -> int | None:
+        return self.chunk_size
+
+
+def _placeholders(dialect, count: int, offset: int = 0) -> List[str]:
+    """DBAPI placeholders for ``count`` positional parameters."""
+    style = dialect.paramstyle
+    if style == "qmark":
+        return ["?"] * count
+    if style in ("format", "pyformat"):
+        return ["%s"] * count
+    if style == "numeric":
+        return [f":{offset + i + 1}" for i in range(count)]
+    raise ValueError(f"Unsupported DBAPI paramstyle {style!r}.")
+
+
+def _driver_rows(table, dialect, keys: List[str], rows: List[tuple]) -> List[tuple]:
+    """Apply the bind processors SQLAlchemy would apply (e.g. timestamps on SQLite)."""
+    processors = [
+        table.table.c[key].type.dialect_impl(dialect).bind_processor(dialect)
+        for key in keys
+    ]
+    if not any(processors):
+        return rows
+    return [
+        tuple(
+            value if process is None or value is None else process(value)
+            for process, value in zip(processors, row)
+        )
+        for row in rows
+    ]
+
+
+def _insert_prefix(table, dialect, keys: List[str]) -> str:
+    quote = dialect.identifier_preparer.quote
+    return (
+        f"INSERT INTO {dialect.identifier_preparer.format_table(table.table)} "
+        f"({', '.join(quote(key) for key in keys)}) VALUES "
+    )
+
+
+class _DriverWriter(BulkWriter):
+    """Writes through the raw DBAPI cursor of the caller's transaction."""
+
+    def supports(self, dialect) -> bool:
+        return dialect.paramstyle in ("qmark", "format", "pyformat", "numeric")
+
+    def insert(self, table, conn, keys, data_iter):
+        rows = list(data_iter)
+        if not rows:
+            return
+        rows = _driver_rows(table, conn.dialect, keys, rows)
+        cursor = conn.connection.cursor()
+        try:
+            self._execute(cursor, table, conn.dialect, keys, rows)
+        finally:
+            cursor.close()
+
+    def _execute(self, cursor, table, dialect, keys, rows) -> None:
+        raise NotImplementedError
+
+
+class MultiRowInsertWriter(_DriverWriter):
+    """Chunked multi-row ``INSERT`` statements.
+
+    Args:
+        max_parameters: Upper bound on bound parameters per statement; the
+            chunk size is this divided by the column count.
+    """
+
+    name = "multirow"
+
+    def __init__(self, max_parameters: int = 10_000) -> None:
+        super().__init__()
+        if max_parameters < 1:
+            raise ValueError(
+                f"max_parameters must be at least 1; got {max_parameters!r}"
+            )
+        self.max_parameters = max_parameters
+
+    def _execute(self, cursor, table, dialect, keys, rows) -> None:
+        width = len(keys)
+        groups = []
+        for i in range(len(rows)):
+            groups.append(f"({', '.join(_placeholders(dialect, width, i * width))})")
+        statement = _insert_prefix(table, dialect, keys) + ", ".join(groups)
+        cursor.execute(statement, tuple(value for row in rows for value in row))
+
+    def _chunk_size_for(self, frame: pd.DataFrame) -> int | None:
+        return max(1, self.max_parameters // max(1, len(frame.columns)))
+
+
+class ExecutemanyWriter(_DriverWriter):
+    """One DBAPI ``executemany`` per chunk, on the caller's transaction.
+
+    Skips SQLAlchemy's per-row parameter handling; only columns whose type
+    needs a bind processor (e.g. timestamps on SQLite) are converted.
+    """
+
+    name = "executemany"
+
+    def __init__(self, chunk_size: int | None = 50_000) -> None:
+        super().__init__(chunk_size)
+
+    def _execute(self, cursor, table, dialect, keys, rows) -> None:
+        statement = (
+            _insert_prefix(table, dialect, keys)
+            + f"({', '.join(_placeholders(dialect, len(keys)))})"
+        )
+        cursor.executemany(statement, rows)
+
+
+class _CsvNull:
+    """Written unquoted by ``csv``; read as ``NULL`` by ``COPY ... NULL '\\N'``."""
+
+    def __str__(self) -> str:
+        return "\\N"
+
+
+_CSV_NULL = _CsvNull()
+
+
+class PostgresCopyWriter(BulkWriter):
+    """``COPY ... FROM STDIN`` in CSV format, for psycopg2 and psycopg 3.
+
+    Strings are quoted and ``NULL`` is written as an unquoted empty field, so
+    empty strings and missing values stay distinct. A one-column row cannot
+    hold a lone unquoted empty field, so single-column tables spell ``NULL``
+    as an unquoted ``\\N`` instead.
+    """
+
+    name = "copy"
+
+    def __init__(self, chunk_size: int | None = 100_000) -> None:
+        super().__init__(chunk_size)
+
+    def supports(self, dialect) -> bool:
+        return dialect.name == "postgresql" and dialect.driver in (
+            "psycopg2",
+            "psycopg",
+        )
+
+    def insert(self, table, conn, keys, data_iter):
+        options = "FORMAT csv"
+        if len(keys) == 1:
+            data_iter = ((_CSV_NULL if v is None else v,) for (v,) in data_iter)
+            options += ", NULL '\\N'"
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_STRINGS).writerows(data_iter)
+        quote = conn.dialect.identifier_preparer.quote
+        statement = (
+            f"COPY {conn.dialect.identifier_preparer.format_table(table.table)} "
+            f"({', '.join(quote(key) for key in keys)}) FROM STDIN WITH ({options})"
+        )
+        cursor = conn.connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+            else:  # psycopg 3
+                with cursor.copy(statement) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+
+class AutoBulkWriter(BulkWriter):
+    """Picks the fastest supported writer for the connection's dialect."""
+
+    name = "auto"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._candidates = (
+            PostgresCopyWriter(),
+            ExecutemanyWriter(),
+            MultiRowInsertWriter(),
+        )
+
+    def writer_for(self, dialect) -> BulkWriter:
+        if dialect.name == "postgresql" and self._candidates[0].supports(dialect):
+            return self._candidates[0]
+        if dialect.name == "sqlite":
+            return self._candidates[1]
+        return self._candidates[2]
+
+    def append(self, conn, table_name, df, discriminators=None) -> None:
+        self.writer_for(conn.dialect).append(conn, table_name, df, discriminators)
+
+
+_WRITERS = {
+    "auto": AutoBulkWriter,
+    "pandas": BulkWriter,
+    "multirow": MultiRowInsertWriter,
+    "executemany": ExecutemanyWriter,
+    "copy": PostgresCopyWriter,
+}
+
+
+def get_bulk_writer(method: "str | BulkWriter" = "auto") -> BulkWriter:
+    """The :class:`BulkWriter` named by ``method``, or ``method`` itself."""
+    if isinstance(method, BulkWriter):
+        return method
+    if method not in _WRITERS:
+        raise ValueError(
+            f"bulk write method must be one of {BULK_WRITE_METHODS}; got {method!r}"
+        )
+    return _WRITERS[method]()
@@ -22,17 +22,21 @@ import json
 import re
 import threading
 from collections import OrderedDict
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 
 import pandas as pd
 import sqlalchemy as sa
 from algomancy_utils import Logger
+from algomancy_utils.metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
 
 from ..datamanager import DataManager
-from ..datasource import DataClassification, BASEDATASOURCE
+from ..datasource import DataClassification, DataSource, BASEDATASOURCE
 from ..etl import ETLResult
 from ..schema import Schema
 from ..validator import schema_table_map
+from .bulk_writer import BulkWriter, get_bulk_writer
+from .lazy_tables import LazySqlTables
+from .migrations import ensure_discriminator_index, migrate_data_schema
 from .models import (
     DATA_TABLE_PREFIX,
     DATASET_COL,
@@ -57,6 +61,14 @@ def _data_table_name(sub_table: str) -> str:
     return f"{DATA_TABLE_PREFIX}{_safe_segment(sub_table)}"
 
 
+def _supports_lazy_tables(ds: BASEDATASOURCE) -> bool:
+    """True if ``ds`` keeps its sub-tables in the ``tables`` dict of DataSource."""
+    return (
+        isinstance(ds, DataSource)
+        and type(ds).from_sql_tables is DataSource.from_sql_tables
+    )
+
+
 class DatabaseDataManager(DataManager):
     """DataManager that persists DataSources to a SQL database.
 
@@ -82,6 +94,14 @@ class DatabaseDataManager(DataManager):
             maintains an LRU and evicts the least-recently-used datasource once
             the bound is exceeded; eviction only drops the manager's cached
             reference, never data held live elsewhere.
+        bulk_writer: How rows are appended to the shared tables: a name from
+            ``BULK_WRITE_METHODS`` (default ``"auto"``, the fastest path for
+            the engine's dialect) or a :class:`BulkWriter` instance.
+        lazy_tables: When True, a hydrated :class:`DataSource` reads each
+            sub-table on first access instead of all of them up front (see
+            :class:`LazySqlTables`), and ``datasource_cache_size`` bounds the
+            number of loaded sub-tables rather than datasets. Other
+            ``data_object_type`` classes are hydrated eagerly.
         logger: Optional logger.
     """
 
@@ -93,10 +113,13 @@ class DatabaseDataManager(DataManager):
         session_id: str,
         data_object_type: type[BASEDATASOURCE],
         datasource_cache_size: int | None = None,
+        bulk_writer: str | BulkWriter = "auto",
+        lazy_tables: bool = False,
         logger: Logger | None = None,
     ) -> None:
         super().__init__(etl_factory, schemas, "database", data_object_type, logger)
         self._engine = engine
+        self._bulk_writer = get_bulk_writer(bulk_writer)
         self._session_id = session_id
         # Catalogue: dataset_name → metadata dict (id, ds_type, creation_datetime, payload, sub_tables)
         self._db_catalogue: Dict[str, dict] = {}
@@ -104,6 +127,15 @@ class DatabaseDataManager(DataManager):
         self._cache_size = datasource_cache_size
         self._cache_lock = threading.Lock()
         self._data: "OrderedDict[str, BASEDATASOURCE]" = OrderedDict()
+        # With lazy tables the LRU holds loaded sub-tables instead of datasets,
+        # keyed by (id of the dataset's LazySqlTables, sub-table name).
+        self._lazy_tables = lazy_tables
+        self._table_lru: "OrderedDict[tuple[int, str], LazySqlTables]" = OrderedDict()
+        # Per-key locks so concurrent requests for one dataset load it once.
+        self._key_locks: Dict[str, threading.Lock] = {}
+        # Names of the tables in the database, inspected once and dropped
+        # whenever this manager creates a table.
+        self._table_names: Optional[set[str]] = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -113,6 +145,7 @@ class DatabaseDataManager(DataManager):
         """Initialise DB schema and load dataset metadata (not data)."""
         _catalogue_metadata.create_all(self._engine, checkfirst=True)
         self._assert_catalogue_schema_current()
+        migrate_data_schema(self._engine, self.logger)
         with self._engine.connect() as conn:
             rows = conn.execute(
                 datasets_table.select().where(
@@ -128,6 +161,7 @@ class DatabaseDataManager(DataManager):
                 "creation_datetime": row.creation_datetime,
                 "payload": row.payload,
                 "sub_tables": _decode_sub_tables(row.sub_tables),
+                "fingerprint": row.fingerprint,
             }
         self.log(
             f"DatabaseDataManager startup for session '{self._session_id}': "
@@ -161,14 +195,38 @@ class DatabaseDataManager(DataManager):
         known = set(self._db_catalogue.keys()) | set(self._data.keys())
         return list(known)
 
+    def get_data_classification(self, data_key: str) -> Optional[DataClassification]:
+        """The classification of ``data_key`` from the catalogue, without loading it."""
+        with self._cache_lock:
+            data = self._data.get(data_key)
+        if data is not None:
+            return data._ds_type
+        info = self._db_catalogue.get(data_key)
+        if info is None:
+            return None
+        try:
+            return DataClassification(info["ds_type"])
+        except ValueError:
+            return None
+
     def get_data(self, data_key: str) -> Optional[BASEDATASOURCE]:
         with self._cache_lock:
             if data_key in self._data:
                 self._data.move_to_end(data_key)
+                CACHE_HITS.inc(cache="datasource")
                 return self._data[data_key]
-        if data_key in self._db_catalogue:
-            # Load outside the lock (DB read can be slow); a concurrent load of
-            # the same key just recomputes identical data — last write wins.
+        if data_key not in self._db_catalogue:
+            return None
+        # Single-flight: the first caller loads (outside the cache lock, as
+        # the DB read can be slow); concurrent callers for the same key wait
+        # for it and get the cached result.
+        with self._get_key_lock(data_key):
+            with self._cache_lock:
+                if data_key in self._data:
+                    self._data.move_to_end(data_key)
+                    CACHE_HITS.inc(cache="datasource")
+                    return self._data[data_key]
+            CACHE_MISSES.inc(cache="datasource")
             ds = self._load_datasource_from_db(data_key)
             if ds is not None:
                 with self._cache_lock:
@@ -176,30 +234,84 @@ class DatabaseDataManager(DataManager):
                     self._data.move_to_end(data_key)
                     self._evict_if_needed()
             return ds
-        return None
+
+    def _get_key_lock(self, data_key: str) -> threading.Lock:
+        with self._cache_lock:
+            lock = self._key_locks.get(data_key)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[data_key] = lock
+            return lock
 
     def _evict_if_needed(self) -> None:
         """Evict least-recently-used datasources beyond the cache bound.
 
         Must be called while holding ``self._cache_lock``. Eviction only drops
         the manager's cached reference; live holders keep their own reference.
+        With lazy tables, loaded sub-tables are bounded instead (see
+        :meth:`_on_table_access`).
         """
-        if self._cache_size is None:
+        if self._cache_size is None or self._lazy_tables:
             return
         while len(self._data) > self._cache_size:
             self._data.popitem(last=False)
+            CACHE_EVICTIONS.inc(cache="datasource")
+
+    def _on_table_access(self, tables: LazySqlTables, sub_table: str) -> None:
+        """Mark a loaded sub-table most recently used; unload beyond the bound."""
+        key = (id(tables), sub_table)
+        evicted = []
+        with self._cache_lock:
+            self._table_lru[key] = tables
+            self._table_lru.move_to_end(key)
+            while len(self._table_lru) > self._cache_size:
+                (_, name), owner = self._table_lru.popitem(last=False)
+                evicted.append((owner, name))
+        # Unloaded outside the cache lock: a LazySqlTables holds its own lock
+        # while it reads from the database.
+        for owner, name in evicted:
+            if owner.unload(name):
+                CACHE_EVICTIONS.inc(cache="table")
+
+    def _forget_tables(
+        self, ds: Optional[BASEDATASOURCE], change: str, load_missing: bool = False
+    ) -> None:
+        """Detach the hydrated dataset ``ds`` before its stored rows change.
+
+        Its sub-tables leave the table LRU and, as they are read by name,
+        its :class:`LazySqlTables` is marked stale, so a holder (e.g. a running
+        scenario) never reads rows of another version. With ``load_missing``
+        (the dataset is replaced) the tables it has not read yet are read
+        first, so the holder keeps the whole version it started with. Call
+        before writing, without holding ``self._cache_lock``.
+        """
+        tables = getattr(ds, "tables", None)
+        if not isinstance(tables, LazySqlTables):
+            return
+        with self._cache_lock:
+            for key in [k for k in self._table_lru if k[0] == id(tables)]:
+                del self._table_lru[key]
+        tables.mark_stale(
+            f"DataSource '{ds.name}' was {change} after it was loaded.",
+            load_missing=load_missing,
+        )
 
     # ------------------------------------------------------------------
     # Write operations (override to persist to DB)
     # ------------------------------------------------------------------
 
     def etl_data(self, files, dataset_name: str) -> ETLResult:
+        previous = self._data.get(dataset_name)
         result = super().etl_data(files, dataset_name)
         if result.is_success:
+            self._forget_tables(previous, "replaced", load_missing=True)
             self._persist_datasource(result.datasource, dataset_name)
         return result
 
     def add_data_source(self, data_source: BASEDATASOURCE) -> None:
+        previous = self._data.get(str(data_source.name))
+        if previous is not data_source:
+            self._forget_tables(previous, "replaced", load_missing=True)
         super().add_data_source(data_source)
         self._persist_datasource(data_source, str(data_source.name))
 
@@ -220,7 +332,10 @@ class DatabaseDataManager(DataManager):
         assert data_key in self.get_data_keys(), f"Data '{data_key}' not found."
         info = self._db_catalogue.get(data_key, {})
         sub_tables: List[str] = info.get("sub_tables") or []
-        existing_tables = set(sa.inspect(self._engine).get_table_names())
+        existing_tables = self._existing_tables(
+            _data_table_name(sub) for sub in sub_tables
+        )
+        self._forget_tables(self._data.get(data_key), "deleted")
         with self._engine.begin() as conn:
             self._delete_dataset_rows(conn, data_key, sub_tables, existing_tables)
             conn.execute(
@@ -230,13 +345,35 @@ class DatabaseDataManager(DataManager):
                 )
             )
         self._db_catalogue.pop(data_key, None)
-        self._data.pop(data_key, None)
+        with self._cache_lock:
+            self._data.pop(data_key, None)
+            self._key_locks.pop(data_key, None)
         self.log(f"Data '{data_key}' deleted from database.")
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _existing_tables(self, needed: Iterable[str] = ()) -> set[str]:
+        """Names of the tables in the database, from the cached catalogue.
+
+        The catalogue is inspected on first use and again whenever one of the
+        ``needed`` tables is missing from it, so a table created by another
+        manager or process is found once it matters. Like ``sa.inspect``
+        itself, call this OUTSIDE any open transaction.
+        """
+        with self._cache_lock:
+            names = self._table_names
+        if names is None or not names.issuperset(needed):
+            names = set(sa.inspect(self._engine).get_table_names())
+            with self._cache_lock:
+                self._table_names = names
+        return names
+
+    def _invalidate_table_names(self) -> None:
+        with self._cache_lock:
+            self._table_names = None
+
     def _delete_dataset_rows(
         self,
         conn: sa.Connection,
@@ -253,7 +390,7 @@ class DatabaseDataManager(DataManager):
         ``sqlite:///:memory:``), undoing the pending DML.
         """
         if existing_tables is None:
-            existing_tables = set(sa.inspect(self._engine).get_table_names())
+            existing_tables = self._existing_tables()
         for sub in sub_tables:
             table_name = _data_table_name(sub)
             if table_name not in existing_tables:
@@ -315,27 +452,26 @@ class DatabaseDataManager(DataManager):
             )
 
         sub_tables: List[str] = info.get("sub_tables") or []
-        inspector = sa.inspect(self._engine)
-        existing = set(inspector.get_table_names())
+        existing = self._existing_tables(_data_table_name(sub) for sub in sub_tables)
+        stored = [sub for sub in sub_tables if _data_table_name(sub) in existing]
+
+        if self._lazy_tables and _supports_lazy_tables(ds):
+            ds.tables = LazySqlTables(
+                stored,
+                lambda sub: self._read_sub_table_lazily(dataset_name, sub),
+                self._on_table_access if self._cache_size is not None else None,
+                fingerprint=info.get("fingerprint"),
+            )
+            self.log(
+                f"Loaded DataSource '{dataset_name}' from database "
+                f"({len(stored)} sub-tables, read on first access)."
+            )
+            return ds
+
         tables: Dict[str, pd.DataFrame] = {}
-        for sub in sub_tables:
-            table_name = _data_table_name(sub)
-            if table_name not in existing:
-                continue
-            with self._engine.connect() as conn:
-                df = pd.read_sql(
-                    sa.text(
-                        f'SELECT * FROM "{table_name}" '
-                        f'WHERE "{SESSION_COL}" = :sid AND "{DATASET_COL}" = :name'
-                    ),
-                    conn,
-                    params={"sid": self._session_id, "name": dataset_name},
-                )
-            df = df.drop(columns=[SESSION_COL, DATASET_COL], errors="ignore")
-            schema = self._schema_for_subtable(sub)
-            if schema is not None:
-                df = coerce_dataframe_to_schema(df, schema)
-            tables[sub] = df
+        with self._engine.connect() as conn:
+            for sub in stored:
+                tables[sub] = self._read_sub_table(conn, dataset_name, sub)
         ds.from_sql_tables(tables)
         self.log(
             f"Loaded DataSource '{dataset_name}' from database "
@@ -343,29 +479,65 @@ class DatabaseDataManager(DataManager):
         )
         return ds
 
+    def _read_sub_table(
+        self, conn: sa.Connection, dataset_name: str, sub_table: str
+    ) -> pd.DataFrame:
+        """Read this session's rows of ``dataset_name`` from one shared table."""
+        df = pd.read_sql(
+            sa.text(
+                f'SELECT * FROM "{_data_table_name(sub_table)}" '
+                f'WHERE "{SESSION_COL}" = :sid AND "{DATASET_COL}" = :name'
+            ),
+            conn,
+            params={"sid": self._session_id, "name": dataset_name},
+        )
+        df = df.drop(columns=[SESSION_COL, DATASET_COL], errors="ignore")
+        schema = self._schema_for_subtable(sub_table)
+        if schema is not None:
+            df = coerce_dataframe_to_schema(df, schema)
+        return df
+
+    def _read_sub_table_lazily(self, dataset_name: str, sub_table: str) -> pd.DataFrame:
+        CACHE_MISSES.inc(cache="table")
+        with self._engine.connect() as conn:
+            df = self._read_sub_table(conn, dataset_name, sub_table)
+        self.log(f"Loaded sub-table '{sub_table}' of DataSource '{dataset_name}'.")
+        return df
+
     def _persist_datasource(
         self, data_source: BASEDATASOURCE, dataset_name: str
     ) -> None:
         payload: Optional[str] = None
         sub_table_names: List[str] = []
+        fingerprint: Optional[str] = None
 
         if isinstance(data_source, SqlTableLayout):
             sql_tables = data_source.to_sql_tables()
+            if callable(getattr(data_source, "fingerprint", None)):
+                fingerprint = data_source.fingerprint()
             sub_table_names = list(sql_tables.keys())
             # Clean up any rows this (session, dataset) wrote previously —
             # including sub-tables that no longer appear in the current shape.
             previous = self._db_catalogue.get(dataset_name, {}).get("sub_tables") or []
             stale = set(previous) - set(sub_table_names)
-            existing_tables = set(sa.inspect(self._engine).get_table_names())
-            with self._engine.begin() as conn:
-                self._delete_dataset_rows(
-                    conn,
-                    dataset_name,
-                    list(stale) + sub_table_names,
-                    existing_tables,
-                )
-                for sub_table, df in sql_tables.items():
-                    self._append_to_shared_table(conn, sub_table, dataset_name, df)
+            table_names = [_data_table_name(sub) for sub in sub_table_names]
+            existing_tables = self._existing_tables(table_names)
+            try:
+                with self._engine.begin() as conn:
+                    self._delete_dataset_rows(
+                        conn,
+                        dataset_name,
+                        list(stale) + sub_table_names,
+                        existing_tables,
+                    )
+                    for sub_table, df in sql_tables.items():
+                        self._append_to_shared_table(
+                            conn, sub_table, dataset_name, df, existing_tables
+                        )
+            finally:
+                if not existing_tables.issuperset(table_names):
+                    # The write created (or tried to create) tables.
+                    self._invalidate_table_names()
         else:
             payload = data_source.to_json()
 
@@ -398,6 +570,7 @@ class DatabaseDataManager(DataManager):
                     creation_datetime=creation_dt,
                     payload=payload,
                     sub_tables=sub_tables_json,
+                    fingerprint=fingerprint,
                 )
             )
 
@@ -409,6 +582,7 @@ class DatabaseDataManager(DataManager):
             "creation_datetime": data_source.creation_datetime,
             "payload": payload,
             "sub_tables": sub_table_names if payload is None else None,
+            "fingerprint": fingerprint,
         }
         if payload is None:
             self.log(
@@ -427,27 +601,31 @@ class DatabaseDataManager(DataManager):
         sub_table: str,
         dataset_name: str,
         df: pd.DataFrame,
+        existing_tables: Optional[set[str]] = None,
     ) -> None:
         """Append ``df`` to the shared physical table for ``sub_table``.
 
         Prepends the (session_id, dataset_name) discriminator columns. The
         physical table is created on first write with column types inferred
-        by pandas — subsequent writes share that schema.
+        by pandas — subsequent writes share that schema — and gets a composite
+        index on the discriminator columns. Tables in ``existing_tables`` are
+        assumed to be indexed already. Rows are written by the manager's
+        :class:`BulkWriter`.
         """
         if SESSION_COL in df.columns or DATASET_COL in df.columns:
             raise ValueError(
                 f"DataFrame for sub-table '{sub_table}' must not contain reserved "
                 f"columns {SESSION_COL!r} / {DATASET_COL!r}."
             )
-        out = df.copy()
-        out.insert(0, DATASET_COL, dataset_name)
-        out.insert(0, SESSION_COL, self._session_id)
-        out.to_sql(
-            _data_table_name(sub_table),
+        table_name = _data_table_name(sub_table)
+        self._bulk_writer.append(
             conn,
-            if_exists="append",
-            index=False,
+            table_name,
+            df,
+            {SESSION_COL: self._session_id, DATASET_COL: dataset_name},
         )
+        if existing_tables is None or table_name not in existing_tables:
+            ensure_discriminator_index(conn, table_name, (SESSION_COL, DATASET_COL))
 
 
 def _decode_sub_tables(raw: Optional[str]) -> Optional[List[str]]:
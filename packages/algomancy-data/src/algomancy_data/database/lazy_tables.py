@@ -0,0 +1,227 @@
+"""Sub-tables of a database-backed DataSource, read on first access.
+
+With ``DatabaseDataManager(lazy_tables=True)`` a hydrated :class:`DataSource`
+gets a :class:`LazySqlTables` as its ``tables`` dict instead of every
+sub-table read up front. The mapping knows the sub-table names from the
+catalogue; ``ds.get_table(name)`` / ``ds.tables[name]`` reads, coerces and
+keeps that one sub-table. Anything that needs every table — ``items()``,
+``values()``, ``copy()``, ``to_json``, ``derive``, pickling — reads the
+missing ones first, so a lazy DataSource behaves like an eager one. The
+exception is ``DataSource.fingerprint()``: it returns the fingerprint the
+catalogue stored when the dataset was written (:attr:`LazySqlTables.fingerprint`)
+until a table is changed in memory.
+
+The manager's LRU then counts loaded sub-tables rather than datasets:
+:meth:`LazySqlTables.unload` drops a table read from the database (it is read
+again on next access), while tables assigned in memory are never unloaded.
+
+Tables are read by dataset name, so before the stored dataset is replaced the
+manager calls :meth:`LazySqlTables.mark_stale` with ``load_missing=True``: the
+tables not in memory yet are read first, and a holder (e.g. a running
+scenario) keeps using the version it started with. Once the dataset is
+deleted, reading a table that is not in memory raises instead of returning no
+rows.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Iterable, List, Optional
+
+import pandas as pd
+
+_UNLOADED = object()
+
+
+class LazySqlTables(dict):
+    """A ``dict`` of sub-table name to DataFrame that reads each on first access.
+
+    Args:
+        names: Names of the sub-tables stored in the database, in order.
+        load: Reads and returns one sub-table by name.
+        on_access: Called with ``(self, name)`` whenever a table read from the
+            database is returned, after it was read or when it is served from
+            memory; the manager uses it to keep its table LRU.
+        fingerprint: Fingerprint of the stored dataset, if the catalogue has
+            one.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        load: Callable[[str], pd.DataFrame],
+        on_access: Optional[Callable[["LazySqlTables", str], None]] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        super().__init__(dict.fromkeys(names, _UNLOADED))
+        self._load = load
+        self._on_access = on_access
+        self._fingerprint = fingerprint
+        # Tables read from the database (the only ones unload() may drop).
+        self._from_db: set[str] = set()
+        # Why reads are refused, once the stored dataset changed.
+        self._stale: Optional[str] = None
+        self._lock = threading.Lock()
+
+    # Lazy reads
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        df = super().__getitem__(name)
+        if df is _UNLOADED:
+            with self._lock:
+                # Single-flight: a concurrent reader may have loaded it.
+                df = super().__getitem__(name)
+                if df is _UNLOADED:
+                    if self._stale is not None:
+                        raise RuntimeError(
+                            f"Sub-table '{name}' cannot be read: {self._stale}"
+                        )
+                    df = self._load(name)
+                    super().__setitem__(name, df)
+                    self._from_db.add(name)
+        if name in self._from_db and self._on_access is not None:
+            self._on_access(self, name)
+        return df
+
+    def is_loaded(self, name: str) -> bool:
+        """True if ``name`` is in memory (read already, or assigned)."""
+        return super().get(name, _UNLOADED) is not _UNLOADED
+
+    def loaded_tables(self) -> List[str]:
+        """Names of the sub-tables currently in memory."""
+        return [name for name in self if self.is_loaded(name)]
+
+    def unload(self, name: str) -> bool:
+        """Drop ``name`` from memory if it was read from the database.
+
+        It is read again on next access. Returns whether it was dropped.
+        """
+        with self._lock:
+            if name not in self._from_db:
+                return False
+            self._from_db.discard(name)
+            super().__setitem__(name, _UNLOADED)
+            return True
+
+    def mark_stale(self, reason: str, load_missing: bool = False) -> None:
+        """Stop reading from the database, e.g. before the dataset is replaced.
+
+        With ``load_missing`` the tables not in memory are read first, while
+        their rows are still stored. Tables in memory stay and are no longer
+        unloaded; reading one that is not loaded (e.g. it failed to read)
+        raises ``RuntimeError`` mentioning ``reason``. Waits for a read in
+        progress to finish.
+        """
+        with self._lock:
+            if load_missing:
+                for name, df in list(super().items()):
+                    if df is not _UNLOADED:
+                        continue
+                    try:
+                        super().__setitem__(name, self._load(name))
+                    except Exception:
+                        continue
+            self._stale = reason
+            self._from_db.clear()
+
+    @property
+    def is_stale(self) -> bool:
+        return self._stale is not None
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """The stored dataset's fingerprint; None once a table was changed."""
+        return self._fingerprint
+
+    # Writes: assigned tables live in memory only
+    def __setitem__(self, name: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            self._from_db.discard(name)
+            self._fingerprint = None
+            super().__setitem__(name, df)
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            self._from_db.discard(name)
+            self._fingerprint = None
+            super().__delitem__(name)
+
+    def pop(self, name: str, *default):
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        df = self[name]
+        del self[name]
+        return df
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        name = next(reversed(list(self)))
+        return name, self.pop(name)
+
+    def setdefault(self, name: str, default=None):
+        if name in self:
+            return self[name]
+        self[name] = default
+        return default
+
+    def update(self, *args, **kwargs) -> None:
+        for name, df in dict(*args, **kwargs).items():
+            self[name] = df
+
+    def clear(self) -> None:
+        with self._lock:
+            self._from_db.clear()
+            self._fingerprint = None
+            super().clear()
+
+    # Whole-mapping views read every missing table first
+    def get(self, name: str, default=None):
+        return self[name] if name in self else default
+
+    def __iter__(self):
+        # Overridden so dict(self) and {**self} go through keys() / __getitem__
+        # instead of copying the placeholders.
+        return super().__iter__()
+
+    def items(self):
+        return [(name, self[name]) for name in self]
+
+    def values(self):
+        return [self[name] for name in self]
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazySqlTables):
+            other = other.copy()
+        return dict(self.items()) == other
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __ror__(self, other):
+        return other | self.copy()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        # Pickles (e.g. for the process executor) as a plain, complete dict.
+        return dict, (self.copy(),)
+
+    def __repr__(self) -> str:
+        loaded = set(self.loaded_tables())
+        parts = [
+            f"{name!r}: {'<loaded>' if name in loaded else '<not loaded>'}"
+            for name in self
+        ]
+        return f"LazySqlTables({{{', '.join(parts)}}})"
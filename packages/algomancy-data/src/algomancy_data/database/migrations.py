@@ -0,0 +1,222 @@
+"""Versioned schema migrations for the database backend.
+
+``create_all(checkfirst=True)`` creates missing tables but never changes an
+existing one, so a database created by an older version keeps its old shape.
+Each component (``"data"`` for algomancy-data, ``"scenario"`` for
+algomancy-scenario) keeps an ordered list of :class:`Migration` steps, and a
+:class:`MigrationRunner` applies the ones a database has not seen yet, in
+order, recording each in ``algomancy_schema_migrations``.
+
+A migration runs in the same transaction that records it, and must be
+idempotent: a fresh database gets the current shape from ``create_all``
+first, and two processes starting against the same database may both apply a
+step before one of them records it.
+
+The shared ``algomancy_ds__*`` / ``algomancy_result__*`` tables are created by
+pandas on first write, so their discriminator indexes are created right after
+(:func:`ensure_discriminator_index`); the migrations add them to tables that
+already existed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, List, Sequence
+
+import sqlalchemy as sa
+from algomancy_utils import Logger
+
+from .models import (
+    DATA_TABLE_PREFIX,
+    DATASET_COL,
+    SESSION_COL,
+    datasets_table,
+    schema_migrations_table,
+)
+
+#: Longest identifier every supported dialect accepts (Postgres: 63).
+_MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change of a component.
+
+    Args:
+        version: Position in the component's sequence, counting from 1.
+        name: Short description, stored with the applied version.
+        apply: Applies the change on the given connection. Must be idempotent.
+    """
+
+    version: int
+    name: str
+    apply: Callable[[sa.Connection], None]
+
+
+class MigrationRunner:
+    """Applies the pending migrations of one component to a database.
+
+    Args:
+        engine: The SQLAlchemy ``Engine`` to migrate.
+        component: Name under which the applied versions are recorded.
+        migrations: The component's migrations, versions ``1..n`` in order.
+        logger: Optional logger instance.
+    """
+
+    def __init__(
+        self,
+        engine: sa.Engine,
+        component: str,
+        migrations: Sequence[Migration],
+        logger: Logger | None = None,
+    ) -> None:
+        versions = [m.version for m in migrations]
+        if versions != list(range(1, len(migrations) + 1)):
+            raise ValueError(
+                f"Migrations of '{component}' must be numbered 1..n in order; "
+                f"got {versions}"
+            )
+        self._engine = engine
+        self._component = component
+        self._migrations = list(migrations)
+        self._logger = logger
+
+    @property
+    def head(self) -> int:
+        """The version the latest migration brings the schema to."""
+        return len(self._migrations)
+
+    def current_version(self) -> int:
+        """The highest version applied to the database (0 if none)."""
+        with self._engine.connect() as conn:
+            return self._current_version(conn)
+
+    def pending(self) -> List[Migration]:
+        """The migrations not applied to the database yet, in order."""
+        return self._migrations[self.current_version() :]
+
+    def run(self) -> List[Migration]:
+        """Apply every pending migration, one transaction each.
+
+        Returns the migrations this call applied.
+        """
+        schema_migrations_table.create(self._engine, checkfirst=True)
+        applied = []
+        for migration in self.pending():
+            try:
+                with self._engine.begin() as conn:
+                    migration.apply(conn)
+                    conn.execute(
+                        schema_migrations_table.insert().values(
+                            component=self._component,
+                            version=migration.version,
+                            name=migration.name,
+                            applied_at=datetime.now(timezone.utc),
+                        )
+                    )
+            except Exception:
+                # Another process applying the same step got there first.
+                if self.current_version() >= migration.version:
+                    continue
+                raise
+            applied.append(migration)
+            self._log(
+                f"Applied {self._component} schema migration "
+                f"{migration.version} ({migration.name})."
+            )
+        return applied
+
+    def _current_version(self, conn: sa.Connection) -> int:
+        if not sa.inspect(conn).has_table(schema_migrations_table.name):
+            return 0
+        version = conn.execute(
+            sa.select(sa.func.max(schema_migrations_table.c.version)).where(
+                schema_migrations_table.c.component == self._component
+            )
+        ).scalar()
+        return version or 0
+
+    def _log(self, msg: str) -> None:
+        if self._logger:
+            self._logger.log(msg)
+
+
+# ---------------------------------------------------------------------------
+# Helpers for migrations and the shared tables
+# ---------------------------------------------------------------------------
+
+
+def discriminator_index_name(table_name: str) -> str:
+    """Name of the discriminator index of ``table_name``, within 63 characters."""
+    name = f"ix_{table_name}__discriminators"
+    if len(name) <= _MAX_IDENTIFIER_LENGTH:
+        return name
+    digest = hashlib.sha1(table_name.encode()).hexdigest()[:10]
+    return f"{name[: _MAX_IDENTIFIER_LENGTH - len(digest) - 1]}_{digest}"
+
+
+def ensure_discriminator_index(
+    conn: sa.Connection, table_name: str, columns: Sequence[str]
+) -> None:
+    """Create the composite index on ``columns`` of ``table_name`` if missing."""
+    table = sa.Table(
+        table_name, sa.MetaData(), *(sa.Column(col, sa.String) for col in columns)
+    )
+    sa.Index(
+        discriminator_index_name(table_name), *(table.c[col] for col in columns)
+    ).create(conn, checkfirst=True)
+
+
+def index_shared_tables(
+    conn: sa.Connection, prefix: str, columns: Sequence[str]
+) -> None:
+    """Add the discriminator index to every existing table named ``prefix*``."""
+    for table_name in sa.inspect(conn).get_table_names():
+        if table_name.startswith(prefix):
+            ensure_discriminator_index(conn, table_name, columns)
+
+
+def add_column_if_missing(
+    conn: sa.Connection, table: sa.Table, column: str, ddl_type: str
+) -> None:
+    """``ALTER TABLE ... ADD COLUMN`` unless ``table`` already has ``column``."""
+    existing = {col["name"] for col in sa.inspect(conn).get_columns(table.name)}
+    if column not in existing:
+        conn.execute(
+            sa.text(f"ALTER TABLE {table.name} ADD COLUMN {column} {ddl_type}")
+        )
+
+
+def create_indexes(conn: sa.Connection, table: sa.Table) -> None:
+    """Create the indexes declared on ``table`` that the database lacks."""
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+# ---------------------------------------------------------------------------
+# algomancy-data migrations
+# ---------------------------------------------------------------------------
+
+DATA_MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "index shared data table discriminators",
+        lambda conn: index_shared_tables(
+            conn, DATA_TABLE_PREFIX, (SESSION_COL, DATASET_COL)
+        ),
+    ),
+    Migration(
+        2,
+        "add algomancy_datasets.fingerprint",
+        lambda conn: add_column_if_missing(
+            conn, datasets_table, "fingerprint", "VARCHAR"
+        ),
+    ),
+]
+
+
+def migrate_data_schema(engine: sa.Engine, logger: Logger | None = None) -> None:
+    """Bring algomancy-data's tables in ``engine`` to the current version."""
+    MigrationRunner(engine, "data", DATA_MIGRATIONS, logger).run()
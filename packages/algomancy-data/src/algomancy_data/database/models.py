@@ -1,9 +1,11 @@
 """Fixed SQLAlchemy table definitions for algomancy-data's database backend.
 
-Only the metadata catalogue lives here. Data rows live in shared per-sub-table
-tables (one physical table per DataSource sub-table *name*, across all sessions
-and datasets); those tables are created lazily by ``DatabaseDataManager`` on
-first write because pandas infers the column types from the DataFrame.
+Only the metadata catalogue and the schema migration log live here. Data rows
+live in shared per-sub-table tables (one physical table per DataSource
+sub-table *name*, across all sessions and datasets); those tables are created
+lazily by ``DatabaseDataManager`` on first write because pandas infers the
+column types from the DataFrame. Each gets a composite index on its
+discriminator columns when it is created.
 """
 
 import sqlalchemy as sa
@@ -33,4 +35,19 @@ datasets_table = sa.Table(
     # JSON array of sub-table names this dataset writes to. NULL when the
     # JSON-blob path is used.
     sa.Column("sub_tables", sa.Text, nullable=True),
+    # DataSource.fingerprint() of the data as written, so a lazily hydrated
+    # dataset has one without reading its sub-tables. NULL on the JSON-blob
+    # path and for rows written before the column existed.
+    sa.Column("fingerprint", sa.String, nullable=True),
+)
+
+#: Applied schema migrations (see ``MigrationRunner``), one row per migration.
+#: The highest ``version`` of a ``component`` is that component's schema version.
+schema_migrations_table = sa.Table(
+    "algomancy_schema_migrations",
+    metadata,
+    sa.Column("component", sa.String, primary_key=True),
+    sa.Column("version", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String, nullable=False),
+    sa.Column("applied_at", sa.DateTime, nullable=True),
 )
@@ -1,7 +1,10 @@
+import json
 import os
 import shutil
+import threading
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional, Tuple, TypeVar
 
 import pandas as pd
@@ -12,6 +15,14 @@ from .etl import ETLFactory, ETLConstructionError, ETLResult
 from .schema import Schema, FileExtension
 from .validator import ValidationSequence
 from .file import File, CSVFile, JSONFile, XLSXFile
+from .parquet import (
+    PARQUET_SUFFIX,
+    is_parquet_datasource,
+    read_parquet_datasource,
+    read_parquet_metadata,
+    write_parquet_datasource,
+)
+from .snapshot import ETL_SNAPSHOT_FOLDER, ETLSnapshotCache
 
 E = TypeVar("E", bound=ETLFactory)
 
@@ -21,6 +32,13 @@ E = TypeVar("E", bound=ETLFactory)
 # ``from_json`` will fail on every restart.
 _RESERVED_SESSION_FILENAMES = frozenset({"meta.json", "scenarios.json"})
 
+#: Formats a ``StatefulDataManager`` can store data sources in.
+SUPPORTED_SAVE_TYPES = ("json", "parquet")
+
+
+class DataLoadError(Exception):
+    """A dataset listed by ``get_data_keys`` failed to load when requested."""
+
 
 class DataManager(ABC):
     """
@@ -65,6 +83,14 @@ class DataManager(ABC):
     def set_data(self, data_key: str, data: BASEDATASOURCE) -> None:
         self._data[data_key] = data
 
+    def get_data_classification(self, data_key: str) -> DataClassification | None:
+        """The classification of ``data_key``, or None if it is unknown.
+
+        Unlike ``get_data`` this never loads a dataset that is not in memory.
+        """
+        data = self._data.get(data_key)
+        return data._ds_type if data is not None else None
+
     # Derive/Delete
     def derive_data(self, existing_key: str, derived_key: str) -> None:
         assert existing_key in self.get_data_keys(), f"Data '{existing_key}' not found."
@@ -228,6 +254,38 @@ class StatelessDataManager(DataManager):
 
 
 class StatefulDataManager(DataManager):
+    """
+    Keeps data sources in a data folder and in memory.
+
+    By default ``startup()`` loads every stored data source and runs the ETL
+    pipeline on every other directory of the data folder before it returns.
+    With ``lazy_loading=True`` it only catalogues the folder: the dataset
+    names are known immediately and each dataset is loaded the first time
+    ``get_data`` asks for it. ``warmup_workers`` then loads the catalogued
+    datasets in the background on that many threads, so they are usually
+    ready before they are requested.
+
+    Args:
+        etl_factory: ETL factory class used for directories of input files.
+        schemas: List of Schema instances.
+        data_folder: Folder the data sources are stored in.
+        save_type: Storage format, one of ``SUPPORTED_SAVE_TYPES``.
+        data_object_type: ``BaseDataSource`` subclass of the stored data.
+        logger: Optional logger.
+        lazy_loading: Catalogue the data folder at startup and load each
+            dataset on first access.
+        warmup_workers: With ``lazy_loading``, the number of background
+            threads that load the catalogued datasets after startup. ``0``
+            (the default) loads only on access.
+        etl_snapshots: Keep the ETL result of every input directory as a
+            snapshot in ``<data_folder>/.etl_snapshots`` and load it instead
+            of running ETL while the directory is unchanged (see
+            ``algomancy_data.snapshot``). Requires pyarrow.
+        snapshot_fingerprint: How input directories are compared with their
+            snapshot: ``"stat"`` (file names, sizes and modification times)
+            or ``"content"`` (file contents).
+    """
+
     def __init__(
         self,
         etl_factory: type[ETLFactory],
@@ -236,6 +294,10 @@ class StatefulDataManager(DataManager):
         save_type: str,
         data_object_type: type[BASEDATASOURCE],
         logger: Logger | None = None,
+        lazy_loading: bool = False,
+        warmup_workers: int = 0,
+        etl_snapshots: bool = False,
+        snapshot_fingerprint: str = "stat",
     ):
         warnings.warn(
             "StatefulDataManager is deprecated and will be removed in a future release. "
@@ -245,9 +307,36 @@ class StatefulDataManager(DataManager):
             stacklevel=2,
         )
         super().__init__(etl_factory, schemas, save_type, data_object_type, logger)
+        if not isinstance(warmup_workers, int) or warmup_workers < 0:
+            raise ValueError(
+                f"warmup_workers must be a non-negative integer; got {warmup_workers!r}"
+            )
         self._data_folder = data_folder
         self._data: Dict[str, BASEDATASOURCE] = {}  # Loading
         self.startup_errors: List[Tuple[str, Exception]] = []
+        self._lazy_loading = lazy_loading
+        self._warmup_workers = warmup_workers
+        # Catalogue (lazy loading): dataset key → (kind, item, path) of the
+        # data folder entry it is loaded from; dropped once loaded.
+        self._catalogue: Dict[str, Tuple[str, str, str]] = {}
+        # Classifications of catalogued datasets read from their metadata.
+        self._catalogue_types: Dict[str, DataClassification] = {}
+        self._catalogue_lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        # Deferred loads that failed: dataset key → the exception raised.
+        self._load_failures: Dict[str, Exception] = {}
+        self._warmup_futures: List[Future] = []
+        self._snapshots: ETLSnapshotCache | None = None
+        if etl_snapshots:
+            self._snapshots = ETLSnapshotCache(
+                os.path.join(data_folder, ETL_SNAPSHOT_FOLDER),
+                fingerprint=snapshot_fingerprint,
+                logger=logger,
+            )
+
+    @property
+    def lazy_loading(self) -> bool:
+        return self._lazy_loading
 
     def startup(self) -> None:
         """Load persisted data sources from the data folder.
@@ -258,11 +347,25 @@ class StatefulDataManager(DataManager):
         Other items continue to load. Failures are surfaced through the
         configured logger; ``self.startup_errors`` collects them so callers
         can inspect what happened.
+
+        With ``lazy_loading`` the folder is only catalogued here; failures of
+        the later loads are logged and collected in ``startup_errors`` the
+        same way, the failed dataset disappears from ``get_data_keys`` and
+        ``get_data`` raises ``DataLoadError`` for it.
         """
         self.startup_errors: List[Tuple[str, Exception]] = []
         try:
-            self._load_data_from_data_folder()
-            self.log(f"Data folder '{self._data_folder}' loaded.")
+            if self._lazy_loading:
+                self._catalogue_data_folder()
+                self.log(
+                    f"Data folder '{self._data_folder}' catalogued: "
+                    f"{len(self._catalogue)} datasets."
+                )
+                if self._warmup_workers:
+                    self._start_warmup()
+            else:
+                self._load_data_from_data_folder()
+                self.log(f"Data folder '{self._data_folder}' loaded.")
         except Exception as exc:
             # Hitting this branch indicates a defect in the loader itself;
             # individual file failures are handled inside the loop.
@@ -278,33 +381,55 @@ class StatefulDataManager(DataManager):
 
         # Retrieve files from directory
         file_path = os.path.join(root, file_name)
+        self.add_data_source(self._read_data_source(file_path))
 
+    def _read_data_source(self, file_path: str) -> BASEDATASOURCE:
         if self._save_type == "json":
             # Read the file content as text
             with open(file_path, "r", encoding="utf-8") as f:
                 json_string = f.read()
-            data_source = self.data_object_type.from_json(json_string)
+            return self.data_object_type.from_json(json_string)
+        elif self._save_type == "parquet":
+            # A directory of per-table parquet files plus a metadata sidecar
+            return read_parquet_datasource(self.data_object_type, file_path)
         else:
             raise Exception(f"Unsupported save type: {self._save_type}")
 
-        self.add_data_source(data_source)
-
     def _load_data_from_data_folder(self) -> None:
         """
-        Loads all parquet files from the data folder and creates DataSource objects.
-        Each parquet file is expected to be a serialized DataSource.
+        Loads all stored data sources (``<name>.json`` files or ``<name>.parquet``
+        directories, depending on the save type) from the data folder, and runs
+        the ETL pipeline on every other directory.
         """
-        import os
+        for kind, item, item_path in self._scan_data_folder():
+            pre_keys = set(self._data.keys())
+            try:
+                if kind == "etl":
+                    self.load_data_from_dir(item)
+                else:
+                    self.load_data_from_file(item)
+            except Exception as exc:
+                # Roll back any partial keys that this load added so the
+                # manager is never left in an undefined state.
+                for added in set(self._data.keys()) - pre_keys:
+                    del self._data[added]
+                self._record_load_failure(kind, item_path, exc)
+
+    def _scan_data_folder(self) -> List[Tuple[str, str, str]]:
+        """
+        The loadable entries of the data folder as ``(kind, item, path)``.
 
+        ``kind`` is ``"file"`` for a stored ``.json`` file, ``"parquet"`` for a
+        stored parquet directory and ``"etl"`` for a directory of input files.
+        Entries that do not match the save type are skipped with a warning.
+        """
         # Check if the folder exists
         if not os.path.exists(self._data_folder):
             self.logger.warning(f"Data folder '{self._data_folder}' does not exist.")
-            return
+            return []
 
-        # List all files in the data folder
-        items = os.listdir(self._data_folder)
-
-        for item in items:
+        entries: List[Tuple[str, str, str]] = []
+        for item in os.listdir(self._data_folder):
             item_path = os.path.join(self._data_folder, item)
 
             # If it's a file, try to load it as a file of the appropriate type
@@ -321,37 +446,179 @@ class StatefulDataManager(DataManager):
                             f"Skipping file '{item_path}' because it is not a {self._save_type} file."
                         )
                     continue
+                entries.append(("file", item, item_path))
 
-                pre_keys = set(self._data.keys())
-                try:
-                    self.load_data_from_file(item)
-                except Exception as exc:
-                    # Roll back any partial keys that this load added so the
-                    # manager is never left in an undefined state.
-                    for added in set(self._data.keys()) - pre_keys:
-                        del self._data[added]
+            # A data source stored in parquet format is a directory as well;
+            # never feed those to the ETL pipeline.
+            elif is_parquet_datasource(item_path):
+                if self._save_type != "parquet":
                     if self.logger:
-                        self.logger.error(
-                            f"Failed to load file '{item_path}' as a DataSource"
+                        self.logger.warning(
+                            f"Skipping '{item_path}' because it is not a {self._save_type} file."
                         )
-                        self.logger.log_traceback(exc)
-                    self.startup_errors.append((item_path, exc))
+                    continue
+                entries.append(("parquet", item, item_path))
 
-            # If it's a directory, run ETL
+            # If it's a directory, run ETL; the snapshot folder holds
+            # cached ETL results, not input files.
+            elif item == ETL_SNAPSHOT_FOLDER:
+                continue
             elif os.path.isdir(item_path):
-                pre_keys = set(self._data.keys())
+                entries.append(("etl", item, item_path))
+        return entries
+
+    def _record_load_failure(self, kind: str, item_path: str, exc: Exception) -> None:
+        if self.logger:
+            if kind == "file":
+                self.logger.error(f"Failed to load file '{item_path}' as a DataSource")
+                self.logger.log_traceback(exc)
+            elif kind == "parquet":
+                self.logger.error(
+                    f"Failed to load directory '{item_path}' as a DataSource"
+                )
+                self.logger.log_traceback(exc)
+            else:
+                self.logger.error(
+                    f"Failed to load directory '{item_path}' as a DataSource: {exc}"
+                )
+                if not isinstance(exc, ETLConstructionError):
+                    self.logger.log_traceback(exc)
+        self.startup_errors.append((item_path, exc))
+
+    # Lazy loading
+    def _catalogue_data_folder(self) -> None:
+        """Record the datasets of the data folder without loading them.
+
+        Stored files are keyed by their file name without extension; stored
+        parquet directories by the name in their metadata sidecar and ETL
+        directories by the directory name, as in an eager load.
+        """
+        catalogue: Dict[str, Tuple[str, str, str]] = {}
+        for kind, item, item_path in self._scan_data_folder():
+            if kind == "etl":
+                key = item
+            elif kind == "parquet":
                 try:
-                    self.load_data_from_dir(item)
-                except Exception as exc:
-                    for added in set(self._data.keys()) - pre_keys:
-                        del self._data[added]
-                    if self.logger:
-                        self.logger.error(
-                            f"Failed to load directory '{item_path}' as a DataSource: {exc}"
-                        )
-                        if not isinstance(exc, ETLConstructionError):
-                            self.logger.log_traceback(exc)
-                    self.startup_errors.append((item_path, exc))
+                    key = str(read_parquet_metadata(item_path)["name"])
+                except Exception:
+                    # An unreadable sidecar fails (and is reported) on load.
+                    key = item[: -len(PARQUET_SUFFIX)]
+            else:
+                key = item[: -len(f".{self._save_type}")]
+            catalogue[key] = (kind, item, item_path)
+        with self._catalogue_lock:
+            self._catalogue = catalogue
+            self._catalogue_types = {}
+            self._load_locks = {}
+            self._load_failures = {}
+
+    def _load_lock(self, data_key: str) -> threading.Lock:
+        with self._catalogue_lock:
+            return self._load_locks.setdefault(data_key, threading.Lock())
+
+    def _load_catalogued(self, data_key: str) -> None:
+        """Load one catalogued dataset; the caller holds its load lock."""
+        kind, item, item_path = self._catalogue[data_key]
+        try:
+            if kind == "etl":
+                self.load_data_from_dir(item)
+            else:
+                data_source = self._read_data_source(item_path)
+                if self.logger and str(data_source.name) != data_key:
+                    self.logger.warning(
+                        f"DataSource '{data_source.name}' in '{item_path}' is "
+                        f"available as '{data_key}'."
+                    )
+                self._data[data_key] = data_source
+                self.log(f"Loaded DataSource '{data_key}' from {self._save_type} file.")
+        except Exception as exc:
+            self._record_load_failure(kind, item_path, exc)
+            self._load_failures[data_key] = exc
+        finally:
+            with self._catalogue_lock:
+                self._catalogue.pop(data_key, None)
+                self._catalogue_types.pop(data_key, None)
+
+    def _start_warmup(self) -> None:
+        keys = list(self._catalogue)
+        if not keys:
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=self._warmup_workers, thread_name_prefix="algomancy-warmup"
+        )
+        self._warmup_futures = [pool.submit(self.get_data, key) for key in keys]
+        # Queued loads still run; the threads exit once the queue is drained.
+        pool.shutdown(wait=False)
+
+    def wait_for_warmup(self, timeout: float | None = None) -> bool:
+        """Block until the background warm-up has loaded every dataset.
+
+        Returns ``False`` if ``timeout`` seconds passed first.
+        """
+        _, pending = wait(self._warmup_futures, timeout=timeout)
+        return not pending
+
+    def is_loaded(self, data_key: str) -> bool:
+        """True if ``data_key`` is in memory rather than only catalogued."""
+        return data_key in self._data
+
+    def get_data_keys(self) -> List[str]:
+        keys = list(self._data)
+        with self._catalogue_lock:
+            keys.extend(key for key in self._catalogue if key not in self._data)
+        return keys
+
+    def get_data_classification(self, data_key: str) -> DataClassification | None:
+        """The classification of ``data_key``, without loading it.
+
+        A catalogued ETL directory is master data; a stored data source is
+        classified by the type in its metadata, which is read once. None if
+        the dataset is unknown, failed to load or has unreadable metadata.
+        """
+        if data_key in self._data:
+            return super().get_data_classification(data_key)
+        with self._catalogue_lock:
+            entry = self._catalogue.get(data_key)
+            known = self._catalogue_types.get(data_key)
+        if entry is None or known is not None:
+            return known
+        kind, _, item_path = entry
+        try:
+            if kind == "etl":
+                ds_type = DataClassification.MASTER_DATA
+            elif kind == "parquet":
+                ds_type = DataClassification(read_parquet_metadata(item_path)["type"])
+            else:
+                with open(item_path, "r", encoding="utf-8") as f:
+                    ds_type = DataClassification(json.load(f)["metadata"]["type"])
+        except Exception:
+            # Reported by the load, if it fails there as well.
+            return None
+        with self._catalogue_lock:
+            if data_key in self._catalogue:
+                self._catalogue_types[data_key] = ds_type
+        return ds_type
+
+    def get_data(self, data_key: str) -> BASEDATASOURCE | None:
+        """Return the dataset ``data_key``, loading it if only catalogued.
+
+        Raises:
+            DataLoadError: If its deferred load failed (see ``startup_errors``).
+        """
+        data = self._data.get(data_key)
+        if data is None and data_key in self._catalogue:
+            # One load per dataset: concurrent callers (and the warm-up) wait
+            # for the load in progress instead of starting their own.
+            with self._load_lock(data_key):
+                if data_key in self._catalogue:
+                    self._load_catalogued(data_key)
+            data = self._data.get(data_key)
+        if data is None and data_key in self._load_failures:
+            raise DataLoadError(
+                f"Dataset '{data_key}' could not be loaded: "
+                f"{self._load_failures[data_key]}"
+            ) from self._load_failures[data_key]
+        return data
 
     def load_data_from_dir(self, directory: str, root: str | None = None) -> None:
         if root is None:
@@ -360,6 +627,21 @@ class StatefulDataManager(DataManager):
         # Retrieve files from directory
         dataset_name = directory
         dataset_path = os.path.join(root, directory)
+
+        # Reuse the snapshot of an earlier run while the inputs are unchanged
+        snapshot_key = None
+        if self._snapshots is not None:
+            snapshot_key = self._snapshots.key(
+                dataset_path, self._etl_factory, self._schemas, self.data_object_type
+            )
+            data_source = self._snapshots.load(
+                dataset_name, snapshot_key, self.data_object_type
+            )
+            if data_source is not None:
+                self._data[dataset_name] = data_source
+                self.log(f"Loaded dataset '{dataset_name}' from its ETL snapshot.")
+                return
+
         files = os.listdir(dataset_path)
 
         # Compile the file-items
@@ -376,6 +658,15 @@ class StatefulDataManager(DataManager):
                 f"ETL for dataset '{dataset_name}' failed: "
                 f"{result.validation_result.counts_by_severity if result.validation_result else 'unknown'}"
             )
+        if snapshot_key is not None:
+            try:
+                self._snapshots.store(dataset_name, snapshot_key, result.datasource)
+            except Exception as exc:
+                # The dataset is loaded; only the next startup misses the cache.
+                if self.logger:
+                    self.logger.warning(
+                        f"Could not store ETL snapshot of '{dataset_name}': {exc}"
+                    )
 
     def delete_data(
         self, data_key: str, prevent_masterdata_removal: bool = False
@@ -383,15 +674,29 @@ class StatefulDataManager(DataManager):
         assert data_key in self.get_data_keys(), f"Data '{data_key}' not found."
         # note: responsibility for checking scenario usage resides in callers
 
-        # Delete files if applicable
-        if self._data[data_key].is_master_data():
-            directory = os.path.join(self._data_folder, data_key)
-            if os.path.isdir(directory):
-                shutil.rmtree(directory)
-            elif os.path.isfile(directory):
-                os.remove(directory)
+        # A catalogued dataset is loaded first to learn its classification
+        try:
+            data = self.get_data(data_key)
+        except DataLoadError:
+            data = None
+        with self._load_lock(data_key):
+            with self._catalogue_lock:
+                self._catalogue.pop(data_key, None)
+                self._catalogue_types.pop(data_key, None)
+            self._load_failures.pop(data_key, None)
 
-        del self._data[data_key]
+        # Delete files if applicable
+        if data is not None and data.is_master_data():
+            for name in (data_key, f"{data_key}.{self._save_type}"):
+                path = os.path.join(self._data_folder, name)
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.isfile(path):
+                    os.remove(path)
+            if self._snapshots is not None:
+                self._snapshots.discard(data_key)
+
+        self._data.pop(data_key, None)
         self.log(f"Data '{data_key}' deleted.")
 
     # Store new dataset to data folder (as CSVs) and keep in memory
@@ -447,3 +752,31 @@ class StatefulDataManager(DataManager):
         # store bytes in file
         with open(file_name, "wb") as f:
             f.write(json_content.encode("utf-8"))
+
+    def store_data_source_as_parquet(
+        self, dataset_name: str, allow_overwrite: bool = False
+    ) -> None:
+        """Store a data source as ``<dataset_name>.parquet/`` in the data folder.
+
+        Each table becomes a parquet file; see ``algomancy_data.parquet``.
+        Requires pyarrow (``algomancy-data[parquet]``).
+        """
+        path = os.path.join(self._data_folder, f"{dataset_name}{PARQUET_SUFFIX}")
+        if os.path.exists(path) and not allow_overwrite:
+            raise Exception(
+                f"Directory '{dataset_name}{PARQUET_SUFFIX}' already exists in '{self._data_folder}'"
+            )
+
+        data_source = self.get_data(dataset_name)
+        assert data_source is not None, f"Data source '{dataset_name}' not found."
+
+        write_parquet_datasource(data_source, path)
+
+    def store_data_source(self, dataset_name: str, allow_overwrite: bool = False):
+        """Store a data source in the data folder in the configured save type."""
+        if self._save_type == "json":
+            self.store_data_source_as_json(dataset_name, allow_overwrite)
+        elif self._save_type == "parquet":
+            self.store_data_source_as_parquet(dataset_name, allow_overwrite)
+        else:
+            raise Exception(f"Unsupported save type: {self._save_type}")
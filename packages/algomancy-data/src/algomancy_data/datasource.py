@@ -4,8 +4,10 @@ base class for data sources as well as concrete implementations with
 serialization and deserialization functionality.
 """
 
+import hashlib
 import json
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import StrEnum, auto
@@ -104,8 +106,7 @@ class BaseDataSource(ABC):
             Type of the calling class: A new instance of the same class with the
             derived data and updated key.
         """
-        # Create a deepcopy via json roundtrip
-        new_data = type(self).from_json(self.to_json())
+        new_data = self._copy()
 
         # Update registration fields
         new_data._set_name(new_data_key)
@@ -117,6 +118,27 @@ class BaseDataSource(ABC):
 
         return new_data
 
+    def _copy(self) -> "BaseDataSource":
+        """
+        Returns an independent copy with the same id and name, used by ``derive``.
+
+        The default makes a deep copy through a ``to_json`` / ``from_json``
+        round trip. Subclasses that can copy their state directly should
+        override this; it is much faster for large data.
+        """
+        return type(self).from_json(self.to_json())
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hex digest that changes whenever the data changes.
+
+        Used to recognise runs on identical input (see the scenario run cache).
+        The default hashes ``to_json()``, which for most subclasses includes
+        the id and name, so only the very same data source matches itself.
+        Subclasses should override this to hash their content alone.
+        """
+        return hashlib.sha256(self.to_json().encode("utf-8")).hexdigest()
+
     @abstractmethod
     def to_json(self) -> str:
         raise NotImplementedError("Abstract method")
@@ -157,8 +179,20 @@ class BaseDataSource(ABC):
 BASEDATASOURCE = TypeVar("BASEDATASOURCE", bound=BaseDataSource)
 
 
+def _copy_on_write_enabled() -> bool:
+    """True if pandas copy-on-write is active (always from pandas 3, opt-in before)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
 # todo: consider excluding from package
 class DataSource(BaseDataSource):
+    # Bumped by add_table; part of the key of the memoised fingerprint.
+    _table_version = 0
+    # (table version, tables, weak references to the DataFrames, digest)
+    _fingerprint_memo = None
+
     def __init__(
         self,
         ds_type: DataClassification,
@@ -312,9 +346,47 @@ class DataSource(BaseDataSource):
 
         return ds
 
+    def _copy(self) -> "DataSource":
+        """
+        Copies the tables without serialising them, so dtypes stay exact.
+
+        With pandas copy-on-write active, each table is a lazy copy that shares
+        memory with the original until either side modifies it; otherwise each
+        table is copied. Subclasses that override ``to_json`` / ``from_json``
+        may keep state outside ``tables`` and fall back to the JSON round trip.
+        """
+        cls = type(self)
+        if (
+            cls.to_json is not DataSource.to_json
+            or cls.from_json.__func__ is not DataSource.from_json.__func__
+        ):
+            return super()._copy()
+
+        new_data = cls(
+            ds_type=self._ds_type,
+            name=self._name,
+            ds_id=self._id,
+            creation_datetime=self._creation_datetime,
+        )
+        deep = not _copy_on_write_enabled()
+        for table_name, df in self.tables.items():
+            new_data.add_table(table_name, df.copy(deep=deep))
+        # Same content, so a derived copy need not hash its tables again.
+        digest = self._memoised_fingerprint()
+        if digest is not None:
+            new_data._memoise_fingerprint(new_data._table_version, digest)
+        return new_data
+
+    def __getstate__(self):
+        # Weak references do not pickle, and a copy has tables of its own.
+        state = self.__dict__.copy()
+        state.pop("_fingerprint_memo", None)
+        return state
+
     def add_table(self, name: str, df: pd.DataFrame, logger=None):
         if logger:
             logger.log(f"Adding table '{name}' to DataSource")
+        self._table_version += 1
         self.tables[name] = df
 
     def get_table(self, name: str) -> pd.DataFrame:
@@ -323,6 +395,73 @@ class DataSource(BaseDataSource):
     def list_tables(self):
         return list(self.tables.keys())
 
+    def fingerprint(self) -> str:
+        """
+        Content hash of the tables: names, columns, dtypes, index and values.
+
+        Ignores id, name and creation time, so a derived copy with unchanged
+        tables has the same fingerprint as its source. Tables read lazily from
+        the database (``LazySqlTables``) answer with the fingerprint stored
+        when the dataset was written, without reading them.
+
+        The digest is memoised until ``add_table`` is called or a table in
+        ``tables`` is replaced; after changing a DataFrame in place, add it
+        again with ``add_table``.
+        """
+        stored = getattr(self.tables, "fingerprint", None)
+        if stored is not None:
+            return stored
+        memoised = self._memoised_fingerprint()
+        if memoised is not None:
+            return memoised
+        version = self._table_version
+        digest = hashlib.sha256()
+        for name in sorted(self.tables):
+            df = self.tables[name]
+            digest.update(name.encode("utf-8"))
+            digest.update(
+                json.dumps([[str(c), str(df[c].dtype)] for c in df.columns]).encode(
+                    "utf-8"
+                )
+            )
+            try:
+                values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+                digest.update(values.tobytes())
+            except TypeError:
+                # Unhashable cells (lists, dicts): fall back to a text rendering.
+                digest.update(df.to_json(orient="split").encode("utf-8"))
+        hexdigest = digest.hexdigest()
+        self._memoise_fingerprint(version, hexdigest)
+        return hexdigest
+
+    def _memoised_fingerprint(self) -> str | None:
+        """The memoised digest, if no table was added or replaced since."""
+        memo = self._fingerprint_memo
+        if memo is None:
+            return None
+        version, tables, refs, digest = memo
+        if (
+            version != self._table_version
+            or tables is not self.tables
+            or refs.keys() != self.tables.keys()
+        ):
+            return None
+        # dict.get: a LazySqlTables would read a table it has unloaded.
+        if any(ref() is not dict.get(tables, name) for name, ref in refs.items()):
+            return None
+        return digest
+
+    def _memoise_fingerprint(self, version: int, digest: str) -> None:
+        if version != self._table_version:
+            # A table was added while hashing.
+            return
+        try:
+            refs = {name: weakref.ref(df) for name, df in dict.items(self.tables)}
+        except TypeError:
+            # Not DataFrames (or unloaded): hashed again next time.
+            return
+        self._fingerprint_memo = (version, self.tables, refs, digest)
+
     def to_sql_tables(self) -> dict[str, pd.DataFrame]:
         return self.tables
 
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional
 
 from algomancy_utils import Logger
+from algomancy_utils.metrics import REGISTRY
 
 from algomancy_data.transformer import (
     NoopTransformer,
@@ -53,6 +54,12 @@ _EXPECTED_ETL_EXCEPTIONS: tuple = (
     ValidationError,
 )
 
+_STAGE_DURATION = REGISTRY.histogram(
+    "algomancy_etl_stage_duration_seconds",
+    "Duration of ETL pipeline stages.",
+    ["stage"],
+)
+
 
 @dataclass
 class ETLResult:
@@ -144,7 +151,8 @@ class ETLPipeline:
         """
         # ---- Extraction (expected failures: missing/malformed files) ----
         try:
-            raw_data = self.extraction_sequence.data
+            with _STAGE_DURATION.time(stage="extract"):
+                raw_data = self.extraction_sequence.data
         except _EXPECTED_ETL_EXCEPTIONS as exc:
             if self.logger:
                 self.logger.error(f"Extraction failed: {exc}")
@@ -164,9 +172,10 @@ class ETLPipeline:
         )
 
         # ---- Validation (never raises; surfaces via ValidationResult) ----
-        validation_result: ValidationResult = self.validation_sequence.run_validation(
-            raw_data
-        )
+        with _STAGE_DURATION.time(stage="validate"):
+            validation_result: ValidationResult = (
+                self.validation_sequence.run_validation(raw_data)
+            )
         if conversion_messages:
             validation_result = _augment_with_messages(
                 validation_result, conversion_messages
@@ -186,18 +195,20 @@ class ETLPipeline:
 
         # ---- Transformation / Load -----------------------------------
         # Programmer errors in user-supplied transformers/loaders propagate.
-        transformed_data = self.transformation_sequence.run_transformation(raw_data)
+        with _STAGE_DURATION.time(stage="transform"):
+            transformed_data = self.transformation_sequence.run_transformation(raw_data)
         transform_messages = self.transformation_sequence.collect_messages()
         if transform_messages:
             validation_result = _augment_with_messages(
                 validation_result, transform_messages
             )
-        datasource = self.loader.load(
-            name=self.destination_name,
-            data=transformed_data,
-            validation_messages=validation_result.messages,
-            ds_type=DataClassification.MASTER_DATA,
-        )
+        with _STAGE_DURATION.time(stage="load"):
+            datasource = self.loader.load(
+                name=self.destination_name,
+                data=transformed_data,
+                validation_messages=validation_result.messages,
+                ds_type=DataClassification.MASTER_DATA,
+            )
 
         if self.logger:
             self.logger.log("ETL job completed.")
@@ -289,8 +300,21 @@ class ETLFactory(ABC):
 
     Because the factory carries no instance state, it is always passed
     and used as a *class* (``type[ETLFactory]``), never instantiated.
+
+    Set ``extraction_executor`` to ``"thread"`` or ``"process"`` to parse
+    the files of a dataset concurrently (see ``ExtractionSequence``);
+    ``extraction_max_workers`` caps the pool size. Left at ``None``, the
+    extraction sequence runs however ``create_extraction_sequence`` built it.
+
+    ``version`` is part of the key of cached ETL snapshots (see
+    ``algomancy_data.snapshot``); bump it when the pipeline produces different
+    data for the same input files, so stale snapshots are not reused.
     """
 
+    extraction_executor: Optional[str] = None
+    extraction_max_workers: Optional[int] = None
+    version: str = "1"
+
     @classmethod
     @abstractmethod
     def create_extraction_sequence(
@@ -338,6 +362,8 @@ class ETLFactory(ABC):
             ETLPipeline ready to run.
         """
         e_seq = cls.create_extraction_sequence(files, schemas, logger)
+        if cls.extraction_executor is not None:
+            e_seq.set_executor(cls.extraction_executor, cls.extraction_max_workers)
         v_seq = cls.create_validation_sequence(schemas, logger)
         t_seq = cls.create_transformation_sequence(schemas, logger)
         loader = cls.create_loader(logger)
@@ -1,13 +1,24 @@
+import copy
+import os
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
 from io import StringIO
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import json
 
-from .schema import Schema, DataType
+from .schema import Column, ColumnGroup, Schema, DataType
 from .file import File, XLSXFile, JSONFile, CSVFile
 from algomancy_utils import Logger
+from algomancy_utils.metrics import REGISTRY
 
 
 class DateFormatError(Exception):
@@ -38,13 +49,53 @@ class ConversionIssue:
         )
 
 
+#: Rows sampled to choose a conversion notation before converting a column.
+CONVERSION_SAMPLE_SIZE = 1000
+
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d.%m.%Y %H:%M:%S",
+)
+_PARSE_ERRORS = (ValueError, TypeError, AttributeError, IndexError)
+
+_CONVERSION_DURATION = REGISTRY.histogram(
+    "algomancy_etl_column_conversion_seconds",
+    "Duration of converting one column to its schema type.",
+    ["dtype"],
+)
+
+Parser = Callable[[pd.Series], pd.Series]
+
+
 class DataTypeConverter:
+    """
+    Converts extracted columns to the types declared in a schema.
+
+    Numeric and datetime text can come in several notations (decimal commas,
+    thousands separators, day- or month-first dates). Instead of trying each
+    notation on the full column, the converter tries them, in a fixed order,
+    on the first ``CONVERSION_SAMPLE_SIZE`` rows and converts the full column
+    with the first one that fits. Should that fail on the full column, the
+    later notations are tried in order, so the result is always that of the
+    first notation that parses the whole column.
+
+    Locale hints on a schema ``Column`` (``decimal``, ``thousands`` and
+    ``date_format``) are tried before any detected notation.
+    """
+
     @staticmethod
     def convert_dtypes(
         df: pd.DataFrame,
         schema_types: dict[str, DataType],
         issues: Optional[List[ConversionIssue]] = None,
         table_name: Optional[str] = None,
+        columns: Optional[Dict[str, Column]] = None,
+        copy: bool = True,
+        timings: Optional[Dict[str, float]] = None,
     ) -> pd.DataFrame:
         """
         Converts DataFrame columns to the specified data types in the schema.
@@ -60,24 +111,33 @@ class DataTypeConverter:
                 step rather than silently corrupting data.
             table_name: Optional logical table name used to attach context to
                 ``ConversionIssue`` entries.
+            columns: Optional ``Column`` declarations by name, whose locale
+                hints are honoured.
+            copy: If ``False``, convert ``df`` in place instead of a copy.
+                Extractors pass ``False`` for frames they have just built.
+            timings: Optional dict that receives the seconds spent converting
+                each column.
 
         Returns:
             DataFrame with converted data types where possible.
         """
 
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
+        columns = columns or {}
 
         for column, target_type in schema_types.items():
             if column not in result_df.columns:
                 continue
 
+            started = time.perf_counter()
+            hint = columns.get(column)
             if target_type in (DataType.FLOAT, DataType.INTEGER):
                 result_df = DataTypeConverter._convert_numeric_column(
-                    result_df, column, target_type, issues, table_name
+                    result_df, column, target_type, issues, table_name, hint
                 )
             elif target_type == DataType.DATETIME:
                 result_df = DataTypeConverter._convert_datetime_column(
-                    result_df, column, issues, table_name
+                    result_df, column, issues, table_name, hint
                 )
             elif target_type == DataType.BOOLEAN:
                 result_df = DataTypeConverter._convert_boolean_column(
@@ -90,8 +150,72 @@ class DataTypeConverter:
             else:
                 raise NotImplementedError(f"Unsupported data type: {target_type}")
 
+            elapsed = time.perf_counter() - started
+            _CONVERSION_DURATION.observe(elapsed, dtype=str(target_type))
+            if timings is not None:
+                timings[column] = elapsed
+
         return result_df
 
+    @staticmethod
+    def _parse_first(series: pd.Series, parsers: List[Parser]) -> pd.Series:
+        """
+        Result of the first parser in ``parsers`` that parses ``series``.
+
+        Parsers that fail on the sample would fail on the full column too, so
+        they are skipped. Raises the last parser's error if none fits.
+        """
+        if len(parsers) > 1 and len(series) > CONVERSION_SAMPLE_SIZE:
+            sample = series.iloc[:CONVERSION_SAMPLE_SIZE]
+            for i, parse in enumerate(parsers):
+                try:
+                    parse(sample)
+                except _PARSE_ERRORS:
+                    continue
+                parsers = parsers[i:]
+                break
+
+        error: Exception | None = None
+        for parse in parsers:
+            try:
+                return parse(series)
+            except _PARSE_ERRORS as exc:
+                error = exc
+        raise error
+
+    @staticmethod
+    def _numeric_parsers(
+        target_type: DataType, hint: Optional[Column] = None
+    ) -> List[Parser]:
+        """Numeric notations to try: hinted, plain, decimal comma, thousands comma."""
+
+        plain = partial(pd.Series.astype, dtype=target_type)
+
+        def decimal_comma(s: pd.Series) -> pd.Series:
+            # For integers, first convert to float (handling comma separators) then to int
+            values = s.str.replace(",", ".").astype(DataType.FLOAT)
+            if target_type == DataType.INTEGER:
+                values = values.astype(DataType.INTEGER)
+            return values
+
+        def thousands_comma(s: pd.Series) -> pd.Series:
+            return s.str.replace(",", "").astype(target_type)
+
+        parsers = [plain, decimal_comma, thousands_comma]
+        if hint is None or (hint.decimal is None and hint.thousands is None):
+            return parsers
+
+        def hinted(s: pd.Series) -> pd.Series:
+            if hint.thousands:
+                s = s.str.replace(hint.thousands, "", regex=False)
+            if hint.decimal and hint.decimal != ".":
+                s = s.str.replace(hint.decimal, ".", regex=False)
+            if target_type == DataType.INTEGER and hint.decimal:
+                return s.astype(DataType.FLOAT).astype(DataType.INTEGER)
+            return s.astype(target_type)
+
+        return [hinted] + parsers
+
     @staticmethod
     def _convert_numeric_column(
         df: pd.DataFrame,
@@ -99,85 +223,39 @@ class DataTypeConverter:
         target_type: DataType,
         issues: Optional[List[ConversionIssue]] = None,
         table_name: Optional[str] = None,
+        hint: Optional[Column] = None,
     ) -> pd.DataFrame:
         """Convert a column to a numeric type, handling different number formats."""
+        series = df[column]
+        parsers = DataTypeConverter._numeric_parsers(target_type, hint)
+        # Notations only apply to text; other columns only get the plain cast.
+        is_text = series.dtype == "object" and len(series) > 0
         try:
-            # Standard conversion first
-            df[column] = df[column].astype(target_type)
-        except ValueError, TypeError:
-            # Try fixing common localization issues
-            try:
-                # Try European format (comma as decimal separator)
-                if df[column].dtype == "object" and len(df[column]) > 0:
-                    if target_type == DataType.FLOAT:
-                        temp_values = (
-                            df[column].str.replace(",", ".").astype(DataType.FLOAT)
-                        )
-                        df[column] = temp_values
-                    else:
-                        # For integers, first convert to float (handling comma separators) then to int
-                        temp_values = (
-                            df[column]
-                            .str.replace(",", ".")
-                            .astype(DataType.FLOAT)
-                            .astype(DataType.INTEGER)
-                        )
-                        df[column] = temp_values
-            except ValueError, TypeError, AttributeError, IndexError:
-                try:
-                    # Try with thousands separator removal
-                    if df[column].dtype == "object" and len(df[column]) > 0:
-                        if target_type == DataType.FLOAT:
-                            temp_values = (
-                                df[column].str.replace(",", "").astype(DataType.FLOAT)
-                            )
-                            df[column] = temp_values
-                        else:
-                            temp_values = (
-                                df[column].str.replace(",", "").astype(DataType.INTEGER)
-                            )
-                            df[column] = temp_values
-                except (ValueError, TypeError, AttributeError, IndexError) as exc:
-                    if issues is not None:
-                        issues.append(
-                            ConversionIssue(
-                                table=table_name or "",
-                                column=column,
-                                target_type=target_type,
-                                reason=f"Numeric conversion failed: {exc}",
-                            )
-                        )
+            df[column] = DataTypeConverter._parse_first(
+                series,
+                parsers if is_text else [partial(pd.Series.astype, dtype=target_type)],
+            )
+        except _PARSE_ERRORS as exc:
+            if is_text and issues is not None:
+                issues.append(
+                    ConversionIssue(
+                        table=table_name or "",
+                        column=column,
+                        target_type=target_type,
+                        reason=f"Numeric conversion failed: {exc}",
+                    )
+                )
         return df
 
     @staticmethod
-    def _convert_date_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
-        """Convert a column to date type, trying multiple formats."""
-        try:
-            # Standard conversion using pandas to_datetime
-            temp = pd.to_datetime(df[column])
-            df[column] = temp
-        except ValueError, TypeError, AttributeError:
-            # Try different date formats
-            success = False
-            for date_format in [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-                "%d.%m.%Y",
-            ]:
-                try:
-                    temp = pd.to_datetime(df[column], format=date_format)
-                    df[column] = temp
-                    success = True
-                    break  # Break the loop if conversion succeeds
-                except ValueError, TypeError, AttributeError:
-                    continue  # Try next format
-            if not success:
-                raise DateFormatError(
-                    f"Could not convert column '{column}' to date format."
-                )
-        return df
+    def _datetime_parsers(hint: Optional[Column] = None) -> List[Parser]:
+        """Datetime notations to try: hinted, inferred, then known formats."""
+        parsers: List[Parser] = [pd.to_datetime]
+        for date_format in _DATE_FORMATS + _DATETIME_FORMATS:
+            parsers.append(partial(pd.to_datetime, format=date_format))
+        if hint is not None and hint.date_format is not None:
+            parsers.insert(0, partial(pd.to_datetime, format=hint.date_format))
+        return parsers
 
     @staticmethod
     def _convert_datetime_column(
@@ -185,34 +263,14 @@ class DataTypeConverter:
         column: str,
         issues: Optional[List[ConversionIssue]] = None,
         table_name: Optional[str] = None,
+        hint: Optional[Column] = None,
     ) -> pd.DataFrame:
         """Convert a column to datetime type, trying multiple formats."""
         try:
-            DataTypeConverter._convert_date_column(df, column)
-        except DateFormatError:
-            # try to format as datetime
-            pass
-
-        try:
-            # Standard conversion using pandas to_datetime
-            temp = pd.to_datetime(df[column])
-            df[column] = temp
-            return df
-        except ValueError, TypeError:
-            # Try different datetime formats
-            for datetime_format in [
-                "%Y-%m-%d %H:%M:%S",
-                "%m/%d/%Y %H:%M:%S",
-                "%d/%m/%Y %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%d.%m.%Y %H:%M:%S",
-            ]:
-                try:
-                    temp = pd.to_datetime(df[column], format=datetime_format)
-                    df[column] = temp
-                    return df
-                except ValueError, TypeError, AttributeError:
-                    continue  # Try next format
+            df[column] = DataTypeConverter._parse_first(
+                df[column], DataTypeConverter._datetime_parsers(hint)
+            )
+        except _PARSE_ERRORS:
             if issues is not None:
                 issues.append(
                     ConversionIssue(
@@ -295,12 +353,50 @@ class DataTypeConverter:
         return df
 
 
+def _declared_columns(schema: Schema, group: Optional[str] = None) -> Dict[str, Column]:
+    """
+    ``Column`` declarations of a SINGLE schema, or of one ``group`` of a
+    MULTI schema; empty for schemas using the legacy ``_DATATYPES``.
+    Accepts a ``Schema`` class or instance, like the pipeline does.
+    """
+    # Columns are class attributes, as in ``Schema.columns()``; vars() of an
+    # instance would not see them.
+    schema_cls = schema if isinstance(schema, type) else type(schema)
+    attrs = vars(schema_cls).values()
+    if group is None:
+        return {c.name: c for c in attrs if isinstance(c, Column)}
+    for attr in attrs:
+        if isinstance(attr, ColumnGroup) and attr.name == group:
+            return {c.name: c for c in attr.columns}
+    return {}
+
+
 class Extractor(ABC):
     def __init__(self, file: File, schema: Schema, logger: Logger = None) -> None:
         self.file = file
         self.logger = logger
         self.schema = schema
         self.conversion_issues: List[ConversionIssue] = []
+        #: Seconds spent converting each column, by table name.
+        self.conversion_timings: Dict[str, Dict[str, float]] = {}
+
+    def _convert_dtypes(
+        self,
+        df: pd.DataFrame,
+        schema_types: Dict[str, DataType],
+        columns: Dict[str, Column],
+        table_name: str,
+    ) -> pd.DataFrame:
+        """Convert a freshly extracted ``df`` in place to the schema types."""
+        return DataTypeConverter.convert_dtypes(
+            df,
+            schema_types,
+            issues=self.conversion_issues,
+            table_name=table_name,
+            columns=columns,
+            copy=False,
+            timings=self.conversion_timings.setdefault(table_name, {}),
+        )
 
     def _extraction_message(self):
         if self.logger:
@@ -324,11 +420,8 @@ class SingleExtractor(Extractor):
 
         self._extraction_message()
         df = self._extract_file()
-        df = DataTypeConverter.convert_dtypes(
-            df,
-            self.schema.datatypes(),
-            issues=self.conversion_issues,
-            table_name=self.file.name,
+        df = self._convert_dtypes(
+            df, self.schema.datatypes(), _declared_columns(self.schema), self.file.name
         )
         self._extraction_success_message()
 
@@ -374,11 +467,11 @@ class MultiExtractor(Extractor):
         # Before this we check if the keys of the schemas and the names of the extracted dataframes match
         self._check_schemas(dfs)
         dfs = {
-            key: DataTypeConverter.convert_dtypes(
+            key: self._convert_dtypes(
                 df,
                 self._get_schema_types(self.get_schema_name(key)),
-                issues=self.conversion_issues,
-                table_name=key,
+                _declared_columns(self.schema, self.get_schema_name(key)),
+                key,
             )
             for key, df in dfs.items()
         }
@@ -415,6 +508,11 @@ class CSVSingleExtractor(SingleExtractor):
     in the CSV file through the separator parameter. The extracted data
     is provided in the form of a pandas DataFrame.
 
+    The file is parsed straight from its path or stream when it has one.
+    Integer and float columns of the schema are typed while parsing; if a
+    column does not parse cleanly (decimal commas, missing integers) the file
+    is parsed untyped and ``DataTypeConverter`` applies its fallbacks.
+
     Attributes:
         file: CSVFile
             File object that contains the content of the CSV file.
@@ -425,18 +523,86 @@ class CSVSingleExtractor(SingleExtractor):
         separator: str
             The delimiter string to use for parsing the CSV file
             (default is ";").
+        engine: str, optional
+            The ``pd.read_csv`` parser engine; ``"pyarrow"`` is multithreaded
+            and usually fastest on large files (requires pyarrow).
+        schema_columns_only: bool
+            Only read the columns declared in the schema (default False).
     """
 
+    #: Schema types that are safe to apply while parsing.
+    _PARSE_TIME_TYPES = (DataType.INTEGER, DataType.FLOAT)
+
     def __init__(
-        self, file: CSVFile, schema: Schema, logger: Logger = None, separator: str = ";"
+        self,
+        file: CSVFile,
+        schema: Schema,
+        logger: Logger = None,
+        separator: str = ";",
+        engine: Optional[str] = None,
+        schema_columns_only: bool = False,
     ) -> None:
         super().__init__(file, schema, logger)
         self._separator = separator
+        self._engine = engine
+        self._schema_columns_only = schema_columns_only
 
     def _extract_file(self) -> pd.DataFrame:
-        csv_content = self.file.content
-        df = pd.read_csv(StringIO(csv_content), sep=self._separator)
-        return df
+        source = self.file.source
+        rewind = self._rewinder(source)
+        options = {"sep": self._separator}
+        if self._engine is not None:
+            options["engine"] = self._engine
+        if self._schema_columns_only:
+            usecols = self._usecols(source, rewind)
+            if usecols is not None:
+                options["usecols"] = usecols
+
+        # Columns with locale hints are left to DataTypeConverter.
+        hinted = {
+            name
+            for name, column in _declared_columns(self.schema).items()
+            if column.decimal is not None or column.thousands is not None
+        }
+        dtypes = {
+            column: str(dtype)
+            for column, dtype in self.schema.datatypes().items()
+            if dtype in self._PARSE_TIME_TYPES and column not in hinted
+        }
+        if dtypes and rewind is not None:
+            try:
+                return pd.read_csv(source, dtype=dtypes, **options)
+            except ValueError, TypeError:
+                source = rewind()
+        return pd.read_csv(source, **options)
+
+    @classmethod
+    def _rewinder(cls, source) -> Optional[Callable[[], object]]:
+        """A callable returning ``source`` ready to be read again, if possible."""
+        if isinstance(source, str):
+            return lambda: source
+        if hasattr(source, "seekable") and source.seekable():
+            return cls._rewind_to(source, source.tell())
+        return None
+
+    @staticmethod
+    def _rewind_to(stream, position: int) -> Callable[[], object]:
+        def rewind():
+            stream.seek(position)
+            return stream
+
+        return rewind
+
+    def _usecols(self, source, rewind) -> Optional[Callable | List[str]]:
+        wanted = set(self.schema.datatypes())
+        if self._engine != "pyarrow":
+            return lambda column: column in wanted
+        # The pyarrow engine needs an explicit list of columns that exist.
+        if rewind is None:
+            return None
+        header = pd.read_csv(source, sep=self._separator, nrows=0).columns
+        rewind()
+        return [column for column in header if column in wanted]
 
 
 class JSONSingleExtractor(SingleExtractor):
@@ -479,8 +645,8 @@ class XLSXSingleExtractor(SingleExtractor):
     Represents an extractor for XLSX files.
 
     This class is designed to handle the extraction of data from XLSX files.
-    It uses pandas to read specified sheets from an XLSX file and converts
-    the content into a DataFrame. It extends the functionality of a base
+    It uses pandas to read the specified sheet, and only that sheet, from an
+    XLSX file into a DataFrame. It extends the functionality of a base
     SingleExtractor class, providing a specialized implementation for XLSX data.
 
     Attributes:
@@ -492,6 +658,8 @@ class XLSXSingleExtractor(SingleExtractor):
             The name or index of the sheet to extract data from.
         logger: Logger, optional
             An optional logger instance for logging purposes.
+        engine: str, optional
+            The ``pd.read_excel`` engine, e.g. ``"calamine"`` for speed.
     """
 
     def __init__(
@@ -500,48 +668,15 @@ class XLSXSingleExtractor(SingleExtractor):
         schema: Schema,
         sheet_name: str | int,
         logger: Logger = None,
+        engine: Optional[str] = None,
     ) -> None:
         super().__init__(file, schema, logger)
         self._sheet_name: str | int = sheet_name
+        self._engine = engine
 
     def _extract_file(self) -> pd.DataFrame:
-        # Parse the content stored in the file
-        content_obj = json.loads(self.file.content)
-
-        # Handle sheet selection
-        sheet_name = self._sheet_name
-
-        # If sheet_name is an integer, convert it to the actual sheet name using the mapping
-        if isinstance(sheet_name, int):
-            # Get the sheet name from the index mapping
-            if str(sheet_name) in content_obj["metadata"]["index_to_sheet_name"]:
-                sheet_name = content_obj["metadata"]["index_to_sheet_name"][
-                    str(sheet_name)
-                ]
-            else:
-                # Use the index directly to get from the list of sheet names
-                try:
-                    sheet_name = content_obj["metadata"]["sheet_names"][sheet_name]
-                except IndexError:
-                    raise ValueError(
-                        f"Sheet index {sheet_name} is out of range. "
-                        f"Available sheets: {content_obj['metadata']['sheet_names']}"
-                    )
-
-        # Check if the requested sheet exists
-        if sheet_name not in content_obj["sheets"]:
-            raise ValueError(
-                f"Sheet '{sheet_name}' not found in Excel file. "
-                f"Available sheets: {content_obj['metadata']['sheet_names']}"
-            )
-
-        # Get the data for the requested sheet
-        sheet_data = content_obj["sheets"][sheet_name]
-
-        # Convert back to DataFrame
-        df = pd.DataFrame(sheet_data)
-
-        return df
+        sheets = self.file.read_sheets([self._sheet_name], engine=self._engine)
+        return sheets[self._sheet_name]
 
 
 class XLSXMultiExtractor(MultiExtractor):
@@ -549,8 +684,8 @@ class XLSXMultiExtractor(MultiExtractor):
     Represents an extractor for XLSX files.
 
     This class is designed to handle the extraction of data from XLSX files.
-    It uses pandas to read specified sheets from an XLSX file and converts
-    the content into DataFrame(s). It extends the functionality of a base
+    It uses pandas to read the sheets named in the schema, in one pass over
+    the workbook, into DataFrames. It extends the functionality of a base
     MultiExtractor class, providing a specialized implementation for XLSX data.
 
     Attributes:
@@ -562,6 +697,8 @@ class XLSXMultiExtractor(MultiExtractor):
             The name of the sheets to extract data from.
         logger: Logger, optional
             An optional logger instance for logging purposes.
+        engine: str, optional
+            The ``pd.read_excel`` engine, e.g. ``"calamine"`` for speed.
 
     Note that the sheet_names should match the keys of the schemas Dict.
     """
@@ -571,21 +708,17 @@ class XLSXMultiExtractor(MultiExtractor):
         file: XLSXFile,
         schema: Schema,
         logger: Logger = None,
+        engine: Optional[str] = None,
     ) -> None:
         super().__init__(file, schema, logger)
         self._sheet_names = list(self.schema.sub_names())
-        self._single_sheet_extractors = {}
-        for sheet_name in self._sheet_names:
-            subschema = self.schema.get_subschema(sheet_name)
-            self._single_sheet_extractors[sheet_name] = XLSXSingleExtractor(
-                file, subschema, sheet_name
-            )
+        self._engine = engine
 
     def _extract_files(self) -> Dict[str, pd.DataFrame]:
-        dfs = {}
-        for name, extractor in self._single_sheet_extractors.items():
-            dfs[self.get_extraction_key(name)] = list(extractor.extract().values())[0]
-        return dfs
+        sheets = self.file.read_sheets(self._sheet_names, engine=self._engine)
+        return {
+            self.get_extraction_key(name): sheets[name] for name in self._sheet_names
+        }
 
 
 class JSONMultiExtractor(MultiExtractor):
@@ -753,6 +886,16 @@ class JSONMultiExtractor(MultiExtractor):
         return out
 
 
+class _MemoryFile:
+    """Minimal pseudo-File so the base class plumbing (extraction messages,
+    etc.) keeps working without on-disk IO."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, n: str) -> None:
+        self.name = n
+
+
 class DataFrameExtractor(Extractor):
     """Extractor that wraps a pre-built ``pandas.DataFrame``.
 
@@ -773,14 +916,6 @@ class DataFrameExtractor(Extractor):
         schema: Schema,
         logger: Logger = None,
     ) -> None:
-        # Construct a minimal pseudo-File so the base class plumbing
-        # (extraction messages, etc.) keeps working without on-disk IO.
-        class _MemoryFile:
-            __slots__ = ("name",)
-
-            def __init__(self, n: str) -> None:
-                self.name = n
-
         if not schema.is_single():
             raise ValueError(
                 "DataFrameExtractor only supports SINGLE schemas; "
@@ -791,41 +926,148 @@ class DataFrameExtractor(Extractor):
 
     def extract(self) -> Dict[str, pd.DataFrame]:
         self._extraction_message()
-        df = DataTypeConverter.convert_dtypes(
+        df = self._convert_dtypes(
             self._df.copy(),
             self.schema.datatypes(),
-            issues=self.conversion_issues,
-            table_name=self.file.name,
+            _declared_columns(self.schema),
+            self.file.name,
         )
         self._extraction_success_message()
         return {self.file.name: df}
 
 
+#: Ways ``ExtractionSequence`` can run its extractors.
+EXTRACTION_MODES = ("serial", "thread", "process")
+
+
+#: What one extractor run yields: tables, conversion issues and timings.
+_ExtractionOutcome = Tuple[
+    Dict[str, pd.DataFrame], List[ConversionIssue], Dict[str, Dict[str, float]]
+]
+
+
+def _run_extractor(extractor: Extractor) -> _ExtractionOutcome:
+    """Run one extractor afresh; also the entry point of pool workers."""
+    extractor.conversion_issues = []  # reset before each run
+    extractor.conversion_timings = {}
+    data = extractor.extract()
+    return data, extractor.conversion_issues, extractor.conversion_timings
+
+
 class ExtractionSequence:
+    """
+    Runs a list of extractors and merges their tables.
+
+    By default the extractors run one after another. Independent files can be
+    parsed concurrently instead:
+
+    - ``executor="thread"`` runs them on a thread pool. pandas' C parsers
+      release the GIL for much of the work, so CSV-heavy datasets scale well.
+    - ``executor="process"`` runs them on a process pool, for parsing that
+      holds the GIL (e.g. ``openpyxl``). Extractors are pickled to the
+      workers, without their logger.
+
+    ``max_workers`` caps the pool size (default: one worker per extractor, at
+    most ``os.cpu_count()``). Whatever the mode, tables and
+    ``conversion_issues`` are merged in extractor order, so the result is the
+    same as a serial run. If extractors fail, the error of the first failing
+    extractor in that order is raised.
+    """
+
     def __init__(
-        self, extractors: List[Extractor] = None, logger: Logger = None
+        self,
+        extractors: List[Extractor] = None,
+        logger: Logger = None,
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
     ) -> None:
         self._extractors = extractors or []
         self._completed: bool = False
         self.logger = logger
         self._data = None
         self._conversion_issues: List[ConversionIssue] = []
+        self._conversion_timings: Dict[str, Dict[str, float]] = {}
+        self._executor = "serial"
+        self._max_workers: Optional[int] = None
+        self.set_executor(executor, max_workers)
+
+    def set_executor(self, executor: str, max_workers: Optional[int] = None) -> None:
+        """Choose how ``run_extraction`` runs the extractors."""
+        if executor not in EXTRACTION_MODES:
+            raise ValueError(
+                f"executor must be one of {EXTRACTION_MODES}; got {executor!r}"
+            )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(
+                f"max_workers must be None or at least 1; got {max_workers!r}"
+            )
+        self._executor = executor
+        self._max_workers = max_workers
+
+    @property
+    def executor(self) -> str:
+        return self._executor
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
 
     def run_extraction(self) -> Dict[str, pd.DataFrame]:
+        if self._executor == "serial" or len(self._extractors) < 2:
+            results = [_run_extractor(e) for e in self._extractors]
+        else:
+            results = self._extract_concurrently()
+
         data: Dict[str, pd.DataFrame] = {}
         all_issues: List[ConversionIssue] = []
-
-        for extractor in self._extractors:
-            extractor.conversion_issues = []  # reset before each run
-            dfs: Dict[str, pd.DataFrame] = extractor.extract()
+        all_timings: Dict[str, Dict[str, float]] = {}
+        for dfs, issues, timings in results:
             data.update(dfs)
-            all_issues.extend(extractor.conversion_issues)
+            all_issues.extend(issues)
+            all_timings.update(timings)
 
         self._completed = True
         self._data = data
         self._conversion_issues = all_issues
+        self._conversion_timings = all_timings
         return data
 
+    def _extract_concurrently(self) -> List[_ExtractionOutcome]:
+        workers = min(len(self._extractors), self._max_workers or os.cpu_count() or 1)
+        pool: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if self._executor == "process"
+            else ThreadPoolExecutor(max_workers=workers)
+        )
+
+        if self.logger:
+            self.logger.log(
+                f"Extracting {len(self._extractors)} files on {workers} "
+                f"{self._executor} workers"
+            )
+        with pool:
+            futures = [self._submit(pool, extractor) for extractor in self._extractors]
+            for future in futures:
+                if future.exception() is not None:
+                    pool.shutdown(cancel_futures=True)
+                    raise future.exception()
+            results = [future.result() for future in futures]
+
+        if self._executor == "process":
+            for extractor, (_, issues, timings) in zip(self._extractors, results):
+                extractor.conversion_issues = issues
+                extractor.conversion_timings = timings
+                extractor._extraction_success_message()
+        return results
+
+    def _submit(self, pool: Executor, extractor: Extractor) -> Future:
+        if self._executor == "thread":
+            return pool.submit(_run_extractor, extractor)
+        # Loggers stay in this process; the worker gets a detached copy.
+        detached = copy.copy(extractor)
+        detached.logger = None
+        return pool.submit(_run_extractor, detached)
+
     @property
     def completed(self) -> bool:
         return self._completed
@@ -845,6 +1087,11 @@ class ExtractionSequence:
         """
         return list(self._conversion_issues)
 
+    @property
+    def conversion_timings(self) -> Dict[str, Dict[str, float]]:
+        """Seconds spent converting each column to its schema type, by table."""
+        return {table: dict(t) for table, t in self._conversion_timings.items()}
+
     def add_extractor(self, extractor: Extractor) -> None:
         self._extractors.append(extractor)
 
@@ -5,9 +5,10 @@ provides helpers to normalize their contents to strings/JSON that the
 extractors can consume.
 """
 
+import os
 from abc import ABC
-from io import BytesIO
-from typing import Dict
+from io import BytesIO, StringIO
+from typing import IO, Dict, List
 import pandas as pd
 import json
 import base64
@@ -42,17 +43,53 @@ class File(ABC):
 
 
 class CSVFile(File):
-    """CSV file backed by uploader content or a filesystem path."""
+    """CSV file backed by uploader content, a filesystem path or a stream.
+
+    Path- and stream-backed files are not read into memory up front:
+    extractors parse them directly from ``source``. ``content`` still returns
+    the full text, read on demand.
+    """
 
     def __init__(
         self,
         name: str,
         path: str = None,
         content: str = None,
+        stream: IO = None,
     ):
-        super().__init__(name, FileExtension.CSV, path, None)
+        super().__init__(name, FileExtension.CSV, None, None)
+        self.path = path
+        self.stream: IO | None = stream
         if content is not None:
             self.content = self._set_content_from_uploader(content)
+        elif path is not None:
+            os.stat(path)  # fail early on a missing file
+
+    @property
+    def content(self) -> str | None:
+        if self._content is None:
+            if self.stream is not None:
+                data = self.stream.read()
+                self._content = (
+                    data.decode("utf-8") if isinstance(data, bytes) else data
+                )
+                self.stream = None
+            elif self.path is not None:
+                return self.read_contents_from_path()
+        return self._content
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        self._content = value
+
+    @property
+    def source(self) -> str | IO | None:
+        """What ``pd.read_csv`` should read: the text, the stream or the path."""
+        if self._content is not None:
+            return StringIO(self._content)
+        if self.stream is not None:
+            return self.stream
+        return self.path
 
     @staticmethod
     def _set_content_from_uploader(content: str) -> str:
@@ -94,39 +131,103 @@ class JSONFile(File):
 
 
 class XLSXFile(File):
-    """Excel file that exposes its sheets as a JSON payload.
+    """Excel workbook backed by uploader content or a filesystem path.
 
-    The content string contains JSON with metadata (sheet names and order)
-    and a ``sheets`` mapping where each sheet is a list of records.
+    Extractors read the sheets they need straight into DataFrames with
+    ``read_sheets``; other sheets are never parsed. ``content`` still returns
+    the JSON payload of earlier versions (metadata plus every sheet as a list
+    of records), built on demand.
     """
 
     def __init__(self, name: str, path: str = None, content: str = None):
-        super().__init__(name, FileExtension.XLSX, path, None)
+        super().__init__(name, FileExtension.XLSX, None, None)
+        self.path = path
         self.index_to_sheet_name: Dict[int, str] = {}
+        self._workbook: bytes | None = None
         if content is not None:
-            self.content: str = self._set_content_from_uploader(content)
+            self._workbook = self._set_content_from_uploader(content)
+        if self.has_workbook:
+            # Opening the workbook validates it and lists its sheets without
+            # parsing any of them.
+            with pd.ExcelFile(self._workbook_source()) as excel_file:
+                self.index_to_sheet_name = dict(enumerate(excel_file.sheet_names))
 
-    def _set_content_from_uploader(self, content: str) -> str:
-        """
-        XLSX content is treated individually. The content is extracted from the data URI,
-        and stored in a dictionary. Each sheet is converted to JSON and stored, to allow
-        the XLSX extractor to access the appropriate sheet.
-        """
-        # Extract the base64 content from the data URI
+    @staticmethod
+    def _set_content_from_uploader(content: str) -> bytes:
+        """Decode the workbook bytes from the uploader's data URI."""
         content_type, content_string = content.split(",", 1)
-        decoded = base64.b64decode(content_string)
-
-        # Use BytesIO instead of StringIO for binary data
-        excel_file = pd.ExcelFile(BytesIO(decoded))
+        return base64.b64decode(content_string)
+
+    @property
+    def has_workbook(self) -> bool:
+        """True if the file is backed by an actual workbook, not a payload."""
+        return self._workbook is not None or self.path is not None
+
+    def _workbook_source(self) -> str | BytesIO:
+        if self._workbook is not None:
+            return BytesIO(self._workbook)
+        return self.path
+
+    @property
+    def content(self) -> str | None:
+        if self._content is None and self.has_workbook:
+            self._content = self.read_contents_from_path()
+        return self._content
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        self._content = value
+
+    @property
+    def sheet_names(self) -> List[str]:
+        if self.has_workbook:
+            return list(self.index_to_sheet_name.values())
+        return json.loads(self.content)["metadata"]["sheet_names"]
+
+    def resolve_sheet_name(self, sheet: str | int) -> str:
+        """The name of ``sheet``, given by name or position."""
+        sheet_names = self.sheet_names
+        if isinstance(sheet, int):
+            try:
+                return sheet_names[sheet]
+            except IndexError:
+                raise ValueError(
+                    f"Sheet index {sheet} is out of range. "
+                    f"Available sheets: {sheet_names}"
+                )
+        if sheet not in sheet_names:
+            raise ValueError(
+                f"Sheet '{sheet}' not found in Excel file. "
+                f"Available sheets: {sheet_names}"
+            )
+        return sheet
+
+    def read_sheets(
+        self, sheets: List[str | int], engine: str | None = None
+    ) -> Dict[str | int, pd.DataFrame]:
+        """
+        Read only the given sheets, keyed as requested.
 
-        # Return as JSON string
-        return self._process_excel_file(excel_file)
+        The workbook is opened once for all of them. ``engine`` is passed to
+        ``pd.read_excel``; ``"calamine"`` is considerably faster than the
+        default openpyxl (requires ``algomancy-data[calamine]``).
+        """
+        names = {sheet: self.resolve_sheet_name(sheet) for sheet in sheets}
+        if not self.has_workbook:
+            payload = json.loads(self.content)["sheets"]
+            return {sheet: pd.DataFrame(payload[name]) for sheet, name in names.items()}
+
+        frames = pd.read_excel(
+            self._workbook_source(),
+            sheet_name=list(dict.fromkeys(names.values())),
+            engine=engine,
+        )
+        return {sheet: frames[name] for sheet, name in names.items()}
 
     def read_contents_from_path(self) -> str:
-        """Read and convert the Excel file to the standard JSON payload."""
-        # Read all sheets from the Excel file
-        excel_file = pd.ExcelFile(self.path)
-        return self._process_excel_file(excel_file)
+        """Read and convert the whole workbook to the JSON payload."""
+        with pd.ExcelFile(self._workbook_source()) as excel_file:
+            return self._process_excel_file(excel_file)
 
     def _process_excel_file(self, excel_file):
         """Convert all sheets in the given ``ExcelFile`` to a JSON payload."""
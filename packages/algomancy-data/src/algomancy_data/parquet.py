@@ -0,0 +1,162 @@
+"""
+parquet.py - Columnar on-disk storage of data sources
+
+With ``save_type="parquet"`` a ``StatefulDataManager`` stores each data source
+as a directory ``<name>.parquet/`` holding one Parquet file per table and a
+small ``metadata.json`` sidecar::
+
+    orders.parquet/
+        metadata.json       id, name, type, creation time, table files
+        table_0.parquet
+        table_1.parquet
+
+Tables are read and written with pyarrow, which keeps pandas dtypes
+(categoricals, nullable integers, timezone-aware datetimes) and the index,
+so a load returns the frames exactly as they were stored.
+
+Data sources that expose their tables through ``to_sql_tables`` /
+``from_sql_tables`` (like the bundled ``DataSource``) are stored table by
+table. Any other ``BaseDataSource`` subclass is stored as its ``to_json``
+payload inside the same directory layout.
+
+pyarrow is optional: install it with ``pip install algomancy-data[parquet]``.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+
+import pandas as pd
+
+from .datasource import BASEDATASOURCE, DataClassification
+
+#: Suffix of the directory a data source is stored in.
+PARQUET_SUFFIX = ".parquet"
+#: Name of the metadata sidecar inside that directory.
+METADATA_FILE = "metadata.json"
+#: Name of the payload file for data sources without table access.
+PAYLOAD_FILE = "datasource.json"
+
+_FORMAT_VERSION = 1
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "save_type='parquet' requires pyarrow. "
+            "Install it with: pip install algomancy-data[parquet]"
+        ) from exc
+
+
+def _has_table_layout(obj) -> bool:
+    return callable(getattr(obj, "to_sql_tables", None)) and callable(
+        getattr(obj, "from_sql_tables", None)
+    )
+
+
+def is_parquet_datasource(path: str) -> bool:
+    """True if ``path`` is a directory written by ``write_parquet_datasource``."""
+    return (
+        path.endswith(PARQUET_SUFFIX)
+        and os.path.isdir(path)
+        and os.path.isfile(os.path.join(path, METADATA_FILE))
+    )
+
+
+def write_parquet_datasource(data_source: BASEDATASOURCE, path: str) -> None:
+    """
+    Store ``data_source`` in the directory ``path``, replacing what is there.
+
+    The files are written into a temporary sibling directory first, so an
+    interrupted write never leaves a half-written data source behind.
+    """
+    _require_pyarrow()
+
+    creation = data_source.creation_datetime
+    metadata = {
+        "format_version": _FORMAT_VERSION,
+        "id": data_source.id,
+        "name": data_source.name,
+        "type": str(data_source._ds_type),
+        "creation_datetime": (
+            creation.isoformat() if isinstance(creation, datetime) else creation
+        ),
+        "tables": [],
+        "payload": None,
+    }
+
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+    try:
+        if _has_table_layout(data_source):
+            for i, (table_name, df) in enumerate(data_source.to_sql_tables().items()):
+                file_name = f"table_{i}{PARQUET_SUFFIX}"
+                df.to_parquet(os.path.join(tmp_path, file_name), engine="pyarrow")
+                metadata["tables"].append({"name": table_name, "file": file_name})
+        else:
+            with open(os.path.join(tmp_path, PAYLOAD_FILE), "w", encoding="utf-8") as f:
+                f.write(data_source.to_json())
+            metadata["payload"] = PAYLOAD_FILE
+
+        with open(os.path.join(tmp_path, METADATA_FILE), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+
+
+def read_parquet_metadata(path: str) -> dict:
+    """The ``metadata.json`` sidecar of the data source stored in ``path``."""
+    with open(os.path.join(path, METADATA_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_parquet_datasource(
+    data_object_type: type[BASEDATASOURCE], path: str
+) -> BASEDATASOURCE:
+    """Load a data source stored by ``write_parquet_datasource``."""
+    metadata = read_parquet_metadata(path)
+
+    version = metadata.get("format_version")
+    if version != _FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported parquet data source format version {version!r} in '{path}'"
+        )
+
+    payload = metadata.get("payload")
+    if payload:
+        with open(os.path.join(path, payload), "r", encoding="utf-8") as f:
+            return data_object_type.from_json(f.read())
+
+    _require_pyarrow()
+    creation = metadata.get("creation_datetime")
+    ds = data_object_type(
+        ds_type=DataClassification(metadata["type"]),
+        name=metadata["name"],
+        ds_id=metadata["id"],
+        creation_datetime=datetime.fromisoformat(creation) if creation else None,
+    )
+    if not _has_table_layout(ds):
+        raise TypeError(
+            f"Data source in '{path}' was stored table by table, but "
+            f"data_object_type {data_object_type.__name__} does not implement "
+            "to_sql_tables / from_sql_tables."
+        )
+    ds.from_sql_tables(
+        {
+            table["name"]: pd.read_parquet(
+                os.path.join(path, table["file"]), engine="pyarrow"
+            )
+            for table in metadata["tables"]
+        }
+    )
+    return ds
@@ -12,6 +12,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple, Type
 
+import pandas as pd
+
 from .schema import Schema
 
 
@@ -126,3 +128,14 @@ def merge_relations(
     for r in override:
         by_key[r.key] = r
     return list(by_key.values())
+
+
+def key_index(df: pd.DataFrame, cols: Sequence[str]) -> pd.Index:
+    """Row keys of ``cols`` as an ``Index`` (a ``MultiIndex`` for composite keys).
+
+    Membership tests (``isin``) and lookups (``get_indexer``) on it are hashed
+    and vectorised, instead of building a Python tuple per row.
+    """
+    if len(cols) == 1:
+        return pd.Index(df[cols[0]], name=None, tupleize_cols=False)
+    return pd.MultiIndex.from_frame(df[list(cols)], names=[None] * len(cols))
@@ -67,6 +67,12 @@ class Column:
             mid-pipeline are dropped. Requires a ``CascadeSnapshot`` paired
             with the cascade transformer. Only meaningful when ``foreign_key``
             is set.
+        decimal: Decimal separator of a numeric column stored as text (e.g.
+            ``","`` for ``"1,5"``). Skips notation detection during extraction.
+        thousands: Thousands separator of a numeric column stored as text
+            (e.g. ``"."`` for ``"1.000,5"``).
+        date_format: ``strftime`` format of a datetime column stored as text
+            (e.g. ``"%d-%m-%Y"``). Skips format detection during extraction.
     """
 
     name: str
@@ -80,8 +86,15 @@ class Column:
     foreign_key: Tuple[str, str] | None = None
     parent_requires_child: bool = False
     track_partial_loss: bool = False
+    decimal: str | None = None
+    thousands: str | None = None
+    date_format: str | None = None
 
     def __post_init__(self) -> None:
+        if self.decimal is not None and self.decimal == self.thousands:
+            raise ValueError(
+                f"Column '{self.name}': decimal and thousands separators must differ."
+            )
         if self.foreign_key is None:
             if self.parent_requires_child:
                 raise ValueError(
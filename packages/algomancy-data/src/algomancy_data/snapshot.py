@@ -0,0 +1,198 @@
+"""
+snapshot.py - Cached ETL results of raw input directories
+
+Running the ETL pipeline over a directory of CSV / XLSX files is the slow part
+of a ``StatefulDataManager`` startup. With ``etl_snapshots=True`` the manager
+stores every successful ETL result as a snapshot in the data folder::
+
+    data/
+        shop/                   raw input files, run through ETL
+        .etl_snapshots/
+            shop.parquet/       the loaded data source (see ``parquet``)
+                snapshot.key    fingerprint the snapshot was made from
+
+A snapshot is reused instead of running ETL when its key still matches. The
+key covers the directory's files (names plus sizes and modification times,
+or their content hashes with ``fingerprint="content"``), the ETL factory
+class and its ``version``, the schema definitions and the data object type,
+so changing any of them invalidates the snapshot.
+
+Snapshots are stored in the parquet layout and need pyarrow
+(``pip install algomancy-data[parquet]``).
+"""
+
+import dataclasses
+import hashlib
+import os
+import shutil
+import warnings
+from typing import List
+
+from algomancy_utils import Logger
+from algomancy_utils.metrics import CACHE_HITS, CACHE_MISSES
+
+from .datasource import BASEDATASOURCE
+from .parquet import (
+    PARQUET_SUFFIX,
+    _require_pyarrow,
+    read_parquet_datasource,
+    write_parquet_datasource,
+)
+from .schema import Schema
+
+#: Name of the snapshot folder inside a data folder.
+ETL_SNAPSHOT_FOLDER = ".etl_snapshots"
+#: Ways of fingerprinting an input directory.
+FINGERPRINT_MODES = ("stat", "content")
+
+_KEY_FILE = "snapshot.key"
+_FORMAT_VERSION = 1
+_HASH_CHUNK = 1 << 20
+
+
+def directory_fingerprint(directory: str, mode: str = "stat") -> str:
+    """
+    Hex digest of the files in ``directory``.
+
+    ``"stat"`` hashes file names, sizes and modification times and reads no
+    file content; ``"content"`` hashes file names and contents, so touching a
+    file without changing it keeps the fingerprint.
+    """
+    if mode not in FINGERPRINT_MODES:
+        raise ValueError(
+            f"fingerprint must be one of {FINGERPRINT_MODES}; got {mode!r}"
+        )
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        digest.update(name.encode("utf-8") + b"\0")
+        if mode == "stat":
+            stat = os.stat(path)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+        else:
+            with open(path, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK):
+                    digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _schema_signature(schema: type[Schema]) -> str:
+    """The declaration of ``schema``: identity and every column setting."""
+    with warnings.catch_warnings():
+        # Legacy ``_DATATYPES`` schemas warn on every column access.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        if schema.is_multi():
+            columns = {
+                group: [dataclasses.asdict(col) for col in cols.values()]
+                for group, cols in schema.column_groups().items()
+            }
+        else:
+            columns = [dataclasses.asdict(col) for col in schema.columns().values()]
+    return repr(
+        (
+            schema.file_name(),
+            str(schema.extension()),
+            str(schema.schema_type()),
+            columns,
+        )
+    )
+
+
+class ETLSnapshotCache:
+    """
+    Stores ETL results of input directories and hands them back while the
+    inputs are unchanged.
+
+    Args:
+        folder: Folder the snapshots are kept in; created on first store.
+        fingerprint: How input directories are fingerprinted, one of
+            ``FINGERPRINT_MODES``.
+        logger: Optional logger.
+    """
+
+    def __init__(
+        self, folder: str, fingerprint: str = "stat", logger: Logger | None = None
+    ) -> None:
+        if fingerprint not in FINGERPRINT_MODES:
+            raise ValueError(
+                f"fingerprint must be one of {FINGERPRINT_MODES}; got {fingerprint!r}"
+            )
+        _require_pyarrow()
+        self._folder = folder
+        self._fingerprint = fingerprint
+        self.logger = logger
+
+    @property
+    def folder(self) -> str:
+        return self._folder
+
+    def _path(self, dataset_name: str) -> str:
+        return os.path.join(self._folder, f"{dataset_name}{PARQUET_SUFFIX}")
+
+    def key(
+        self,
+        directory: str,
+        etl_factory: type,
+        schemas: List[type[Schema]],
+        data_object_type: type[BASEDATASOURCE],
+    ) -> str:
+        """The snapshot key of running ``etl_factory`` over ``directory``."""
+        digest = hashlib.sha256()
+        parts = [
+            f"format={_FORMAT_VERSION}",
+            f"files={directory_fingerprint(directory, self._fingerprint)}",
+            f"factory={_qualified_name(etl_factory)}",
+            f"version={getattr(etl_factory, 'version', None)!r}",
+            f"data_object_type={_qualified_name(data_object_type)}",
+        ]
+        parts.extend(
+            sorted(f"schema={_schema_signature(schema)}" for schema in schemas)
+        )
+        for part in parts:
+            digest.update(part.encode("utf-8") + b"\0")
+        return digest.hexdigest()
+
+    def load(
+        self, dataset_name: str, key: str, data_object_type: type[BASEDATASOURCE]
+    ) -> BASEDATASOURCE | None:
+        """The snapshot of ``dataset_name`` if it was stored under ``key``."""
+        path = self._path(dataset_name)
+        try:
+            with open(os.path.join(path, _KEY_FILE), "r", encoding="utf-8") as f:
+                stored_key = f.read().strip()
+        except OSError:
+            stored_key = None
+        if stored_key != key:
+            CACHE_MISSES.inc(cache="etl_snapshot")
+            return None
+        try:
+            data_source = read_parquet_datasource(data_object_type, path)
+        except Exception as exc:
+            # A damaged snapshot is not an error: drop it and run ETL again.
+            if self.logger:
+                self.logger.warning(
+                    f"Discarding unreadable ETL snapshot of '{dataset_name}': {exc}"
+                )
+            self.discard(dataset_name)
+            CACHE_MISSES.inc(cache="etl_snapshot")
+            return None
+        CACHE_HITS.inc(cache="etl_snapshot")
+        return data_source
+
+    def store(self, dataset_name: str, key: str, data_source: BASEDATASOURCE) -> None:
+        """Store ``data_source`` as the snapshot of ``dataset_name``."""
+        path = self._path(dataset_name)
+        os.makedirs(self._folder, exist_ok=True)
+        write_parquet_datasource(data_source, path)
+        # Written last: a snapshot without a key file never matches.
+        with open(os.path.join(path, _KEY_FILE), "w", encoding="utf-8") as f:
+            f.write(key)
+
+    def discard(self, dataset_name: str) -> None:
+        """Remove the snapshot of ``dataset_name``, if there is one."""
+        shutil.rmtree(self._path(dataset_name), ignore_errors=True)
@@ -6,12 +6,18 @@ transformers into a single pipeline step.
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Sequence, Tuple, Type
 from algomancy_utils import Logger
 from copy import deepcopy
 
-from .relations import Relation, merge_relations, resolve_relations_from_schemas
+from .relations import (
+    Relation,
+    key_index,
+    merge_relations,
+    resolve_relations_from_schemas,
+)
 from .schema import Schema
 from .validator import ValidationMessage, ValidationSeverity
 
@@ -137,6 +143,10 @@ class CascadeDropTransformer(Transformer):
        ``parent_requires_child=True``: drop parent rows whose PK doesn't
        appear in any child's FK column.
 
+    Keys are matched with hashed ``Index.isin`` / ``get_indexer`` lookups
+    rather than per-row Python tuples, and after the first pass a rule is only
+    re-checked for relations whose input table lost rows since it last ran.
+
     Aggregated ``ValidationMessage``s are emitted with
     :class:`ValidationSeverity.ERROR` — one per ``(table, rule, relation)``
     with the dropped row count.
@@ -174,9 +184,32 @@ class CascadeDropTransformer(Transformer):
         # Accumulators: {(table, code, fk_label): dropped_count}
         drops: Dict[Tuple[str, str, str], int] = {}
 
+        # Each drop bumps its table's version. A rule is only re-checked when
+        # the table it depends on changed since its last check: orphans appear
+        # when the parent shrinks, parents lose children when the child does.
+        versions: Dict[str, int] = {}
+        checked: Dict[Tuple[str, int], int] = {}
+
+        def stale(rule: str, index: int, table: str) -> bool:
+            version = versions.get(table, 0)
+            if checked.get((rule, index)) == version:
+                return False
+            checked[(rule, index)] = version
+            return True
+
+        def drop(table: str, mask_keep, code: str, relation: Relation) -> bool:
+            dropped = int((~mask_keep).sum())
+            if dropped == 0:
+                return False
+            data[table] = data[table][mask_keep].reset_index(drop=True)
+            versions[table] = versions.get(table, 0) + 1
+            key = (table, code, _relation_label(relation))
+            drops[key] = drops.get(key, 0) + dropped
+            return True
+
         while True:
             any_drop = False
-            for relation in self.relations:
+            for i, relation in enumerate(self.relations):
                 if (
                     relation.child_table not in data
                     or relation.parent_table not in data
@@ -184,79 +217,44 @@ class CascadeDropTransformer(Transformer):
                     continue
 
                 # --- Orphan-child drop ---
-                child_df = data[relation.child_table]
-                parent_df = data[relation.parent_table]
-                if (
-                    not child_df.empty
-                    and all(c in child_df.columns for c in relation.child_cols)
-                    and all(p in parent_df.columns for p in relation.parent_cols)
-                ):
-                    parent_keys = set(_row_tuples(parent_df, relation.parent_cols))
-                    child_keys = _row_tuples(child_df, relation.child_cols)
-                    # Treat any row with NA in FK as "no reference" → keep it.
-                    mask_has_value = (
-                        child_df[list(relation.child_cols)].notna().all(axis=1)
-                    )
-                    mask_match = pd.Series(
-                        [k in parent_keys for k in child_keys],
-                        index=child_df.index,
-                    )
-                    mask_keep = (~mask_has_value) | mask_match
-                    dropped = int((~mask_keep).sum())
-                    if dropped > 0:
-                        data[relation.child_table] = child_df[mask_keep].reset_index(
-                            drop=True
-                        )
-                        key = (
-                            relation.child_table,
-                            "CASCADE_ORPHAN_DROP",
-                            _relation_label(relation),
-                        )
-                        drops[key] = drops.get(key, 0) + dropped
+                if stale("orphan", i, relation.parent_table):
+                    mask_keep = self._orphan_keep_mask(data, relation)
+                    if mask_keep is not None and drop(
+                        relation.child_table,
+                        mask_keep,
+                        "CASCADE_ORPHAN_DROP",
+                        relation,
+                    ):
                         any_drop = True
 
                 # --- Required-child parent drop ---
-                if relation.parent_requires_child:
-                    child_df = data[relation.child_table]
-                    parent_df = data[relation.parent_table]
-                    if not parent_df.empty and all(
-                        p in parent_df.columns for p in relation.parent_cols
+                if relation.parent_requires_child and stale(
+                    "required", i, relation.child_table
+                ):
+                    mask_keep = self._required_child_keep_mask(data, relation)
+                    if mask_keep is not None and drop(
+                        relation.parent_table,
+                        mask_keep,
+                        "CASCADE_REQUIRED_CHILD_DROP",
+                        relation,
                     ):
-                        referenced_keys: set = set()
-                        if not child_df.empty and all(
-                            c in child_df.columns for c in relation.child_cols
-                        ):
-                            child_mask = (
-                                child_df[list(relation.child_cols)].notna().all(axis=1)
-                            )
-                            referenced_keys = set(
-                                _row_tuples(child_df[child_mask], relation.child_cols)
-                            )
-                        parent_keys = _row_tuples(parent_df, relation.parent_cols)
-                        mask_keep = pd.Series(
-                            [k in referenced_keys for k in parent_keys],
-                            index=parent_df.index,
-                        )
-                        dropped = int((~mask_keep).sum())
-                        if dropped > 0:
-                            data[relation.parent_table] = parent_df[
-                                mask_keep
-                            ].reset_index(drop=True)
-                            key = (
-                                relation.parent_table,
-                                "CASCADE_REQUIRED_CHILD_DROP",
-                                _relation_label(relation),
-                            )
-                            drops[key] = drops.get(key, 0) + dropped
-                            any_drop = True
+                        any_drop = True
 
             # --- Partial-loss parent drop (only when paired with snapshot) ---
             if self.snapshot is not None:
-                partial_drops = self._apply_partial_loss(data)
-                if partial_drops:
-                    any_drop = True
-                    for key, n in partial_drops.items():
-                        drops[key] = drops.get(key, 0) + n
+                for i, relation in enumerate(self.relations):
+                    if not relation.track_partial_loss:
+                        continue
+                    if not stale("partial", i, relation.child_table):
+                        continue
+                    mask_keep = self._partial_loss_keep_mask(data, relation)
+                    if mask_keep is not None and drop(
+                        relation.parent_table,
+                        mask_keep,
+                        "CASCADE_PARTIAL_LOSS_DROP",
+                        relation,
+                    ):
+                        any_drop = True
 
             if not any_drop:
                 break
@@ -278,9 +276,44 @@ class CascadeDropTransformer(Transformer):
                     f"'{table}' by {code} on {fk_label}"
                 )
 
-    def _apply_partial_loss(
-        self, data: dict[str, pd.DataFrame]
-    ) -> Dict[Tuple[str, str, str], int]:
+    @staticmethod
+    def _orphan_keep_mask(
+        data: dict[str, pd.DataFrame], relation: Relation
+    ) -> Optional[np.ndarray]:
+        """Child rows to keep: FK matches a parent key, or has a missing value."""
+        child_df = data[relation.child_table]
+        parent_df = data[relation.parent_table]
+        if (
+            child_df.empty
+            or not _has_columns(child_df, relation.child_cols)
+            or not _has_columns(parent_df, relation.parent_cols)
+        ):
+            return None
+        # Treat any row with NA in FK as "no reference" → keep it.
+        has_value = _notna_mask(child_df, relation.child_cols)
+        match = key_index(child_df, relation.child_cols).isin(
+            key_index(parent_df, relation.parent_cols)
+        )
+        return ~has_value | match
+
+    @staticmethod
+    def _required_child_keep_mask(
+        data: dict[str, pd.DataFrame], relation: Relation
+    ) -> Optional[np.ndarray]:
+        """Parent rows to keep: referenced by at least one child row."""
+        child_df = data[relation.child_table]
+        parent_df = data[relation.parent_table]
+        if parent_df.empty or not _has_columns(parent_df, relation.parent_cols):
+            return None
+        parent_keys = key_index(parent_df, relation.parent_cols)
+        if child_df.empty or not _has_columns(child_df, relation.child_cols):
+            return np.zeros(len(parent_df), dtype=bool)
+        child_mask = _notna_mask(child_df, relation.child_cols)
+        return parent_keys.isin(key_index(child_df[child_mask], relation.child_cols))
+
+    def _partial_loss_keep_mask(
+        self, data: dict[str, pd.DataFrame], relation: Relation
+    ) -> Optional[np.ndarray]:
         """Drop parents whose child-count fell below the snapshot baseline.
 
         Only relations with ``track_partial_loss=True`` are considered. A
@@ -289,56 +322,26 @@ class CascadeDropTransformer(Transformer):
         already covered by required-child drop or by orphan downstream).
         """
         assert self.snapshot is not None
-        partial: Dict[Tuple[str, str, str], int] = {}
-        for relation in self.relations:
-            if not relation.track_partial_loss:
-                continue
-            baseline = self.snapshot.counts_for(relation)
-            if baseline is None:
-                continue
-            if relation.parent_table not in data:
-                continue
-            parent_df = data[relation.parent_table]
-            if parent_df.empty or not all(
-                p in parent_df.columns for p in relation.parent_cols
-            ):
-                continue
-            child_df = data.get(relation.child_table)
-            if child_df is None or child_df.empty:
-                current_counts: Dict[Tuple, int] = {}
-            elif not all(c in child_df.columns for c in relation.child_cols):
-                current_counts = {}
-            else:
-                mask = child_df[list(relation.child_cols)].notna().all(axis=1)
-                current_counts = (
-                    child_df[mask].groupby(list(relation.child_cols)).size().to_dict()
-                )
-                # Normalize single-col dict keys to tuples
-                if relation.child_cols and len(relation.child_cols) == 1:
-                    current_counts = {(k,): v for k, v in current_counts.items()}
-
-            parent_keys = _row_tuples(parent_df, relation.parent_cols)
-            mask_keep = []
-            for key in parent_keys:
-                base_n = baseline.get(key, 0)
-                cur_n = current_counts.get(key, 0)
-                if base_n > 0 and 0 < cur_n < base_n:
-                    mask_keep.append(False)
-                else:
-                    mask_keep.append(True)
-            mask_keep_s = pd.Series(mask_keep, index=parent_df.index)
-            dropped = int((~mask_keep_s).sum())
-            if dropped > 0:
-                data[relation.parent_table] = parent_df[mask_keep_s].reset_index(
-                    drop=True
-                )
-                key = (
-                    relation.parent_table,
-                    "CASCADE_PARTIAL_LOSS_DROP",
-                    _relation_label(relation),
-                )
-                partial[key] = partial.get(key, 0) + dropped
-        return partial
+        baseline = self.snapshot._count_series(relation)
+        if baseline is None:
+            return None
+        parent_df = data[relation.parent_table]
+        if parent_df.empty or not _has_columns(parent_df, relation.parent_cols):
+            return None
+        child_df = data.get(relation.child_table)
+        if (
+            child_df is None
+            or child_df.empty
+            or not _has_columns(child_df, relation.child_cols)
+        ):
+            current = _empty_counts()
+        else:
+            current = _child_counts(child_df, relation.child_cols)
+
+        parent_keys = key_index(parent_df, relation.parent_cols)
+        base_n = _lookup_counts(baseline, parent_keys)
+        cur_n = _lookup_counts(current, parent_keys)
+        return ~((base_n > 0) & (cur_n > 0) & (cur_n < base_n))
 
 
 class CascadeSnapshot(Transformer):
@@ -374,7 +377,7 @@ class CascadeSnapshot(Transformer):
             for r in merge_relations(base, list(extra_relations or []))
             if r.track_partial_loss
         ]
-        self._counts: Dict[Tuple[str, Tuple[str, ...]], Dict[Tuple, int]] = {}
+        self._counts: Dict[Tuple[str, Tuple[str, ...]], pd.Series] = {}
 
     def transform(self, data: dict[str, pd.DataFrame]) -> None:
         self.messages = []
@@ -384,36 +387,61 @@ class CascadeSnapshot(Transformer):
                 continue
             child_df = data[relation.child_table]
             parent_df = data[relation.parent_table]
-            if child_df.empty or not all(
-                c in child_df.columns for c in relation.child_cols
-            ):
+            if child_df.empty or not _has_columns(child_df, relation.child_cols):
                 continue
-            mask = child_df[list(relation.child_cols)].notna().all(axis=1)
-            counts = child_df[mask].groupby(list(relation.child_cols)).size().to_dict()
-            if relation.child_cols and len(relation.child_cols) == 1:
-                counts = {(k,): v for k, v in counts.items()}
+            counts = _child_counts(child_df, relation.child_cols)
             # Initialise parents not present in child to 0
-            parent_keys = (
-                _row_tuples(parent_df, relation.parent_cols)
-                if all(p in parent_df.columns for p in relation.parent_cols)
-                else []
-            )
-            full = {k: 0 for k in parent_keys}
-            full.update(counts)
-            self._counts[relation.key] = full
+            if _has_columns(parent_df, relation.parent_cols):
+                parent_keys = key_index(parent_df, relation.parent_cols).unique()
+                missing = parent_keys[~parent_keys.isin(counts.index)]
+                if len(missing):
+                    counts = counts.reindex(counts.index.union(missing), fill_value=0)
+            self._counts[relation.key] = counts
+
+    def _count_series(self, relation: Relation) -> Optional[pd.Series]:
+        """Captured child counts indexed by parent key, or None."""
+        return self._counts.get(relation.key)
 
     def counts_for(self, relation: Relation) -> Optional[Dict[Tuple, int]]:
         """Return captured ``{parent_key_tuple: count}`` for the relation, or None."""
-        return self._counts.get(relation.key)
+        counts = self._counts.get(relation.key)
+        if counts is None:
+            return None
+        if isinstance(counts.index, pd.MultiIndex):
+            return {tuple(k): int(v) for k, v in counts.items()}
+        return {(k,): int(v) for k, v in counts.items()}
+
+
+def _has_columns(df: pd.DataFrame, cols: Tuple[str, ...]) -> bool:
+    return all(c in df.columns for c in cols)
+
+
+def _notna_mask(df: pd.DataFrame, cols: Tuple[str, ...]) -> np.ndarray:
+    """Rows where every column in ``cols`` has a value."""
+    return df[list(cols)].notna().all(axis=1).to_numpy()
+
+
+def _child_counts(df: pd.DataFrame, cols: Tuple[str, ...]) -> pd.Series:
+    """Number of rows per (non-missing) key, indexed like ``_key_index``."""
+    keys = key_index(df[_notna_mask(df, cols)], cols)
+    counts = pd.Series(1, index=keys).groupby(level=list(range(keys.nlevels))).size()
+    counts.index.names = [None] * counts.index.nlevels
+    return counts
+
+
+def _empty_counts() -> pd.Series:
+    return pd.Series([], dtype="int64")
 
 
-def _row_tuples(df: pd.DataFrame, cols: Tuple[str, ...]) -> List[Tuple]:
-    """Return a list of column-value tuples (one per row) for the given columns."""
-    if not cols:
-        return []
-    if len(cols) == 1:
-        return [(v,) for v in df[cols[0]].tolist()]
-    return [tuple(row) for row in df[list(cols)].itertuples(index=False, name=None)]
+def _lookup_counts(counts: pd.Series, keys: pd.Index) -> np.ndarray:
+    """``counts`` at each of ``keys``; 0 for keys without a count."""
+    if counts.empty:
+        return np.zeros(len(keys), dtype="int64")
+    if isinstance(keys, pd.MultiIndex) != isinstance(counts.index, pd.MultiIndex):
+        return np.zeros(len(keys), dtype="int64")
+    positions = counts.index.get_indexer(keys)
+    values = counts.to_numpy()[positions]
+    return np.where(positions >= 0, values, 0)
 
 
 def _relation_label(relation: Relation) -> str:
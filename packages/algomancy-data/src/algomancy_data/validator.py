@@ -12,13 +12,22 @@ from abc import ABC, abstractmethod
 from collections import Counter
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
+from .relations import key_index
 from .schema import Schema, DataType
 from algomancy_utils import Logger
 
+#: Default number of offending rows a row-level check reports one message
+#: each for; above it the check emits a single aggregated message instead.
+DEFAULT_MAX_ROW_MESSAGES = 100
+
+#: Number of offending row labels quoted in an aggregated message.
+ROW_SAMPLE_SIZE = 10
+
 
 class ValidationSeverity(StrEnum):
     """Severity levels used in validation messages."""
@@ -70,9 +79,23 @@ class ValidationError(Exception):
 
 
 class ValidationMessage:
-    """Container for a validation outcome with optional structured location."""
+    """Container for a validation outcome with optional structured location.
 
-    __slots__ = ("severity", "message", "table", "column", "row", "code")
+    A message either points at a single ``row``, or aggregates a row-level
+    rule violated by many rows: then ``count`` is the number of offending rows
+    and ``rows`` holds all their labels (the message text quotes a sample).
+    """
+
+    __slots__ = (
+        "severity",
+        "message",
+        "table",
+        "column",
+        "row",
+        "code",
+        "count",
+        "rows",
+    )
 
     def __init__(
         self,
@@ -82,6 +105,8 @@ class ValidationMessage:
         column: Optional[str] = None,
         row: Optional[int] = None,
         code: Optional[str] = None,
+        count: Optional[int] = None,
+        rows: Optional[Sequence[int]] = None,
     ) -> None:
         self.severity = severity
         self.message = self.clean(message)
@@ -89,6 +114,8 @@ class ValidationMessage:
         self.column = column
         self.row = row
         self.code = code
+        self.count = count
+        self.rows = rows
 
     @staticmethod
     def clean(message: str) -> str:
@@ -103,6 +130,8 @@ class ValidationMessage:
             loc_parts.append(f"column={self.column}")
         if self.row is not None:
             loc_parts.append(f"row={self.row}")
+        if self.count is not None:
+            loc_parts.append(f"count={self.count}")
         if self.code is not None:
             loc_parts.append(f"code={self.code}")
         suffix = f" [{', '.join(loc_parts)}]" if loc_parts else ""
@@ -112,7 +141,7 @@ class ValidationMessage:
         return (
             f"ValidationMessage(severity={self.severity!r}, message={self.message!r}, "
             f"table={self.table!r}, column={self.column!r}, row={self.row!r}, "
-            f"code={self.code!r})"
+            f"code={self.code!r}, count={self.count!r})"
         )
 
     def __eq__(self, other: object) -> bool:
@@ -125,6 +154,7 @@ class ValidationMessage:
             and self.column == other.column
             and self.row == other.row
             and self.code == other.code
+            and self.count == other.count
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -135,6 +165,7 @@ class ValidationMessage:
             "column": self.column,
             "row": self.row,
             "code": self.code,
+            "count": self.count,
         }
 
 
@@ -166,13 +197,45 @@ class ValidationResult:
         """Return all messages with severity ``>= severity``."""
         return [m for m in self.messages if _severity_at_least(m.severity, severity)]
 
-    def as_dataframe(self) -> pd.DataFrame:
-        """Render messages as a pandas DataFrame for display/inspection."""
+    def as_dataframe(self, expand_rows: bool = True) -> pd.DataFrame:
+        """Render messages as a pandas DataFrame for display/inspection.
+
+        Args:
+            expand_rows: Expand each aggregated message into one line per
+                offending row, so the frame holds the full row-level detail.
+                With ``False`` there is one line per message.
+        """
+        columns = ["severity", "message", "table", "column", "row", "code"]
         if not self.messages:
-            return pd.DataFrame(
-                columns=["severity", "message", "table", "column", "row", "code"]
-            )
-        return pd.DataFrame([m.to_dict() for m in self.messages])
+            return pd.DataFrame(columns=columns)
+        frames = []
+        plain = []
+        for m in self.messages:
+            if expand_rows and m.rows is not None and len(m.rows) > 0:
+                if plain:
+                    frames.append(pd.DataFrame(plain, columns=columns))
+                    plain = []
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "severity": str(m.severity),
+                            "message": m.message,
+                            "table": m.table,
+                            "column": m.column,
+                            "row": np.asarray(m.rows),
+                            "code": m.code,
+                        },
+                        columns=columns,
+                    )
+                )
+            else:
+                d = m.to_dict()
+                plain.append([d[c] for c in columns])
+        if plain:
+            frames.append(pd.DataFrame(plain, columns=columns))
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
 
     def __bool__(self) -> bool:
         return self.is_valid
@@ -185,11 +248,21 @@ class ValidationResult:
 
 
 class Validator(ABC):
-    """Abstract validator that appends messages during ``validate``."""
+    """Abstract validator that appends messages during ``validate``.
+
+    Attributes:
+        max_row_messages: Row-level checks report one message per offending
+            row up to this many rows, and a single aggregated message above
+            it (see ``add_row_messages``). ``0`` always aggregates, ``None``
+            never does.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, max_row_messages: Optional[int] = DEFAULT_MAX_ROW_MESSAGES
+    ) -> None:
         self._messages: List[ValidationMessage] = []
         self._message_buffer: List[ValidationMessage] = []
+        self.max_row_messages = max_row_messages
 
     @property
     def messages(self) -> List[ValidationMessage]:
@@ -211,6 +284,52 @@ class Validator(ABC):
             )
         )
 
+    def add_row_messages(
+        self,
+        severity: ValidationSeverity,
+        rows: Sequence,
+        summary: str,
+        row_message: Callable[[Any], str],
+        table: Optional[str] = None,
+        column: Optional[str] = None,
+        code: Optional[str] = None,
+    ) -> None:
+        """Report the offending ``rows`` (index labels) of a row-level rule.
+
+        Up to ``max_row_messages`` rows get one message each, worded by
+        ``row_message(row)``. More rows get a single message: ``summary``
+        with the row count and a sample of row labels, carrying all labels
+        in ``ValidationMessage.rows``.
+        """
+        count = len(rows)
+        if count == 0:
+            return
+        if self.max_row_messages is None or count <= self.max_row_messages:
+            for row in rows:
+                self.add_message(
+                    severity,
+                    row_message(row),
+                    table=table,
+                    column=column,
+                    row=int(row),
+                    code=code,
+                )
+            return
+        labels = np.asarray(rows)
+        sample = ", ".join(str(r) for r in labels[:ROW_SAMPLE_SIZE].tolist())
+        more = ", ..." if count > ROW_SAMPLE_SIZE else ""
+        self._messages.append(
+            ValidationMessage(
+                severity,
+                f"{summary}: {count} row(s), e.g. rows {sample}{more}.",
+                table=table,
+                column=column,
+                code=code,
+                count=count,
+                rows=labels,
+            )
+        )
+
     def buffer_message(
         self,
         severity: ValidationSeverity,
@@ -393,13 +512,6 @@ class RequiredColumnsValidator(Validator):
         return self.messages
 
 
-def _composite_key(df: pd.DataFrame, columns: List[str]) -> pd.Series:
-    """Render a composite key as tuple values for duplicate/null checks."""
-    if len(columns) == 1:
-        return df[columns[0]]
-    return df[columns].apply(tuple, axis=1)
-
-
 class PrimaryKeyValidator(Validator):
     """Enforce uniqueness and non-null over each schema's primary key.
 
@@ -414,8 +526,9 @@ class PrimaryKeyValidator(Validator):
         self,
         schemas: List[Schema],
         severity: ValidationSeverity = ValidationSeverity.ERROR,
+        max_row_messages: Optional[int] = DEFAULT_MAX_ROW_MESSAGES,
     ) -> None:
-        super().__init__()
+        super().__init__(max_row_messages=max_row_messages)
         self._schemas = schemas
         self._severity = severity
 
@@ -440,28 +553,30 @@ class PrimaryKeyValidator(Validator):
 
             # Nulls in any PK column
             null_mask = df[pk].isna().any(axis=1)
-            for row_idx in df.index[null_mask].tolist():
-                self.add_message(
-                    self._severity,
-                    f"Null value in primary key {tuple(pk)} of {table_name}.",
-                    table=table_name,
-                    column=",".join(pk),
-                    row=int(row_idx),
-                    code="PK_NULL",
-                )
+            null_message = f"Null value in primary key {tuple(pk)} of {table_name}"
+            self.add_row_messages(
+                self._severity,
+                df.index[null_mask],
+                null_message,
+                lambda _row: f"{null_message}.",
+                table=table_name,
+                column=",".join(pk),
+                code="PK_NULL",
+            )
 
             # Duplicate composite keys
-            key_series = _composite_key(df.loc[~null_mask], pk)
-            duplicated_mask = key_series.duplicated(keep=False)
-            for row_idx in key_series.index[duplicated_mask].tolist():
-                self.add_message(
-                    self._severity,
-                    f"Duplicate primary key value in {table_name}.",
-                    table=table_name,
-                    column=",".join(pk),
-                    row=int(row_idx),
-                    code="PK_DUPLICATE",
-                )
+            non_null = df.loc[~null_mask, pk]
+            duplicated_mask = non_null.duplicated(keep=False)
+            duplicate_message = f"Duplicate primary key value in {table_name}"
+            self.add_row_messages(
+                self._severity,
+                non_null.index[duplicated_mask],
+                duplicate_message,
+                lambda _row: f"{duplicate_message}.",
+                table=table_name,
+                column=",".join(pk),
+                code="PK_DUPLICATE",
+            )
         return self.messages
 
 
@@ -481,8 +596,9 @@ class UniqueValueValidator(Validator):
         table: str,
         columns: List[str],
         severity: ValidationSeverity = ValidationSeverity.ERROR,
+        max_row_messages: Optional[int] = DEFAULT_MAX_ROW_MESSAGES,
     ) -> None:
-        super().__init__()
+        super().__init__(max_row_messages=max_row_messages)
         self.table = table
         self.columns = list(columns)
         self.severity = severity
@@ -509,15 +625,16 @@ class UniqueValueValidator(Validator):
                 continue
             non_null = df[col].dropna()
             duplicated_mask = non_null.duplicated(keep=False)
-            for row_idx in non_null.index[duplicated_mask].tolist():
-                self.add_message(
-                    self.severity,
-                    f"Duplicate value in '{self.table}.{col}'.",
-                    table=self.table,
-                    column=col,
-                    row=int(row_idx),
-                    code="DUPLICATE_VALUE",
-                )
+            message = f"Duplicate value in '{self.table}.{col}'"
+            self.add_row_messages(
+                self.severity,
+                non_null.index[duplicated_mask],
+                message,
+                lambda _row, message=message: f"{message}.",
+                table=self.table,
+                column=col,
+                code="DUPLICATE_VALUE",
+            )
         return self.messages
 
 
@@ -535,8 +652,9 @@ class MissingValueValidator(Validator):
         table: str,
         columns: List[str],
         severity: ValidationSeverity = ValidationSeverity.ERROR,
+        max_row_messages: Optional[int] = DEFAULT_MAX_ROW_MESSAGES,
     ) -> None:
-        super().__init__()
+        super().__init__(max_row_messages=max_row_messages)
         self.table = table
         self.columns = list(columns)
         self.severity = severity
@@ -561,16 +679,16 @@ class MissingValueValidator(Validator):
                     code="COLUMN_NOT_FOUND",
                 )
                 continue
-            null_mask = df[col].isna()
-            for row_idx in df.index[null_mask].tolist():
-                self.add_message(
-                    self.severity,
-                    f"Null value in '{self.table}.{col}'.",
-                    table=self.table,
-                    column=col,
-                    row=int(row_idx),
-                    code="NULL_VALUE",
-                )
+            message = f"Null value in '{self.table}.{col}'"
+            self.add_row_messages(
+                self.severity,
+                df.index[df[col].isna()],
+                message,
+                lambda _row, message=message: f"{message}.",
+                table=self.table,
+                column=col,
+                code="NULL_VALUE",
+            )
         return self.messages
 
 
@@ -596,8 +714,9 @@ class ForeignKeyValidator(Validator):
         right_table: str,
         right_col,
         severity: ValidationSeverity = ValidationSeverity.ERROR,
+        max_row_messages: Optional[int] = DEFAULT_MAX_ROW_MESSAGES,
     ) -> None:
-        super().__init__()
+        super().__init__(max_row_messages=max_row_messages)
         self.left_table = left_table
         self.right_table = right_table
         self.left_col: List[str] = (
@@ -656,25 +775,34 @@ class ForeignKeyValidator(Validator):
                 )
                 return self.messages
 
-        left_keys = _composite_key(left_df, self.left_col)
-        right_keys = set(_composite_key(right_df, self.right_col).dropna().tolist())
-
         # Skip nulls — they should be caught by MissingValueValidator instead.
-        non_null_mask = ~left_df[self.left_col].isna().any(axis=1)
-        for row_idx in left_df.index[non_null_mask].tolist():
-            value = left_keys.loc[row_idx]
-            if value not in right_keys:
-                self._bail(
-                    (
-                        f"Foreign key {tuple(self.left_col)}={value!r} in "
-                        f"{self.left_table} has no match in "
-                        f"{self.right_table}.{tuple(self.right_col)}."
-                    ),
-                    table=self.left_table,
-                    column=",".join(self.left_col),
-                    row=int(row_idx),
-                    code="FK_VIOLATION",
-                )
+        non_null_mask = ~left_df[self.left_col].isna().any(axis=1).to_numpy()
+        right_keys = key_index(
+            right_df[~right_df[self.right_col].isna().any(axis=1)], self.right_col
+        )
+        missing = non_null_mask & ~key_index(left_df, self.left_col).isin(right_keys)
+
+        def key_value(row):
+            if len(self.left_col) == 1:
+                return left_df.at[row, self.left_col[0]]
+            return tuple(left_df.loc[row, self.left_col])
+
+        self.add_row_messages(
+            self.severity,
+            left_df.index[missing],
+            (
+                f"Foreign key {tuple(self.left_col)} in {self.left_table} has "
+                f"no match in {self.right_table}.{tuple(self.right_col)}"
+            ),
+            lambda row: (
+                f"Foreign key {tuple(self.left_col)}={key_value(row)!r} in "
+                f"{self.left_table} has no match in "
+                f"{self.right_table}.{tuple(self.right_col)}."
+            ),
+            table=self.left_table,
+            column=",".join(self.left_col),
+            code="FK_VIOLATION",
+        )
         return self.messages
 
     @classmethod
@@ -0,0 +1,263 @@
+"""Tests for the bulk writers of the shared per-sub-table SQL tables."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="requires algomancy-data[database]")
+
+import csv
+import io
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from algomancy_data import DataClassification, DataSource
+from algomancy_data.database import (
+    BULK_WRITE_METHODS,
+    BulkWriter,
+    ExecutemanyWriter,
+    MultiRowInsertWriter,
+    PostgresCopyWriter,
+    get_bulk_writer,
+)
+from algomancy_data.database.bulk_writer import AutoBulkWriter, with_discriminators
+from algomancy_data.database.database_manager import DatabaseDataManager
+
+_DRIVER_METHODS = ["pandas", "multirow", "executemany", "auto"]
+
+
+@pytest.fixture
+def engine():
+    return sa.create_engine("sqlite:///:memory:")
+
+
+def _frame(rows=25):
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "price": [np.nan if i % 7 == 0 else i / 4 for i in range(rows)],
+            "sku": [
+                None if i % 5 == 0 else "" if i % 6 == 0 else f"s{i}"
+                for i in range(rows)
+            ],
+            "at": pd.Timestamp("2024-03-01")
+            + pd.to_timedelta(np.arange(rows), unit="h"),
+        }
+    )
+
+
+def _read(engine, table):
+    with engine.connect() as conn:
+        df = pd.read_sql_table(table, conn)
+    return df.sort_values("id", ignore_index=True)
+
+
+@pytest.mark.parametrize("method", _DRIVER_METHODS)
+def test_every_method_writes_the_same_rows(engine, method):
+    frame = _frame()
+    with engine.begin() as conn:
+        get_bulk_writer("pandas").append(conn, "expected", frame, {"_s": "a"})
+        get_bulk_writer(method).append(conn, "actual", frame, {"_s": "a"})
+
+    pd.testing.assert_frame_equal(_read(engine, "actual"), _read(engine, "expected"))
+    assert list(_read(engine, "actual").columns) == ["_s", "id", "price", "sku", "at"]
+
+
+def test_multirow_statements_stay_under_the_parameter_limit(engine):
+    writer = MultiRowInsertWriter(max_parameters=20)
+    statements = []
+
+    with engine.begin() as conn:
+        conn.connection.driver_connection.set_trace_callback(statements.append)
+        writer.append(conn, "t", _frame(10), {"_s": "a"})
+        conn.connection.driver_connection.set_trace_callback(None)
+
+    # 5 columns -> 4 rows (20 parameters) per statement.
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 3
+    assert len(_read(engine, "t")) == 10
+
+
+def test_discriminators_share_the_callers_column_data():
+    frame = _frame()
+    framed = with_discriminators(frame, {"_s": "a", "_d": "b"})
+
+    assert list(framed.columns) == ["_s", "_d", "id", "price", "sku", "at"]
+    assert (framed["_s"] == "a").all()
+    assert np.shares_memory(framed["price"].to_numpy(), frame["price"].to_numpy())
+    assert list(frame.columns) == ["id", "price", "sku", "at"]
+
+
+def test_unknown_and_unsupported_methods_are_rejected(engine):
+    assert set(BULK_WRITE_METHODS) == {
+        "auto",
+        "pandas",
+        "multirow",
+        "executemany",
+        "copy",
+    }
+    with pytest.raises(ValueError, match="bulk write method"):
+        get_bulk_writer("bcp")
+
+    with engine.begin() as conn, pytest.raises(ValueError, match="sqlite"):
+        get_bulk_writer("copy").append(conn, "t", _frame())
+
+
+class _Psycopg2Cursor:
+    def __init__(self):
+        self.statement = self.payload = None
+
+    def copy_expert(self, statement, file):
+        self.statement, self.payload = statement, file.read()
+
+    def close(self):
+        pass
+
+
+class _Psycopg3Cursor:
+    def __init__(self):
+        self.statement, self.payload = None, ""
+
+    @contextmanager
+    def copy(self, statement):
+        self.statement = statement
+        yield self
+
+    def write(self, data):
+        self.payload += data
+
+    def close(self):
+        pass
+
+
+class _PostgresConnection:
+    """What ``PostgresCopyWriter.insert`` uses of a SQLAlchemy connection."""
+
+    def __init__(self, dialect, cursor):
+        self.dialect = dialect
+        self.connection = self
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+def _copy(engine, frame, dialect, cursor):
+    """COPY statement and payload for ``frame``, converted by pandas as usual."""
+    writer = PostgresCopyWriter()
+
+    def method(table, conn, keys, data_iter):
+        writer.insert(table, _PostgresConnection(dialect, cursor), keys, data_iter)
+
+    with engine.begin() as conn:
+        frame.to_sql("t", conn, index=False, method=method)
+    return cursor.statement, cursor.payload
+
+
+def _copy_rows(payload):
+    """Parse ``payload`` as Postgres does: unquoted empty fields are NULL."""
+    reader = csv.reader(io.StringIO(payload, newline=""), quoting=csv.QUOTE_NOTNULL)
+    return list(reader)
+
+
+_COPY_DRIVERS = [
+    pytest.param(postgresql.psycopg2.dialect(), _Psycopg2Cursor, id="psycopg2"),
+    pytest.param(postgresql.psycopg.dialect(), _Psycopg3Cursor, id="psycopg"),
+]
+
+
+@pytest.mark.parametrize(("dialect", "cursor_type"), _COPY_DRIVERS)
+def test_copy_writes_postgres_csv(engine, dialect, cursor_type):
+    frame = pd.DataFrame(
+        {
+            "Name": ["plain", "", None, 'say "hi", then\nleave'],
+            "qty": [1, 2, 3, 4],
+            "price": [1.5, np.nan, 0.1, -2.0],
+            "flag": [True, False, True, False],
+            "at": pd.to_datetime(
+                ["2024-03-01 12:30", "2024-03-01 00:00:00.25", None, "2024-12-31"],
+                format="ISO8601",
+            ),
+        }
+    )
+    statement, payload = _copy(engine, frame, dialect, cursor_type())
+
+    assert statement == (
+        'COPY t ("Name", qty, price, flag, at) FROM STDIN WITH (FORMAT csv)'
+    )
+    # Empty strings are quoted; NULLs (None, NaN, NaT) are unquoted empty fields.
+    assert payload.splitlines()[1:3] == [
+        '"",2,,False,2024-03-01 00:00:00.250000',
+        ",3,0.1,True,",
+    ]
+    assert _copy_rows(payload) == [
+        ["plain", "1", "1.5", "True", "2024-03-01 12:30:00"],
+        ["", "2", None, "False", "2024-03-01 00:00:00.250000"],
+        [None, "3", "0.1", "True", None],
+        ['say "hi", then\nleave', "4", "-2.0", "False", "2024-12-31 00:00:00"],
+    ]
+
+
+@pytest.mark.parametrize(("dialect", "cursor_type"), _COPY_DRIVERS)
+def test_copy_keeps_nulls_of_single_column_tables(engine, dialect, cursor_type):
+    frame = pd.DataFrame({"note": ["x", "", None, "\\N"]})
+    statement, payload = _copy(engine, frame, dialect, cursor_type())
+
+    assert statement == "COPY t (note) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    # Only the unquoted \\N is NULL; the string "\\N" stays quoted.
+    assert payload.splitlines() == ['"x"', '""', "\\N", '"\\N"']
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected"),
+    [
+        (postgresql.psycopg2.dialect(), PostgresCopyWriter),
+        (postgresql.psycopg.dialect(), PostgresCopyWriter),
+        (postgresql.pg8000.dialect(), MultiRowInsertWriter),
+        (sqlite.pysqlite.dialect(), ExecutemanyWriter),
+        (mysql.pymysql.dialect(), MultiRowInsertWriter),
+    ],
+    ids=["psycopg2", "psycopg", "pg8000", "sqlite", "mysql"],
+)
+def test_auto_picks_the_writer_for_the_dialect(dialect, expected):
+    assert type(AutoBulkWriter().writer_for(dialect)) is expected
+
+
+def test_custom_writer_is_used_by_the_data_manager(engine):
+    class CountingWriter(BulkWriter):
+        name = "counting"
+        appended = []
+
+        def append(self, conn, table_name, df, discriminators=None):
+            self.appended.append((table_name, len(df), discriminators))
+            super().append(conn, table_name, df, discriminators)
+
+    writer = CountingWriter()
+    dm = DatabaseDataManager(
+        etl_factory=None,
+        schemas=[],
+        engine=engine,
+        session_id="s1",
+        data_object_type=DataSource,
+        bulk_writer=writer,
+    )
+    dm.startup()
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="shop")
+    ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "price": [1.0, 2.0]}))
+    dm.add_data_source(ds)
+
+    assert writer.appended == [
+        (
+            "algomancy_ds__item",
+            2,
+            {"_algomancy_session_id": "s1", "_algomancy_dataset_name": "shop"},
+        )
+    ]
+    dm._data.clear()
+    pd.testing.assert_frame_equal(
+        dm.get_data("shop").get_table("item"), ds.get_table("item")
+    )
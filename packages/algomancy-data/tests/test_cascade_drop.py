@@ -186,6 +186,38 @@ class TestCompositeKey:
         assert len(data["sale"]) == 2
         assert set(data["sale"]["store"]) == {"S1", "S2"}
 
+    def test_composite_key_with_mixed_dtypes(self):
+        # Categorical parent keys and nullable-int child keys still match.
+        data = {
+            "shop": pd.DataFrame(
+                {
+                    "region": pd.Categorical(["EU", "US"]),
+                    "store": pd.Series([1, 2], dtype="int64"),
+                }
+            ),
+            "sale": pd.DataFrame(
+                {
+                    "region": ["EU", "US", "EU", "US"],
+                    "store": pd.Series([1, 2, 3, None], dtype="Int64"),
+                }
+            ),
+        }
+        t = CascadeDropTransformer(
+            extra_relations=[
+                Relation(
+                    "sale",
+                    ("region", "store"),
+                    "shop",
+                    ("region", "store"),
+                    parent_requires_child=True,
+                )
+            ]
+        )
+        t.transform(data)
+        # (EU, 3) is orphaned; (US, NA) has a missing key and is kept.
+        assert data["sale"]["store"].tolist() == [1, 2, pd.NA]
+        assert len(data["shop"]) == 2
+
 
 # ------------------------------------------------------------------ #
 # Schema-derived vs. transformer-override
@@ -342,6 +374,19 @@ class TestPartialLoss:
         assert "CASCADE_REQUIRED_CHILD_DROP" in codes
         assert "CASCADE_PARTIAL_LOSS_DROP" not in codes
 
+    def test_snapshot_counts_parents_without_any_children(self, recwarn):
+        """Only null foreign keys: every parent is counted with zero children."""
+        data = {
+            "product": pd.DataFrame({"id": [1, 2]}),
+            "order": pd.DataFrame({"id": ["O1"], "product_id": [float("nan")]}),
+        }
+        snap = CascadeSnapshot(schemas=[ProductSchema, PartialLossOrderSchema])
+        snap.transform(data)
+
+        relation = Relation("order", ("product_id",), "product", ("id",))
+        assert snap.counts_for(relation) == {(1,): 0, (2,): 0}
+        assert not [w for w in recwarn.list if w.category is FutureWarning]
+
 
 class TestPipelineIntegration:
     """End-to-end pipeline run with CascadeDropTransformer wired into SimpleETLFactory."""
@@ -97,6 +97,36 @@ class TestXLSXFileFromPath:
         assert "metadata" in payload
         assert "Sheet1" in payload["sheets"]
 
+    def _workbook(self, tmp_path):
+        p = tmp_path / "x.xlsx"
+        with pd.ExcelWriter(p) as writer:
+            pd.DataFrame({"a": [1, 2]}).to_excel(writer, sheet_name="A", index=False)
+            pd.DataFrame(
+                {"when": pd.to_datetime(["2024-01-01", "2024-02-01"])}
+            ).to_excel(writer, sheet_name="B", index=False)
+        return p
+
+    def test_read_sheets_by_name_and_index(self, tmp_path):
+        f = XLSXFile(name="x", path=str(self._workbook(tmp_path)))
+        sheets = f.read_sheets(["A", 1])
+        assert f.sheet_names == ["A", "B"]
+        assert sheets["A"]["a"].tolist() == [1, 2]
+        # Sheets are read directly, so datetimes survive as datetimes.
+        assert sheets[1]["when"].dtype == "datetime64[ns]"
+        assert f._content is None  # the JSON payload was never built
+
+    def test_read_sheets_rejects_unknown_sheets(self, tmp_path):
+        f = XLSXFile(name="x", path=str(self._workbook(tmp_path)))
+        with pytest.raises(ValueError, match="not found"):
+            f.read_sheets(["C"])
+        with pytest.raises(ValueError, match="out of range"):
+            f.read_sheets([2])
+
+    def test_read_sheets_with_calamine(self, tmp_path):
+        pytest.importorskip("python_calamine")
+        f = XLSXFile(name="x", path=str(self._workbook(tmp_path)))
+        assert f.read_sheets(["A"], engine="calamine")["A"]["a"].tolist() == [1, 2]
+
 
 # ------------------------------------------------------------------ #
 # transformer.py — clean / join / fill / drop
@@ -379,6 +409,45 @@ class TestDataTypeConverter:
         with pytest.raises(NotImplementedError):
             DataTypeConverter.convert_dtypes(df, {"a": "ridiculous-dtype"})
 
+    def test_notation_detected_from_sample_falls_back_on_full_column(self):
+        from algomancy_data.extractor import (
+            CONVERSION_SAMPLE_SIZE,
+            DataTypeConverter,
+        )
+
+        # The sample is plain, a later row has a decimal comma.
+        values = ["1.5"] * CONVERSION_SAMPLE_SIZE + ["2,5"]
+        df = pd.DataFrame({"x": values})
+        issues, timings = [], {}
+        out = DataTypeConverter.convert_dtypes(
+            df, {"x": DataType.FLOAT}, issues, copy=False, timings=timings
+        )
+        assert out is df
+        assert out["x"].iloc[-1] == 2.5
+        assert issues == [] and timings["x"] >= 0
+
+    def test_locale_hints_on_columns(self):
+        from algomancy_data.extractor import DataTypeConverter
+
+        df = pd.DataFrame(
+            {"amount": ["1.234,5", "10,25"], "when": ["03-02-2024", "04-02-2024"]}
+        )
+        columns = {
+            "amount": Column("amount", DataType.FLOAT, decimal=",", thousands="."),
+            "when": Column("when", DataType.DATETIME, date_format="%d-%m-%Y"),
+        }
+        out = DataTypeConverter.convert_dtypes(
+            df,
+            {"amount": DataType.FLOAT, "when": DataType.DATETIME},
+            columns=columns,
+        )
+        assert out["amount"].tolist() == [1234.5, 10.25]
+        assert out["when"].dt.month.tolist() == [2, 2]
+
+    def test_equal_decimal_and_thousands_rejected(self):
+        with pytest.raises(ValueError, match="must differ"):
+            Column("x", DataType.FLOAT, decimal=",", thousands=",")
+
 
 # ------------------------------------------------------------------ #
 # XLSXMultiExtractor — exercise multi-sheet branch
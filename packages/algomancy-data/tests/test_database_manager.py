@@ -178,6 +178,19 @@ class TestDatabaseDataManagerRoundTrip:
         assert loaded is not None
         assert loaded.tables["item"].iloc[0]["name"] == "X"
 
+    def test_classification_comes_from_the_catalogue(self, dm):
+        """get_data_classification should not load a dataset."""
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="src")
+        ds.add_table("item", pd.DataFrame({"id": ["a"], "name": ["A"], "price": [1.0]}))
+        dm.add_data_source(ds)
+        dm.derive_data("src", "derived")
+
+        dm._data.clear()
+        assert dm.get_data_classification("src") == DataClassification.MASTER_DATA
+        assert dm.get_data_classification("derived") == DataClassification.DERIVED_DATA
+        assert dm.get_data_classification("nope") is None
+        assert len(dm._data) == 0
+
     def test_derive_data(self, dm):
         """derive_data should create a new DB-persisted dataset."""
         ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="src")
@@ -544,3 +557,106 @@ class TestDatasourceCacheBound:
         for name in ("d0", "d1", "d2"):
             dm.get_data(name)
         assert len(dm._data) == 3
+
+
+class TestSingleFlightLoading:
+    @pytest.fixture
+    def file_engine(self, tmp_path):
+        # A file database: every thread gets its own connection to it.
+        return sa.create_engine(f"sqlite:///{tmp_path}/data.db")
+
+    def _manager(self, engine):
+        m = DatabaseDataManager(
+            etl_factory=SimpleETLFactory,
+            schemas=[ItemSchema()],
+            engine=engine,
+            session_id="test",
+            data_object_type=DataSource,
+        )
+        m.startup()
+        return m
+
+    def _seed(self, engine, name, sub_tables=("item",)):
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name=name)
+        for sub in sub_tables:
+            ds.add_table(
+                sub, pd.DataFrame({"id": [name], "name": [sub], "price": [1.0]})
+            )
+        self._manager(engine).add_data_source(ds)
+
+    def test_concurrent_requests_load_the_dataset_once(self, file_engine):
+        import threading
+        import time
+
+        self._seed(file_engine, "d0")
+        dm = self._manager(file_engine)
+        loads = []
+        load = dm._load_datasource_from_db
+
+        def slow_load(name):
+            loads.append(name)
+            time.sleep(0.05)
+            return load(name)
+
+        dm._load_datasource_from_db = slow_load
+        barrier = threading.Barrier(8)
+        results = []
+
+        def request():
+            barrier.wait()
+            results.append(dm.get_data("d0"))
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loads == ["d0"]
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+
+    def test_loads_reuse_the_table_catalogue_and_one_connection(
+        self, file_engine, monkeypatch
+    ):
+        self._seed(file_engine, "d0", sub_tables=("item", "extra", "more"))
+        dm = self._manager(file_engine)
+        dm.get_data("d0")
+
+        inspections = []
+        inspect = sa.inspect
+
+        def counting_inspect(bind):
+            # pandas inspects the connection it reads from; count the engine.
+            if bind is file_engine:
+                inspections.append(bind)
+            return inspect(bind)
+
+        monkeypatch.setattr(sa, "inspect", counting_inspect)
+        checkouts = []
+        sa.event.listen(file_engine, "checkout", lambda *args: checkouts.append(1))
+
+        dm._data.clear()
+        reloaded = dm.get_data("d0")
+
+        assert set(reloaded.tables) == {"item", "extra", "more"}
+        assert inspections == []
+        assert len(checkouts) == 1
+
+    def test_tables_created_after_the_catalogue_was_read_are_found(self, file_engine):
+        self._seed(file_engine, "d0")
+        dm = self._manager(file_engine)
+        dm.get_data("d0")  # reads the table catalogue
+
+        # Another manager creates a table this one has not seen.
+        self._seed(file_engine, "d1", sub_tables=("late",))
+        dm.startup()
+        assert dm.get_data("d1").tables["late"]["id"].tolist() == ["d1"]
+
+        # Tables this manager creates itself drop the cached catalogue.
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="d2")
+        ds.add_table("own", pd.DataFrame({"id": ["d2"]}))
+        dm.add_data_source(ds)
+        assert dm._table_names is None
+        dm._data.clear()
+        assert dm.get_data("d2").tables["own"]["id"].tolist() == ["d2"]
@@ -1,5 +1,10 @@
 """Tests for the DataSource derive functionality."""
 
+import contextlib
+import json
+import pickle
+
+import numpy as np
 import pandas as pd
 import pytest
 from algomancy_data.datasource import DataSource, DataClassification
@@ -215,3 +220,118 @@ class TestDataSourceDerive:
         assert isinstance(derived, TestDataSource)
         assert derived.post_derive_called is True
         assert ds.post_derive_called is False  # Original should not have flag set
+
+    def test_derive_keeps_extension_dtypes(self):
+        """Test that derive copies tables without losing extension dtypes."""
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="Typed Data")
+        df = pd.DataFrame(
+            {
+                "qty": pd.Series([1, None, 3], dtype="Int32"),
+                "region": pd.Categorical(["n", "s", "n"], categories=["s", "n"]),
+                "at": pd.DatetimeIndex(["2024-01-01", None, "2024-01-03"], tz="UTC"),
+            },
+            index=[5, 6, 7],
+        )
+        ds.add_table("typed", df)
+
+        derived = ds.derive("Derived Typed")
+
+        pd.testing.assert_frame_equal(derived.get_table("typed"), df)
+
+    def test_derive_shares_memory_until_written_with_copy_on_write(
+        self, sample_datasource
+    ):
+        """Test that derived tables are lazy copies under pandas copy-on-write."""
+        cow = (
+            contextlib.nullcontext()
+            if int(pd.__version__.split(".")[0]) >= 3
+            else pd.option_context("mode.copy_on_write", True)
+        )
+        with cow:
+            derived = sample_datasource.derive("Derived Data")
+            original_df = sample_datasource.get_table("test_table")
+            derived_df = derived.get_table("test_table")
+            assert np.shares_memory(
+                original_df["value"].to_numpy(), derived_df["value"].to_numpy()
+            )
+
+            derived_df.loc[0, "value"] = 999.9
+            assert original_df.loc[0, "value"] == 10.5
+
+    def test_derive_uses_json_round_trip_for_custom_serialisation(self):
+        """Test that subclasses with their own to_json keep their extra state."""
+
+        class TaggedDataSource(DataSource):
+            tag = None
+
+            def to_json(self):
+                return json.dumps({"base": super().to_json(), "tag": self.tag})
+
+            @classmethod
+            def from_json(cls, json_string):
+                data = json.loads(json_string)
+                ds = super().from_json(data["base"])
+                ds.tag = data["tag"]
+                return ds
+
+        ds = TaggedDataSource(ds_type=DataClassification.MASTER_DATA, name="Tagged")
+        ds.tag = "kept"
+
+        assert ds.derive("Derived Tagged").tag == "kept"
+
+
+class TestDataSourceFingerprint:
+    """Test suite for DataSource.fingerprint()."""
+
+    @staticmethod
+    def _make(name: str, values) -> DataSource:
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name=name)
+        ds.add_table("t", pd.DataFrame({"id": [1, 2, 3], "value": values}))
+        return ds
+
+    def test_fingerprint_ignores_identity(self):
+        first = self._make("first", [1.0, 2.0, 3.0])
+        second = self._make("second", [1.0, 2.0, 3.0])
+        assert first.id != second.id
+        assert first.fingerprint() == second.fingerprint()
+        assert first.derive("copy").fingerprint() == first.fingerprint()
+
+    def test_fingerprint_changes_with_content(self):
+        base = self._make("base", [1.0, 2.0, 3.0])
+        assert base.fingerprint() != self._make("x", [1.0, 2.0, 4.0]).fingerprint()
+
+        renamed_column = self._make("y", [1.0, 2.0, 3.0])
+        renamed_column.tables["t"] = renamed_column.tables["t"].rename(
+            columns={"value": "other"}
+        )
+        assert base.fingerprint() != renamed_column.fingerprint()
+
+    def test_fingerprint_handles_unhashable_cells(self):
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="lists")
+        ds.add_table("t", pd.DataFrame({"items": [[1, 2], [3]]}))
+        assert ds.fingerprint() == ds.fingerprint()
+
+    def test_fingerprint_is_memoised_until_a_table_changes(self, monkeypatch):
+        ds = self._make("memo", [1.0, 2.0, 3.0])
+        first = ds.fingerprint()
+
+        calls = []
+        hash_object = pd.util.hash_pandas_object
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return hash_object(*args, **kwargs)
+
+        monkeypatch.setattr(pd.util, "hash_pandas_object", counting)
+        assert ds.fingerprint() == first
+        assert ds.derive("copy").fingerprint() == first
+        assert pickle.loads(pickle.dumps(ds)).fingerprint() == first
+        assert len(calls) == 1  # only the unpickled copy hashed its tables
+
+        ds.add_table("t", pd.DataFrame({"id": [1, 2, 3], "value": [1.0, 2.0, 4.0]}))
+        second = ds.fingerprint()
+        assert second != first
+
+        ds.tables["t"] = ds.tables["t"].copy()
+        ds.tables["t"].loc[0, "value"] = 9.0
+        assert ds.fingerprint() != second
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+import threading
+import time
 from typing import Dict
 
 import pandas as pd
@@ -10,6 +13,8 @@ import pytest
 from algomancy_data import (
     Column,
     CSVSingleExtractor,
+    DataClassification,
+    DataLoadError,
     DataSource,
     DataSourceLoader,
     DataType,
@@ -233,6 +238,143 @@ class TestConversionMessages:
         assert conv[0].table == "widget"
 
 
+# ------------------------------------------------------------------ #
+# Concurrent extraction
+# ------------------------------------------------------------------ #
+
+
+def _widget_files(tmp_path, count: int = 4) -> Dict[str, CSVFile]:
+    files = {}
+    for i in range(count):
+        price = "abc" if i % 2 else f"{i}.5"
+        path = tmp_path / f"widget_{i}.csv"
+        path.write_text(f"id;name;price\nw{i};W{i};{price}\n", encoding="utf-8")
+        files[f"widget_{i}"] = CSVFile(name=f"widget_{i}", path=str(path))
+    return files
+
+
+class TestParallelExtraction:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_matches_serial_extraction(self, tmp_path, executor):
+        files = _widget_files(tmp_path)
+
+        def run(mode):
+            seq = ExtractionSequence(
+                extractors=[
+                    CSVSingleExtractor(f, WidgetSchema) for f in files.values()
+                ],
+                executor=mode,
+                max_workers=2,
+            )
+            return seq.data, seq.conversion_issues
+
+        serial_data, serial_issues = run("serial")
+        data, issues = run(executor)
+
+        assert list(data) == list(serial_data) == list(files)
+        for name in files:
+            pd.testing.assert_frame_equal(data[name], serial_data[name])
+        assert [(i.table, i.column) for i in issues] == [
+            (i.table, i.column) for i in serial_issues
+        ]
+        assert [i.table for i in issues] == ["widget_1", "widget_3"]
+
+    def test_first_failure_in_extractor_order_is_raised(self, tmp_path):
+        class Failing(CSVSingleExtractor):
+            def _extract_file(self):
+                raise FileNotFoundError(self.file.name)
+
+        files = list(_widget_files(tmp_path).values())
+        seq = ExtractionSequence(
+            extractors=[
+                CSVSingleExtractor(files[0], WidgetSchema),
+                Failing(files[1], WidgetSchema),
+                Failing(files[2], WidgetSchema),
+            ],
+            executor="thread",
+        )
+        with pytest.raises(FileNotFoundError, match="widget_1"):
+            seq.run_extraction()
+
+    def test_factory_configures_the_sequence(self, tmp_path):
+        class ThreadedFactory(_GoodETLFactory):
+            extraction_executor = "thread"
+            extraction_max_workers = 3
+
+        pipeline = ThreadedFactory.build_pipeline(
+            "widgets", _widget_files(tmp_path), {}, None
+        )
+        assert pipeline.extraction_sequence.executor == "thread"
+        assert pipeline.extraction_sequence.max_workers == 3
+        result = pipeline.run()
+        conv = [m.table for m in result.messages if m.code == "CONVERSION_FAILED"]
+        assert conv == ["widget_1", "widget_3"]
+
+    def test_conversion_timings_are_collected_per_table(self, tmp_path):
+        seq = ExtractionSequence(
+            extractors=[CSVSingleExtractor(_csv_file(tmp_path), WidgetSchema)]
+        )
+        seq.run_extraction()
+        assert set(seq.conversion_timings["widget"]) == {"id", "name", "price"}
+
+    def test_rejects_unknown_executor(self):
+        with pytest.raises(ValueError, match="executor must be one of"):
+            ExtractionSequence(executor="gpu")
+
+
+# ------------------------------------------------------------------ #
+# Path- and stream-based CSV extraction
+# ------------------------------------------------------------------ #
+
+
+class TestCSVStreaming:
+    def test_path_backed_file_is_not_read_up_front(self, tmp_path):
+        file = _csv_file(tmp_path)
+        assert file._content is None
+        df = CSVSingleExtractor(file, WidgetSchema).extract()["widget"]
+        assert list(df["id"]) == ["w1", "w2"]
+        assert df["price"].dtype == "float64"
+
+    def test_stream_with_decimal_commas_falls_back_to_converter(self):
+        stream = io.BytesIO(b"id;name;price\nw1;A;1,5\nw2;B;2,25\n")
+        extractor = CSVSingleExtractor(
+            CSVFile(name="widget", stream=stream), WidgetSchema
+        )
+        df = extractor.extract()["widget"]
+        assert list(df["price"]) == [1.5, 2.25]
+        assert extractor.conversion_issues == []
+
+    @pytest.mark.parametrize("as_instance", [False, True])
+    def test_column_hints_apply_to_schema_classes_and_instances(self, as_instance):
+        class HintedSchema(Schema):
+            _FILENAME = "widget"
+            _EXTENSION = FileExtension.CSV
+            _SCHEMA_TYPE = SchemaType.SINGLE
+
+            ID = Column(name="id", dtype=DataType.STRING)
+            PRICE = Column(
+                name="price", dtype=DataType.FLOAT, decimal=",", thousands="."
+            )
+
+        stream = io.BytesIO(b"id;price\nw1;1.234,5\nw2;2,25\n")
+        schema = HintedSchema() if as_instance else HintedSchema
+        extractor = CSVSingleExtractor(CSVFile(name="widget", stream=stream), schema)
+        df = extractor.extract()["widget"]
+        assert list(df["price"]) == [1234.5, 2.25]
+        assert extractor.conversion_issues == []
+
+    @pytest.mark.parametrize("engine", [None, "pyarrow"])
+    def test_schema_columns_only(self, tmp_path, engine):
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        file = _csv_file(tmp_path, "id;extra;price\nw1;x;1.5\nw2;y;2.0\n")
+        df = CSVSingleExtractor(
+            file, WidgetSchema, engine=engine, schema_columns_only=True
+        ).extract()["widget"]
+        assert list(df.columns) == ["id", "price"]
+        assert df["price"].dtype == "float64"
+
+
 # ------------------------------------------------------------------ #
 # Issue #90 — fill_empty no longer uses deprecated kwarg
 # ------------------------------------------------------------------ #
@@ -337,6 +479,109 @@ class TestStatefulStartup:
         assert dm.get_data_keys() == []
 
 
+def _lazy_folder(tmp_path):
+    """A data folder with a stored data source and an ETL directory."""
+    folder = tmp_path / "data"
+    folder.mkdir()
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="stored")
+    ds.add_table("widget", pd.DataFrame({"id": ["w1"], "price": [1.5]}))
+    (folder / "stored.json").write_text(ds.to_json(), encoding="utf-8")
+    (folder / "shop").mkdir()
+    (folder / "shop" / "widget.csv").write_text(
+        "id;name;price\nw1;Widget A;1.5\n", encoding="utf-8"
+    )
+    return folder
+
+
+def _lazy_manager(folder, **kwargs):
+    return StatefulDataManager(
+        etl_factory=_GoodETLFactory,
+        schemas=[WidgetSchema],
+        data_folder=str(folder),
+        save_type="json",
+        data_object_type=DataSource,
+        logger=None,
+        lazy_loading=True,
+        **kwargs,
+    )
+
+
+class TestLazyStartup:
+    def test_startup_only_catalogues(self, tmp_path):
+        dm = _lazy_manager(_lazy_folder(tmp_path))
+        dm.startup()
+
+        assert sorted(dm.get_data_keys()) == ["shop", "stored"]
+        assert not dm.is_loaded("shop") and not dm.is_loaded("stored")
+
+        shop = dm.get_data("shop")
+        assert shop.get_table("widget")["price"].tolist() == [1.5]
+        assert dm.is_loaded("shop") and not dm.is_loaded("stored")
+        assert dm.get_data("stored").is_master_data()
+        assert dm.startup_errors == []
+
+    def test_warmup_loads_every_dataset_in_the_background(self, tmp_path):
+        dm = _lazy_manager(_lazy_folder(tmp_path), warmup_workers=2)
+        dm.startup()
+
+        assert dm.wait_for_warmup(timeout=30)
+        assert dm.is_loaded("shop") and dm.is_loaded("stored")
+        assert sorted(dm.get_data_keys()) == ["shop", "stored"]
+
+    def test_concurrent_requests_load_once(self, tmp_path, monkeypatch):
+        dm = _lazy_manager(_lazy_folder(tmp_path))
+        dm.startup()
+        calls = []
+        read = dm._read_data_source
+
+        def slow_read(path):
+            calls.append(path)
+            time.sleep(0.05)
+            return read(path)
+
+        monkeypatch.setattr(dm, "_read_data_source", slow_read)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(dm.get_data("stored")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8 and all(r is results[0] for r in results)
+
+    def test_failed_load_is_recorded_and_dropped(self, tmp_path):
+        folder = _lazy_folder(tmp_path)
+        (folder / "broken.json").write_text("not valid json", encoding="utf-8")
+        dm = _lazy_manager(folder)
+        dm.startup()
+        assert "broken" in dm.get_data_keys()
+
+        with pytest.raises(DataLoadError, match="'broken' could not be loaded"):
+            dm.get_data("broken")
+        assert "broken" not in dm.get_data_keys()
+        with pytest.raises(DataLoadError):
+            dm.get_data("broken")
+        assert len(dm.startup_errors) == 1
+        assert "broken.json" in dm.startup_errors[0][0]
+
+    def test_deleting_an_unloaded_dataset_removes_its_file(self, tmp_path):
+        folder = _lazy_folder(tmp_path)
+        dm = _lazy_manager(folder)
+        dm.startup()
+
+        dm.delete_data("stored")
+        assert not (folder / "stored.json").exists()
+        assert dm.get_data_keys() == ["shop"]
+
+    def test_negative_warmup_workers_are_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="warmup_workers"):
+            _lazy_manager(tmp_path, warmup_workers=-1)
+
+
 # ------------------------------------------------------------------ #
 # ETLResult convenience helpers
 # ------------------------------------------------------------------ #
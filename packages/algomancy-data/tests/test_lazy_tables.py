@@ -0,0 +1,192 @@
+"""Tests for table-level lazy hydration of database-backed DataSources."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="requires algomancy-data[database]")
+
+import pandas as pd
+import sqlalchemy as sa
+
+from algomancy_data import (
+    Column,
+    DataClassification,
+    DataSource,
+    DataType,
+    FileExtension,
+    Schema,
+)
+from algomancy_data.database.database_manager import DatabaseDataManager
+from algomancy_data.database.lazy_tables import LazySqlTables
+from algomancy_data.schema import SchemaType
+
+
+class FlagSchema(Schema):
+    _FILENAME = "flags"
+    _EXTENSION = FileExtension.CSV
+    _SCHEMA_TYPE = SchemaType.SINGLE
+
+    ID = Column(name="id", dtype=DataType.STRING, primary_key=True)
+    ACTIVE = Column(name="active", dtype=DataType.BOOLEAN)
+
+
+@pytest.fixture
+def engine():
+    return sa.create_engine("sqlite:///:memory:")
+
+
+def _manager(engine, **kwargs):
+    dm = DatabaseDataManager(
+        etl_factory=None,
+        schemas=[FlagSchema()],
+        engine=engine,
+        session_id="s1",
+        data_object_type=kwargs.pop("data_object_type", DataSource),
+        lazy_tables=kwargs.pop("lazy_tables", True),
+        **kwargs,
+    )
+    dm.startup()
+    return dm
+
+
+def _dataset(name="shop", tables=("a", "b", "c")):
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name=name)
+    for table in tables:
+        ds.add_table(table, pd.DataFrame({"table": [table] * 3, "n": [1, 2, 3]}))
+    ds.add_table("flags", pd.DataFrame({"id": ["x", "y"], "active": [True, False]}))
+    return ds
+
+
+def _hydrated(engine, **kwargs):
+    original = _dataset()
+    _manager(engine).add_data_source(original)
+    return original, _manager(engine, **kwargs).get_data("shop")
+
+
+def test_only_requested_sub_tables_are_read(engine):
+    original, ds = _hydrated(engine)
+
+    assert isinstance(ds.tables, LazySqlTables)
+    assert ds.list_tables() == ["a", "b", "c", "flags"]
+    assert ds.tables.loaded_tables() == []
+
+    pd.testing.assert_frame_equal(ds.get_table("b"), original.get_table("b"))
+    assert ds.tables.loaded_tables() == ["b"]
+    # Coerced through the registered schema on first access.
+    assert ds.get_table("flags")["active"].tolist() == [True, False]
+    assert str(ds.get_table("flags")["active"].dtype) == "boolean"
+    assert ds.tables.loaded_tables() == ["b", "flags"]
+
+
+def test_cache_bound_counts_loaded_sub_tables(engine):
+    _, ds = _hydrated(engine, datasource_cache_size=2)
+
+    first = ds.get_table("a")
+    ds.get_table("b")
+    ds.get_table("c")  # unloads the least recently used table, "a"
+    assert ds.tables.loaded_tables() == ["b", "c"]
+    assert first["table"].tolist() == ["a"] * 3  # live references stay usable
+
+    # An unloaded table is read again on the next access.
+    pd.testing.assert_frame_equal(ds.get_table("a"), first)
+    assert ds.tables.loaded_tables() == ["a", "c"]
+
+    # Tables assigned in memory are never unloaded.
+    ds.add_table("own", pd.DataFrame({"n": [9]}))
+    ds.get_table("b")
+    ds.get_table("c")
+    assert ds.tables.is_loaded("own")
+
+
+def test_the_fingerprint_is_stored_rather_than_read(engine):
+    original, ds = _hydrated(engine)
+
+    assert ds.fingerprint() == original.fingerprint()
+    assert ds.tables.loaded_tables() == []
+
+    # Once a table changes in memory it is computed from the tables again.
+    ds.add_table("a", pd.DataFrame({"table": ["new"], "n": [0]}))
+    assert ds.fingerprint() != original.fingerprint()
+    assert ds.tables.loaded_tables() == ["a", "b", "c", "flags"]
+
+
+def test_whole_dataset_operations_read_every_table(engine):
+    _, ds = _hydrated(engine)
+    eager = _manager(engine, lazy_tables=False).get_data("shop")
+    assert type(eager.tables) is dict
+
+    copied = dict(ds.tables)
+    assert set(copied) == {"a", "b", "c", "flags"}
+    assert all(isinstance(df, pd.DataFrame) for df in copied.values())
+
+    _, ds = _hydrated(engine)
+    restored = pickle.loads(pickle.dumps(ds))
+    assert type(restored.tables) is dict
+    assert restored.fingerprint() == eager.fingerprint()
+
+    _, ds = _hydrated(engine)
+    derived = ds.derive("copy")
+    assert type(derived.tables) is dict
+    assert derived.fingerprint() == eager.fingerprint()
+
+
+def test_subclasses_with_their_own_table_layout_load_eagerly(engine):
+    class Custom(DataSource):
+        def from_sql_tables(self, tables):
+            super().from_sql_tables(tables)
+
+    _manager(engine).add_data_source(_dataset())
+    ds = _manager(engine, data_object_type=Custom).get_data("shop")
+
+    assert type(ds.tables) is dict
+    assert set(ds.tables) == {"a", "b", "c", "flags"}
+
+
+def test_replacing_a_dataset_drops_its_tables_from_the_bound(engine):
+    _manager(engine).add_data_source(_dataset())
+    dm = _manager(engine, datasource_cache_size=10)
+    ds = dm.get_data("shop")
+    ds.get_table("a")
+    assert len(dm._table_lru) == 1
+
+    dm.add_data_source(_dataset(tables=("z",)))
+    assert len(dm._table_lru) == 0
+    dm.delete_data("shop")
+    assert dm._table_lru == {}
+
+
+def test_a_replaced_dataset_keeps_the_version_it_was_loaded_with(engine):
+    _manager(engine).add_data_source(_dataset())
+    _manager(engine).add_data_source(_dataset("other"))
+    dm = _manager(engine, datasource_cache_size=1)
+    held = dm.get_data("shop")  # e.g. the input of a running scenario
+    first = held.get_table("a")
+
+    replacement = _dataset(tables=("a", "b"))
+    replacement.add_table("a", pd.DataFrame({"table": ["new"], "n": [0]}))
+    dm.add_data_source(replacement)
+
+    # Tables read before stay, and are not unloaded by the bound any more;
+    # the ones not read yet were read before the rows were replaced.
+    dm.get_data("other").get_table("a")
+    assert held.get_table("a") is first
+    assert held.tables.is_stale
+    assert held.get_table("c")["table"].tolist() == ["c"] * 3
+    assert dm.get_data("shop").list_tables() == ["a", "b", "flags"]
+    assert dm.get_data("shop").get_table("a")["table"].tolist() == ["new"]
+
+
+def test_a_deleted_dataset_does_not_read_empty_tables(engine):
+    _manager(engine).add_data_source(_dataset())
+    dm = _manager(engine)
+    held = dm.get_data("shop")
+    flags = held.get_table("flags")
+
+    dm.delete_data("shop")
+
+    assert held.get_table("flags") is flags
+    with pytest.raises(RuntimeError, match="'shop' was deleted"):
+        held.get_table("a")
@@ -0,0 +1,150 @@
+"""Tests for the versioned schema migrations and discriminator indexes."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="requires algomancy-data[database]")
+
+import pandas as pd
+import sqlalchemy as sa
+
+from algomancy_data import DataClassification, DataSource
+from algomancy_data.database.database_manager import DatabaseDataManager
+from algomancy_data.database.migrations import (
+    DATA_MIGRATIONS,
+    Migration,
+    MigrationRunner,
+    discriminator_index_name,
+)
+from algomancy_data.database.models import (
+    DATASET_COL,
+    SESSION_COL,
+    metadata as data_meta,
+    schema_migrations_table,
+)
+
+
+@pytest.fixture
+def engine():
+    return sa.create_engine("sqlite:///:memory:")
+
+
+def _manager(engine, session_id="s1"):
+    dm = DatabaseDataManager(
+        etl_factory=None,
+        schemas=[],
+        engine=engine,
+        session_id=session_id,
+        data_object_type=DataSource,
+    )
+    dm.startup()
+    return dm
+
+
+def _indexes(engine, table_name):
+    return {
+        index["name"]: index["column_names"]
+        for index in sa.inspect(engine).get_indexes(table_name)
+    }
+
+
+def _applied(engine, component="data"):
+    with engine.connect() as conn:
+        return (
+            conn.execute(
+                sa.select(schema_migrations_table.c.version).where(
+                    schema_migrations_table.c.component == component
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+
+def test_new_shared_tables_get_a_discriminator_index(engine):
+    dm = _manager(engine)
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="shop")
+    ds.add_table("item", pd.DataFrame({"id": ["a"], "price": [1.0]}))
+    dm.add_data_source(ds)
+    # Rewriting the dataset into the now existing table keeps the one index.
+    dm.add_data_source(ds)
+
+    assert _indexes(engine, "algomancy_ds__item") == {
+        discriminator_index_name("algomancy_ds__item"): [SESSION_COL, DATASET_COL]
+    }
+    assert _applied(engine) == [1, 2]
+
+
+def test_startup_indexes_tables_of_an_older_database(engine):
+    data_meta.create_all(engine)
+    pd.DataFrame({SESSION_COL: ["s1"], DATASET_COL: ["shop"], "id": ["a"]}).to_sql(
+        "algomancy_ds__item", engine, index=False
+    )
+    assert _indexes(engine, "algomancy_ds__item") == {}
+
+    _manager(engine)
+    assert list(_indexes(engine, "algomancy_ds__item").values()) == [
+        [SESSION_COL, DATASET_COL]
+    ]
+
+    # Applied once: later startups find nothing pending.
+    runner = MigrationRunner(engine, "data", DATA_MIGRATIONS)
+    assert runner.current_version() == runner.head == 2
+    assert runner.pending() == []
+    _manager(engine, "s2")
+    assert _applied(engine) == [1, 2]
+
+
+def test_startup_adds_the_fingerprint_column_to_an_older_catalogue(engine):
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE algomancy_datasets (id VARCHAR PRIMARY KEY, "
+                "name VARCHAR NOT NULL, session_id VARCHAR NOT NULL, "
+                "ds_type VARCHAR NOT NULL, creation_datetime DATETIME, "
+                "payload TEXT, sub_tables TEXT)"
+            )
+        )
+
+    dm = _manager(engine)
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="shop")
+    ds.add_table("item", pd.DataFrame({"id": ["a"], "price": [1.0]}))
+    dm.add_data_source(ds)
+
+    assert _manager(engine)._db_catalogue["shop"]["fingerprint"] == ds.fingerprint()
+
+
+def test_runner_applies_pending_steps_in_order_and_stops_on_failure(engine):
+    calls = []
+
+    def fail(conn):
+        calls.append(3)
+        raise RuntimeError("boom")
+
+    steps = [
+        Migration(1, "first", lambda conn: calls.append(1)),
+        Migration(2, "second", lambda conn: calls.append(2)),
+    ]
+    assert [m.version for m in MigrationRunner(engine, "app", steps).run()] == [1, 2]
+    assert MigrationRunner(engine, "app", steps).run() == []
+
+    with pytest.raises(RuntimeError, match="boom"):
+        MigrationRunner(engine, "app", [*steps, Migration(3, "fails", fail)]).run()
+    assert calls == [1, 2, 3]
+    assert _applied(engine, "app") == [1, 2]
+
+
+def test_runner_rejects_misnumbered_migrations(engine):
+    with pytest.raises(ValueError, match="numbered"):
+        MigrationRunner(engine, "app", [Migration(2, "gap", lambda conn: None)])
+
+
+def test_long_table_names_get_a_bounded_index_name():
+    short = discriminator_index_name("algomancy_ds__item")
+    long_a = discriminator_index_name("algomancy_ds__" + "a" * 80)
+    long_b = discriminator_index_name("algomancy_ds__" + "a" * 79 + "b")
+
+    assert short == "ix_algomancy_ds__item__discriminators"
+    assert len(long_a) == len(long_b) == 63
+    assert long_a != long_b
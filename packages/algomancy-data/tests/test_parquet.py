@@ -0,0 +1,141 @@
+"""Tests for the columnar ``save_type="parquet"`` storage of StatefulDataManager."""
+
+import json
+
+import pytest
+
+pytest.importorskip("pyarrow", reason="requires algomancy-data[parquet]")
+
+import pandas as pd
+
+from algomancy_data import (
+    BaseDataSource,
+    DataClassification,
+    DataSource,
+    SimpleETLFactory,
+    StatefulDataManager,
+)
+from algomancy_data.parquet import METADATA_FILE, is_parquet_datasource
+
+
+def _manager(folder, save_type="parquet", data_object_type=DataSource):
+    return StatefulDataManager(
+        etl_factory=SimpleETLFactory,
+        schemas=[],
+        data_folder=str(folder),
+        save_type=save_type,
+        data_object_type=data_object_type,
+        logger=None,
+    )
+
+
+def _orders() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": pd.Series([1, 2, 3], dtype="int32"),
+            "qty": pd.Series([5, None, 7], dtype="Int64"),
+            "price": [1.5, float("nan"), 3.25],
+            "region": pd.Categorical(["north", "south", "north"]),
+            "placed": pd.DatetimeIndex(
+                ["2024-01-01 00:00", None, "2024-03-01 12:30"],
+                tz="Europe/Amsterdam",
+            ),
+            "rush": [True, False, True],
+            "note": ["a", None, "c"],
+        },
+        index=[10, 20, 30],
+    )
+
+
+def test_data_source_round_trips_with_dtypes_and_index(tmp_path):
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="orders")
+    ds.add_table("orders", _orders())
+    ds.add_table("empty", pd.DataFrame({"x": pd.Series([], dtype="float64")}))
+    dm = _manager(tmp_path)
+    dm.set_data("orders", ds)
+    dm.store_data_source("orders")
+
+    restarted = _manager(tmp_path)
+    restarted.startup()
+    loaded = restarted.get_data("orders")
+
+    assert restarted.startup_errors == []
+    assert loaded.id == ds.id and loaded.is_master_data()
+    assert loaded.creation_datetime == ds.creation_datetime
+    pd.testing.assert_frame_equal(loaded.get_table("orders"), _orders())
+    pd.testing.assert_frame_equal(loaded.get_table("empty"), ds.get_table("empty"))
+
+
+def test_store_writes_a_directory_with_a_metadata_sidecar(tmp_path):
+    ds = DataSource(ds_type=DataClassification.DERIVED_DATA, name="orders")
+    ds.add_table("orders", _orders())
+    dm = _manager(tmp_path)
+    dm.set_data("orders", ds)
+    dm.store_data_source_as_parquet("orders")
+
+    path = tmp_path / "orders.parquet"
+    metadata = json.loads((path / METADATA_FILE).read_text(encoding="utf-8"))
+    assert is_parquet_datasource(str(path))
+    assert [t["name"] for t in metadata["tables"]] == ["orders"]
+    assert (path / metadata["tables"][0]["file"]).is_file()
+
+    with pytest.raises(Exception, match="already exists"):
+        dm.store_data_source_as_parquet("orders")
+    dm.store_data_source_as_parquet("orders", allow_overwrite=True)
+    assert not (tmp_path / "orders.parquet.tmp").exists()
+
+
+class OpaqueDataSource(BaseDataSource):
+    """A data source without table access, persisted through to_json."""
+
+    def __init__(self, ds_type, name=None, payload=None, **kwargs):
+        super().__init__(ds_type, name, **kwargs)
+        self.payload = payload
+
+    def to_json(self) -> str:
+        return json.dumps({"id": self.id, "name": self.name, "payload": self.payload})
+
+    @classmethod
+    def from_json(cls, json_string: str) -> "OpaqueDataSource":
+        data = json.loads(json_string)
+        return cls(
+            DataClassification.MASTER_DATA,
+            data["name"],
+            payload=data["payload"],
+            ds_id=data["id"],
+        )
+
+
+def test_data_sources_without_tables_are_stored_as_payload(tmp_path):
+    ds = OpaqueDataSource(DataClassification.MASTER_DATA, "opaque", payload=[1, 2])
+    dm = _manager(tmp_path, data_object_type=OpaqueDataSource)
+    dm.set_data("opaque", ds)
+    dm.store_data_source("opaque")
+
+    restarted = _manager(tmp_path, data_object_type=OpaqueDataSource)
+    restarted.startup()
+    assert restarted.get_data("opaque").payload == [1, 2]
+
+
+def test_parquet_directories_are_not_run_through_etl(tmp_path):
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="orders")
+    ds.add_table("orders", _orders())
+    dm = _manager(tmp_path)
+    dm.set_data("orders", ds)
+    dm.store_data_source("orders")
+
+    json_dm = _manager(tmp_path, save_type="json")
+    json_dm.startup()
+    assert json_dm.get_data_keys() == []
+    assert json_dm.startup_errors == []
+
+
+def test_delete_removes_the_stored_directory(tmp_path):
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="orders")
+    ds.add_table("orders", _orders())
+    dm = _manager(tmp_path)
+    dm.set_data("orders", ds)
+    dm.store_data_source("orders")
+
+    dm.delete_data("orders")
+    assert not (tmp_path / "orders.parquet").exists()
@@ -0,0 +1,154 @@
+"""Tests for cached ETL snapshots of StatefulDataManager input directories."""
+
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow", reason="requires algomancy-data[parquet]")
+
+import pandas as pd
+
+from algomancy_data import (
+    Column,
+    DataSource,
+    DataType,
+    FileExtension,
+    Schema,
+    SimpleETLFactory,
+    StatefulDataManager,
+)
+from algomancy_data.schema import SchemaType
+from algomancy_data.snapshot import (
+    ETL_SNAPSHOT_FOLDER,
+    ETLSnapshotCache,
+    directory_fingerprint,
+)
+
+
+class WidgetSchema(Schema):
+    _FILENAME = "widget"
+    _EXTENSION = FileExtension.CSV
+    _SCHEMA_TYPE = SchemaType.SINGLE
+
+    ID = Column(name="id", dtype=DataType.STRING, primary_key=True)
+    PRICE = Column(name="price", dtype=DataType.FLOAT)
+
+
+class CountingETLFactory(SimpleETLFactory):
+    builds = 0
+
+    @classmethod
+    def build_pipeline(cls, dataset_name, files, schemas, logger=None):
+        cls.builds += 1
+        return super().build_pipeline(dataset_name, files, schemas, logger)
+
+
+@pytest.fixture
+def factory():
+    class Factory(CountingETLFactory):
+        builds = 0
+
+    return Factory
+
+
+def _folder(tmp_path, rows="id;price\nw1;1.5\nw2;2.0\n"):
+    folder = tmp_path / "data"
+    (folder / "shop").mkdir(parents=True)
+    (folder / "shop" / "widget.csv").write_text(rows, encoding="utf-8")
+    return folder
+
+
+def _manager(folder, factory, schemas=(WidgetSchema,), **kwargs):
+    dm = StatefulDataManager(
+        etl_factory=factory,
+        schemas=list(schemas),
+        data_folder=str(folder),
+        save_type="json",
+        data_object_type=DataSource,
+        logger=None,
+        etl_snapshots=True,
+        **kwargs,
+    )
+    dm.startup()
+    assert dm.startup_errors == []
+    return dm
+
+
+def test_restart_loads_the_snapshot_instead_of_running_etl(tmp_path, factory):
+    folder = _folder(tmp_path)
+    first = _manager(folder, factory)
+    assert factory.builds == 1
+    assert (folder / ETL_SNAPSHOT_FOLDER / "shop.parquet").is_dir()
+
+    second = _manager(folder, factory)
+    assert factory.builds == 1
+    assert second.get_data_keys() == ["shop"]
+    pd.testing.assert_frame_equal(
+        second.get_data("shop").get_table("widget"),
+        first.get_data("shop").get_table("widget"),
+    )
+
+
+def test_changed_inputs_invalidate_the_snapshot(tmp_path, factory):
+    folder = _folder(tmp_path)
+    _manager(folder, factory)
+
+    (folder / "shop" / "widget.csv").write_text(
+        "id;price\nw1;1.5\nw2;2.0\nw3;9.0\n", encoding="utf-8"
+    )
+    dm = _manager(folder, factory)
+    assert factory.builds == 2
+    assert len(dm.get_data("shop").get_table("widget")) == 3
+
+    # The refreshed snapshot serves the next restart.
+    _manager(folder, factory)
+    assert factory.builds == 2
+
+
+def test_factory_version_and_schema_are_part_of_the_key(tmp_path, factory):
+    folder = _folder(tmp_path)
+    _manager(folder, factory)
+
+    factory.version = "2"
+    _manager(folder, factory)
+    assert factory.builds == 2
+
+    class NullablePrice(WidgetSchema):
+        PRICE = Column(name="price", dtype=DataType.FLOAT, nullable=True)
+
+    _manager(folder, factory, schemas=[NullablePrice])
+    assert factory.builds == 3
+
+
+def test_content_fingerprint_ignores_touched_files(tmp_path):
+    folder = _folder(tmp_path)
+    path = folder / "shop" / "widget.csv"
+    stat_before = directory_fingerprint(str(folder / "shop"))
+    content_before = directory_fingerprint(str(folder / "shop"), "content")
+
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+    assert directory_fingerprint(str(folder / "shop")) != stat_before
+    assert directory_fingerprint(str(folder / "shop"), "content") == content_before
+
+    with pytest.raises(ValueError, match="fingerprint"):
+        ETLSnapshotCache(str(tmp_path), fingerprint="mtime")
+
+
+def test_unreadable_snapshot_is_discarded(tmp_path, factory):
+    folder = _folder(tmp_path)
+    _manager(folder, factory)
+    snapshot = folder / ETL_SNAPSHOT_FOLDER / "shop.parquet"
+    (snapshot / "metadata.json").write_text("{", encoding="utf-8")
+
+    dm = _manager(folder, factory)
+    assert factory.builds == 2
+    assert dm.get_data("shop") is not None
+    assert (snapshot / "metadata.json").read_text(encoding="utf-8") != "{"
+
+
+def test_deleting_the_dataset_discards_its_snapshot(tmp_path, factory):
+    folder = _folder(tmp_path)
+    dm = _manager(folder, factory)
+
+    dm.delete_data("shop")
+    assert not (folder / ETL_SNAPSHOT_FOLDER / "shop.parquet").exists()
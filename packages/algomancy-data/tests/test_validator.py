@@ -9,6 +9,7 @@ from algomancy_data import (
     Column,
     DataType,
     FileExtension,
+    ForeignKeyValidator,
     MissingValueValidator,
     PrimaryKeyValidator,
     RequiredColumnsValidator,
@@ -386,6 +387,56 @@ class TestMissingValueValidator:
         assert set(cols) == {"x", "y"}
 
 
+class TestAggregatedRowMessages:
+    def test_rows_above_cap_are_aggregated(self):
+        v = MissingValueValidator(table="t", columns=["x"], max_row_messages=2)
+        msgs = v.validate({"t": pd.DataFrame({"x": [None, 1, None, None, None]})})
+        assert len(msgs) == 1
+        msg = msgs[0]
+        assert msg.code == "NULL_VALUE" and msg.column == "x"
+        assert msg.count == 4 and msg.row is None
+        assert list(msg.rows) == [0, 2, 3, 4]
+        assert "4 row(s), e.g. rows 0, 2, 3, 4." in msg.message
+
+    def test_zero_cap_always_aggregates_and_none_never_does(self):
+        data = {"t": pd.DataFrame({"x": [1, 1, 2]})}
+        assert (
+            len(UniqueValueValidator("t", ["x"], max_row_messages=0).validate(data))
+            == 1
+        )
+        assert (
+            len(UniqueValueValidator("t", ["x"], max_row_messages=None).validate(data))
+            == 2
+        )
+
+    def test_composite_foreign_key_violations_are_aggregated(self):
+        data = {
+            "shop": pd.DataFrame({"region": ["EU", "US"], "store": [1, 2]}),
+            "sale": pd.DataFrame(
+                {"region": ["EU", "US", "EU", "US", None], "store": [1, 2, 2, 3, 9]}
+            ),
+        }
+        v = ForeignKeyValidator(
+            "sale", ["region", "store"], "shop", ["region", "store"], max_row_messages=1
+        )
+        msgs = v.validate(data)
+        assert len(msgs) == 1
+        assert msgs[0].code == "FK_VIOLATION"
+        assert list(msgs[0].rows) == [2, 3]
+
+    def test_as_dataframe_expands_aggregated_messages(self):
+        v = MissingValueValidator(table="t", columns=["x"], max_row_messages=0)
+        result = ValidationSequence([v]).run_validation(
+            {"t": pd.DataFrame({"x": [None] * 1000})}
+        )
+        assert len(result) == 1
+        df = result.as_dataframe()
+        assert len(df) == 1000
+        assert df["row"].tolist() == list(range(1000))
+        assert (df["code"] == "NULL_VALUE").all()
+        assert len(result.as_dataframe(expand_rows=False)) == 1
+
+
 # ------------------------------------------------------------------ #
 # Existing SchemaValidator — structured fields preserved
 # ------------------------------------------------------------------ #
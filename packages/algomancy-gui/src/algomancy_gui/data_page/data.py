@@ -1,5 +1,6 @@
 from dash import html, get_app, callback, Output, Input, State
 
+from algomancy_data import DataLoadError
 from algomancy_scenario import ScenarioManager
 
 from ..componentids import (
@@ -68,7 +69,12 @@ def fill_data_page_content(data_key: str, session_id: str):
     if data_key not in sm.get_data_keys():
         return [html.P("Select a dataset.")]
 
-    data = sm.get_data(data_key)
+    try:
+        data = sm.get_data(data_key)
+    except DataLoadError as exc:
+        return [html.P(str(exc))]
+    if data is None:
+        return [html.P("Select a dataset.")]
     page = cr.data_content(data)
 
     return page
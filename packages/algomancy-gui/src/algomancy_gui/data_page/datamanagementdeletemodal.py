@@ -4,6 +4,7 @@ import dash
 import dash_bootstrap_components as dbc
 from dash import html, dcc, callback, Output, Input, no_update, get_app, State
 
+from algomancy_data import DataLoadError
 from algomancy_scenario import ScenarioManager
 from ..componentids import (
     DM_DELETE_SET_SELECTOR,
@@ -169,8 +170,12 @@ def open_confirm_section(selected_data_key, session_id: str):
         return False, ""
     sm: ScenarioManager = get_scenario_manager(get_app().server, session_id)
 
-    is_master_data = sm.get_data(selected_data_key).is_master_data()
-    if is_master_data:
+    try:
+        data = sm.get_data(selected_data_key)
+    except DataLoadError:
+        data = None
+    # A dataset that cannot be loaded has no classification to protect.
+    if data is not None and data.is_master_data():
         return True, ""
     else:
         return False, "DELETE"
@@ -144,7 +144,9 @@ def download_modal_children(n, selected_keys, session_id: str):
 
     # Build file contents mapping
     files = {}
-    if sm.save_type == "json":
+    # Downloads are JSON for every save type: parquet data is stored as a
+    # directory per data source, which does not travel as a single file.
+    if sm.save_type in ("json", "parquet"):
         for key in selected_keys:
             name = _sanitize_filename(key) + ".json"
             files[name] = sm.get_data_as_json(key)
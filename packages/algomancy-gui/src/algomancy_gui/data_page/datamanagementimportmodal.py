@@ -441,8 +441,4 @@ def create_derived_dropdown_options(sm):
     Returns:
         List of option dictionaries for derived data dropdowns
     """
-    return [
-        {"label": ds, "value": ds}
-        for ds in sm.get_data_keys()
-        if not sm.get_data(ds).is_master_data()
-    ]
+    return [{"label": ds, "value": ds} for ds in sm.get_derived_data_keys()]
@@ -36,11 +36,7 @@ def create_derived_data_selector(sm: ScenarioManager):
     Returns:
         dcc.Dropdown: A Dash dropdown component populated with derived datasets
     """
-    derived_options = [
-        {"label": ds, "value": ds}
-        for ds in sm.get_data_keys()
-        if not sm.get_data(ds).is_master_data()
-    ]
+    derived_options = [{"label": ds, "value": ds} for ds in sm.get_derived_data_keys()]
 
     return dcc.Dropdown(
         id=DM_SAVE_SET_SELECTOR,
@@ -177,10 +173,14 @@ def save_derived_data(
 
     try:
         data = sm.get_data(set_name)
+        if data is None:
+            raise ValueError(f"Dataset '{set_name}' not found.")
         data.set_to_master_data()
 
         if sm.save_type == "json":
             sm.store_data_as_json(set_name)
+        elif sm.save_type == "parquet":
+            sm.store_data_as_parquet(set_name)
         else:
             raise ValueError(f"Unknown save type: {sm.save_type}")
 
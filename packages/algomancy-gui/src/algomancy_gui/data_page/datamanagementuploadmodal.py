@@ -63,7 +63,7 @@ def data_management_upload_modal(sm: ScenarioManager, themed_styling):
                         dbc.Label(
                             "The uploaded file will be uploaded as a new dataset."
                             "The name of the dataset will be the name of the uploaded file."
-                            f"The file must be in {sm.save_type} format."
+                            "The file must be in json format."
                         ),
                         dcc.Upload(
                             id=DM_UPLOAD_UPLOADER,
@@ -249,7 +249,8 @@ def _render_uploaded_files(filenames, wrong_filenames) -> html.Div:
 
 def check_files(filenames, session_id: str):
     sm: ScenarioManager = get_scenario_manager(get_app().server, session_id)
-    allowed_type = sm.save_type
+    # Uploads are parsed with ``from_json`` whatever the save type is.
+    allowed_type = "json"
 
     filenames_with_wrong_type = [
         file_name
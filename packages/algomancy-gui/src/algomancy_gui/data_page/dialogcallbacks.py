@@ -42,10 +42,6 @@ def get_options_for_lists(data, session_id: str):
     sm = get_scenario_manager(get_app().server, session_id)
 
     options = [{"label": ds, "value": ds} for ds in sm.get_data_keys()]
-    derived_options = [
-        {"label": ds, "value": ds}
-        for ds in sm.get_data_keys()
-        if not sm.get_data(ds).is_master_data()
-    ]
+    derived_options = [{"label": ds, "value": ds} for ds in sm.get_derived_data_keys()]
 
     return options, options, options, derived_options, options
@@ -279,7 +279,7 @@ def process_scenario(process_clicks, session_id):
             sm.process_scenario_async(scenario)
             return False  # enable progress interval
         elif scenario.status in (ScenarioStatus.QUEUED, ScenarioStatus.PROCESSING):
-            scenario.cancel(logger=sm.logger)
+            sm.cancel_scenario(scenario.id)
             return no_update
         elif scenario.status in (ScenarioStatus.COMPLETE, ScenarioStatus.FAILED):
             sm.refresh_scenario(scenario.id)
@@ -7,12 +7,19 @@ from algomancy_utils.baseparameterset import (
     BooleanParameter,
 )
 from .algorithmfactory import AlgorithmFactory
-from .keyperformanceindicator import KpiError, BaseKPI, BASE_KPI, ImprovementDirection
+from .keyperformanceindicator import (
+    KpiError,
+    KpiContext,
+    BaseKPI,
+    BASE_KPI,
+    ImprovementDirection,
+)
 from .result import BaseScenarioResult, BASE_RESULT_BOUND, ScenarioResult
+from .runmetrics import RunMetrics
 from .scenario import Scenario, ScenarioStatus
 from .scenariomanager import ScenarioManager
 from .sessionmanager import SessionManager
-from .basealgorithm import ALGORITHM, BaseAlgorithm
+from .basealgorithm import ALGORITHM, AlgorithmCancelled, BaseAlgorithm
 from .core_configuration import CoreConfig
 
 __all__ = [
@@ -24,15 +31,18 @@ __all__ = [
     "BooleanParameter",
     "BaseAlgorithm",
     "ALGORITHM",
+    "AlgorithmCancelled",
     "AlgorithmFactory",
     "ScenarioStatus",
     "ImprovementDirection",
     "KpiError",
+    "KpiContext",
     "BaseKPI",
     "BASE_KPI",
     "BaseScenarioResult",
     "BASE_RESULT_BOUND",
     "ScenarioResult",
+    "RunMetrics",
     "Scenario",
     "ScenarioManager",
     "SessionManager",
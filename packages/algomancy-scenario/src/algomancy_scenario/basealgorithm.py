@@ -1,5 +1,6 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Type, TypeVar
+from typing import Callable, Type, TypeVar
 
 from algomancy_data import BASEDATASOURCE
 from algomancy_utils import Logger
@@ -11,12 +12,36 @@ from algomancy_utils.baseparameterset import (
 )
 
 
+class AlgorithmCancelled(Exception):
+    """
+    Raised inside ``BaseAlgorithm.run`` when cancellation has been requested.
+
+    Algorithms rarely raise this themselves: ``set_progress`` and
+    ``check_cancelled`` raise it once ``request_cancel`` has been called
+    (by the user, or by the run timeout). The scenario is then marked FAILED
+    with the cancellation reason as its error.
+
+    Args:
+        message: Why the run was cancelled.
+    """
+
+    def __init__(self, message: str = "Scenario cancelled.") -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
 class BaseAlgorithm(ABC):
     # Class returned by ``run``. Override on subclasses whose ``run`` returns a
     # custom ``BaseScenarioResult`` subclass; the database repository uses this
     # to rehydrate persisted results into their original type.
     result_class: Type[BaseScenarioResult] = ScenarioResult
 
+    # Wall-clock limit for one run, in seconds. ``None`` means no limit. When
+    # exceeded the run is cancelled and the scenario is marked FAILED.
+    # Cancellation is cooperative in thread mode: it takes effect at the next
+    # ``set_progress`` / ``check_cancelled`` call made by ``run``.
+    timeout: float | None = None
+
     def __init__(self, name: str, params: BASE_PARAMS_BOUND):
         self._name: str = name
         self.description = str(params.serialize())
@@ -24,10 +49,30 @@ class BaseAlgorithm(ABC):
         self._data_params: BaseParameterSet = EmptyParameters()
         self._progress: float = 0
         self._logger: Logger | None = None  # set by factory after initialization
+        self._cancel_event = threading.Event()
+        self._cancel_reason: str | None = None
+        # Called with the new value on every ``set_progress``; set by the
+        # processor while a run is in flight so progress can be pushed.
+        self._progress_listener: Callable[[float], None] | None = None
 
     def __str__(self):
         return f"{self.name} [{self._progress:.0f}%]: {self.description}"
 
+    def __getstate__(self):
+        # Loggers hold console/file handles and events hold locks; drop them
+        # when the algorithm is pickled into a process-pool worker. The worker
+        # runs without a logger, and cancellation is enforced by the parent.
+        # Progress listeners live in the parent process too.
+        state = self.__dict__.copy()
+        state["_logger"] = None
+        state["_cancel_event"] = None
+        state["_progress_listener"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cancel_event = threading.Event()
+
     @property
     def params(self):
         return self._params
@@ -58,8 +103,41 @@ class BaseAlgorithm(ABC):
         self._logger = logger
 
     def set_progress(self, progress: float):
+        """Report progress (0-100). Raises ``AlgorithmCancelled`` if cancellation was requested."""
         assert 0 <= progress <= 100, "progress must be between 0 and 100"
         self._progress = progress
+        if self._progress_listener is not None:
+            self._progress_listener(progress)
+        self.check_cancelled()
+
+    def set_progress_listener(self, listener: Callable[[float], None] | None) -> None:
+        """Register a callback invoked with each ``set_progress`` value (None clears it)."""
+        self._progress_listener = listener
+
+    # Cancellation
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def request_cancel(self, reason: str = "Scenario cancelled.") -> None:
+        """Ask the running algorithm to stop at its next cancellation check."""
+        if not self._cancel_event.is_set():
+            self._cancel_reason = reason
+            self._cancel_event.set()
+
+    def check_cancelled(self) -> None:
+        """Raise ``AlgorithmCancelled`` if cancellation was requested.
+
+        Long-running ``run`` implementations that do not report progress
+        should call this periodically so cancellation and timeouts can free
+        the worker.
+        """
+        if self._cancel_event.is_set():
+            raise AlgorithmCancelled(self._cancel_reason or "Scenario cancelled.")
+
+    def reset_cancellation(self) -> None:
+        self._cancel_reason = None
+        self._cancel_event.clear()
 
     def is_complete(self):
         return self._progress == 100
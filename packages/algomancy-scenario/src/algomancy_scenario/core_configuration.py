@@ -24,6 +24,18 @@ class CoreConfig:
         data_path: Path to the directory where session and persistent data is stored.
         has_persistent_state: If True, data is persisted to disk using `save_type`.
         save_type: Format for persistent data storage ('json' or 'parquet').
+        lazy_data_loading: If True, startup only catalogues the datasets in the
+            data folder and each one is loaded on first access. Cannot be
+            combined with `autocreate`.
+        data_warmup_workers: With lazy data loading, the number of background
+            threads that load the catalogued datasets after startup. 0 loads
+            only on access.
+        etl_snapshots: If True, the ETL result of every input directory in the
+            data folder is cached as a snapshot and reused on later startups
+            while the directory is unchanged. Requires pyarrow.
+        etl_snapshot_fingerprint: How input directories are compared with
+            their snapshot: 'stat' (names, sizes, modification times) or
+            'content' (file contents).
         data_object_type: The class used to represent the data source (must inherit
             from `BaseDataSource`).
         etl_factory: An instance responsible for creating ETL processes.
@@ -38,6 +50,39 @@ class CoreConfig:
         default_algo: The name of the algorithm to use for autocreation.
         default_algo_params_values: Initial parameter values for the default algorithm.
         autorun: If True, the default algorithm is executed immediately after creation.
+        executor: How queued scenarios are run: 'thread' (in-process worker
+            threads) or 'process' (a process pool, for CPU-bound algorithms).
+        max_workers: Number of scenarios each processor runs concurrently.
+        max_concurrent_runs: When set, all sessions share one scheduler that runs
+            at most this many scenarios at once (round-robin across sessions).
+            ``max_workers`` is then ignored.
+        session_quota: With a shared scheduler, the maximum number of runs one
+            session may have in flight at once. None means no per-session cap.
+        run_cache_size: When set, completed runs are memoised (up to this many)
+            and scenarios repeating an earlier run on identical data, algorithm
+            and parameters reuse its result. None disables the cache.
+        persist_run_cache: With the database backend, also store cached runs
+            in the database so they survive restarts.
+        kpi_workers: Number of threads each scenario's KPIs are computed on.
+        progress_throttle: Minimum seconds between two pushed progress updates
+            of the same scenario. Status changes are always pushed.
+        durable_queue: With the database backend, queue runs in the
+            ``algomancy_jobs`` table so they survive restarts and can be shared
+            by several processes using the same database.
+        job_lease_seconds: How long a claimed durable job stays reserved for a
+            worker without renewal; a crashed worker's jobs are re-run after this.
+        job_max_attempts: How often a durable job is claimed before it is
+            dropped and its scenario marked failed (e.g. its scenario cannot
+            be loaded, or its runs keep crashing the worker).
+        async_persistence: With the database backend, finished runs are
+            written by a background writer that commits them in batches, so
+            workers do not wait on the database.
+        persist_batch_size: Maximum number of runs the background writer
+            commits in one transaction.
+        bulk_write_method: How the database backend appends dataset and
+            result rows to its shared tables: one of
+            `algomancy_data.database.BULK_WRITE_METHODS` ("auto", "pandas",
+            "multirow", "executemany" or "copy").
         title: The display title for the application.
     """
 
@@ -48,12 +93,17 @@ class CoreConfig:
         # === data manager configuration ===
         has_persistent_state: bool = False,
         save_type: str | None = "json",
+        lazy_data_loading: bool = False,
+        data_warmup_workers: int = 0,
+        etl_snapshots: bool = False,
+        etl_snapshot_fingerprint: str = "stat",
         data_object_type: type[BASEDATASOURCE] | None = None,
         # === persistence backend ===
         persistence_backend: str | None = None,
         database_url: str | None = None,
         hydrated_cache_size: int | None = None,
         eager_startup: bool = False,
+        lazy_table_loading: bool = False,
         # === scenario manager configuration ===
         etl_factory: Any | None = None,
         kpis: Dict[str, Type[BASE_KPI]] | None = None,
@@ -64,6 +114,21 @@ class CoreConfig:
         default_algo: str | None = None,
         default_algo_params_values: Dict[str, Any] | None = None,
         autorun: bool | None = None,
+        # === scenario processing ===
+        executor: str = "thread",
+        max_workers: int = 1,
+        max_concurrent_runs: int | None = None,
+        session_quota: int | None = None,
+        run_cache_size: int | None = None,
+        persist_run_cache: bool = False,
+        kpi_workers: int = 1,
+        progress_throttle: float = 0.5,
+        durable_queue: bool = False,
+        job_lease_seconds: float = 60.0,
+        job_max_attempts: int = 5,
+        async_persistence: bool = False,
+        persist_batch_size: int = 100,
+        bulk_write_method: str = "auto",
         # === misc (core) ===
         title: str = "Algomancy",
         **_: Any,
@@ -75,6 +140,10 @@ class CoreConfig:
             data_path: File system path for data storage. Defaults to "data".
             has_persistent_state: Enable or disable disk persistence. Defaults to False.
             save_type: File format for persistence ('json' or 'parquet'). Defaults to "json".
+            lazy_data_loading: Load datasets of the data folder on first access. Defaults to False.
+            data_warmup_workers: Background threads warming lazily loaded datasets. Defaults to 0.
+            etl_snapshots: Cache ETL results of input directories. Defaults to False.
+            etl_snapshot_fingerprint: Fingerprint mode of the ETL snapshots. Defaults to "stat".
             data_object_type: Type of the data container. Defaults to None.
             etl_factory: Factory object for ETL operations. Defaults to None.
             kpis: Dictionary of KPI identifiers and classes. Defaults to None.
@@ -84,6 +153,21 @@ class CoreConfig:
             default_algo: Name of the default algorithm. Defaults to None.
             default_algo_params_values: Default algorithm parameters. Defaults to None.
             autorun: Whether to run the default algorithm on startup. Defaults to None.
+            executor: Scenario execution mode ('thread' or 'process'). Defaults to "thread".
+            max_workers: Concurrent scenario runs per processor. Defaults to 1.
+            max_concurrent_runs: Global run cap for a scheduler shared by all
+                sessions. Defaults to None (one private processor per session).
+            session_quota: Per-session run cap under the shared scheduler. Defaults to None.
+            run_cache_size: Number of completed runs to memoise. Defaults to None (off).
+            persist_run_cache: Persist the run cache in the database backend. Defaults to False.
+            kpi_workers: Threads used to compute a scenario's KPIs. Defaults to 1.
+            progress_throttle: Seconds between pushed progress updates per scenario. Defaults to 0.5.
+            durable_queue: Queue runs in the database backend's job table. Defaults to False.
+            job_lease_seconds: Lease period of a claimed durable job. Defaults to 60.
+            job_max_attempts: Claims of a durable job before it is dropped. Defaults to 5.
+            async_persistence: Persist finished runs in background batches. Defaults to False.
+            persist_batch_size: Runs committed per background batch. Defaults to 100.
+            bulk_write_method: Bulk insert strategy of the database backend. Defaults to "auto".
             title: Application title. Defaults to "Algomancy".
             **_: Additional keyword arguments (ignored).
 
@@ -96,6 +180,10 @@ class CoreConfig:
         # data / scenario manager
         self.has_persistent_state = has_persistent_state
         self.save_type = save_type
+        self.lazy_data_loading = lazy_data_loading
+        self.data_warmup_workers = data_warmup_workers
+        self.etl_snapshots = etl_snapshots
+        self.etl_snapshot_fingerprint = etl_snapshot_fingerprint
         self.data_object_type = data_object_type
         self.etl_factory = etl_factory
         self.kpis = kpis
@@ -119,6 +207,26 @@ class CoreConfig:
         # of lazily on first access — reproducing the pre-0.10 "all scenarios
         # ready in memory" behaviour. Only meaningful with an unbounded cache.
         self.eager_startup = eager_startup
+        # When True, datasets hydrated by the SQL backend read each sub-table
+        # on first access, and hydrated_cache_size bounds loaded sub-tables
+        # instead of whole datasets.
+        self.lazy_table_loading = lazy_table_loading
+
+        # scenario processing
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_concurrent_runs = max_concurrent_runs
+        self.session_quota = session_quota
+        self.run_cache_size = run_cache_size
+        self.persist_run_cache = persist_run_cache
+        self.kpi_workers = kpi_workers
+        self.progress_throttle = progress_throttle
+        self.durable_queue = durable_queue
+        self.job_lease_seconds = job_lease_seconds
+        self.job_max_attempts = job_max_attempts
+        self.async_persistence = async_persistence
+        self.persist_batch_size = persist_batch_size
+        self.bulk_write_method = bulk_write_method
 
         # misc
         self.title = title
@@ -131,6 +239,10 @@ class CoreConfig:
             "data_path": self.data_path,
             "has_persistent_state": self.has_persistent_state,
             "save_type": self.save_type,
+            "lazy_data_loading": self.lazy_data_loading,
+            "data_warmup_workers": self.data_warmup_workers,
+            "etl_snapshots": self.etl_snapshots,
+            "etl_snapshot_fingerprint": self.etl_snapshot_fingerprint,
             "data_object_type": self.data_object_type,
             "etl_factory": self.etl_factory,
             "kpis": self.kpis,
@@ -145,6 +257,21 @@ class CoreConfig:
             "database_url": self.database_url,
             "hydrated_cache_size": self.hydrated_cache_size,
             "eager_startup": self.eager_startup,
+            "lazy_table_loading": self.lazy_table_loading,
+            "executor": self.executor,
+            "max_workers": self.max_workers,
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "session_quota": self.session_quota,
+            "run_cache_size": self.run_cache_size,
+            "persist_run_cache": self.persist_run_cache,
+            "kpi_workers": self.kpi_workers,
+            "progress_throttle": self.progress_throttle,
+            "durable_queue": self.durable_queue,
+            "job_lease_seconds": self.job_lease_seconds,
+            "job_max_attempts": self.job_max_attempts,
+            "async_persistence": self.async_persistence,
+            "persist_batch_size": self.persist_batch_size,
+            "bulk_write_method": self.bulk_write_method,
         }
 
     # ----- validation -----
@@ -220,6 +347,143 @@ class CoreConfig:
                 f"eager_startup must be a boolean; got {self.eager_startup!r}"
             )
 
+        # lazy table loading
+        if not isinstance(self.lazy_table_loading, bool):
+            raise ValueError(
+                f"lazy_table_loading must be a boolean; got {self.lazy_table_loading!r}"
+            )
+        if self.lazy_table_loading and self.persistence_backend != "database":
+            raise ValueError(
+                "lazy_table_loading requires persistence_backend='database'"
+            )
+
+        # lazy data loading
+        if not isinstance(self.lazy_data_loading, bool):
+            raise ValueError(
+                f"lazy_data_loading must be a boolean; got {self.lazy_data_loading!r}"
+            )
+        if (
+            not isinstance(self.data_warmup_workers, int)
+            or isinstance(self.data_warmup_workers, bool)
+            or self.data_warmup_workers < 0
+        ):
+            raise ValueError(
+                "data_warmup_workers must be a non-negative integer; "
+                f"got {self.data_warmup_workers!r}"
+            )
+        if self.data_warmup_workers and not self.lazy_data_loading:
+            raise ValueError("data_warmup_workers requires lazy_data_loading=True")
+        if self.lazy_data_loading and self.autocreate:
+            # A scenario is created from its loaded dataset, so autocreate
+            # would load the whole data folder at startup.
+            raise ValueError("lazy_data_loading cannot be combined with autocreate")
+
+        # ETL snapshots
+        if not isinstance(self.etl_snapshots, bool):
+            raise ValueError(
+                f"etl_snapshots must be a boolean; got {self.etl_snapshots!r}"
+            )
+        if self.etl_snapshot_fingerprint not in {"stat", "content"}:
+            raise ValueError(
+                "etl_snapshot_fingerprint must be 'stat' or 'content'; "
+                f"got {self.etl_snapshot_fingerprint!r}"
+            )
+
+        # scenario processing
+        valid_executors = {"thread", "process"}
+        if self.executor not in valid_executors:
+            raise ValueError(
+                f"executor must be one of {valid_executors}; got {self.executor!r}"
+            )
+        for name, val in {
+            "max_workers": self.max_workers,
+            "kpi_workers": self.kpi_workers,
+        }.items():
+            if not isinstance(val, int) or isinstance(val, bool) or val <= 0:
+                raise ValueError(f"{name} must be a positive integer; got {val!r}")
+        for name, val in {
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "session_quota": self.session_quota,
+            "run_cache_size": self.run_cache_size,
+        }.items():
+            if val is None:
+                continue
+            if not isinstance(val, int) or isinstance(val, bool) or val <= 0:
+                raise ValueError(
+                    f"{name} must be None or a positive integer; got {val!r}"
+                )
+        if (
+            not isinstance(self.progress_throttle, (int, float))
+            or isinstance(self.progress_throttle, bool)
+            or self.progress_throttle < 0
+        ):
+            raise ValueError(
+                "progress_throttle must be a non-negative number; "
+                f"got {self.progress_throttle!r}"
+            )
+        if not isinstance(self.durable_queue, bool):
+            raise ValueError(
+                f"durable_queue must be a boolean; got {self.durable_queue!r}"
+            )
+        if self.durable_queue and self.persistence_backend != "database":
+            raise ValueError("durable_queue requires persistence_backend='database'")
+        if (
+            not isinstance(self.job_lease_seconds, (int, float))
+            or isinstance(self.job_lease_seconds, bool)
+            or self.job_lease_seconds <= 0
+        ):
+            raise ValueError(
+                "job_lease_seconds must be a positive number; "
+                f"got {self.job_lease_seconds!r}"
+            )
+        if (
+            not isinstance(self.job_max_attempts, int)
+            or isinstance(self.job_max_attempts, bool)
+            or self.job_max_attempts < 1
+        ):
+            raise ValueError(
+                "job_max_attempts must be a positive integer; "
+                f"got {self.job_max_attempts!r}"
+            )
+        if not isinstance(self.async_persistence, bool):
+            raise ValueError(
+                f"async_persistence must be a boolean; got {self.async_persistence!r}"
+            )
+        if self.async_persistence and self.persistence_backend != "database":
+            raise ValueError(
+                "async_persistence requires persistence_backend='database'"
+            )
+        if (
+            not isinstance(self.persist_batch_size, int)
+            or isinstance(self.persist_batch_size, bool)
+            or self.persist_batch_size < 1
+        ):
+            raise ValueError(
+                "persist_batch_size must be a positive integer; "
+                f"got {self.persist_batch_size!r}"
+            )
+        if self.persistence_backend == "database":
+            # Only the database backend writes in bulk, and only with the
+            # database extra installed can it (or this check) run.
+            from algomancy_data.database import BULK_WRITE_METHODS
+
+            if self.bulk_write_method not in BULK_WRITE_METHODS:
+                raise ValueError(
+                    f"bulk_write_method must be one of {BULK_WRITE_METHODS}; "
+                    f"got {self.bulk_write_method!r}"
+                )
+        if not isinstance(self.persist_run_cache, bool):
+            raise ValueError(
+                f"persist_run_cache must be a boolean; got {self.persist_run_cache!r}"
+            )
+        if self.persist_run_cache and (
+            self.persistence_backend != "database" or self.run_cache_size is None
+        ):
+            raise ValueError(
+                "persist_run_cache requires persistence_backend='database' "
+                "and a run_cache_size"
+            )
+
         # save type
         if self.save_type is None:
             raise ValueError("save_type must be set to 'json' or 'parquet'")
@@ -0,0 +1,220 @@
+"""
+jobrunner.py - Runs scenarios from the durable database job queue
+
+With ``CoreConfig(durable_queue=True)`` a ``ScenarioManager`` does not hand a
+queued scenario straight to its processor. It records a job in
+``algomancy_jobs`` (see ``SqlJobQueue``) and wakes the ``JobRunner``, which
+claims jobs from the table and feeds them to the owning session's processor.
+
+Because the table is the queue, queued work survives a restart, a crashed
+worker's jobs are picked up again once their lease expires, and several
+processes sharing the database (e.g. API workers behind a load balancer)
+split the work without running anything twice.
+
+A job is only completed once its run is persisted. One that cannot be
+started here (its session is not hosted, or its scenario cannot be loaded),
+or whose run was lost before it was written, is released with a growing
+retry delay, so jobs queued behind it still run. After ``max_attempts``
+claims it is dropped and its scenario marked FAILED.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
+
+from algomancy_utils.logger import Logger
+
+from .persistence.job_queue import ClaimedJob, SqlJobQueue
+from .scenario import Scenario
+
+if TYPE_CHECKING:
+    from .scenariomanager import ScenarioManager
+
+
+class JobRunner:
+    """
+    Background thread that claims durable jobs and runs them locally.
+
+    At most ``capacity`` claimed jobs are held at once, so one process does
+    not lease more work than it can run. Leases of held jobs are renewed
+    every third of the lease period.
+
+    Args:
+        queue: The durable job queue.
+        resolve_manager: Returns the ``ScenarioManager`` for a session id, or
+            ``None`` if this process does not host that session.
+        session_ids: Returns the ids of the sessions hosted by this process;
+            only their jobs are claimed.
+        capacity: Maximum number of jobs held (queued locally or running).
+        poll_interval: Seconds between polls for jobs enqueued elsewhere.
+        max_attempts: Claims of one job before it is given up on; counts
+            releases and runs lost to crashed workers alike.
+        retry_seconds: Delay before a job that could not be started is
+            claimable again; doubled per attempt, capped at the lease period.
+        logger: Optional logger.
+    """
+
+    def __init__(
+        self,
+        queue: SqlJobQueue,
+        resolve_manager: Callable[[str], Optional["ScenarioManager"]],
+        session_ids: Callable[[], Iterable[str]],
+        capacity: int = 1,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        retry_seconds: float = 5.0,
+        logger: Logger | None = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1; got {max_attempts!r}")
+        if retry_seconds <= 0:
+            raise ValueError(f"retry_seconds must be positive; got {retry_seconds!r}")
+        self.logger = logger
+        self._queue = queue
+        self._resolve_manager = resolve_manager
+        self._session_ids = session_ids
+        self._capacity = capacity
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_seconds = retry_seconds
+        self._held: Dict[str, ClaimedJob] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._last_renewal = time.monotonic()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def queue(self) -> SqlJobQueue:
+        return self._queue
+
+    @property
+    def held_count(self) -> int:
+        with self._lock:
+            return len(self._held)
+
+    def start(self) -> "JobRunner":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop claiming jobs. Jobs already handed to a processor still finish."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def wake(self) -> None:
+        """Poll for jobs now instead of at the next interval."""
+        self._wake.set()
+
+    def submit(self, session_id: str, scenario: Scenario, priority: int = 0) -> None:
+        """Record a job for ``scenario`` and let a worker pick it up."""
+        self._queue.enqueue(session_id, scenario.id, priority=priority)
+        self.wake()
+
+    def cancel(self, scenario_id: str) -> bool:
+        """Drop the scenario's job unless another process is running it."""
+        return self._queue.cancel(scenario_id)
+
+    def wait_for_session(self, session_id: str, poll: float = 0.05) -> None:
+        """Block until ``session_id`` has no queued or running durable jobs."""
+        while self._queue.depth(session_id) > 0:
+            time.sleep(poll)
+
+    # Worker
+    def _loop(self) -> None:
+        while not self._stopping:
+            self._wake.clear()
+            try:
+                self._renew_if_due()
+                while not self._stopping and self.held_count < self._capacity:
+                    job = self._queue.claim(session_ids=list(self._session_ids()))
+                    if job is None:
+                        break
+                    self._dispatch(job)
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error("Durable job queue poll failed.")
+                    self.logger.log_traceback(exc)
+            self._wake.wait(self._poll_interval)
+
+    def _renew_if_due(self) -> None:
+        if time.monotonic() - self._last_renewal < self._queue.lease_seconds / 3:
+            return
+        self._last_renewal = time.monotonic()
+        with self._lock:
+            held = list(self._held)
+        for job_id in self._queue.renew(held):
+            if self.logger:
+                self.logger.warning(f"Lost the lease on job {job_id}.")
+
+    def _dispatch(self, job: ClaimedJob) -> None:
+        """Hand ``job`` to its session's processor, or put it back for later."""
+        if job.attempts > self._max_attempts:
+            # Claimed again and again without finishing: its runs keep dying.
+            self._give_up(job, "its runs did not finish")
+            return
+        manager = self._resolve_manager(job.session_id)
+        if manager is None:
+            # Not hosted here (any more); leave it to a process that hosts it.
+            self._retry_later(job, f"session {job.session_id} is not hosted here")
+            return
+        scenario = manager.get_by_id(job.scenario_id)
+        if scenario is None:
+            if not manager.sync_scenario(job.scenario_id):
+                # The scenario was deleted; nothing left to run.
+                self._queue.complete(job.job_id)
+                return
+            # Created by another process after this one indexed its session.
+            scenario = manager.get_by_id(job.scenario_id)
+        if scenario is None:
+            # Stored, but not loadable here yet (e.g. its dataset is missing).
+            self._retry_later(job, f"scenario {job.scenario_id} cannot be loaded")
+            return
+        with self._lock:
+            self._held[job.job_id] = job
+        try:
+            manager.enqueue_local(
+                scenario,
+                priority=job.priority,
+                on_done=lambda _scenario, persisted: self._finish(job, persisted),
+            )
+        except Exception:
+            with self._lock:
+                self._held.pop(job.job_id, None)
+            self._retry_later(job, "it could not be queued locally")
+            raise
+
+    def _retry_later(self, job: ClaimedJob, reason: str) -> None:
+        if job.attempts >= self._max_attempts:
+            self._give_up(job, reason)
+            return
+        delay = min(
+            self._retry_seconds * 2 ** (job.attempts - 1), self._queue.lease_seconds
+        )
+        if self.logger:
+            self.logger.warning(
+                f"Job {job.job_id} put back: {reason}; retrying in {delay:g}s."
+            )
+        self._queue.release(job.job_id, retry_after=delay)
+
+    def _give_up(self, job: ClaimedJob, reason: str) -> None:
+        if self.logger:
+            self.logger.error(
+                f"Job {job.job_id} dropped after {job.attempts} attempts: {reason}. "
+                f"Scenario {job.scenario_id} is marked failed."
+            )
+        self._queue.fail(job.job_id)
+
+    def _finish(self, job: ClaimedJob, persisted: bool) -> None:
+        with self._lock:
+            self._held.pop(job.job_id, None)
+        if persisted:
+            self._queue.complete(job.job_id)
+        else:
+            # The run's outcome was lost; keep the job so it runs again.
+            self._retry_later(job, "its run was not persisted")
+        self.wake()
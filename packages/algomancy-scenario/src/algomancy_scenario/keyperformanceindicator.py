@@ -1,6 +1,8 @@
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum, auto
-from typing import TypeVar
+from typing import Any, Callable, Dict, TypeVar
 
 from .result import BASE_RESULT_BOUND
 from algomancy_utils.unit import BaseMeasurement, Measurement, Unit
@@ -35,6 +37,12 @@ Quick start:
     3. Call `compute_and_check(result)` to populate the KPI value from scenario results.
     4. Use `pretty()` to get a human-readable string of the result.
 
+Shared precomputation:
+    When a scenario evaluates its KPIs, every KPI sees the same `KpiContext`
+    via `self.context`. Intermediate frames that several KPIs need (joins,
+    group-bys, indexes) can be built once with
+    `self.context.get("key", factory)` instead of once per KPI.
+
 Example:
     >>> from algomancy_scenario.keyperformanceindicator import BaseKPI, ImprovementDirection
     >>> from algomancy_utils.unit import QUANTITIES, BaseMeasurement
@@ -91,6 +99,50 @@ class KpiError(Exception):
         super().__init__(self.message)
 
 
+class KpiContext:
+    """
+    Per-result cache of derived values shared by the KPIs of one evaluation.
+
+    ``get(key, factory)`` calls ``factory(result)`` the first time ``key`` is
+    requested and returns the stored value afterwards. It is safe to call
+    from KPIs evaluated concurrently: each key is computed exactly once, and
+    callers requesting a key that is being computed wait for it.
+
+    Args:
+        result: The scenario result the KPIs are evaluated on.
+    """
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, key: str, factory: Callable[[Any], Any]) -> Any:
+        """
+        Returns the value for `key`, computing it with `factory(result)` once.
+
+        Args:
+            key: Name of the derived value.
+            factory: Builds the value from the result.
+
+        Returns:
+            The (cached) derived value.
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = factory(self.result)
+            with self._lock:
+                self._values[key] = value
+            return value
+
+
 class BaseKPI(ABC):
     """
     Abstract base class for all Key Performance Indicators.
@@ -110,8 +162,13 @@ class BaseKPI(ABC):
     Notes:
         - Subclasses MUST implement the `compute` method.
         - The `value` of the KPI is typically set via `compute_and_check`.
+        - KPIs of one scenario may be computed concurrently on a thread pool.
+          Set the class attribute `parallel_safe = False` for KPIs whose
+          `compute` must not run alongside others; they run sequentially.
     """
 
+    parallel_safe: bool = True
+
     def __init__(
         self,
         name: str,
@@ -125,6 +182,7 @@ class BaseKPI(ABC):
         self._threshold = (
             Measurement(base_measurement, threshold) if threshold else None
         )
+        self._context: KpiContext | None = None
 
     def __str__(self):
         """
@@ -139,6 +197,15 @@ class BaseKPI(ABC):
         """
         return self._measurement
 
+    @property
+    def context(self) -> KpiContext | None:
+        """
+        Returns the `KpiContext` shared with the other KPIs during `compute`.
+
+        Only set while `compute_and_check` runs; `None` otherwise.
+        """
+        return self._context
+
     @property
     def name(self) -> str:
         """
@@ -270,7 +337,9 @@ class BaseKPI(ABC):
         """
         raise NotImplementedError("Abstract method")
 
-    def compute_and_check(self, result: BASE_RESULT_BOUND) -> None:
+    def compute_and_check(
+        self, result: BASE_RESULT_BOUND, context: KpiContext | None = None
+    ) -> None:
         """
         Computes the KPI value and updates the internal state.
 
@@ -279,10 +348,13 @@ class BaseKPI(ABC):
 
         Args:
             result: The scenario result data.
+            context: Shared precompute cache for `result`, exposed to
+                `compute` as `self.context`. A fresh one is used when omitted.
 
         Raises:
             KpiError: If computation fails or returns a non-numeric value.
         """
+        self._context = context if context is not None else KpiContext(result)
         try:
             value = self.compute(result)
             if not isinstance(value, (int, float)):
@@ -291,6 +363,8 @@ class BaseKPI(ABC):
         except Exception as e:
             print(f"Error computing KPI {self.name}: {e}")
             raise KpiError(f"Error computing KPI {self.name}") from e
+        finally:
+            self._context = None
 
     def to_dict(self):
         """
@@ -310,3 +384,44 @@ class BaseKPI(ABC):
 
 
 BASE_KPI = TypeVar("BASE_KPI", bound=BaseKPI)
+
+
+def evaluate_kpis(
+    kpis: Dict[str, BaseKPI], result: BASE_RESULT_BOUND, max_workers: int = 1
+) -> None:
+    """
+    Computes every KPI in `kpis` on `result` with one shared `KpiContext`.
+
+    With `max_workers > 1` the `parallel_safe` KPIs run on a thread pool of
+    that size; the others run sequentially afterwards. All KPIs are attempted
+    even if some fail.
+
+    Args:
+        kpis: The KPIs to compute, keyed by name.
+        result: The scenario result data.
+        max_workers: Number of threads to compute KPIs on.
+
+    Raises:
+        KpiError: The first KPI failure, after all KPIs have been attempted.
+    """
+    context = KpiContext(result)
+    errors = []
+    parallel = [k for k in kpis.values() if k.parallel_safe] if max_workers > 1 else []
+    sequential = [k for k in kpis.values() if k not in parallel]
+
+    if len(parallel) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(kpi.compute_and_check, result, context) for kpi in parallel
+            ]
+        errors.extend(f.exception() for f in futures if f.exception() is not None)
+    else:
+        sequential = list(kpis.values())
+
+    for kpi in sequential:
+        try:
+            kpi.compute_and_check(result, context)
+        except KpiError as e:
+            errors.append(e)
+    if errors:
+        raise errors[0]
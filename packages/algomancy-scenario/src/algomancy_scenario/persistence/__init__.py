@@ -1,9 +1,16 @@
+from .job_queue import ClaimedJob, SqlJobQueue
 from .protocols import SqlResultLayout
 from .repository import ScenarioRepository
+from .run_cache_store import SqlRunCache
+from .run_writer import RunWriter
 from .sql_repository import SqlScenarioRepository
 
 __all__ = [
+    "ClaimedJob",
+    "RunWriter",
     "ScenarioRepository",
+    "SqlJobQueue",
     "SqlResultLayout",
+    "SqlRunCache",
     "SqlScenarioRepository",
 ]
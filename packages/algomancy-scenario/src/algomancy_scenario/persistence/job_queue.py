@@ -0,0 +1,257 @@
+"""Durable, lease-based scenario job queue for the database backend.
+
+Queued scenarios are recorded in ``algomancy_jobs`` so they survive restarts,
+and every process sharing the database can take work from the same queue.
+
+A worker *claims* a job by setting ``lease_owner`` / ``lease_expires_at`` with
+a conditional ``UPDATE`` that only succeeds if nobody else holds a live lease,
+so two workers never run the same job at once. While running, the worker
+renews its lease; if it dies, the lease expires and another worker (or the
+restarted process) claims the job again. Finished jobs are deleted. A job
+that cannot be started here is released with a retry delay, during which its
+lease keeps it from being claimed; one that keeps failing is dropped with
+:meth:`SqlJobQueue.fail`, which marks its scenario FAILED.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+import sqlalchemy as sa
+from algomancy_utils.logger import Logger
+
+from ..scenario import ScenarioStatus
+from .models import jobs_table, scenarios_table
+
+#: Candidate rows fetched per claim attempt; losing a race moves on to the next.
+_CLAIM_BATCH = 5
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """A job leased to this worker by :meth:`SqlJobQueue.claim`."""
+
+    job_id: str
+    session_id: str
+    scenario_id: str
+    priority: int
+    attempts: int
+
+
+class SqlJobQueue:
+    """Scenario job queue in the ``algomancy_jobs`` table.
+
+    Args:
+        engine: A SQLAlchemy ``Engine`` for the target database.
+        lease_seconds: How long a claim stays valid without renewal. A crashed
+            worker's jobs become claimable again after this long.
+        worker_id: Identifies this worker in ``lease_owner``. Defaults to a
+            unique ``host:pid:random`` string.
+        logger: Optional logger instance.
+    """
+
+    def __init__(
+        self,
+        engine: sa.Engine,
+        lease_seconds: float = 60.0,
+        worker_id: str | None = None,
+        logger: Logger | None = None,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError(f"lease_seconds must be positive; got {lease_seconds!r}")
+        self._engine = engine
+        self._lease = timedelta(seconds=lease_seconds)
+        self._worker_id = (
+            worker_id
+            if worker_id
+            else f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._logger = logger
+        jobs_table.create(engine, checkfirst=True)
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease.total_seconds()
+
+    def enqueue(self, session_id: str, scenario_id: str, priority: int = 0) -> str:
+        """Queue a run of ``scenario_id`` and mark the scenario QUEUED.
+
+        Enqueueing a scenario that already has a job is a no-op; the existing
+        job id is returned.
+        """
+        with self._engine.begin() as conn:
+            existing = conn.execute(
+                sa.select(jobs_table.c.job_id).where(
+                    jobs_table.c.scenario_id == scenario_id
+                )
+            ).scalar()
+            if existing is not None:
+                return existing
+            job_id = str(uuid.uuid4())
+            conn.execute(
+                jobs_table.insert().values(
+                    job_id=job_id,
+                    scenario_id=scenario_id,
+                    session_id=session_id,
+                    priority=priority,
+                    enqueued_at=datetime.now(),
+                    attempts=0,
+                )
+            )
+            conn.execute(
+                scenarios_table.update()
+                .where(scenarios_table.c.id == scenario_id)
+                .values(status=str(ScenarioStatus.QUEUED))
+            )
+        return job_id
+
+    def claim(self, session_ids: Iterable[str] | None = None) -> Optional[ClaimedJob]:
+        """Lease the next available job, highest priority then oldest first.
+
+        Only jobs of ``session_ids`` are considered when given. Returns
+        ``None`` when no job is available.
+        """
+        now = datetime.now()
+        available = sa.or_(
+            jobs_table.c.lease_owner.is_(None), jobs_table.c.lease_expires_at < now
+        )
+        query = sa.select(jobs_table).where(available)
+        if session_ids is not None:
+            query = query.where(jobs_table.c.session_id.in_(list(session_ids)))
+        query = query.order_by(
+            jobs_table.c.priority.desc(), jobs_table.c.enqueued_at
+        ).limit(_CLAIM_BATCH)
+
+        with self._engine.connect() as conn:
+            candidates = conn.execute(query).fetchall()
+        for row in candidates:
+            with self._engine.begin() as conn:
+                # Compare-and-set: succeeds for exactly one concurrent claimer.
+                claimed = conn.execute(
+                    jobs_table.update()
+                    .where(jobs_table.c.job_id == row.job_id)
+                    .where(available)
+                    .values(
+                        lease_owner=self._worker_id,
+                        lease_expires_at=now + self._lease,
+                        attempts=jobs_table.c.attempts + 1,
+                    )
+                ).rowcount
+            if claimed == 1:
+                return ClaimedJob(
+                    job_id=row.job_id,
+                    session_id=row.session_id,
+                    scenario_id=row.scenario_id,
+                    priority=row.priority,
+                    attempts=row.attempts + 1,
+                )
+        return None
+
+    def renew(self, job_ids: Iterable[str]) -> List[str]:
+        """Extend this worker's leases on ``job_ids``.
+
+        Returns the ids whose lease was lost (expired and claimed elsewhere,
+        cancelled, or finished).
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return []
+        with self._engine.begin() as conn:
+            conn.execute(
+                jobs_table.update()
+                .where(jobs_table.c.job_id.in_(job_ids))
+                .where(jobs_table.c.lease_owner == self._worker_id)
+                .values(lease_expires_at=datetime.now() + self._lease)
+            )
+            held = set(
+                conn.execute(
+                    sa.select(jobs_table.c.job_id)
+                    .where(jobs_table.c.job_id.in_(job_ids))
+                    .where(jobs_table.c.lease_owner == self._worker_id)
+                ).scalars()
+            )
+        return [job_id for job_id in job_ids if job_id not in held]
+
+    def complete(self, job_id: str) -> None:
+        """Remove a finished job this worker holds."""
+        with self._engine.begin() as conn:
+            conn.execute(
+                jobs_table.delete()
+                .where(jobs_table.c.job_id == job_id)
+                .where(jobs_table.c.lease_owner == self._worker_id)
+            )
+
+    def release(self, job_id: str, retry_after: float = 0.0) -> None:
+        """Give a claimed job back to the queue without running it.
+
+        With a positive ``retry_after`` the lease is kept for that many
+        seconds instead of cleared, so no worker claims the job again before
+        then and jobs queued behind it are claimed first.
+        """
+        if retry_after > 0:
+            values = {
+                "lease_expires_at": datetime.now() + timedelta(seconds=retry_after)
+            }
+        else:
+            values = {"lease_owner": None, "lease_expires_at": None}
+        with self._engine.begin() as conn:
+            conn.execute(
+                jobs_table.update()
+                .where(jobs_table.c.job_id == job_id)
+                .where(jobs_table.c.lease_owner == self._worker_id)
+                .values(**values)
+            )
+
+    def fail(self, job_id: str) -> None:
+        """Drop a claimed job that will not be run and mark its scenario FAILED."""
+        with self._engine.begin() as conn:
+            scenario_id = conn.execute(
+                sa.select(jobs_table.c.scenario_id)
+                .where(jobs_table.c.job_id == job_id)
+                .where(jobs_table.c.lease_owner == self._worker_id)
+            ).scalar()
+            if scenario_id is None:
+                return
+            conn.execute(jobs_table.delete().where(jobs_table.c.job_id == job_id))
+            conn.execute(
+                scenarios_table.update()
+                .where(scenarios_table.c.id == scenario_id)
+                .values(status=str(ScenarioStatus.FAILED))
+            )
+
+    def cancel(self, scenario_id: str) -> bool:
+        """Drop the job of ``scenario_id`` unless another worker is running it.
+
+        Returns ``True`` if a job was removed.
+        """
+        now = datetime.now()
+        with self._engine.begin() as conn:
+            removed = conn.execute(
+                jobs_table.delete()
+                .where(jobs_table.c.scenario_id == scenario_id)
+                .where(
+                    sa.or_(
+                        jobs_table.c.lease_owner.is_(None),
+                        jobs_table.c.lease_owner == self._worker_id,
+                        jobs_table.c.lease_expires_at < now,
+                    )
+                )
+            ).rowcount
+        return removed > 0
+
+    def depth(self, session_id: str | None = None) -> int:
+        """Number of jobs queued or running, overall or for one session."""
+        query = sa.select(sa.func.count()).select_from(jobs_table)
+        if session_id is not None:
+            query = query.where(jobs_table.c.session_id == session_id)
+        with self._engine.connect() as conn:
+            return int(conn.execute(query).scalar() or 0)
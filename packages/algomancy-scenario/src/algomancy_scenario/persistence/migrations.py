@@ -0,0 +1,64 @@
+"""Schema migrations of algomancy-scenario's database tables.
+
+Applied by :meth:`SqlScenarioRepository.startup` through algomancy-data's
+:class:`~algomancy_data.database.migrations.MigrationRunner`, recorded under
+the ``"scenario"`` component. Append new steps to :data:`SCENARIO_MIGRATIONS`;
+never renumber or edit one that has shipped.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import sqlalchemy as sa
+from algomancy_data.database.migrations import (
+    Migration,
+    MigrationRunner,
+    add_column_if_missing,
+    create_indexes,
+    index_shared_tables,
+)
+from algomancy_utils.logger import Logger
+
+from .models import (
+    RESULT_TABLE_PREFIX,
+    SCENARIO_COL,
+    SESSION_COL,
+    kpi_measurements_table,
+    scenario_runs_table,
+    scenarios_table,
+)
+
+
+def _index_runs_and_results(conn: sa.Connection) -> None:
+    create_indexes(conn, scenario_runs_table)
+    create_indexes(conn, kpi_measurements_table)
+    index_shared_tables(conn, RESULT_TABLE_PREFIX, (SESSION_COL, SCENARIO_COL))
+
+
+SCENARIO_MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "add scenarios.data_parameter_values",
+        lambda conn: add_column_if_missing(
+            conn, scenarios_table, "data_parameter_values", "TEXT"
+        ),
+    ),
+    Migration(
+        2,
+        "add scenario_runs.metrics",
+        lambda conn: add_column_if_missing(
+            conn, scenario_runs_table, "metrics", "TEXT"
+        ),
+    ),
+    Migration(
+        3,
+        "index runs, KPI measurements and shared result table discriminators",
+        _index_runs_and_results,
+    ),
+]
+
+
+def migrate_scenario_schema(engine: sa.Engine, logger: Logger | None = None) -> None:
+    """Bring algomancy-scenario's tables in ``engine`` to the current version."""
+    MigrationRunner(engine, "scenario", SCENARIO_MIGRATIONS, logger).run()
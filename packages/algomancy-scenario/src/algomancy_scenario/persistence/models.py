@@ -1,10 +1,12 @@
 """Fixed SQLAlchemy table definitions for algomancy-scenario's database backend.
 
-Covers sessions, scenario definitions, per-run execution history, and KPI
-measurements. Per-result data rows live in shared per-sub-table tables (one
+Covers sessions, scenario definitions, per-run execution history, KPI
+measurements, the durable job queue, and the persistent run cache. Per-result data rows live in shared per-sub-table tables (one
 physical table per ScenarioResult sub-table *name*, across all sessions and
 scenarios); those tables are created lazily by ``SqlScenarioRepository`` on
-first write because pandas infers their column types from the DataFrame.
+first write because pandas infers their column types from the DataFrame, and
+get a composite index on their discriminator columns right after. Changes to
+existing databases are applied by the steps in ``migrations.py``.
 """
 
 import sqlalchemy as sa
@@ -52,6 +54,7 @@ scenario_runs_table = sa.Table(
         sa.String,
         sa.ForeignKey("algomancy_scenarios.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     ),
     sa.Column("started_at", sa.DateTime, nullable=True),
     sa.Column("finished_at", sa.DateTime, nullable=True),
@@ -61,6 +64,8 @@ scenario_runs_table = sa.Table(
     # JSON array of sub-table names this run wrote rows to in the shared
     # ``algomancy_result__<sub>`` tables. NULL when the JSON-blob path is used.
     sa.Column("result_sub_tables", sa.Text, nullable=True),
+    # JSON from RunMetrics.to_dict(): phase timings, peak memory, profile.
+    sa.Column("metrics", sa.Text, nullable=True),
 )
 
 kpi_measurements_table = sa.Table(
@@ -72,6 +77,7 @@ kpi_measurements_table = sa.Table(
         sa.String,
         sa.ForeignKey("algomancy_scenario_runs.run_id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     ),
     sa.Column("kpi_name", sa.String, nullable=False),
     sa.Column("value", sa.Float, nullable=True),
@@ -79,3 +85,38 @@ kpi_measurements_table = sa.Table(
     sa.Column("direction", sa.String, nullable=True),
     sa.Column("computed_at", sa.DateTime, nullable=True),
 )
+
+#: Durable scenario job queue (see ``SqlJobQueue``). One row per queued or
+#: running scenario; a worker owns a row while ``lease_expires_at`` is in the
+#: future, and the row is deleted when the run finishes.
+jobs_table = sa.Table(
+    "algomancy_jobs",
+    metadata,
+    sa.Column("job_id", sa.String, primary_key=True),
+    sa.Column(
+        "scenario_id",
+        sa.String,
+        sa.ForeignKey("algomancy_scenarios.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    ),
+    sa.Column("session_id", sa.String, nullable=False),
+    sa.Column("priority", sa.Integer, nullable=False, default=0),
+    sa.Column("enqueued_at", sa.DateTime, nullable=False),
+    sa.Column("lease_owner", sa.String, nullable=True),
+    sa.Column("lease_expires_at", sa.DateTime, nullable=True),
+    sa.Column("attempts", sa.Integer, nullable=False, default=0),
+)
+
+#: Persistent second level of the scenario run cache (see ``RunCache``). Keyed
+#: by content hash, so entries are shared across sessions.
+run_cache_table = sa.Table(
+    "algomancy_run_cache",
+    metadata,
+    sa.Column("cache_key", sa.String, primary_key=True),
+    sa.Column("result_blob", sa.Text, nullable=False),  # result.to_json()
+    sa.Column("kpi_values", sa.Text, nullable=False),  # JSON object
+    sa.Column("progress", sa.Float, nullable=True),
+    sa.Column("created_at", sa.DateTime, nullable=True),
+    sa.Column("last_used_at", sa.DateTime, nullable=True),
+)
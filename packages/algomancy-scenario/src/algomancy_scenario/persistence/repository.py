@@ -22,6 +22,7 @@ from ..records import ScenarioRecord
 @runtime_checkable
 class ScenarioRepository(Protocol):
     def add(self, scenario: Scenario) -> None: ...
+    def add_many(self, scenarios: List[Scenario]) -> None: ...
     def get_by_id(self, scenario_id: str) -> Optional[Scenario]: ...
     def get_by_tag(self, tag: str) -> Optional[Scenario]: ...
     def delete(self, scenario_id: str) -> bool: ...
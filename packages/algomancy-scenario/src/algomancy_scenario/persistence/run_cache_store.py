@@ -0,0 +1,98 @@
+"""SQL-backed persistent store for the scenario run cache.
+
+Lets :class:`~algomancy_scenario.runcache.RunCache` hits survive restarts and
+be shared by every session using the same database. Only results that
+implement :class:`BaseScenarioResult` (and so round-trip through
+``to_json`` / ``from_json``) are stored; other runs stay memory-only.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Optional, Type
+
+import sqlalchemy as sa
+from algomancy_utils.logger import Logger
+
+from ..result import BaseScenarioResult
+from ..runcache import CachedRun
+from .models import run_cache_table
+
+
+class SqlRunCache:
+    """Persistent run-cache store in the ``algomancy_run_cache`` table.
+
+    Args:
+        engine: A SQLAlchemy ``Engine`` for the target database.
+        max_entries: Rows kept in the table; the least recently used rows are
+            pruned on write. ``None`` keeps every entry.
+        logger: Optional logger instance.
+    """
+
+    def __init__(
+        self,
+        engine: sa.Engine,
+        max_entries: int | None = None,
+        logger: Logger | None = None,
+    ) -> None:
+        self._engine = engine
+        self._max_entries = max_entries
+        self._logger = logger
+        run_cache_table.create(engine, checkfirst=True)
+
+    def load(
+        self, key: str, result_class: Type[BaseScenarioResult]
+    ) -> Optional[CachedRun]:
+        with self._engine.begin() as conn:
+            row = conn.execute(
+                run_cache_table.select().where(run_cache_table.c.cache_key == key)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                run_cache_table.update()
+                .where(run_cache_table.c.cache_key == key)
+                .values(last_used_at=datetime.now())
+            )
+        try:
+            result = result_class.from_json(row.result_blob)
+        except (TypeError, ValueError, KeyError) as exc:
+            if self._logger:
+                self._logger.warning(f"Could not deserialise cached run: {exc}")
+            return None
+        return CachedRun(
+            result=result,
+            kpi_values=json.loads(row.kpi_values),
+            progress=row.progress if row.progress is not None else 100.0,
+        )
+
+    def save(self, key: str, run: CachedRun) -> None:
+        if not isinstance(run.result, BaseScenarioResult):
+            return
+        now = datetime.now()
+        with self._engine.begin() as conn:
+            conn.execute(
+                run_cache_table.delete().where(run_cache_table.c.cache_key == key)
+            )
+            conn.execute(
+                run_cache_table.insert().values(
+                    cache_key=key,
+                    result_blob=run.result.to_json(),
+                    kpi_values=json.dumps(run.kpi_values),
+                    progress=run.progress,
+                    created_at=now,
+                    last_used_at=now,
+                )
+            )
+            if self._max_entries is not None:
+                stale = (
+                    sa.select(run_cache_table.c.cache_key)
+                    .order_by(run_cache_table.c.last_used_at.desc())
+                    .offset(self._max_entries)
+                )
+                conn.execute(
+                    run_cache_table.delete().where(
+                        run_cache_table.c.cache_key.in_(stale)
+                    )
+                )
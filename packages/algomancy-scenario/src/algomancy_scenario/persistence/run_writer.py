@@ -0,0 +1,198 @@
+"""Background group-commit writer for finished scenario runs.
+
+Without it, :meth:`SqlScenarioRepository.persist_run` writes a run on the
+processor thread that ran it: a read of the previous result sub-tables, a
+schema inspection, and a transaction per run, all before the worker can pick
+up its next scenario.
+
+With ``CoreConfig(async_persistence=True)`` the repository captures the run
+and hands it to a :class:`RunWriter` instead. The writer's thread takes every
+run queued so far (up to ``max_batch``) and commits them in one transaction,
+with multi-row inserts for the run and KPI rows, so the commit cost is shared
+by all runs that finished while the previous batch was being written. Each
+``submit`` returns a :class:`~concurrent.futures.Future` that resolves once
+the run is committed — the processor ends the scenario's job (and, with the
+durable queue, completes its job row) only then.
+
+Runs of the same scenario queued in one batch are coalesced: only the latest
+is written, as an earlier one would be replaced by it anyway, and every
+submitter's future resolves with the id of the run that was written. If a
+batch fails, its runs are retried one transaction each, so one bad run does
+not fail the others.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Deque, Dict, List, Tuple
+
+import sqlalchemy as sa
+from algomancy_utils.logger import Logger
+from algomancy_utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from .sql_repository import SqlScenarioRepository, _PendingRun
+
+_BATCH_SIZE = REGISTRY.histogram(
+    "algomancy_run_persist_batch_size",
+    "Scenario runs committed per background persistence batch.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+_Entry = Tuple["SqlScenarioRepository", "_PendingRun", Future]
+
+
+class RunWriter:
+    """Commits finished runs of one or more repositories in background batches.
+
+    Every repository submitting to a writer must use the writer's engine, so
+    runs of different sessions can share a transaction.
+
+    Args:
+        engine: The SQLAlchemy ``Engine`` the runs are written to.
+        max_batch: Maximum number of runs committed in one transaction.
+        logger: Optional logger instance.
+    """
+
+    def __init__(
+        self,
+        engine: sa.Engine,
+        max_batch: int = 100,
+        logger: Logger | None = None,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1; got {max_batch!r}")
+        self._engine = engine
+        self._max_batch = max_batch
+        self._logger = logger
+        self._queue: Deque[_Entry] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def engine(self) -> sa.Engine:
+        return self._engine
+
+    @property
+    def pending(self) -> int:
+        """Runs submitted but not yet committed (or failed)."""
+        with self._cond:
+            return len(self._queue) + self._in_flight
+
+    def submit(self, repository: "SqlScenarioRepository", run: "_PendingRun") -> Future:
+        """Queue ``run`` of ``repository`` for the next batch.
+
+        The returned future resolves to the id of the committed run, or to the
+        exception that kept it from being written.
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("RunWriter is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._queue.append((repository, run, future))
+            self._cond.notify_all()
+        return future
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every run submitted so far is committed or failed.
+
+        Returns ``False`` if ``timeout`` seconds passed first.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and self._in_flight == 0, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write the runs still queued, then stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    # Worker
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self._max_batch))
+                ]
+                self._in_flight = len(batch)
+            try:
+                self._commit(batch)
+            except Exception as exc:
+                # _commit settles every future itself; this only guards the loop.
+                self._log_error("Run writer failed to settle a batch.", exc)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def _commit(self, batch: List[_Entry]) -> None:
+        _BATCH_SIZE.observe(len(batch))
+        # The latest run of each scenario; earlier ones would only be replaced.
+        latest: Dict[tuple, _Entry] = {}
+        for entry in batch:
+            repository, run, _ = entry
+            key = (id(repository), run.scenario_id)
+            latest.pop(key, None)
+            latest[key] = entry
+
+        failures: Dict[tuple, Exception] = {}
+        try:
+            self._write(list(latest.values()))
+        except Exception as exc:
+            if len(latest) == 1:
+                failures = {key: exc for key in latest}
+            else:
+                # Isolate the run that broke the batch.
+                for key, entry in latest.items():
+                    try:
+                        self._write([entry])
+                    except Exception as single_exc:
+                        failures[key] = single_exc
+
+        for key, exc in failures.items():
+            repository, run, _ = latest[key]
+            self._log_error(f"Could not persist the run of '{run.tag}'.", exc)
+            repository.unpin(run.scenario_id)
+
+        for repository, run, future in batch:
+            key = (id(repository), run.scenario_id)
+            if key in failures:
+                future.set_exception(failures[key])
+            else:
+                future.set_result(latest[key][1].run_id)
+
+    def _write(self, entries: List[_Entry]) -> None:
+        by_repository: Dict["SqlScenarioRepository", List["_PendingRun"]] = {}
+        for repository, run, _ in entries:
+            by_repository.setdefault(repository, []).append(run)
+        for repository, runs in by_repository.items():
+            repository._prepare_runs(runs)
+        # Inspected outside the transaction; see _delete_result_rows.
+        existing_tables = set(sa.inspect(self._engine).get_table_names())
+        with self._engine.begin() as conn:
+            for repository, runs in by_repository.items():
+                repository._write_runs(conn, runs, existing_tables)
+        for repository, runs in by_repository.items():
+            repository._apply_runs(runs)
+
+    def _log_error(self, msg: str, exc: Exception) -> None:
+        if self._logger:
+            self._logger.error(msg)
+            self._logger.log_traceback(exc)
@@ -19,6 +19,10 @@ scenario discriminator columns — the table count is bounded by the result
 shape, not by the number of scenarios. Results that do not implement the
 protocol fall back to a JSON blob on ``algomancy_scenario_runs.result_blob``.
 
+Finished runs are written by :meth:`persist_run`, either directly on the
+calling thread or — with a :class:`RunWriter` — captured there and committed
+by the writer in background batches.
+
 The repository reconstructs ``Scenario`` objects on demand by matching stored
 ``algorithm_name`` and ``kpi_names`` against the in-process template
 dictionaries. If a referenced template no longer exists (or its dataset is
@@ -31,33 +35,45 @@ from __future__ import annotations
 import json
 import re
 import threading
+import time
 import uuid
 from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
 import pandas as pd
 import sqlalchemy as sa
+from algomancy_data.database.bulk_writer import BulkWriter, get_bulk_writer
+from algomancy_data.database.migrations import ensure_discriminator_index
 from algomancy_utils.logger import Logger
+from algomancy_utils.metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
 
 from ..algorithmfactory import AlgorithmFactory
 from ..basealgorithm import ALGORITHM
 from ..keyperformanceindicator import BASE_KPI
 from ..kpifactory import KpiFactory
 from ..result import BaseScenarioResult
+from ..runmetrics import RunMetrics
 from ..scenario import Scenario, ScenarioStatus
 from .models import (
     RESULT_TABLE_PREFIX,
     SCENARIO_COL,
     SESSION_COL,
+    jobs_table,
     kpi_measurements_table,
     metadata as _scenario_metadata,
     scenario_runs_table,
     scenarios_table,
 )
+from .migrations import migrate_scenario_schema
 from .protocols import SqlResultLayout
 from ..records import ScenarioRecord, build_kpi_dicts
 
+if TYPE_CHECKING:
+    from .run_writer import RunWriter
+
 
 def _safe_segment(s: str) -> str:
     """Collapse anything that is not alphanumeric or underscore into ``_``."""
@@ -69,6 +85,32 @@ def _result_table_name(sub_table: str) -> str:
     return f"{RESULT_TABLE_PREFIX}{_safe_segment(sub_table)}"
 
 
+@dataclass
+class _PendingRun:
+    """A finished run captured for persistence, plus what writing it needs."""
+
+    run_id: str
+    scenario_id: str
+    tag: str
+    status: ScenarioStatus
+    result: object
+    error: Optional[str]
+    kpi_rows: List[dict]
+    kpi_dicts: Dict[str, dict]
+    metrics: Optional[RunMetrics]
+    started_at: datetime
+    finished_at: datetime
+    captured_at: float
+    # Filled in by _prepare_runs.
+    result_blob: Optional[str] = None
+    result_frames: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    previous_sub_tables: List[str] = field(default_factory=list)
+
+    @property
+    def sub_tables(self) -> List[str]:
+        return list(self.result_frames)
+
+
 class SqlScenarioRepository:
     """ScenarioRepository backed by a SQL database.
 
@@ -87,6 +129,12 @@ class SqlScenarioRepository:
             scenarios ready in memory" behaviour. Only meaningful with an
             unbounded cache; with a bounded cache only the last
             ``hydrated_cache_size`` warmed scenarios stay resident.
+        run_writer: Optional :class:`RunWriter` sharing ``engine``. When set,
+            :meth:`persist_run` hands finished runs to it for batched
+            background commits instead of writing them itself.
+        bulk_writer: How result rows are appended to the shared result
+            tables: a name from ``BULK_WRITE_METHODS`` (default ``"auto"``)
+            or a :class:`BulkWriter` instance.
         logger: Optional logger instance.
     """
 
@@ -99,8 +147,12 @@ class SqlScenarioRepository:
         data_manager,
         hydrated_cache_size: int | None = None,
         eager_startup: bool = False,
+        run_writer: "RunWriter | None" = None,
+        bulk_writer: "str | BulkWriter" = "auto",
         logger: Logger | None = None,
     ) -> None:
+        if run_writer is not None and run_writer.engine is not engine:
+            raise ValueError("run_writer must write to the repository's engine")
         self._engine = engine
         self._session_id = session_id
         self._algo_factory = AlgorithmFactory(algorithms, logger)
@@ -108,6 +160,8 @@ class SqlScenarioRepository:
         self._data_manager = data_manager
         self._cache_size = hydrated_cache_size
         self._eager_startup = eager_startup
+        self._run_writer = run_writer
+        self._bulk_writer = get_bulk_writer(bulk_writer)
         self._logger = logger
         # Metadata index (populated at startup, kept in sync on every mutation).
         self._records: Dict[str, ScenarioRecord] = {}
@@ -132,7 +186,7 @@ class SqlScenarioRepository:
         payload read. Full scenarios hydrate lazily on first access.
         """
         _scenario_metadata.create_all(self._engine, checkfirst=True)
-        self._migrate_add_data_parameter_values_column()
+        migrate_scenario_schema(self._engine, self._logger)
         with self._engine.connect() as conn:
             rows = conn.execute(
                 scenarios_table.select().where(
@@ -171,6 +225,37 @@ class SqlScenarioRepository:
     # ------------------------------------------------------------------
 
     def add(self, scenario: Scenario) -> None:
+        self.add_many([scenario])
+
+    def add_many(self, scenarios: List[Scenario]) -> None:
+        """Insert several scenario definitions in a single transaction.
+
+        Either every scenario is stored or — if the insert fails — none is,
+        and the in-memory index is left untouched.
+        """
+        if not scenarios:
+            return
+        created_at = datetime.now()
+        rows = [self._definition_row(scenario, created_at) for scenario in scenarios]
+        with self._engine.begin() as conn:
+            conn.execute(scenarios_table.insert(), rows)
+        with self._lock:
+            for scenario in scenarios:
+                record = ScenarioRecord.from_scenario(scenario)
+                record.created_at = created_at
+                self._records[scenario.id] = record
+                self._tag_index[scenario.tag] = scenario.id
+                # Cache the live instance so autorun/enqueue processes and polls
+                # the same object; eviction leaves it (just accessed → newest).
+                self._hydrated[scenario.id] = scenario
+                self._hydrated.move_to_end(scenario.id)
+            self._evict_if_needed()
+        if len(scenarios) == 1:
+            self._log(f"Registered scenario '{scenarios[0].tag}'.")
+        else:
+            self._log(f"Registered {len(scenarios)} scenarios.")
+
+    def _definition_row(self, scenario: Scenario, created_at: datetime) -> dict:
         # serialize() already returns a JSON string; store it directly
         params_json = "{}"
         if hasattr(scenario._algorithm, "params"):
@@ -178,40 +263,25 @@ class SqlScenarioRepository:
         data_params_json: Optional[str] = None
         if scenario.data_params is not None and scenario.data_params.has_inputs():
             data_params_json = scenario.data_params.serialize()
-        kpi_names = list(scenario.kpis.keys())
-        created_at = datetime.now()
-        with self._engine.begin() as conn:
-            conn.execute(
-                scenarios_table.insert().values(
-                    id=scenario.id,
-                    tag=scenario.tag,
-                    session_id=self._session_id,
-                    input_data_key=scenario.input_data_key,
-                    algorithm_name=scenario._algorithm.name,
-                    parameter_values=params_json,
-                    data_parameter_values=data_params_json,
-                    kpi_names=json.dumps(kpi_names),
-                    status=str(scenario.status),
-                    created_at=created_at,
-                )
-            )
-        record = ScenarioRecord.from_scenario(scenario)
-        record.created_at = created_at
-        with self._lock:
-            self._records[scenario.id] = record
-            self._tag_index[scenario.tag] = scenario.id
-            # Cache the live instance so autorun/enqueue processes and polls the
-            # same object; eviction leaves it (it was just accessed → newest).
-            self._hydrated[scenario.id] = scenario
-            self._hydrated.move_to_end(scenario.id)
-            self._evict_if_needed()
-        self._log(f"Registered scenario '{scenario.tag}'.")
+        return {
+            "id": scenario.id,
+            "tag": scenario.tag,
+            "session_id": self._session_id,
+            "input_data_key": scenario.input_data_key,
+            "algorithm_name": scenario._algorithm.name,
+            "parameter_values": params_json,
+            "data_parameter_values": data_params_json,
+            "kpi_names": json.dumps(list(scenario.kpis.keys())),
+            "status": str(scenario.status),
+            "created_at": created_at,
+        }
 
     def get_by_id(self, scenario_id: str) -> Optional[Scenario]:
         with self._lock:
             scenario = self._hydrated.get(scenario_id)
             if scenario is not None:
                 self._hydrated.move_to_end(scenario_id)
+                CACHE_HITS.inc(cache="scenario")
                 return scenario
             record = self._records.get(scenario_id)
         if record is None:
@@ -224,10 +294,12 @@ class SqlScenarioRepository:
                 scenario = self._hydrated.get(scenario_id)
                 if scenario is not None:
                     self._hydrated.move_to_end(scenario_id)
+                    CACHE_HITS.inc(cache="scenario")
                     return scenario
                 record = self._records.get(scenario_id)
             if record is None:
                 return None
+            CACHE_MISSES.inc(cache="scenario")
             scenario = self._rehydrate_by_id(record)
             if scenario is None:
                 # Leave uncached so a later request can retry (e.g. once the
@@ -250,6 +322,7 @@ class SqlScenarioRepository:
             if record is None:
                 return False
             tag = record.tag
+        self._flush_runs()
         sub_tables = self._collect_sub_tables(scenario_id)
         existing_tables = set(sa.inspect(self._engine).get_table_names())
         with self._engine.begin() as conn:
@@ -268,6 +341,9 @@ class SqlScenarioRepository:
                     scenario_runs_table.c.scenario_id == scenario_id
                 )
             )
+            conn.execute(
+                jobs_table.delete().where(jobs_table.c.scenario_id == scenario_id)
+            )
             conn.execute(
                 scenarios_table.delete().where(scenarios_table.c.id == scenario_id)
             )
@@ -297,6 +373,7 @@ class SqlScenarioRepository:
             if record is None:
                 return False
             tag = record.tag
+        self._flush_runs()
         sub_tables = self._collect_sub_tables(scenario_id)
         existing_tables = set(sa.inspect(self._engine).get_table_names())
         with self._engine.begin() as conn:
@@ -332,6 +409,38 @@ class SqlScenarioRepository:
         self._log(f"Refreshed scenario '{tag}'.")
         return True
 
+    def sync(self, scenario_id: str) -> bool:
+        """Index ``scenario_id`` if another process stored it after startup.
+
+        Processes sharing the database each load the scenario index once, at
+        :meth:`startup`; a scenario created elsewhere later is unknown here
+        until synced. Returns ``False`` if no such scenario is stored in this
+        session.
+        """
+        with self._lock:
+            if scenario_id in self._records:
+                return True
+        with self._engine.connect() as conn:
+            row = conn.execute(
+                scenarios_table.select()
+                .where(scenarios_table.c.id == scenario_id)
+                .where(scenarios_table.c.session_id == self._session_id)
+            ).first()
+        if row is None:
+            return False
+        latest = self._load_latest_runs([scenario_id]).get(scenario_id)
+        values = (
+            self._load_kpi_values([latest.run_id]).get(latest.run_id, {})
+            if latest
+            else {}
+        )
+        record = self._build_record(row, latest, values)
+        with self._lock:
+            self._records.setdefault(record.id, record)
+            self._tag_index.setdefault(record.tag, record.id)
+        self._log(f"Indexed scenario '{record.tag}' stored by another process.")
+        return True
+
     def list(self) -> List[Scenario]:
         """Eagerly hydrate every scenario and return the full objects.
 
@@ -411,108 +520,196 @@ class SqlScenarioRepository:
     # Post-run persistence (called by ScenarioManager after processing)
     # ------------------------------------------------------------------
 
-    def persist_run(self, scenario: Scenario) -> None:
+    def persist_run(self, scenario: Scenario) -> Optional[Future]:
         """Persist the outcome of a completed (or failed) scenario run.
 
         Inserts a row in ``algomancy_scenario_runs`` and one row per KPI in
-        ``algomancy_kpi_measurements``, updates the scenario's status in
-        ``algomancy_scenarios``, refreshes the in-memory metadata record, and
-        unpins the scenario from the hydration cache.
+        ``algomancy_kpi_measurements``, replaces the scenario's result rows,
+        updates its status in ``algomancy_scenarios``, refreshes the in-memory
+        metadata record, and unpins the scenario from the hydration cache.
+
+        The run's start/finish times and ``RunMetrics`` come from
+        ``scenario.metrics``; the time from this call until the run row is
+        written is added to it as the ``persist`` phase.
+
+        Without a ``run_writer`` the run is written before this returns
+        ``None``. With one, the run is captured now and committed by the
+        writer in a later batch; the returned ``Future`` resolves to the run
+        id once it is committed.
         """
-        run_id = str(uuid.uuid4())
-        result_blob: Optional[str] = None
-        error_text: Optional[str] = None
-        sub_tables: List[str] = []
+        run = self._capture_run(scenario)
+        if self._run_writer is not None:
+            return self._run_writer.submit(self, run)
+        self._prepare_runs([run])
+        existing_tables = set(sa.inspect(self._engine).get_table_names())
+        with self._engine.begin() as conn:
+            self._write_runs(conn, [run], existing_tables)
+        self._apply_runs([run])
+        return None
 
-        # Drop any previous run's per-result rows for this scenario before
-        # writing the new ones. Sub-tables that the new shape no longer uses
-        # would otherwise leave stale rows behind.
-        previous_sub_tables = self._collect_sub_tables(scenario.id)
+    def _flush_runs(self) -> None:
+        """Wait for queued runs, so a later write does not race them."""
+        if self._run_writer is not None:
+            self._run_writer.flush()
 
-        if scenario.status == ScenarioStatus.COMPLETE:
-            if scenario.result is not None:
-                try:
-                    result_blob, sub_tables = self._persist_result_payload(
-                        scenario.result, scenario.id, previous_sub_tables
-                    )
-                except (TypeError, ValueError) as exc:
-                    self._log(
-                        f"Could not serialise result for scenario '{scenario.tag}': {exc}"
-                    )
-        elif scenario.status == ScenarioStatus.FAILED:
+    def _capture_run(self, scenario: Scenario) -> _PendingRun:
+        """Snapshot what persisting the scenario's finished run needs.
+
+        Taken when the run finishes, so a queued write is not affected by the
+        scenario being refreshed or run again before it is committed.
+        """
+        run_id = str(uuid.uuid4())
+        now = datetime.now()
+        error_text: Optional[str] = None
+        if scenario.status == ScenarioStatus.FAILED:
             if isinstance(scenario.result, dict) and "error" in scenario.result:
                 error_text = scenario.result["error"]
 
-        now = datetime.now()
-        with self._engine.begin() as conn:
-            # Clear previous run rows for this scenario so per-result rows in
-            # the shared tables remain in sync with run history.
-            conn.execute(
-                sa.text(
-                    "DELETE FROM algomancy_kpi_measurements WHERE run_id IN "
-                    "(SELECT run_id FROM algomancy_scenario_runs WHERE scenario_id = :sid)"
-                ),
-                {"sid": scenario.id},
+        kpi_rows = []
+        for kpi_name, kpi in scenario.kpis.items():
+            threshold = None
+            if kpi._threshold is not None:
+                threshold = kpi._threshold.value
+            kpi_rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "run_id": run_id,
+                    "kpi_name": kpi_name,
+                    "value": kpi.value,
+                    "threshold": threshold,
+                    "direction": str(kpi.better_when) if kpi.better_when else None,
+                    "computed_at": now,
+                }
             )
-            conn.execute(
-                scenario_runs_table.delete().where(
-                    scenario_runs_table.c.scenario_id == scenario.id
-                )
+
+        metrics = scenario.metrics
+        complete = scenario.status == ScenarioStatus.COMPLETE
+        return _PendingRun(
+            run_id=run_id,
+            scenario_id=scenario.id,
+            tag=scenario.tag,
+            status=scenario.status,
+            result=scenario.result if complete else None,
+            error=error_text,
+            kpi_rows=kpi_rows,
+            kpi_dicts={
+                k: v.to_dict() if hasattr(v, "to_dict") else v
+                for k, v in scenario.kpis.items()
+            },
+            metrics=metrics,
+            started_at=metrics.started_at if metrics and metrics.started_at else now,
+            finished_at=metrics.finished_at if metrics and metrics.finished_at else now,
+            captured_at=time.perf_counter(),
+        )
+
+    def _prepare_runs(self, runs: List[_PendingRun]) -> None:
+        """Serialise the runs' results and look up their previous sub-tables.
+
+        Runs outside the write transaction, with one query for all runs.
+        """
+        previous = self._collect_sub_tables_many([run.scenario_id for run in runs])
+        for run in runs:
+            run.previous_sub_tables = previous.get(run.scenario_id, [])
+            run.result_blob, run.result_frames = None, {}
+            if run.result is None:
+                continue
+            try:
+                run.result_blob, run.result_frames = self._serialise_result(run.result)
+            except (TypeError, ValueError) as exc:
+                self._log(f"Could not serialise result for scenario '{run.tag}': {exc}")
+
+    def _write_runs(
+        self,
+        conn: sa.Connection,
+        runs: List[_PendingRun],
+        existing_tables: set[str],
+    ) -> None:
+        """Write prepared runs inside the caller's transaction.
+
+        A scenario keeps only its latest run: previous run rows, their KPI
+        rows and the scenario's result rows are replaced. Runs, KPI values and
+        status updates are each written as one multi-row statement.
+        """
+        scenario_ids = [run.scenario_id for run in runs]
+        previous_run_ids = sa.select(scenario_runs_table.c.run_id).where(
+            scenario_runs_table.c.scenario_id.in_(scenario_ids)
+        )
+        conn.execute(
+            kpi_measurements_table.delete().where(
+                kpi_measurements_table.c.run_id.in_(previous_run_ids)
             )
-            conn.execute(
-                scenario_runs_table.insert().values(
-                    run_id=run_id,
-                    scenario_id=scenario.id,
-                    started_at=now,
-                    finished_at=now,
-                    status=str(scenario.status),
-                    result_blob=result_blob,
-                    error=error_text,
-                    result_sub_tables=json.dumps(sub_tables) if sub_tables else None,
-                )
+        )
+        conn.execute(
+            scenario_runs_table.delete().where(
+                scenario_runs_table.c.scenario_id.in_(scenario_ids)
             )
-            # Persist KPI measurements
-            for kpi_name, kpi in scenario.kpis.items():
-                threshold = None
-                if kpi._threshold is not None:
-                    threshold = kpi._threshold.value
-                direction = str(kpi.better_when) if kpi.better_when else None
-                conn.execute(
-                    kpi_measurements_table.insert().values(
-                        id=str(uuid.uuid4()),
-                        run_id=run_id,
-                        kpi_name=kpi_name,
-                        value=kpi.value,
-                        threshold=threshold,
-                        direction=direction,
-                        computed_at=now,
-                    )
+        )
+        for run in runs:
+            # Sub-tables the new shape no longer uses would otherwise keep
+            # stale rows behind.
+            stale = list(dict.fromkeys(run.previous_sub_tables + run.sub_tables))
+            self._delete_result_rows(conn, run.scenario_id, stale, existing_tables)
+            for sub_table, frame in run.result_frames.items():
+                table_name = _result_table_name(sub_table)
+                self._bulk_writer.append(
+                    conn,
+                    table_name,
+                    frame,
+                    {SESSION_COL: self._session_id, SCENARIO_COL: run.scenario_id},
                 )
-            # Update scenario status
-            conn.execute(
-                scenarios_table.update()
-                .where(scenarios_table.c.id == scenario.id)
-                .values(status=str(scenario.status))
+                if table_name not in existing_tables:
+                    ensure_discriminator_index(
+                        conn, table_name, (SESSION_COL, SCENARIO_COL)
+                    )
+
+        written_at = time.perf_counter()
+        run_rows = []
+        for run in runs:
+            if run.metrics is not None:
+                run.metrics.phases["persist"] = written_at - run.captured_at
+            run_rows.append(
+                {
+                    "run_id": run.run_id,
+                    "scenario_id": run.scenario_id,
+                    "started_at": run.started_at,
+                    "finished_at": run.finished_at,
+                    "status": str(run.status),
+                    "result_blob": run.result_blob,
+                    "error": run.error,
+                    "result_sub_tables": json.dumps(run.sub_tables)
+                    if run.sub_tables
+                    else None,
+                    "metrics": json.dumps(run.metrics.to_dict())
+                    if run.metrics is not None
+                    else None,
+                }
             )
+        conn.execute(scenario_runs_table.insert(), run_rows)
+        kpi_rows = [row for run in runs for row in run.kpi_rows]
+        if kpi_rows:
+            conn.execute(kpi_measurements_table.insert(), kpi_rows)
+        conn.execute(
+            scenarios_table.update()
+            .where(scenarios_table.c.id == sa.bindparam("b_id"))
+            .values(status=sa.bindparam("b_status")),
+            [{"b_id": run.scenario_id, "b_status": str(run.status)} for run in runs],
+        )
 
-        # Refresh metadata from the just-persisted run and release the pin.
+    def _apply_runs(self, runs: List[_PendingRun]) -> None:
+        """Refresh metadata from just-committed runs and release their pins."""
         with self._lock:
-            record = self._records.get(scenario.id)
-            if record is not None:
-                record.status = scenario.status
-                record.run_started_at = now
-                record.run_finished_at = now
-                record.result_available = (
-                    scenario.status == ScenarioStatus.COMPLETE
-                    and scenario.result is not None
-                )
-                if scenario.status == ScenarioStatus.COMPLETE:
-                    record.progress = 100.0
-                record.kpis = {
-                    k: v.to_dict() if hasattr(v, "to_dict") else v
-                    for k, v in scenario.kpis.items()
-                }
-            self._pinned.discard(scenario.id)
+            for run in runs:
+                record = self._records.get(run.scenario_id)
+                if record is not None:
+                    record.status = run.status
+                    record.run_started_at = run.started_at
+                    record.run_finished_at = run.finished_at
+                    record.run_metrics = run.metrics
+                    record.result_available = run.result is not None
+                    if run.status == ScenarioStatus.COMPLETE:
+                        record.progress = 100.0
+                    record.kpis = run.kpi_dicts
+                self._pinned.discard(run.scenario_id)
             self._evict_if_needed()
 
     # ------------------------------------------------------------------
@@ -543,6 +740,7 @@ class SqlScenarioRepository:
             for key in list(self._hydrated.keys()):
                 if key not in self._pinned:
                     del self._hydrated[key]
+                    CACHE_EVICTIONS.inc(cache="scenario")
                     break
             else:
                 return
@@ -625,6 +823,7 @@ class SqlScenarioRepository:
             else None,
             result_available=result_available,
             kpis=build_kpi_dicts(self._kpi_factory, kpi_names, kpi_values),
+            run_metrics=_decode_metrics(getattr(latest_run, "metrics", None)),
         )
 
     @staticmethod
@@ -712,6 +911,7 @@ class SqlScenarioRepository:
             data_params=data_params,
         )
         scenario.status = record.status
+        scenario.metrics = record.run_metrics
 
         if scenario.status == ScenarioStatus.COMPLETE:
             latest_result = self._load_latest_result(record.id, algorithm)
@@ -725,46 +925,34 @@ class SqlScenarioRepository:
 
         return scenario
 
-    def _persist_result_payload(
-        self, result, scenario_id: str, previous_sub_tables: List[str]
-    ) -> tuple[Optional[str], List[str]]:
-        """Persist a scenario result.
+    def _serialise_result(
+        self, result
+    ) -> tuple[Optional[str], Dict[str, pd.DataFrame]]:
+        """Serialise a scenario result for storage.
 
-        Returns a ``(result_blob, sub_tables)`` tuple: ``result_blob`` is the
-        JSON string to store on ``algomancy_scenario_runs.result_blob`` (or
-        ``None`` for the per-table path) and ``sub_tables`` is the list of
-        sub-table names this run wrote to the shared
-        ``algomancy_result__<sub>`` tables (empty for the JSON path).
+        Returns a ``(result_blob, result_frames)`` tuple: ``result_blob`` is
+        the JSON string to store on ``algomancy_scenario_runs.result_blob`` (or
+        ``None`` for the per-table path) and ``result_frames`` maps each
+        sub-table name to the rows to append to its shared
+        ``algomancy_result__<sub>`` table (empty for the JSON path).
 
         Dispatch mirrors :class:`DatabaseDataManager._persist_datasource`: if
         the result implements :class:`SqlResultLayout`, each DataFrame is
-        appended to a shared per-sub-table SQL table and the catalogue blob is
-        ``None``. Otherwise the result is serialised via
+        appended to a shared per-sub-table SQL table and no catalogue blob is
+        stored. Otherwise the result is serialised via
         :meth:`BaseScenarioResult.to_json` and stored as a JSON string. A bare
         ``dict`` is serialised directly via :func:`json.dumps` to preserve
         backward compatibility with code paths that stashed raw dicts as
         ``Scenario.result`` (e.g. failure payloads).
         """
         if isinstance(result, SqlResultLayout):
-            sql_tables = result.to_sql_tables()
-            sub_table_names = list(sql_tables.keys())
-            stale = set(previous_sub_tables) - set(sub_table_names)
-            existing_tables = set(sa.inspect(self._engine).get_table_names())
-            with self._engine.begin() as conn:
-                self._delete_result_rows(
-                    conn,
-                    scenario_id,
-                    list(stale) + sub_table_names,
-                    existing_tables,
-                )
-                for sub_table, df in sql_tables.items():
-                    self._append_to_shared_result_table(
-                        conn, sub_table, scenario_id, df
-                    )
-            return None, sub_table_names
+            return None, {
+                sub_table: self._check_result_frame(sub_table, df)
+                for sub_table, df in result.to_sql_tables().items()
+            }
         if isinstance(result, BaseScenarioResult):
-            return result.to_json(), []
-        return json.dumps(result, default=str), []
+            return result.to_json(), {}
+        return json.dumps(result, default=str), {}
 
     def _load_latest_result(
         self, scenario_id: str, algorithm: ALGORITHM
@@ -839,22 +1027,23 @@ class SqlScenarioRepository:
 
     def _collect_sub_tables(self, scenario_id: str) -> List[str]:
         """Return the union of result sub-table names recorded for any run."""
+        return self._collect_sub_tables_many([scenario_id]).get(scenario_id, [])
+
+    def _collect_sub_tables_many(self, scenario_ids: List[str]) -> Dict[str, List[str]]:
+        """``_collect_sub_tables`` for several scenarios in one query."""
         with self._engine.connect() as conn:
             rows = conn.execute(
-                sa.text(
-                    "SELECT result_sub_tables FROM algomancy_scenario_runs "
-                    "WHERE scenario_id = :sid"
-                ),
-                {"sid": scenario_id},
+                sa.select(
+                    scenario_runs_table.c.scenario_id,
+                    scenario_runs_table.c.result_sub_tables,
+                ).where(scenario_runs_table.c.scenario_id.in_(scenario_ids))
             ).fetchall()
-        names: List[str] = []
-        seen = set()
-        for row in rows:
-            decoded = _decode_sub_tables(row[0]) or []
-            for sub in decoded:
-                if sub not in seen:
-                    seen.add(sub)
-                    names.append(sub)
+        names: Dict[str, List[str]] = {}
+        for scenario_id, raw in rows:
+            collected = names.setdefault(scenario_id, [])
+            for sub in _decode_sub_tables(raw) or []:
+                if sub not in collected:
+                    collected.append(sub)
         return names
 
     def _delete_result_rows(
@@ -886,62 +1075,27 @@ class SqlScenarioRepository:
                 {"sid": self._session_id, "scid": scenario_id},
             )
 
-    def _append_to_shared_result_table(
-        self,
-        conn: sa.Connection,
-        sub_table: str,
-        scenario_id: str,
-        df: pd.DataFrame,
-    ) -> None:
-        """Append ``df`` to the shared physical result table for ``sub_table``.
-
-        Prepends the (session_id, scenario_id) discriminator columns. The
-        physical table is created on first write with column types inferred
-        by pandas — subsequent writes share that schema.
+    @staticmethod
+    def _check_result_frame(sub_table: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Reject result frames that use the discriminator column names.
+
+        On write, the (session_id, scenario_id) discriminator columns are
+        prepended and the rows appended to the shared physical table of
+        ``sub_table`` by the repository's :class:`BulkWriter`. The table is
+        created on first write with column types inferred by pandas —
+        subsequent writes share that schema.
         """
         if SESSION_COL in df.columns or SCENARIO_COL in df.columns:
             raise ValueError(
                 f"DataFrame for result sub-table '{sub_table}' must not contain "
                 f"reserved columns {SESSION_COL!r} / {SCENARIO_COL!r}."
             )
-        out = df.copy()
-        out.insert(0, SCENARIO_COL, scenario_id)
-        out.insert(0, SESSION_COL, self._session_id)
-        out.to_sql(
-            _result_table_name(sub_table),
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        return df
 
     def _log(self, msg: str) -> None:
         if self._logger:
             self._logger.log(msg)
 
-    def _migrate_add_data_parameter_values_column(self) -> None:
-        """Add ``data_parameter_values`` to an older schema's scenarios table.
-
-        ``create_all(checkfirst=True)`` skips existing tables entirely, so it
-        never adds new columns to a table that pre-dates this migration. We
-        ALTER in the column once, idempotently, so older SQLite/Postgres
-        databases keep loading.
-        """
-        inspector = sa.inspect(self._engine)
-        if not inspector.has_table(scenarios_table.name):
-            return
-        existing_columns = {
-            col["name"] for col in inspector.get_columns(scenarios_table.name)
-        }
-        if "data_parameter_values" in existing_columns:
-            return
-        with self._engine.begin() as conn:
-            conn.execute(
-                sa.text(
-                    f"ALTER TABLE {scenarios_table.name} "
-                    "ADD COLUMN data_parameter_values TEXT"
-                )
-            )
-
 
 def _decode_sub_tables(raw: Optional[str]) -> Optional[List[str]]:
     if raw is None:
@@ -953,3 +1107,12 @@ def _decode_sub_tables(raw: Optional[str]) -> Optional[List[str]]:
     if isinstance(value, list):
         return [str(v) for v in value]
     return None
+
+
+def _decode_metrics(raw: Optional[str]) -> Optional[RunMetrics]:
+    if raw is None:
+        return None
+    try:
+        return RunMetrics.from_dict(json.loads(raw))
+    except TypeError, ValueError, AttributeError:
+        return None
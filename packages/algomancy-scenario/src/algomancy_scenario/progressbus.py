@@ -0,0 +1,237 @@
+"""
+progressbus.py - Push-based scenario status and progress events
+
+``ScenarioProcessor`` publishes a ``ProgressEvent`` whenever a scenario is
+queued, starts, reports progress through ``BaseAlgorithm.set_progress``, or
+finishes. Consumers (the API's Server-Sent Events endpoint, a GUI, tests)
+subscribe to the ``ProgressEventBus`` instead of polling
+``ScenarioManager.get_status``.
+
+Progress updates are throttled per scenario: an update with the same status
+as the last one delivered is dropped when it arrives within ``min_interval``
+seconds of it. Status changes are always delivered.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from algomancy_utils.logger import Logger
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Status and progress of one scenario at one moment."""
+
+    session_id: str
+    scenario_id: str
+    tag: str
+    status: str
+    progress: float
+    timestamp: float
+
+    def to_dict(self) -> dict:
+        """Same keys as ``ScenarioManager.get_status``, plus session and time."""
+        return {
+            "session_id": self.session_id,
+            "id": self.scenario_id,
+            "tag": self.tag,
+            "status": self.status,
+            "progress": self.progress,
+            "timestamp": self.timestamp,
+        }
+
+
+class ProgressSubscription:
+    """
+    Buffered stream of events for one subscriber.
+
+    Created by ``ProgressEventBus.subscribe``. When a slow subscriber's buffer
+    is full the oldest event is dropped. Threads wait with ``get``; asyncio
+    consumers (such as the API's event stream) await ``get_async``, which
+    does not hold a thread while waiting.
+    """
+
+    def __init__(
+        self,
+        bus: "ProgressEventBus",
+        session_id: str | None,
+        scenario_id: str | None,
+        max_queue: int,
+    ):
+        self._bus = bus
+        self.session_id = session_id
+        self.scenario_id = scenario_id
+        self._events: Deque[ProgressEvent] = deque(maxlen=max_queue)
+        self._cond = threading.Condition()
+        # Event loops with a pending get_async, woken by _push / close.
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def matches(self, event: ProgressEvent) -> bool:
+        if self.session_id is not None and event.session_id != self.session_id:
+            return False
+        if self.scenario_id is not None and event.scenario_id != self.scenario_id:
+            return False
+        return True
+
+    def get(self, timeout: float | None = None) -> Optional[ProgressEvent]:
+        """Next event, or ``None`` on timeout or once the subscription is closed."""
+        with self._cond:
+            if not self._events and not self._closed:
+                self._cond.wait(timeout)
+            if self._events:
+                return self._events.popleft()
+            return None
+
+    async def get_async(self, timeout: float | None = None) -> Optional[ProgressEvent]:
+        """Awaitable ``get``: waits on the running event loop, not on a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._events or self._closed:
+                return self._events.popleft() if self._events else None
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        with self._cond:
+            return self._events.popleft() if self._events else None
+
+    def close(self) -> None:
+        """Stop receiving events and wake up a waiting ``get`` / ``get_async``."""
+        self._bus.unsubscribe(self)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            waiters = list(self._waiters)
+        self._wake(waiters)
+
+    def _push(self, event: ProgressEvent) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._events.append(event)
+            self._cond.notify_all()
+            waiters = list(self._waiters)
+        self._wake(waiters)
+
+    @staticmethod
+    def _wake(waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+        # Publishers run on worker threads; asyncio.Event is set on its loop.
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # the loop has been closed
+
+
+class ProgressEventBus:
+    """
+    Thread-safe publish/subscribe hub for scenario progress events.
+
+    Args:
+        min_interval: Minimum seconds between two progress updates of the same
+            scenario with unchanged status. 0 delivers every update.
+        max_queue: Events buffered per subscriber before the oldest is dropped.
+        logger: Optional logger.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_queue: int = 1000,
+        logger: Logger | None = None,
+    ):
+        if min_interval < 0:
+            raise ValueError(f"min_interval must be >= 0; got {min_interval!r}")
+        self.logger = logger
+        self._min_interval = min_interval
+        self._max_queue = max_queue
+        self._subscribers: List[ProgressSubscription] = []
+        # (session_id, scenario_id) -> (status, monotonic time) of last delivery
+        self._last: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def min_interval(self) -> float:
+        return self._min_interval
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(
+        self, session_id: str | None = None, scenario_id: str | None = None
+    ) -> ProgressSubscription:
+        """Subscribe to events, optionally only those of one session / scenario."""
+        subscription = ProgressSubscription(
+            self, session_id, scenario_id, self._max_queue
+        )
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def publish(self, event: ProgressEvent) -> bool:
+        """Deliver ``event`` to matching subscribers. Returns False if throttled."""
+        key = (event.session_id, event.scenario_id)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(key)
+            if (
+                last is not None
+                and last[0] == event.status
+                and now - last[1] < self._min_interval
+            ):
+                return False
+            self._last[key] = (event.status, now)
+            targets = [s for s in self._subscribers if s.matches(event)]
+        for subscription in targets:
+            subscription._push(event)
+        return True
+
+    def publish_scenario(self, session_id: str, scenario, status=None) -> bool:
+        """Publish the current state of ``scenario``.
+
+        ``status`` overrides ``scenario.status``, for transitions announced
+        just before the scenario itself makes them.
+        """
+        return self.publish(
+            ProgressEvent(
+                session_id=session_id,
+                scenario_id=scenario.id,
+                tag=scenario.tag,
+                status=str(status if status is not None else scenario.status),
+                progress=float(scenario.progress or 0.0),
+                timestamp=time.time(),
+            )
+        )
+
+    def forget(self, session_id: str, scenario_id: str) -> None:
+        """Drop throttle state for a scenario (e.g. after it is deleted)."""
+        with self._lock:
+            self._last.pop((session_id, scenario_id), None)
+
+    def close(self) -> None:
+        """Close every subscription, ending their streams."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.close()
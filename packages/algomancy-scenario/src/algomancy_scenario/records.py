@@ -21,6 +21,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Iterable, Optional
 
+from .runmetrics import RunMetrics
 from .scenario import Scenario, ScenarioStatus
 
 
@@ -56,6 +57,7 @@ class ScenarioRecord:
     ``algorithm_parameters`` and ``data_parameters`` are plain value dicts (the
     parsed parameter values). ``kpis`` is keyed by registry name, each value the
     :meth:`BaseKPI.to_dict` shape with persisted values already overlaid.
+    ``run_metrics`` holds the timings of the latest run, if it recorded any.
     """
 
     id: str
@@ -71,6 +73,7 @@ class ScenarioRecord:
     run_finished_at: Optional[datetime] = None
     result_available: bool = False
     kpis: Dict[str, dict] = field(default_factory=dict)
+    run_metrics: Optional[RunMetrics] = None
 
     @classmethod
     def from_scenario(cls, scenario: Scenario) -> "ScenarioRecord":
@@ -93,6 +96,7 @@ class ScenarioRecord:
         result_available = (
             scenario.status == ScenarioStatus.COMPLETE and scenario.result is not None
         )
+        metrics = scenario.metrics
         return cls(
             id=scenario.id,
             tag=scenario.tag,
@@ -102,11 +106,14 @@ class ScenarioRecord:
             data_parameters=data_params,
             status=scenario.status,
             progress=float(scenario.progress or 0.0),
+            run_started_at=metrics.started_at if metrics else None,
+            run_finished_at=metrics.finished_at if metrics else None,
             result_available=result_available,
             kpis={
                 k: v.to_dict() if hasattr(v, "to_dict") else v
                 for k, v in scenario.kpis.items()
             },
+            run_metrics=metrics,
         )
 
     def to_summary_dict(self) -> dict:
@@ -127,4 +134,7 @@ class ScenarioRecord:
             "run_finished_at": self.run_finished_at,
             "result_available": self.result_available,
             "kpis": self.kpis,
+            "run_metrics": self.run_metrics.to_dict(include_profile=False)
+            if self.run_metrics is not None
+            else None,
         }
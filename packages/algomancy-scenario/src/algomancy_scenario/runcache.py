@@ -0,0 +1,149 @@
+"""
+runcache.py - Memoisation of completed scenario runs
+
+A scenario run is fully determined by its input data, its algorithm and the
+algorithm and data parameter values. ``RunCache`` keys completed runs on a
+hash of exactly those, so creating a scenario that repeats an earlier what-if
+question reuses the stored result and KPI values instead of re-running.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Protocol, Type
+
+from algomancy_utils.logger import Logger
+
+from .result import BaseScenarioResult
+
+
+@dataclass
+class CachedRun:
+    """The outcome of a completed run: what ``Scenario.process`` would produce."""
+
+    result: object
+    kpi_values: Dict[str, float]
+    progress: float
+
+
+class RunCacheStore(Protocol):
+    """Optional persistent second level behind the in-memory ``RunCache``."""
+
+    def load(
+        self, key: str, result_class: Type[BaseScenarioResult]
+    ) -> Optional[CachedRun]: ...
+    def save(self, key: str, run: CachedRun) -> None: ...
+
+
+class RunCache:
+    """
+    Thread-safe LRU cache of completed scenario runs.
+
+    Keys come from :meth:`run_key`: a hash of the input data's
+    ``fingerprint()``, the algorithm name, the serialised algorithm and data
+    parameters, and the KPI names. ``DataSource`` memoises its fingerprint,
+    so keying repeated runs on the same data does not hash it again. Only
+    successful runs are cached. Cached results are shared, not copied,
+    between the scenarios that hit them.
+
+    Args:
+        max_entries: Number of runs kept in memory; the least recently used
+            run is evicted first.
+        store: Optional persistent store (e.g. ``SqlRunCache``) consulted on
+            an in-memory miss and written through on every ``put``.
+        logger: Optional logger.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        store: RunCacheStore | None = None,
+        logger: Logger | None = None,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1; got {max_entries!r}")
+        self.logger = logger
+        self._max_entries = max_entries
+        self._store = store
+        self._entries: "OrderedDict[str, CachedRun]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def run_key(self, scenario) -> Optional[str]:
+        """Cache key for ``scenario``, or ``None`` if its data cannot be hashed."""
+        try:
+            fingerprint = scenario.data_source.fingerprint()
+        except Exception as exc:
+            if self.logger:
+                self.logger.warning(
+                    f"Run cache disabled for '{scenario.tag}': could not "
+                    f"fingerprint its input data ({exc})."
+                )
+            return None
+        algorithm = scenario._algorithm
+        data_params = scenario.data_params
+        payload = json.dumps(
+            [
+                fingerprint,
+                algorithm.name,
+                algorithm.params.serialize(),
+                data_params.serialize() if data_params.has_inputs() else None,
+                sorted(scenario.kpis.keys()),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self, key: str, result_class: Type[BaseScenarioResult] | None = None
+    ) -> Optional[CachedRun]:
+        """Return the cached run for ``key``, consulting the store on a miss."""
+        with self._lock:
+            run = self._entries.get(key)
+            if run is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return run
+
+        if self._store is not None and result_class is not None:
+            run = self._store.load(key, result_class)
+            if run is not None:
+                with self._lock:
+                    self._insert(key, run)
+                    self.hits += 1
+                return run
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, run: CachedRun) -> None:
+        with self._lock:
+            self._insert(key, run)
+        if self._store is not None:
+            try:
+                self._store.save(key, run)
+            except Exception as exc:
+                if self.logger:
+                    self.logger.warning(f"Could not persist cached run: {exc}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _insert(self, key: str, run: CachedRun) -> None:
+        """Add ``run`` as most recently used; caller must hold ``self._lock``."""
+        self._entries[key] = run
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,209 @@
+"""
+runmetrics.py - Timing and memory instrumentation of scenario runs
+
+Every ``Scenario.process`` call records a ``RunMetrics``: real start and finish
+timestamps, the duration of each processing phase (``set_data_params``,
+``run``, ``compute_kpis`` and, with the database backend, ``persist``), and the
+peak resident memory of the process that ran it. That peak is the process's
+high-water mark since it started, not the run's own: it never goes down, so a
+small run after a large one reports the large one's peak. Use ``memory``
+profiling for a per-run figure.
+
+Two heavier captures can be switched on per scenario with
+``Scenario.set_profiling``:
+
+* ``cpu`` - runs the algorithm and KPIs under ``cProfile`` and keeps the top
+  functions by cumulative time as text.
+* ``memory`` - traces allocations with ``tracemalloc`` and records the peak
+  traced size. Tracing is process-wide, so concurrent runs see each other's
+  allocations.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+#: Number of functions kept in a captured cProfile report.
+PROFILE_TOP_FUNCTIONS = 30
+
+# tracemalloc is process-global: trace while at least one run asks for it.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+
+def process_peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process since it started, or ``None``.
+
+    ``ru_maxrss`` cannot be reset, so this is a process-lifetime high-water
+    mark rather than the peak of any one run.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+@dataclass
+class RunMetrics:
+    """Timings and memory figures of one scenario run.
+
+    ``phases`` maps phase name to wall-clock seconds.
+    ``process_peak_rss_bytes`` is the peak resident memory of the process that
+    ran the scenario (the pool worker, for process-pool runs) over its whole
+    lifetime, read when the run finished; it includes earlier runs in the same
+    process. ``traced_peak_bytes`` is the per-run peak, and it and ``profile``
+    are only set when memory tracing / CPU profiling was enabled.
+    """
+
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    process_peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+    profile: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+    def to_dict(self, include_profile: bool = True) -> dict:
+        out = {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration": self.duration,
+            "phases": dict(self.phases),
+            "process_peak_rss_bytes": self.process_peak_rss_bytes,
+            "traced_peak_bytes": self.traced_peak_bytes,
+            "cached": self.cached,
+        }
+        if include_profile:
+            out["profile"] = self.profile
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunMetrics":
+        def _when(value) -> Optional[datetime]:
+            if isinstance(value, datetime) or value is None:
+                return value
+            return datetime.fromisoformat(value)
+
+        return cls(
+            started_at=_when(data.get("started_at")),
+            finished_at=_when(data.get("finished_at")),
+            phases={k: float(v) for k, v in (data.get("phases") or {}).items()},
+            process_peak_rss_bytes=data.get("process_peak_rss_bytes"),
+            traced_peak_bytes=data.get("traced_peak_bytes"),
+            profile=data.get("profile"),
+            cached=bool(data.get("cached", False)),
+        )
+
+
+class RunRecorder:
+    """
+    Collects a ``RunMetrics`` while a run executes.
+
+    Call ``start`` before the run and ``stop`` after it; time each phase with
+    ``with recorder.phase(name):``. CPU profiling covers the calling thread
+    between ``start`` and ``stop``.
+
+    Args:
+        profile_cpu: Capture a cProfile report.
+        trace_memory: Record the peak size traced by tracemalloc.
+    """
+
+    def __init__(self, profile_cpu: bool = False, trace_memory: bool = False):
+        self.metrics = RunMetrics()
+        self._profile_cpu = profile_cpu
+        self._trace_memory = trace_memory
+        self._profiler: cProfile.Profile | None = None
+        self._started = 0.0
+
+    def start(self) -> "RunRecorder":
+        self.metrics.started_at = datetime.now()
+        self._started = time.perf_counter()
+        if self._trace_memory:
+            _start_tracing()
+        if self._profile_cpu:
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except ValueError:
+                # Another profiler is active on this thread.
+                self._profiler = None
+        return self
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.phases[name] = (
+                self.metrics.phases.get(name, 0.0) + time.perf_counter() - began
+            )
+
+    def absorb(self, other: RunMetrics) -> None:
+        """Adopt phases and memory figures measured elsewhere (a worker process)."""
+        self.metrics.phases.update(other.phases)
+        self.metrics.process_peak_rss_bytes = other.process_peak_rss_bytes
+        if other.traced_peak_bytes is not None:
+            self.metrics.traced_peak_bytes = other.traced_peak_bytes
+        if other.profile is not None:
+            self.metrics.profile = other.profile
+
+    def stop(self) -> RunMetrics:
+        if self._profiler is not None:
+            self._profiler.disable()
+            buffer = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+                PROFILE_TOP_FUNCTIONS
+            )
+            self.metrics.profile = buffer.getvalue()
+            self._profiler = None
+        if self._trace_memory:
+            self.metrics.traced_peak_bytes = _stop_tracing()
+            self._trace_memory = False
+        if self.metrics.process_peak_rss_bytes is None:
+            self.metrics.process_peak_rss_bytes = process_peak_rss_bytes()
+        self.metrics.finished_at = datetime.now()
+        return self.metrics
+
+
+def _start_tracing() -> None:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0:
+            if tracemalloc.is_tracing():
+                # Someone else is tracing; measure from here on.
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        _tracemalloc_users += 1
+
+
+def _stop_tracing() -> int:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _current, peak = tracemalloc.get_traced_memory()
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+        return peak
@@ -6,16 +6,21 @@ It provides functionality for creating, processing, and analyzing scenarios with
 algorithms and parameters.
 """
 
+import threading
+import time
 import uuid
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError
 from enum import StrEnum, auto
-from typing import Dict, Generic
+from typing import Callable, Dict, Generic, Tuple
 
 from algomancy_utils.logger import Logger
 from algomancy_utils.baseparameterset import BaseParameterSet, EmptyParameters
 from algomancy_utils.unit import Measurement
 from algomancy_data import BASEDATASOURCE
-from .basealgorithm import ALGORITHM
-from .keyperformanceindicator import BASE_KPI
+from .basealgorithm import ALGORITHM, AlgorithmCancelled
+from .keyperformanceindicator import BASE_KPI, evaluate_kpis
+from .runcache import CachedRun, RunCache
+from .runmetrics import RunMetrics, RunRecorder
 
 
 class ScenarioStatus(StrEnum):
@@ -30,6 +35,42 @@ class ScenarioStatus(StrEnum):
     FAILED = auto()
 
 
+# How often a process-pool run is checked for cancellation / timeout, in seconds.
+_EXECUTOR_POLL_INTERVAL = 0.1
+
+
+def _run_algorithm(
+    algorithm: ALGORITHM,
+    input_data: BASEDATASOURCE,
+    data_params: BaseParameterSet,
+    kpis: Dict[str, BASE_KPI],
+    kpi_workers: int = 1,
+    profile_cpu: bool = False,
+    trace_memory: bool = False,
+) -> Tuple[object, Dict[str, float], float, RunMetrics]:
+    """Run ``algorithm`` on ``input_data`` and evaluate ``kpis`` on its result.
+
+    Module-level so it can be pickled into a ``ProcessPoolExecutor`` worker.
+    Returns ``(result, {kpi_key: value}, final_progress, metrics)``; the caller
+    copies these back onto its own scenario objects.
+    """
+    recorder = RunRecorder(profile_cpu=profile_cpu, trace_memory=trace_memory)
+    recorder.start()
+    try:
+        with recorder.phase("set_data_params"):
+            algorithm.set_data_params(data_params)
+        with recorder.phase("run"):
+            result = algorithm.run(input_data)
+        if not result:
+            raise ValueError("Scenario result is not available")
+        with recorder.phase("compute_kpis"):
+            evaluate_kpis(kpis, result, max_workers=kpi_workers)
+    finally:
+        metrics = recorder.stop()
+    kpi_values = {key: kpi.value for key, kpi in kpis.items()}
+    return result, kpi_values, algorithm.get_progress, metrics
+
+
 class Scenario(Generic[BASE_KPI]):
     """
     Represents a scenario with input data, algorithm, and results.
@@ -72,6 +113,9 @@ class Scenario(Generic[BASE_KPI]):
 
         self.status = ScenarioStatus.CREATED
         self.result = None
+        self.metrics: RunMetrics | None = None  # of the latest run
+        self._profile_cpu = False
+        self._trace_memory = False
 
     def __str__(self):
         return f"Scenario: {self.tag} ({str(self._algorithm)}"
@@ -84,6 +128,10 @@ class Scenario(Generic[BASE_KPI]):
     def data_source(self) -> BASEDATASOURCE:
         return self._input_data
 
+    @property
+    def algorithm_name(self) -> str:
+        return getattr(self._algorithm, "name", "")
+
     @property
     def algorithm_description(self) -> str:
         return self._algorithm.description
@@ -100,16 +148,59 @@ class Scenario(Generic[BASE_KPI]):
     def progress(self) -> float:
         return self._algorithm.get_progress
 
+    def set_progress_listener(self, listener: Callable[["Scenario"], None] | None):
+        """Call ``listener(self)`` whenever the algorithm reports progress.
+
+        Pass ``None`` to remove it.
+        """
+        self._algorithm.set_progress_listener(
+            (lambda _progress: listener(self)) if listener is not None else None
+        )
+
+    @property
+    def profiling(self) -> Dict[str, bool]:
+        return {"cpu": self._profile_cpu, "memory": self._trace_memory}
+
+    def set_profiling(self, cpu: bool = False, memory: bool = False):
+        """Capture a cProfile report (``cpu``) and/or tracemalloc peak (``memory``)
+        in the ``metrics`` of subsequent runs."""
+        self._profile_cpu = cpu
+        self._trace_memory = memory
+
     def set_queued(self):
+        self._algorithm.reset_cancellation()
         self.status = ScenarioStatus.QUEUED
 
-    def process(self, logger: Logger = None):
+    def process(
+        self,
+        logger: Logger = None,
+        executor: Executor | None = None,
+        run_cache: RunCache | None = None,
+        kpi_workers: int = 1,
+    ):
         """
         Processes the scenario using the specified algorithm.
 
         This method runs the algorithm in the background, updates the scenario status,
         and computes KPIs based on the results.
 
+        When ``executor`` is given (typically a ``ProcessPoolExecutor``), the
+        algorithm, data parameters, input data and KPIs are shipped to it and
+        the call blocks until the result and KPI values are returned.
+
+        A run that is cancelled (see ``cancel``) or exceeds the algorithm's
+        ``timeout`` is marked FAILED with the reason as its error.
+
+        With a ``run_cache``, a previous successful run on identical data,
+        algorithm and parameters is reused instead of running the algorithm,
+        and successful runs are added to the cache.
+
+        ``kpi_workers`` is the number of threads KPIs are computed on (see
+        ``compute_kpis``).
+
+        Timings, peak memory and any profiling enabled with ``set_profiling``
+        are stored in ``metrics``.
+
         Exceptions during processing are caught, and the scenario status is set to FAILED.
         """
         if not (
@@ -119,43 +210,160 @@ class Scenario(Generic[BASE_KPI]):
             return
 
         self.status = ScenarioStatus.PROCESSING
+        timeout = self._algorithm.timeout
+        timer = None
+        cache_key = run_cache.run_key(self) if run_cache is not None else None
+        # Process-pool runs are profiled inside the worker (see _run_algorithm).
+        recorder = RunRecorder(
+            profile_cpu=self._profile_cpu and executor is None,
+            trace_memory=self._trace_memory and executor is None,
+        )
+        recorder.start()
         try:
-            self._algorithm.set_data_params(self._data_params)
-            self.result = self._algorithm.run(self._input_data)
-            self.compute_kpis()
+            self._algorithm.check_cancelled()
+            if cache_key is not None:
+                cached = run_cache.get(cache_key, self._algorithm.result_class)
+                if cached is not None:
+                    self._apply_run(cached)
+                    recorder.metrics.cached = True
+                    self.status = ScenarioStatus.COMPLETE
+                    if logger:
+                        logger.log(f"Scenario '{self.tag}' reused a cached run.")
+                    return
+            if executor is None:
+                if timeout is not None:
+                    timer = threading.Timer(
+                        timeout,
+                        self._algorithm.request_cancel,
+                        kwargs={"reason": f"Scenario timed out after {timeout}s."},
+                    )
+                    timer.daemon = True
+                    timer.start()
+                with recorder.phase("set_data_params"):
+                    self._algorithm.set_data_params(self._data_params)
+                with recorder.phase("run"):
+                    self.result = self._algorithm.run(self._input_data)
+                self._algorithm.check_cancelled()
+                with recorder.phase("compute_kpis"):
+                    self.compute_kpis(max_workers=kpi_workers)
+            else:
+                self._process_in_executor(executor, timeout, kpi_workers, recorder)
             self.status = ScenarioStatus.COMPLETE
+            if cache_key is not None:
+                run_cache.put(
+                    cache_key,
+                    CachedRun(
+                        result=self.result,
+                        kpi_values={k: kpi.value for k, kpi in self._kpis.items()},
+                        progress=self._algorithm.get_progress,
+                    ),
+                )
+        except AlgorithmCancelled as e:
+            self.status = ScenarioStatus.FAILED
+            if logger:
+                logger.warning(f"Scenario '{self.tag}' stopped: {e.message}")
+            self.result = {"error": e.message}
         except Exception as e:
             self.status = ScenarioStatus.FAILED
             if logger:
                 logger.error(f"Scenario '{self.tag}' failed to process.")
                 logger.log_traceback(e)
             self.result = {"error": str(e)}
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self.metrics = recorder.stop()
+
+    def _process_in_executor(
+        self,
+        executor: Executor,
+        timeout: float | None,
+        kpi_workers: int,
+        recorder: RunRecorder,
+    ) -> None:
+        future = executor.submit(
+            _run_algorithm,
+            self._algorithm,
+            self._input_data,
+            self._data_params,
+            self._kpis,
+            kpi_workers,
+            self._profile_cpu,
+            self._trace_memory,
+        )
+        # Cancellation and timeouts cannot reach into the worker process, so
+        # poll instead of blocking: on either, stop waiting and free this
+        # worker thread. A run that already started keeps its pool process
+        # busy until it returns; its result is discarded.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                result, kpi_values, progress, metrics = future.result(
+                    timeout=_EXECUTOR_POLL_INTERVAL
+                )
+                break
+            except FutureTimeoutError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._algorithm.request_cancel(
+                        reason=f"Scenario timed out after {timeout}s."
+                    )
+                if self._algorithm.is_cancelled:
+                    future.cancel()
+                    self._algorithm.check_cancelled()
+        recorder.absorb(metrics)
+        self._apply_run(CachedRun(result, kpi_values, progress))
+
+    def _apply_run(self, run: CachedRun) -> None:
+        """Adopt a run computed elsewhere (worker process or run cache)."""
+        self._algorithm.set_data_params(self._data_params)
+        self._algorithm.set_progress(run.progress)
+        self.result = run.result
+        for key, value in run.kpi_values.items():
+            self._kpis[key].value = value
 
     def cancel(self, logger: Logger = None):
+        """Request cancellation of a queued or running scenario.
+
+        Sets the algorithm's cancellation token; the run stops at its next
+        ``set_progress`` / ``check_cancelled`` call and the scenario is marked
+        FAILED. Removing a still-queued scenario from the processor's queue is
+        done by ``ScenarioManager.cancel_scenario``, which calls this method.
+        """
+        if self.status not in (ScenarioStatus.QUEUED, ScenarioStatus.PROCESSING):
+            return
+        self._algorithm.request_cancel()
         if logger:
-            logger.warning(f"Not Yet Implemented: Scenario {self.tag} cancel")
-        pass
+            logger.log(f"Cancellation requested for scenario {self.tag}")
 
     def refresh(self, logger: Logger = None):
         """Reset the scenario's in-memory state so it can be re-run.
 
         Clears ``result``, returns ``status`` to ``CREATED``, resets the
         algorithm's progress counter, and reverts every KPI's measurement to
-        its uncomputed sentinel (``Measurement.INITIAL_VALUE``). Does NOT touch
+        its uncomputed sentinel (``Measurement.INITIAL_VALUE``) and drops the
+        run ``metrics``. Does NOT touch
         persisted run history; the repository's ``refresh`` hook handles that.
         """
         self.status = ScenarioStatus.CREATED
         self.result = None
+        self.metrics = None
+        self._algorithm.reset_cancellation()
         self._algorithm.set_progress(0)
         for kpi in self._kpis.values():
             kpi._measurement.value = Measurement.INITIAL_VALUE
         if logger:
             logger.log(f"Refreshed scenario {self.tag}")
 
-    def compute_kpis(self):
+    def compute_kpis(self, max_workers: int = 1):
         """
         Calculates key performance indicators (KPIs) for the given scenario.
 
+        All KPIs share one ``KpiContext``, so frames derived from the result
+        are computed once. With ``max_workers > 1`` KPIs run on a thread pool.
+
+        Args:
+            max_workers (int): Number of threads to compute KPIs on.
+
         Raises:
             ValueError: If there is no result available for the scenario.
             KpiError: If one or more KPI calculations fail.
@@ -163,8 +371,7 @@ class Scenario(Generic[BASE_KPI]):
         if not self.result:
             raise ValueError("Scenario result is not available")
 
-        for kpi in self._kpis.values():
-            kpi.compute_and_check(self.result)
+        evaluate_kpis(self._kpis, self.result, max_workers=max_workers)
 
     def to_dict(self) -> dict:
         """
@@ -195,6 +402,9 @@ class Scenario(Generic[BASE_KPI]):
             if self._data_params.has_inputs()
             else {},
             "status": self.status,
+            "metrics": self.metrics.to_dict(include_profile=False)
+            if self.metrics is not None
+            else None,
             "result": self.result.to_dict()
             if hasattr(self.result, "to_dict")
             else self.result,
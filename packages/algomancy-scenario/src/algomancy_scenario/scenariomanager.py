@@ -1,24 +1,32 @@
-from typing import Dict, List, Optional, TypeVar, Type
+import itertools
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Type
 
 from algomancy_data import (
+    DataClassification,
     ETLFactory,
     StatefulDataManager,
     StatelessDataManager,
     BASEDATASOURCE,
     Schema,
 )
+from algomancy_data.datamanager import SUPPORTED_SAVE_TYPES
 
 from algomancy_utils.logger import Logger
 from .basealgorithm import ALGORITHM
 from algomancy_utils.baseparameterset import BASE_PARAMS_BOUND
 
 from .core_configuration import CoreConfig
+from .jobrunner import JobRunner
 from .keyperformanceindicator import BASE_KPI
+from .progressbus import ProgressEventBus
 from .records import ScenarioRecord
-from .scenario import Scenario
+from .scenario import Scenario, ScenarioStatus
 from .scenarioregistry import ScenarioRegistry
 from .scenariofactory import ScenarioFactory
+from .runcache import RunCache
 from .scenarioprocessor import ScenarioProcessor
+from .scenarioscheduler import ScenarioScheduler
 
 
 class ScenarioManager:
@@ -51,10 +59,19 @@ class ScenarioManager:
             data_folder=core.data_path,
             has_persistent_state=core.has_persistent_state,
             save_type=core.save_type,
+            lazy_data_loading=core.lazy_data_loading,
+            data_warmup_workers=core.data_warmup_workers,
+            etl_snapshots=core.etl_snapshots,
+            etl_snapshot_fingerprint=core.etl_snapshot_fingerprint,
             autocreate=core.autocreate,
             default_algo_name=core.default_algo,
             default_param_values=core.default_algo_params_values,
             autorun=core.autorun,
+            executor=core.executor,
+            max_workers=core.max_workers,
+            run_cache_size=core.run_cache_size,
+            kpi_workers=core.kpi_workers,
+            progress_throttle=core.progress_throttle,
         )
 
     def __init__(
@@ -69,12 +86,26 @@ class ScenarioManager:
         scenario_save_location: str = "scenarios.json",
         has_persistent_state: bool = False,
         save_type: str = "json",  # adjusts the format
+        lazy_data_loading: bool = False,
+        data_warmup_workers: int = 0,
+        etl_snapshots: bool = False,
+        etl_snapshot_fingerprint: str = "stat",
         autocreate: bool = False,
         default_algo_name: str = None,
         default_param_values: Dict[str, any] = None,
         autorun: bool = False,
         data_manager=None,
         scenario_repository=None,
+        executor: str = "thread",
+        max_workers: int = 1,
+        scheduler: ScenarioScheduler | None = None,
+        session_key: str | None = None,
+        run_cache: RunCache | None = None,
+        run_cache_size: int | None = None,
+        kpi_workers: int = 1,
+        event_bus: ProgressEventBus | None = None,
+        progress_throttle: float = 0.5,
+        job_runner: JobRunner | None = None,
     ) -> None:
         self.logger = logger if logger else Logger()
         self.scenario_save_location = scenario_save_location
@@ -83,7 +114,7 @@ class ScenarioManager:
         self._default_algo_name = default_algo_name
         self._default_param_values = default_param_values
 
-        assert save_type in ["json"], "Save type must be parquet or json."
+        assert save_type in SUPPORTED_SAVE_TYPES, "Save type must be parquet or json."
         self._save_type = save_type
 
         # Components — prefer injected implementations over auto-constructed ones
@@ -100,6 +131,10 @@ class ScenarioManager:
                 save_type=save_type,
                 data_object_type=data_object_type,
                 logger=self.logger,
+                lazy_loading=lazy_data_loading,
+                warmup_workers=data_warmup_workers,
+                etl_snapshots=etl_snapshots,
+                snapshot_fingerprint=etl_snapshot_fingerprint,
             )
         else:
             self._dm = StatelessDataManager(
@@ -126,9 +161,31 @@ class ScenarioManager:
         if hasattr(self._registry, "persist_run"):
             _on_processed = self._registry.persist_run
 
+        # Prefer a shared run cache (SessionManager); otherwise build a private
+        # one when a size is configured. None disables run memoisation.
+        if run_cache is None and run_cache_size is not None:
+            run_cache = RunCache(max_entries=run_cache_size, logger=self.logger)
+
+        # Prefer a shared event bus (SessionManager); otherwise own one.
+        self._owns_event_bus = event_bus is None
+        if event_bus is None:
+            event_bus = ProgressEventBus(
+                min_interval=progress_throttle, logger=self.logger
+            )
+
         self._processor = ScenarioProcessor(
-            logger=self.logger, on_processed=_on_processed
+            logger=self.logger,
+            on_processed=_on_processed,
+            executor=executor,
+            max_workers=max_workers,
+            scheduler=scheduler,
+            session_key=session_key,
+            run_cache=run_cache,
+            kpi_workers=kpi_workers,
+            event_bus=event_bus,
         )
+        # Durable queue (database backend): runs go through the job table.
+        self._job_runner = job_runner
         self.toggle_autorun(autorun)
 
         # Keep inputs for accessors
@@ -178,6 +235,28 @@ class ScenarioManager:
     def currently_processing(self) -> Optional[Scenario]:
         return self._processor.currently_processing
 
+    @property
+    def queue_depth(self) -> int:
+        return self._processor.queue_depth
+
+    @property
+    def processing(self) -> List[Scenario]:
+        return self._processor.processing
+
+    @property
+    def run_cache(self) -> Optional[RunCache]:
+        return self._processor.run_cache
+
+    @property
+    def event_bus(self) -> ProgressEventBus:
+        """Bus on which this session's scenario status/progress changes are pushed."""
+        return self._processor.event_bus
+
+    @property
+    def session_key(self) -> str:
+        """Key this session's events are published under on ``event_bus``."""
+        return self._processor.session_key
+
     def get_algorithm_parameters(self, key) -> BASE_PARAMS_BOUND:
         return self._factory.algorithms.get(key).initialize_parameters()
 
@@ -188,6 +267,25 @@ class ScenarioManager:
     def get_data(self, data_key):
         return self._dm.get_data(data_key)
 
+    def get_derived_data_keys(self) -> List[str]:
+        """Keys of the datasets that are not master data.
+
+        Classified from the data manager's catalogue, so no dataset is loaded;
+        datasets whose classification is unknown are left out.
+        """
+        keys = []
+        for data_key in self._dm.get_data_keys():
+            ds_type = self._dm.get_data_classification(data_key)
+            if ds_type is not None and ds_type != DataClassification.MASTER_DATA:
+                keys.append(data_key)
+        return keys
+
+    def _require_data(self, data_key: str):
+        data = self._dm.get_data(data_key)
+        if data is None:
+            raise KeyError(f"Dataset '{data_key}' not found.")
+        return data
+
     def set_data(self, data_key, data):
         self._dm.set_data(data_key, data)
 
@@ -227,19 +325,39 @@ class ScenarioManager:
             )
 
     # Processing operations (delegated)
-    def process_scenario_async(self, scenario):
+    def process_scenario_async(self, scenario, priority: int = 0):
         # Pin the scenario in the repository's hydration cache (if it has one)
         # so the live instance stays resident — and is the one polled — from
         # enqueue until its run is persisted. No-op for in-memory backends.
+        if self._job_runner is None:
+            self.enqueue_local(scenario, priority=priority)
+            return
         if hasattr(self._registry, "pin"):
             self._registry.pin(scenario.id)
-        self._processor.enqueue(scenario)
+        scenario.set_queued()
+        self._processor.notify(scenario)
+        self._job_runner.submit(self.session_key, scenario, priority=priority)
+
+    def enqueue_local(
+        self,
+        scenario: Scenario,
+        priority: int = 0,
+        on_done: Callable[[Scenario, bool], None] | None = None,
+    ):
+        """Queue ``scenario`` on this process's processor, bypassing any durable queue."""
+        if hasattr(self._registry, "pin"):
+            self._registry.pin(scenario.id)
+        self._processor.enqueue(scenario, priority=priority, on_done=on_done)
 
     def wait_for_processing(self):
+        if self._job_runner is not None:
+            self._job_runner.wait_for_session(self.session_key)
         self._processor.wait_for_processing()
 
     def shutdown_processing(self):
         self._processor.shutdown()
+        if self._owns_event_bus:
+            self.event_bus.close()
 
     # Scenario creation/registry
     def get_associated_parameters(
@@ -248,7 +366,7 @@ class ScenarioManager:
         return self._factory.get_associated_parameters(algo_name, dataset_key)
 
     def get_data_parameters(self, dataset_key: str) -> BASE_PARAMS_BOUND:
-        return self.get_data(dataset_key).initialize_data_parameters()
+        return self._require_data(dataset_key).initialize_data_parameters()
 
     def create_scenario(
         self,
@@ -275,18 +393,103 @@ class ScenarioManager:
         self._registry.add(scenario)
 
         if self._processor.auto_run_scenarios:
-            if hasattr(self._registry, "pin"):
-                self._registry.pin(scenario.id)
-            self._processor.enqueue(scenario)
+            self.process_scenario_async(scenario)
         return scenario
 
+    def create_scenarios_batch(
+        self, specs: List[Dict[str, Any]], enqueue: bool = False
+    ) -> List[Scenario]:
+        """Create many scenarios at once.
+
+        Each spec is a dict of :meth:`create_scenario` keyword arguments
+        (``tag``, ``dataset_key``, ``algo_name`` and optional ``algo_params`` /
+        ``data_params``). Every spec is validated and built before anything is
+        stored, so a bad spec (duplicate tag, unknown algorithm or dataset,
+        invalid parameter value) raises without registering any scenario. The
+        batch is then added to the repository in one go — a single
+        transaction for the database backend.
+
+        When ``enqueue`` is true (or auto-run is on) the whole batch is queued
+        for processing in spec order.
+        """
+        tags = [spec["tag"] for spec in specs]
+        duplicates = sorted(tag for tag, n in Counter(tags).items() if n > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate tags in batch: {duplicates}.")
+        existing = [tag for tag in tags if self._registry.has_tag(tag)]
+        if existing:
+            raise ValueError(f"Scenarios with tags {existing} already exist.")
+
+        scenarios = [
+            self._factory.create(
+                tag=spec["tag"],
+                dataset_key=spec.get("dataset_key", "Master data"),
+                algo_name=spec.get("algo_name", ""),
+                algo_params=spec.get("algo_params"),
+                data_params=spec.get("data_params"),
+            )
+            for spec in specs
+        ]
+        self._registry.add_many(scenarios)
+
+        if enqueue or self._processor.auto_run_scenarios:
+            for scenario in scenarios:
+                self.process_scenario_async(scenario)
+        return scenarios
+
+    def create_parameter_sweep(
+        self,
+        algo_name: str,
+        dataset_key: str,
+        grid: Dict[str, List[Any]],
+        tag_prefix: Optional[str] = None,
+        algo_params: Optional[Dict[str, Any]] = None,
+        data_params: Optional[Dict[str, Any]] = None,
+        enqueue: bool = False,
+    ) -> List[Scenario]:
+        """Create one scenario per point of the cartesian product of ``grid``.
+
+        ``grid`` maps algorithm parameter names to the values to sweep; fixed
+        values for the remaining parameters go in ``algo_params``. Tags are
+        ``"<tag_prefix> [name=value, ...]"`` with ``tag_prefix`` defaulting to
+        the algorithm name. See :meth:`create_scenarios_batch` for validation
+        and ``enqueue`` semantics.
+        """
+        prefix = tag_prefix if tag_prefix else algo_name
+        names = list(grid.keys())
+        specs = []
+        for values in itertools.product(*(grid[name] for name in names)):
+            point = dict(zip(names, values))
+            label = ", ".join(f"{name}={value}" for name, value in point.items())
+            specs.append(
+                {
+                    "tag": f"{prefix} [{label}]",
+                    "dataset_key": dataset_key,
+                    "algo_name": algo_name,
+                    "algo_params": {**(algo_params or {}), **point},
+                    "data_params": data_params,
+                }
+            )
+        return self.create_scenarios_batch(specs, enqueue=enqueue)
+
     def get_by_id(self, scenario_id: str) -> Optional[Scenario]:
         return self._registry.get_by_id(scenario_id)
 
     def get_by_tag(self, tag: str) -> Optional[Scenario]:
         return self._registry.get_by_tag(tag)
 
+    def sync_scenario(self, scenario_id: str) -> bool:
+        """Pick up a scenario stored by another process sharing the database.
+
+        Returns whether the scenario exists in this session. Without a
+        database backend only scenarios of this process exist.
+        """
+        if hasattr(self._registry, "sync"):
+            return self._registry.sync(scenario_id)
+        return self._registry.get_record(scenario_id) is not None
+
     def delete_scenario(self, scenario_id: str) -> bool:
+        self.event_bus.forget(self.session_key, scenario_id)
         return self._registry.delete(scenario_id)
 
     def refresh_scenario(self, scenario_id: str) -> Optional[Scenario]:
@@ -302,6 +505,41 @@ class ScenarioManager:
         scenario.refresh(logger=self.logger)
         if hasattr(self._registry, "refresh"):
             self._registry.refresh(scenario_id)
+        self._processor.notify(scenario)
+        return scenario
+
+    def cancel_scenario(self, scenario_id: str) -> Optional[Scenario]:
+        """Cancel a queued or running scenario.
+
+        A queued scenario is taken off the queue and returned to ``CREATED``;
+        a running one stops at its algorithm's next progress update and ends
+        up ``FAILED``. Scenarios in any other state are left untouched.
+        Returns the scenario, or ``None`` if no scenario with that id exists
+        in this session.
+        """
+        scenario = self._registry.get_by_id(scenario_id)
+        if scenario is None:
+            return None
+        if scenario.status not in (ScenarioStatus.QUEUED, ScenarioStatus.PROCESSING):
+            return scenario
+        dequeued = self._processor.cancel(scenario)
+        if (
+            not dequeued
+            and self._job_runner is not None
+            and scenario.status == ScenarioStatus.QUEUED
+        ):
+            # Still waiting in the durable queue, not claimed by any worker.
+            dequeued = self._job_runner.cancel(scenario_id)
+            if dequeued:
+                scenario.refresh(logger=self.logger)
+                self._processor.notify(scenario)
+        if dequeued:
+            if self._job_runner is not None and hasattr(self._registry, "refresh"):
+                # The durable queue recorded QUEUED in the database.
+                self._registry.refresh(scenario_id)
+            if hasattr(self._registry, "unpin"):
+                # Dequeued runs never reach ``persist_run``, which normally unpins.
+                self._registry.unpin(scenario_id)
         return scenario
 
     def list_scenarios(self) -> List[Scenario]:
@@ -415,7 +653,7 @@ class ScenarioManager:
             )
 
     def get_data_as_json(self, key: str) -> str:
-        return self._dm.get_data(key).to_json()
+        return self._require_data(key).to_json()
 
     def store_data_as_json(self, set_name):
         if isinstance(self._dm, StatefulDataManager):
@@ -425,6 +663,14 @@ class ScenarioManager:
                 "Stateless data manager does not support internal serialization."
             )
 
+    def store_data_as_parquet(self, set_name):
+        if isinstance(self._dm, StatefulDataManager):
+            self._dm.store_data_source_as_parquet(set_name)
+        else:
+            raise AttributeError(
+                "Stateless data manager does not support internal serialization."
+            )
+
     def debug_load_data(self, dataset_name: str) -> None:
         if isinstance(self._dm, StatefulDataManager):
             self._dm.load_data_from_dir(dataset_name)
@@ -1,31 +1,104 @@
-import queue
 import threading
-from typing import Callable, Optional
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
 
 from algomancy_utils.logger import Logger
+from algomancy_utils.metrics import REGISTRY
 
-from .scenario import Scenario
+from .progressbus import ProgressEventBus
+from .runcache import RunCache
+from .scenario import Scenario, ScenarioStatus
+from .scenarioscheduler import ScenarioScheduler
+
+_RUNS_STARTED = REGISTRY.counter(
+    "algomancy_runs_started_total", "Scenario runs started.", ["algorithm"]
+)
+_RUNS_COMPLETED = REGISTRY.counter(
+    "algomancy_runs_completed_total", "Scenario runs completed.", ["algorithm"]
+)
+_RUNS_FAILED = REGISTRY.counter(
+    "algomancy_runs_failed_total",
+    "Scenario runs failed, cancelled or timed out.",
+    ["algorithm"],
+)
+_RUN_DURATION = REGISTRY.histogram(
+    "algomancy_run_duration_seconds",
+    "Wall-clock duration of scenario runs, excluding persistence.",
+    ["algorithm", "status"],
+)
 
 
 class ScenarioProcessor:
     """
     Manages the processing queue, runs scenarios asynchronously, and tracks status.
+
+    Runs are executed by a ``ScenarioScheduler``. By default each processor
+    owns a private scheduler sized by ``executor`` / ``max_workers``:
+
+    - ``"thread"`` (default): ``max_workers`` daemon threads run
+      ``Scenario.process`` in this process. Progress reported by the
+      algorithm is visible live.
+    - ``"process"``: runs are dispatched to a ``ProcessPoolExecutor`` with
+      ``max_workers`` processes, so CPU-bound algorithms scale across cores
+      instead of serialising on the GIL. The algorithm, its parameters and the
+      input data are pickled to the worker; the result and KPI values are
+      shipped back. Live progress is not available mid-run in this mode — it
+      jumps to the algorithm's final value when the run returns.
+
+    Passing a shared ``scheduler`` (as ``SessionManager`` does when
+    ``max_concurrent_runs`` is configured) makes the processor submit its
+    runs there under ``session_key`` instead; ``executor`` and
+    ``max_workers`` are then taken from the shared scheduler.
+
+    With a ``run_cache``, scenarios that repeat an earlier successful run
+    (same data, algorithm and parameters) reuse its result and KPI values.
+    ``kpi_workers`` threads compute each scenario's KPIs.
+
+    With an ``event_bus``, every status change and progress update of this
+    processor's scenarios is published on it under ``session_key``.
+
+    ``on_processed(scenario)`` is called after each run. If it returns a
+    ``Future`` (as ``SqlScenarioRepository.persist_run`` does with a
+    background writer), the worker moves on at once and the scenario's job
+    ends — ``on_done`` runs and ``wait_for_processing`` stops counting it —
+    only when that future resolves. ``on_done`` is told whether the run was
+    persisted: not if the run raised, ``on_processed`` raised, or the future
+    ended in an exception.
     """
 
     def __init__(
         self,
         logger: Logger | None = None,
-        on_processed: Callable[[Scenario], None] | None = None,
+        on_processed: Callable[[Scenario], Future | None] | None = None,
+        executor: str = "thread",
+        max_workers: int = 1,
+        scheduler: ScenarioScheduler | None = None,
+        session_key: str | None = None,
+        run_cache: RunCache | None = None,
+        kpi_workers: int = 1,
+        event_bus: ProgressEventBus | None = None,
     ):
         self.logger = logger
         self._on_processed = on_processed
-        self._process_queue: queue.Queue[Scenario | None] = queue.Queue()
-        self._worker_thread = threading.Thread(
-            target=self._process_scenarios_worker, daemon=True
+        self._owns_scheduler = scheduler is None
+        self._scheduler = (
+            scheduler
+            if scheduler is not None
+            else ScenarioScheduler(
+                max_concurrent_runs=max_workers, executor=executor, logger=logger
+            )
         )
-        self._currently_processing: Optional[Scenario] = None
+        self._session_key = session_key if session_key else str(uuid.uuid4())
+        self._run_cache = run_cache
+        self._kpi_workers = kpi_workers
+        self._event_bus = event_bus
+        self._processing: List[Scenario] = []
+        # Per-scenario callbacks run once its queued job ends, run or not.
+        self._on_done: Dict[str, Callable[[Scenario, bool], None]] = {}
+        self._pending = 0
+        self._state_cond = threading.Condition()
         self._auto_run_scenarios = False
-        self._worker_thread.start()
 
     # Properties
     @property
@@ -36,46 +109,196 @@ class ScenarioProcessor:
     def auto_run_scenarios(self, value: bool):
         self._auto_run_scenarios = value
 
+    @property
+    def executor(self) -> str:
+        return self._scheduler.executor
+
+    @property
+    def max_workers(self) -> int:
+        return self._scheduler.max_concurrent_runs
+
+    @property
+    def scheduler(self) -> ScenarioScheduler:
+        return self._scheduler
+
+    @property
+    def run_cache(self) -> RunCache | None:
+        return self._run_cache
+
+    @property
+    def session_key(self) -> str:
+        return self._session_key
+
+    @property
+    def event_bus(self) -> ProgressEventBus | None:
+        return self._event_bus
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of this processor's scenarios waiting to start."""
+        return self._scheduler.queue_depth(self._session_key)
+
     @property
     def currently_processing(self) -> Optional[Scenario]:
-        return self._currently_processing
+        """The oldest scenario still being processed, or ``None`` when idle."""
+        with self._state_cond:
+            return self._processing[0] if self._processing else None
+
+    @property
+    def processing(self) -> List[Scenario]:
+        """All scenarios currently being processed, oldest first."""
+        with self._state_cond:
+            return list(self._processing)
 
     # Worker
-    def _process_scenarios_worker(self):
-        while True:
-            scenario = self._process_queue.get()
-            if scenario is None:
-                break
+    def _finish(self, scenario: Scenario, persisted: bool = True):
+        with self._state_cond:
+            on_done = self._on_done.pop(scenario.id, None)
+        if on_done is not None:
+            try:
+                on_done(scenario, persisted)
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error(f"on_done callback failed for '{scenario.tag}'")
+                    self.logger.log_traceback(exc)
 
-            if self.logger:
-                self.logger.log(f"Processing scenario '{scenario.tag}'...")
-            self._currently_processing = scenario
+    def _settle(self, scenario: Scenario, persisted: bool):
+        self._finish(scenario, persisted)
+        with self._state_cond:
+            self._pending -= 1
+            self._state_cond.notify_all()
 
-            scenario.process(logger=self.logger)
+    def _run_scenario(self, scenario: Scenario):
+        if self.logger:
+            self.logger.log(f"Processing scenario '{scenario.tag}'...")
+        with self._state_cond:
+            self._processing.append(scenario)
+
+        acknowledgement = None
+        persisted = False
+        try:
+            if self._event_bus is not None:
+                scenario.set_progress_listener(self.notify)
+            self.notify(scenario, status=ScenarioStatus.PROCESSING)
+            _RUNS_STARTED.inc(algorithm=scenario.algorithm_name)
+            scenario.process(
+                logger=self.logger,
+                executor=self._scheduler.pool,
+                run_cache=self._run_cache,
+                kpi_workers=self._kpi_workers,
+            )
+            scenario.set_progress_listener(None)
+            self.notify(scenario)
+            self._record_run(scenario)
 
             if self._on_processed:
                 try:
-                    self._on_processed(scenario)
+                    acknowledgement = self._on_processed(scenario)
+                    persisted = True
                 except Exception as exc:
                     if self.logger:
                         self.logger.error(
                             f"on_processed callback failed for '{scenario.tag}'"
                         )
                         self.logger.log_traceback(exc)
+            else:
+                persisted = True
 
             if self.logger:
                 self.logger.log(f"Scenario '{scenario.tag}' completed.")
-            self._currently_processing = None
-            self._process_queue.task_done()
+        finally:
+            with self._state_cond:
+                self._processing.remove(scenario)
+            if isinstance(acknowledgement, Future):
+                # The job ends once the run is durable, not when it was handed off.
+                acknowledgement.add_done_callback(
+                    lambda fut: self._settle(
+                        scenario, not fut.cancelled() and fut.exception() is None
+                    )
+                )
+            else:
+                self._settle(scenario, persisted)
+
+    @staticmethod
+    def _record_run(scenario: Scenario):
+        algorithm = scenario.algorithm_name
+        if scenario.status == ScenarioStatus.COMPLETE:
+            _RUNS_COMPLETED.inc(algorithm=algorithm)
+        else:
+            _RUNS_FAILED.inc(algorithm=algorithm)
+        if scenario.metrics is not None and scenario.metrics.duration is not None:
+            _RUN_DURATION.observe(
+                scenario.metrics.duration,
+                algorithm=algorithm,
+                status=str(scenario.status),
+            )
 
     # API
-    def enqueue(self, scenario: Scenario):
+    def notify(self, scenario: Scenario, status: ScenarioStatus | None = None):
+        """Publish the scenario's status and progress on the event bus, if any."""
+        if self._event_bus is not None:
+            self._event_bus.publish_scenario(self._session_key, scenario, status)
+
+    def enqueue(
+        self,
+        scenario: Scenario,
+        priority: int = 0,
+        on_done: Callable[[Scenario, bool], None] | None = None,
+    ):
+        """Queue ``scenario`` for processing.
+
+        ``on_done(scenario, persisted)`` is called when the job ends: after the
+        run (and ``on_processed``), or when the scenario is cancelled while
+        queued. ``persisted`` is ``False`` if the run's outcome was lost.
+        """
         scenario.set_queued()
-        self._process_queue.put(scenario)
+        # Announce before submitting: a free worker may start the run at once.
+        self.notify(scenario)
+        with self._state_cond:
+            self._pending += 1
+            if on_done is not None:
+                self._on_done[scenario.id] = on_done
+        try:
+            self._scheduler.submit(
+                self._session_key, scenario, self._run_scenario, priority=priority
+            )
+        except Exception:
+            with self._state_cond:
+                self._pending -= 1
+                self._on_done.pop(scenario.id, None)
+                self._state_cond.notify_all()
+            raise
+
+    def cancel(self, scenario: Scenario) -> bool:
+        """Cancel a queued or running scenario.
+
+        A scenario still waiting in the queue is removed and returned to
+        CREATED; this returns ``True``. Otherwise cancellation is requested on
+        the running algorithm, which stops at its next progress update and
+        ends up FAILED; this returns ``False``.
+        """
+        if self._scheduler.cancel(self._session_key, scenario):
+            with self._state_cond:
+                self._pending -= 1
+                self._state_cond.notify_all()
+            scenario.refresh()
+            self.notify(scenario)
+            self._finish(scenario)
+            if self.logger:
+                self.logger.log(f"Removed scenario '{scenario.tag}' from the queue.")
+            return True
+
+        scenario.cancel(logger=self.logger)
+        return False
 
     def wait_for_processing(self):
-        self._process_queue.join()
+        with self._state_cond:
+            while self._pending > 0:
+                self._state_cond.wait()
 
     def shutdown(self):
-        self._process_queue.put(None)
-        self._worker_thread.join()
+        if self._owns_scheduler:
+            self._scheduler.shutdown()
+        else:
+            # The shared scheduler outlives this session; just drain our runs.
+            self.wait_for_processing()
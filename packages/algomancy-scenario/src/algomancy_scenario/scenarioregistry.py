@@ -25,6 +25,10 @@ class ScenarioRegistry:
         self._tag_index[scenario.tag] = scenario.id
         self.log(f"Registered scenario '{scenario.tag}'.")
 
+    def add_many(self, scenarios: List[Scenario]) -> None:
+        for scenario in scenarios:
+            self.add(scenario)
+
     def get_by_id(self, scenario_id: str) -> Optional[Scenario]:
         return self._scenarios.get(scenario_id)
 
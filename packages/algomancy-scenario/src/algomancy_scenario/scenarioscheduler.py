@@ -0,0 +1,218 @@
+import heapq
+import itertools
+import threading
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+
+from algomancy_utils.logger import Logger
+
+from .scenario import Scenario
+
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+@dataclass(order=True)
+class _Job:
+    # Heap ordering: highest priority first, then submission order (FIFO).
+    sort_key: tuple
+    session_key: str = field(compare=False)
+    scenario: Scenario = field(compare=False)
+    run: Callable[[Scenario], None] = field(compare=False)
+
+
+class ScenarioScheduler:
+    """
+    Runs queued scenarios on a bounded pool of worker threads.
+
+    A single scheduler can be shared by the ``ScenarioProcessor`` of every
+    session so the process as a whole never runs more than
+    ``max_concurrent_runs`` scenarios at once. Jobs are picked as follows:
+
+    1. Only sessions below ``session_quota`` running jobs are eligible.
+    2. Among those, the highest ``priority`` waiting at the head of any
+       session's queue wins.
+    3. Ties between sessions are broken round-robin, so one session's large
+       batch cannot starve the others. Within a session, jobs of equal
+       priority run in submission order.
+
+    With ``executor="process"`` the scheduler owns a ``ProcessPoolExecutor``
+    of ``max_concurrent_runs`` processes, exposed via ``pool``, that the run
+    callbacks hand to ``Scenario.process``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_runs: int = 1,
+        session_quota: int | None = None,
+        executor: str = "thread",
+        logger: Logger | None = None,
+    ):
+        if executor not in EXECUTOR_MODES:
+            raise ValueError(
+                f"executor must be one of {EXECUTOR_MODES}; got {executor!r}"
+            )
+        if max_concurrent_runs < 1:
+            raise ValueError(
+                f"max_concurrent_runs must be at least 1; got {max_concurrent_runs!r}"
+            )
+        if session_quota is not None and session_quota < 1:
+            raise ValueError(
+                f"session_quota must be None or at least 1; got {session_quota!r}"
+            )
+
+        self.logger = logger
+        self._max_concurrent_runs = max_concurrent_runs
+        self._session_quota = session_quota
+        self._executor_mode = executor
+        self._pool: Executor | None = (
+            ProcessPoolExecutor(max_workers=max_concurrent_runs)
+            if executor == "process"
+            else None
+        )
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, List[_Job]] = {}
+        self._round_robin: Deque[str] = deque()
+        self._running: Counter = Counter()
+        self._sequence = itertools.count()
+        self._closing = False
+
+        self._worker_threads = [
+            threading.Thread(target=self._worker, daemon=True)
+            for _ in range(max_concurrent_runs)
+        ]
+        for thread in self._worker_threads:
+            thread.start()
+
+    # Properties
+    @property
+    def executor(self) -> str:
+        return self._executor_mode
+
+    @property
+    def pool(self) -> Optional[Executor]:
+        return self._pool
+
+    @property
+    def max_concurrent_runs(self) -> int:
+        return self._max_concurrent_runs
+
+    @property
+    def session_quota(self) -> int | None:
+        return self._session_quota
+
+    # API
+    def submit(
+        self,
+        session_key: str,
+        scenario: Scenario,
+        run: Callable[[Scenario], None],
+        priority: int = 0,
+    ) -> None:
+        """Queue ``run(scenario)`` on behalf of ``session_key``.
+
+        Higher ``priority`` values are scheduled first.
+        """
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("Scheduler is shut down.")
+            job = _Job((-priority, next(self._sequence)), session_key, scenario, run)
+            heapq.heappush(self._queues.setdefault(session_key, []), job)
+            if session_key not in self._round_robin:
+                self._round_robin.append(session_key)
+            self._cond.notify_all()
+
+    def cancel(self, session_key: str, scenario: Scenario) -> bool:
+        """Remove ``scenario``'s waiting job from ``session_key``'s queue.
+
+        Returns ``False`` when no such job is queued (it may already be running).
+        """
+        with self._cond:
+            queue = self._queues.get(session_key, [])
+            remaining = [job for job in queue if job.scenario is not scenario]
+            if len(remaining) == len(queue):
+                return False
+            if remaining:
+                heapq.heapify(remaining)
+                self._queues[session_key] = remaining
+            else:
+                del self._queues[session_key]
+                self._round_robin.remove(session_key)
+            self._cond.notify_all()
+            return True
+
+    def queue_depth(self, session_key: str | None = None) -> int:
+        """Number of waiting (not yet running) jobs, overall or for one session."""
+        with self._cond:
+            if session_key is not None:
+                return len(self._queues.get(session_key, []))
+            return sum(len(q) for q in self._queues.values())
+
+    def running_count(self, session_key: str | None = None) -> int:
+        """Number of jobs currently running, overall or for one session."""
+        with self._cond:
+            if session_key is not None:
+                return self._running[session_key]
+            return sum(self._running.values())
+
+    def shutdown(self) -> None:
+        """Run every job still queued, then stop the workers and the pool."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for thread in self._worker_threads:
+            thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    # Worker
+    def _next_job(self) -> Optional[_Job]:
+        """Pop the next eligible job; caller must hold ``self._cond``."""
+        best_key = None
+        best_priority = None
+        for session_key in self._round_robin:
+            if (
+                self._session_quota is not None
+                and self._running[session_key] >= self._session_quota
+            ):
+                continue
+            head_priority = self._queues[session_key][0].sort_key[0]
+            if best_priority is None or head_priority < best_priority:
+                best_key, best_priority = session_key, head_priority
+        if best_key is None:
+            return None
+
+        job = heapq.heappop(self._queues[best_key])
+        self._round_robin.remove(best_key)
+        if self._queues[best_key]:
+            self._round_robin.append(best_key)
+        else:
+            del self._queues[best_key]
+        self._running[best_key] += 1
+        return job
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._closing and not self._queues:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+
+            try:
+                job.run(job.scenario)
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error(f"Scheduled run failed for '{job.scenario.tag}'")
+                    self.logger.log_traceback(exc)
+            finally:
+                with self._cond:
+                    self._running[job.session_key] -= 1
+                    if self._running[job.session_key] <= 0:
+                        del self._running[job.session_key]
+                    self._cond.notify_all()
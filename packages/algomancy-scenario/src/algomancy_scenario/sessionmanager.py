@@ -3,17 +3,25 @@ import os
 import re
 import shutil
 import uuid
-from typing import Dict, List, Optional, TypeVar, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, TypeVar, Type
 
 from algomancy_utils.logger import Logger, MessageStatus
 from algomancy_data import ETLFactory, Schema, BASEDATASOURCE
+from algomancy_data.datamanager import SUPPORTED_SAVE_TYPES
 
 from .basealgorithm import BaseAlgorithm
+from .jobrunner import JobRunner
 from .keyperformanceindicator import BaseKPI
+from .progressbus import ProgressEventBus
+from .runcache import RunCache
 from .scenariomanager import ScenarioManager
+from .scenarioscheduler import ScenarioScheduler
 from .core_configuration import CoreConfig
 from algomancy_utils.baseparameterset import BaseParameterSet
 
+if TYPE_CHECKING:
+    from .persistence.run_writer import RunWriter
+
 
 SESSION_META_FILENAME = "meta.json"
 
@@ -120,6 +128,10 @@ class SessionManager:
             data_folder=core.data_path,
             has_persistent_state=core.has_persistent_state,
             save_type=core.save_type,
+            lazy_data_loading=core.lazy_data_loading,
+            data_warmup_workers=core.data_warmup_workers,
+            etl_snapshots=core.etl_snapshots,
+            etl_snapshot_fingerprint=core.etl_snapshot_fingerprint,
             auto_create=core.autocreate,
             default_algo_name=core.default_algo,
             default_param_values=core.default_algo_params_values,
@@ -128,6 +140,21 @@ class SessionManager:
             database_url=core.database_url,
             hydrated_cache_size=core.hydrated_cache_size,
             eager_startup=core.eager_startup,
+            lazy_table_loading=core.lazy_table_loading,
+            executor=core.executor,
+            max_workers=core.max_workers,
+            max_concurrent_runs=core.max_concurrent_runs,
+            session_quota=core.session_quota,
+            run_cache_size=core.run_cache_size,
+            persist_run_cache=core.persist_run_cache,
+            kpi_workers=core.kpi_workers,
+            progress_throttle=core.progress_throttle,
+            durable_queue=core.durable_queue,
+            job_lease_seconds=core.job_lease_seconds,
+            job_max_attempts=core.job_max_attempts,
+            async_persistence=core.async_persistence,
+            persist_batch_size=core.persist_batch_size,
+            bulk_write_method=core.bulk_write_method,
         )
 
     def __init__(
@@ -142,6 +169,10 @@ class SessionManager:
         scenario_save_location: str = "scenarios.json",
         has_persistent_state: bool = False,
         save_type: str = "json",
+        lazy_data_loading: bool = False,
+        data_warmup_workers: int = 0,
+        etl_snapshots: bool = False,
+        etl_snapshot_fingerprint: str = "stat",
         auto_create: bool = False,
         default_algo_name: str = None,
         default_param_values: Dict[str, any] = None,
@@ -150,6 +181,21 @@ class SessionManager:
         database_url: str | None = None,
         hydrated_cache_size: int | None = None,
         eager_startup: bool = False,
+        lazy_table_loading: bool = False,
+        executor: str = "thread",
+        max_workers: int = 1,
+        max_concurrent_runs: int | None = None,
+        session_quota: int | None = None,
+        run_cache_size: int | None = None,
+        persist_run_cache: bool = False,
+        kpi_workers: int = 1,
+        progress_throttle: float = 0.5,
+        durable_queue: bool = False,
+        job_lease_seconds: float = 60.0,
+        job_max_attempts: int = 5,
+        async_persistence: bool = False,
+        persist_batch_size: int = 100,
+        bulk_write_method: str = "auto",
     ) -> None:
         self.logger = logger if logger else Logger()
         self._etl_factory = etl_factory
@@ -161,6 +207,10 @@ class SessionManager:
         self._scenario_save_location = scenario_save_location
         self._data_folder = data_folder
         self._has_persistent_state = has_persistent_state
+        self._lazy_data_loading = lazy_data_loading
+        self._data_warmup_workers = data_warmup_workers
+        self._etl_snapshots = etl_snapshots
+        self._etl_snapshot_fingerprint = etl_snapshot_fingerprint
         self._auto_create_scenario = auto_create
         self._default_algo_name = default_algo_name
         self._default_param_values = default_param_values
@@ -168,8 +218,30 @@ class SessionManager:
         self._database_url = database_url
         self._hydrated_cache_size = hydrated_cache_size
         self._eager_startup = eager_startup
+        self._lazy_table_loading = lazy_table_loading
+        self._bulk_write_method = bulk_write_method
+        self._executor = executor
+        self._max_workers = max_workers
+        self._kpi_workers = kpi_workers
+
+        # One scheduler shared by every session caps concurrent runs process-wide;
+        # without it each session's processor runs its own workers.
+        self._scheduler: ScenarioScheduler | None = None
+        if max_concurrent_runs is not None:
+            self._scheduler = ScenarioScheduler(
+                max_concurrent_runs=max_concurrent_runs,
+                session_quota=session_quota,
+                executor=executor,
+                logger=self.logger,
+            )
+
+        # Progress events of all sessions go through one bus; subscribers
+        # filter by session id.
+        self._event_bus = ProgressEventBus(
+            min_interval=progress_throttle, logger=self.logger
+        )
 
-        assert save_type in ["json"], "Save type must be parquet or json."
+        assert save_type in SUPPORTED_SAVE_TYPES, "Save type must be parquet or json."
         self._save_type = save_type
 
         # Build shared DB engine when using the database backend
@@ -178,11 +250,58 @@ class SessionManager:
             self._db_engine = self._build_engine(database_url)
             self._init_db_schema()
 
+        # Run results are keyed by content, so one cache serves every session.
+        self._run_cache: RunCache | None = None
+        if run_cache_size is not None:
+            store = None
+            if persist_run_cache and self._db_engine is not None:
+                from .persistence.run_cache_store import SqlRunCache
+
+                store = SqlRunCache(
+                    self._db_engine, max_entries=run_cache_size, logger=self.logger
+                )
+            self._run_cache = RunCache(
+                max_entries=run_cache_size, store=store, logger=self.logger
+            )
+
+        # Finished runs of every session are committed by one background
+        # writer, batched across sessions.
+        self._run_writer = None
+        if async_persistence and self._db_engine is not None:
+            from .persistence.run_writer import RunWriter
+
+            self._run_writer = RunWriter(
+                self._db_engine, max_batch=persist_batch_size, logger=self.logger
+            )
+
         self._sessions: Dict[str, ScenarioManager] = {}
+
+        # Durable queue: queued runs live in the database job table and are
+        # claimed from there, so they survive restarts and can be shared by
+        # several processes. Holds at most as many jobs as can run at once.
+        self._job_runner: JobRunner | None = None
+        if durable_queue and self._db_engine is not None:
+            from .persistence.job_queue import SqlJobQueue
+
+            self._job_runner = JobRunner(
+                SqlJobQueue(
+                    self._db_engine,
+                    lease_seconds=job_lease_seconds,
+                    logger=self.logger,
+                ),
+                resolve_manager=self._sessions.get,
+                session_ids=lambda: list(self._sessions),
+                capacity=max_concurrent_runs or max_workers,
+                max_attempts=job_max_attempts,
+                logger=self.logger,
+            )
+
         self._display_names: Dict[str, str] = {}
         self._directory_names: Dict[str, str] = {}  # only used by filesystem backend
         self._create_default_scenario_managers()
         self._start_session_id = list(self._sessions.keys())[0]
+        if self._job_runner is not None:
+            self._job_runner.start()
 
         self.log("SessionManager initialized.")
 
@@ -348,10 +467,21 @@ class SessionManager:
             logger=self.logger,
             has_persistent_state=self._has_persistent_state,
             save_type=self._save_type,
+            lazy_data_loading=self._lazy_data_loading,
+            data_warmup_workers=self._data_warmup_workers,
+            etl_snapshots=self._etl_snapshots,
+            etl_snapshot_fingerprint=self._etl_snapshot_fingerprint,
             autocreate=self._auto_create_scenario,
             default_algo_name=self._default_algo_name,
             default_param_values=self._default_param_values,
             autorun=self._autorun,
+            executor=self._executor,
+            max_workers=self._max_workers,
+            scheduler=self._scheduler,
+            session_key=session_id,
+            run_cache=self._run_cache,
+            kpi_workers=self._kpi_workers,
+            event_bus=self._event_bus,
         )
         self._display_names[session_id] = display_name
         self._directory_names[session_id] = dir_name
@@ -371,6 +501,8 @@ class SessionManager:
             session_id=session_id,
             data_object_type=self._data_object_type,
             datasource_cache_size=self._hydrated_cache_size,
+            bulk_writer=self._bulk_write_method,
+            lazy_tables=self._lazy_table_loading,
             logger=self.logger,
         )
         repo = SqlScenarioRepository(
@@ -381,6 +513,8 @@ class SessionManager:
             data_manager=dm,
             hydrated_cache_size=self._hydrated_cache_size,
             eager_startup=self._eager_startup,
+            run_writer=self._run_writer,
+            bulk_writer=self._bulk_write_method,
             logger=self.logger,
         )
         return ScenarioManager(
@@ -399,6 +533,14 @@ class SessionManager:
             autorun=self._autorun,
             data_manager=dm,
             scenario_repository=repo,
+            executor=self._executor,
+            max_workers=self._max_workers,
+            scheduler=self._scheduler,
+            session_key=session_id,
+            run_cache=self._run_cache,
+            kpi_workers=self._kpi_workers,
+            event_bus=self._event_bus,
+            job_runner=self._job_runner,
         )
 
     # ------------------------------------------------------------------
@@ -413,6 +555,49 @@ class SessionManager:
     def start_session_id(self) -> str:
         return self._start_session_id
 
+    @property
+    def run_cache(self) -> RunCache | None:
+        return self._run_cache
+
+    @property
+    def job_runner(self) -> JobRunner | None:
+        """Runner of the durable job queue, or ``None`` when it is disabled."""
+        return self._job_runner
+
+    @property
+    def run_writer(self) -> "RunWriter | None":
+        """Background writer of finished runs, or ``None`` when runs are written inline."""
+        return self._run_writer
+
+    @property
+    def event_bus(self) -> ProgressEventBus:
+        """The bus every session publishes scenario progress events on."""
+        return self._event_bus
+
+    @property
+    def scheduler(self) -> ScenarioScheduler | None:
+        """The scheduler shared by all sessions, or ``None`` if each session runs its own."""
+        return self._scheduler
+
+    def shutdown(self) -> None:
+        """Stop background processing: the durable queue runner, every
+        session's processor, the shared scheduler, the run writer and the
+        event bus.
+
+        Runs already queued locally finish first and finished runs are
+        committed; durable jobs not yet claimed stay in the database for the
+        next start.
+        """
+        if self._job_runner is not None:
+            self._job_runner.stop()
+        for sm in self._sessions.values():
+            sm.shutdown_processing()
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
+        if self._run_writer is not None:
+            self._run_writer.close()
+        self._event_bus.close()
+
     def list_sessions(self) -> List[Dict[str, str]]:
         """Return the (id, display_name) for every session.
 
@@ -543,11 +728,15 @@ class SessionManager:
         import sqlalchemy as sa
 
         from .persistence.models import (
+            jobs_table,
             scenarios_table,
             sessions_table,
         )
 
         with self._db_engine.begin() as conn:
+            conn.execute(
+                jobs_table.delete().where(jobs_table.c.session_id == session_id)
+            )
             # Scenarios cascade-delete their runs + KPI measurements via FK.
             conn.execute(
                 scenarios_table.delete().where(
@@ -1,6 +1,7 @@
 import pytest
 
-from algomancy_scenario import ScenarioManager
+from algomancy_data import DataClassification, DataLoadError, DataSource
+from algomancy_scenario import CoreConfig, ScenarioManager
 
 
 @pytest.fixture
@@ -24,3 +25,105 @@ def test_derive_data(
 
     # check if derived data is available
     assert derived_data_key in sm.get_data_keys(), "Derived data not available."
+
+
+def test_lazy_data_loading_defers_etl(mock_configs, quiet_logger):
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=True,
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=quiet_logger,
+        lazy_data_loading=True,
+    )
+    try:
+        assert "example_data" in sm.get_data_keys()
+        assert not sm._dm.is_loaded("example_data")
+
+        assert sm.get_data("example_data") is not None
+        assert sm._dm.is_loaded("example_data")
+    finally:
+        sm.shutdown_processing()
+
+
+def test_datasets_that_fail_to_load_are_left_out_of_the_derived_keys(
+    mock_configs, quiet_logger, tmp_path
+):
+    (tmp_path / "broken.json").write_text("not valid json")
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=str(tmp_path),
+        schemas=mock_configs["schemas"],
+        has_persistent_state=True,
+        save_type="json",
+        data_object_type=DataSource,
+        logger=quiet_logger,
+        lazy_data_loading=True,
+    )
+    try:
+        derived = DataSource(ds_type=DataClassification.DERIVED_DATA, name="derived")
+        sm.add_datasource_from_json(derived.to_json())
+        assert sorted(sm.get_data_keys()) == ["broken", "derived"]
+
+        assert sm.get_derived_data_keys() == ["derived"]
+        with pytest.raises(DataLoadError):
+            sm.get_data_as_json("broken")
+        with pytest.raises(KeyError, match="'nope' not found"):
+            sm.get_data_as_json("nope")
+    finally:
+        sm.shutdown_processing()
+
+
+def test_derived_keys_are_classified_without_loading(
+    mock_configs, quiet_logger, tmp_path
+):
+    for ds_type, name in [
+        (DataClassification.MASTER_DATA, "master"),
+        (DataClassification.DERIVED_DATA, "derived"),
+    ]:
+        ds = DataSource(ds_type=ds_type, name=name)
+        (tmp_path / f"{name}.json").write_text(ds.to_json())
+    (tmp_path / "inputs").mkdir()
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=str(tmp_path),
+        schemas=mock_configs["schemas"],
+        has_persistent_state=True,
+        save_type="json",
+        data_object_type=DataSource,
+        logger=quiet_logger,
+        lazy_data_loading=True,
+    )
+    try:
+        assert sm.get_derived_data_keys() == ["derived"]
+        for key in ("master", "derived", "inputs"):
+            assert not sm._dm.is_loaded(key)
+    finally:
+        sm.shutdown_processing()
+
+
+def test_core_config_rejects_lazy_loading_with_autocreate(mock_configs):
+    cfg = dict(mock_configs, autocreate=True, lazy_data_loading=True)
+    with pytest.raises(ValueError, match="autocreate"):
+        CoreConfig(**cfg)
+
+
+def test_core_config_requires_lazy_loading_for_warmup(mock_configs):
+    cfg = dict(mock_configs, autocreate=False, data_warmup_workers=2)
+    with pytest.raises(ValueError, match="lazy_data_loading"):
+        CoreConfig(**cfg)
+    CoreConfig(**dict(cfg, lazy_data_loading=True))
+
+
+def test_core_config_rejects_unknown_snapshot_fingerprint(mock_configs):
+    cfg = dict(mock_configs, autocreate=False, etl_snapshot_fingerprint="mtime")
+    with pytest.raises(ValueError, match="etl_snapshot_fingerprint"):
+        CoreConfig(**cfg)
@@ -0,0 +1,356 @@
+"""Tests for the durable, lease-based job queue (``durable_queue=True``)."""
+
+import time
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="requires algomancy-scenario[database]")
+
+import pandas as pd
+import sqlalchemy as sa
+
+from algomancy_data import DataClassification, DataSource
+from algomancy_scenario import CoreConfig, ScenarioStatus, SessionManager
+from algomancy_scenario.persistence import SqlJobQueue
+from algomancy_scenario.persistence.models import metadata as scenario_meta
+from algomancy_scenario.persistence.models import scenarios_table
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    scenario_meta.create_all(engine, checkfirst=True)
+    return engine
+
+
+def _add_scenario_row(engine, scenario_id, session_id="s"):
+    with engine.begin() as conn:
+        conn.execute(
+            scenarios_table.insert().values(
+                id=scenario_id,
+                session_id=session_id,
+                tag=scenario_id,
+                input_data_key="d",
+                algorithm_name="Slow",
+                status="created",
+            )
+        )
+
+
+def _status(engine, scenario_id):
+    with engine.connect() as conn:
+        return conn.execute(
+            sa.select(scenarios_table.c.status).where(
+                scenarios_table.c.id == scenario_id
+            )
+        ).scalar()
+
+
+def test_enqueue_is_idempotent_and_marks_the_scenario_queued(engine):
+    _add_scenario_row(engine, "a")
+    queue = SqlJobQueue(engine, worker_id="w1")
+
+    job_id = queue.enqueue("s", "a")
+    assert queue.enqueue("s", "a") == job_id
+    assert queue.depth() == 1
+    assert _status(engine, "a") == str(ScenarioStatus.QUEUED)
+
+
+def test_a_job_is_claimed_by_one_worker_only(engine):
+    _add_scenario_row(engine, "a")
+    first = SqlJobQueue(engine, worker_id="w1")
+    second = SqlJobQueue(engine, worker_id="w2")
+    first.enqueue("s", "a")
+
+    job = first.claim()
+    assert job is not None and job.scenario_id == "a" and job.attempts == 1
+    assert second.claim() is None
+
+    # Only the lease owner can complete the job.
+    second.complete(job.job_id)
+    assert first.depth() == 1
+    first.complete(job.job_id)
+    assert first.depth() == 0
+
+
+def test_claim_orders_by_priority_then_age_and_filters_sessions(engine):
+    for scenario_id in ("low", "high", "other"):
+        _add_scenario_row(engine, scenario_id)
+    queue = SqlJobQueue(engine, worker_id="w1")
+    queue.enqueue("s", "low", priority=0)
+    queue.enqueue("s", "high", priority=5)
+    queue.enqueue("t", "other", priority=9)
+
+    assert queue.claim(session_ids=["s"]).scenario_id == "high"
+    assert queue.claim(session_ids=["s"]).scenario_id == "low"
+    assert queue.claim(session_ids=["s"]) is None
+    assert queue.depth("t") == 1
+
+
+def test_an_expired_lease_is_reclaimed_by_another_worker(engine):
+    _add_scenario_row(engine, "a")
+    crashed = SqlJobQueue(engine, lease_seconds=0.05, worker_id="w1")
+    survivor = SqlJobQueue(engine, worker_id="w2")
+    crashed.enqueue("s", "a")
+    job = crashed.claim()
+
+    time.sleep(0.1)
+    reclaimed = survivor.claim()
+    assert reclaimed is not None and reclaimed.job_id == job.job_id
+    assert reclaimed.attempts == 2
+    assert crashed.renew([job.job_id]) == [job.job_id]
+    assert survivor.renew([job.job_id]) == []
+
+
+def test_cancel_leaves_jobs_leased_by_other_workers(engine):
+    for scenario_id in ("queued", "running"):
+        _add_scenario_row(engine, scenario_id)
+    mine = SqlJobQueue(engine, worker_id="w1")
+    theirs = SqlJobQueue(engine, worker_id="w2")
+    mine.enqueue("s", "running")
+    theirs.claim()
+    mine.enqueue("s", "queued")
+
+    assert mine.cancel("queued")
+    assert not mine.cancel("running")
+    assert mine.depth() == 1
+
+
+def test_release_returns_the_job_to_the_queue(engine):
+    _add_scenario_row(engine, "a")
+    first = SqlJobQueue(engine, worker_id="w1")
+    second = SqlJobQueue(engine, worker_id="w2")
+    first.enqueue("s", "a")
+    job = first.claim()
+
+    first.release(job.job_id)
+    assert second.claim().job_id == job.job_id
+
+
+def test_a_job_released_for_later_is_skipped_until_then(engine):
+    for scenario_id in ("stuck", "next"):
+        _add_scenario_row(engine, scenario_id)
+    first = SqlJobQueue(engine, worker_id="w1")
+    second = SqlJobQueue(engine, worker_id="w2")
+    first.enqueue("s", "stuck", priority=1)
+    first.enqueue("s", "next")
+    job = first.claim()
+
+    first.release(job.job_id, retry_after=60)
+    assert second.claim().scenario_id == "next"
+    assert second.claim() is None
+    assert first.depth() == 2
+
+
+def test_failing_a_job_drops_it_and_fails_its_scenario(engine):
+    _add_scenario_row(engine, "a")
+    queue = SqlJobQueue(engine, worker_id="w1")
+    queue.enqueue("s", "a")
+
+    queue.fail(queue.claim().job_id)
+    assert queue.depth() == 0
+    assert _status(engine, "a") == str(ScenarioStatus.FAILED)
+
+
+# ------------------------------------------------------------------ #
+# SessionManager integration
+# ------------------------------------------------------------------ #
+
+
+def _config(mock_configs, tmp_path, **kwargs):
+    return CoreConfig(
+        data_path=str(tmp_path),
+        has_persistent_state=True,
+        save_type="json",
+        data_object_type=mock_configs["data_object_type"],
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        schemas=mock_configs["schemas"],
+        autocreate=False,
+        autorun=False,
+        persistence_backend="database",
+        database_url=f"sqlite:///{tmp_path}/scenario.db",
+        **kwargs,
+    )
+
+
+def _load_data(manager):
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="test_data")
+    ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+    manager.add_datasource_from_json(ds.to_json())
+
+
+def test_session_manager_runs_scenarios_through_the_durable_queue(
+    mock_configs, tmp_path
+):
+    smgr = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True)
+    )
+    try:
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        _load_data(manager)
+        scenario = manager.create_scenario(
+            "durable", "test_data", "Slow", {"duration": 1}
+        )
+
+        manager.process_scenario_async(scenario)
+        manager.wait_for_processing()
+
+        assert manager.get_by_id(scenario.id).status == ScenarioStatus.COMPLETE
+        assert smgr.job_runner.queue.depth() == 0
+    finally:
+        smgr.shutdown()
+
+
+def test_auto_run_scenarios_are_queued_durably(mock_configs, tmp_path):
+    smgr = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True)
+    )
+    try:
+        smgr.job_runner.stop()  # keep the job in the table
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        _load_data(manager)
+        manager.toggle_autorun(True)
+        scenario = manager.create_scenario("auto", "test_data", "Slow", {})
+
+        assert smgr.job_runner.queue.depth() == 1
+        assert smgr.job_runner.queue.claim().scenario_id == scenario.id
+    finally:
+        smgr.shutdown()
+
+
+def test_jobs_left_by_a_crashed_process_run_after_restart(mock_configs, tmp_path):
+    first = SessionManager.from_config(_config(mock_configs, tmp_path))
+    session_id = first.start_session_id
+    manager = first.get_scenario_manager(session_id)
+    _load_data(manager)
+    scenario = manager.create_scenario("orphan", "test_data", "Slow", {"duration": 1})
+    # Simulate a process that queued the run, then died before running it.
+    SqlJobQueue(sa.create_engine(f"sqlite:///{tmp_path}/scenario.db")).enqueue(
+        session_id, scenario.id
+    )
+    first.shutdown()
+
+    restarted = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True)
+    )
+    try:
+        manager = restarted.get_scenario_manager(session_id)
+        manager.wait_for_processing()
+        assert manager.get_by_id(scenario.id).status == ScenarioStatus.COMPLETE
+    finally:
+        restarted.shutdown()
+
+
+def test_jobs_for_scenarios_created_by_another_process_are_run(mock_configs, tmp_path):
+    creator = SessionManager.from_config(_config(mock_configs, tmp_path))
+    session_id = creator.start_session_id
+    _load_data(creator.get_scenario_manager(session_id))
+    # The worker indexes the session before the scenarios below exist.
+    worker = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True)
+    )
+    try:
+        manager = creator.get_scenario_manager(session_id)
+        queue = SqlJobQueue(sa.create_engine(f"sqlite:///{tmp_path}/scenario.db"))
+        later = manager.create_scenario("later", "test_data", "Slow", {"duration": 1})
+        queue.enqueue(session_id, later.id)
+        gone = manager.create_scenario("gone", "test_data", "Slow", {"duration": 1})
+        queue.enqueue(session_id, gone.id)
+        manager.delete_scenario(gone.id)
+        queue.enqueue(session_id, gone.id)  # a job whose scenario row is gone
+
+        worker_manager = worker.get_scenario_manager(session_id)
+        worker_manager.wait_for_processing()
+
+        assert worker_manager.get_by_id(later.id).status == ScenarioStatus.COMPLETE
+        assert worker_manager.get_by_id(gone.id) is None
+        assert queue.depth() == 0
+    finally:
+        worker.shutdown()
+        creator.shutdown()
+
+
+def _break_loading(manager, scenario_id):
+    """Make ``scenario_id`` unloadable in ``manager`` although its row exists."""
+    get_by_id = manager.get_by_id
+    manager.get_by_id = lambda sid: None if sid == scenario_id else get_by_id(sid)
+
+
+def _wait_for_status(manager, scenario_id, status, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while manager.get_by_id(scenario_id).status != status:
+        assert time.monotonic() < deadline, f"{scenario_id} never became {status}"
+        time.sleep(0.05)
+
+
+def _wait_for_depth(queue, depth, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while queue.depth() > depth:
+        assert time.monotonic() < deadline, f"the queue never drained to {depth}"
+        time.sleep(0.05)
+
+
+def test_an_unloadable_job_does_not_block_the_jobs_behind_it(mock_configs, tmp_path):
+    smgr = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True)
+    )
+    try:
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        _load_data(manager)
+        broken = manager.create_scenario("broken", "test_data", "Slow", {})
+        runnable = manager.create_scenario("ok", "test_data", "Slow", {"duration": 1})
+        _break_loading(manager, broken.id)
+        queue = smgr.job_runner.queue
+        queue.enqueue(manager.session_key, broken.id, priority=1)
+        queue.enqueue(manager.session_key, runnable.id)
+        smgr.job_runner.wake()
+
+        _wait_for_status(manager, runnable.id, ScenarioStatus.COMPLETE)
+        # Its job is completed once the run is persisted, just after the status.
+        _wait_for_depth(queue, 1)
+        # The broken job waits out its retry delay instead of being reclaimed.
+        assert queue.depth() == 1
+        engine = sa.create_engine(f"sqlite:///{tmp_path}/scenario.db")
+        assert SqlJobQueue(engine, worker_id="other").claim() is None
+    finally:
+        smgr.shutdown()
+
+
+def test_a_job_is_dropped_after_its_last_attempt(mock_configs, tmp_path):
+    smgr = SessionManager.from_config(
+        _config(mock_configs, tmp_path, durable_queue=True, job_max_attempts=1)
+    )
+    try:
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        _load_data(manager)
+        broken = manager.create_scenario("broken", "test_data", "Slow", {})
+        _break_loading(manager, broken.id)
+        smgr.job_runner.queue.enqueue(manager.session_key, broken.id)
+        smgr.job_runner.wake()
+
+        manager.wait_for_processing()  # returns once the job is dropped
+        engine = sa.create_engine(f"sqlite:///{tmp_path}/scenario.db")
+        assert _status(engine, broken.id) == str(ScenarioStatus.FAILED)
+    finally:
+        smgr.shutdown()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"durable_queue": "yes"},
+        {"durable_queue": True, "persistence_backend": "none"},
+        {"durable_queue": True, "job_lease_seconds": 0},
+        {"durable_queue": True, "job_lease_seconds": True},
+        {"durable_queue": True, "job_max_attempts": 0},
+        {"durable_queue": True, "job_max_attempts": 2.5},
+    ],
+)
+def test_core_config_rejects_invalid_durable_queue_settings(mock_configs, kwargs):
+    cfg = dict(mock_configs, autocreate=False, **kwargs)
+    if cfg.get("persistence_backend") != "none":
+        cfg.update(persistence_backend="database", database_url="sqlite://")
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
@@ -0,0 +1,156 @@
+import threading
+
+import pytest
+
+from algomancy_scenario import (
+    BaseKPI,
+    CoreConfig,
+    ImprovementDirection,
+    KpiContext,
+    KpiError,
+    ScenarioManager,
+    ScenarioResult,
+    ScenarioStatus,
+)
+from algomancy_scenario.keyperformanceindicator import evaluate_kpis
+from algomancy_utils import QUANTITIES, BaseMeasurement
+
+
+class _ContextKPI(BaseKPI):
+    """Reads a shared value from the context; optionally waits at a barrier."""
+
+    def __init__(self, name, factory, barrier=None):
+        super().__init__(
+            name, ImprovementDirection.HIGHER, BaseMeasurement(QUANTITIES["count"][""])
+        )
+        self._factory = factory
+        self._barrier = barrier
+        self.thread = None
+
+    def compute(self, result):
+        self.thread = threading.get_ident()
+        if self._barrier is not None:
+            self._barrier.wait(timeout=5)
+        return self.context.get("shared", self._factory)
+
+
+class _SequentialKPI(_ContextKPI):
+    parallel_safe = False
+
+
+class _FailingKPI(_ContextKPI):
+    def compute(self, result):
+        raise RuntimeError("boom")
+
+
+def _result():
+    return ScenarioResult(data_id="d")
+
+
+def test_context_factory_runs_once_across_kpis():
+    calls = []
+
+    def factory(result):
+        calls.append(result)
+        return 7
+
+    kpis = {f"k{i}": _ContextKPI(f"k{i}", factory) for i in range(4)}
+    result = _result()
+    evaluate_kpis(kpis, result, max_workers=4)
+
+    assert calls == [result]
+    assert all(kpi.value == 7 for kpi in kpis.values())
+    assert all(kpi.context is None for kpi in kpis.values())
+
+
+def test_parallel_safe_kpis_run_concurrently():
+    # Both KPIs must be inside compute() at the same time to pass the barrier.
+    barrier = threading.Barrier(2)
+    kpis = {
+        "a": _ContextKPI("a", lambda r: 1, barrier),
+        "b": _ContextKPI("b", lambda r: 1, barrier),
+    }
+    evaluate_kpis(kpis, _result(), max_workers=2)
+    assert kpis["a"].thread != kpis["b"].thread
+
+
+def test_non_parallel_safe_kpis_run_on_the_calling_thread():
+    kpis = {
+        "a": _ContextKPI("a", lambda r: 1),
+        "b": _ContextKPI("b", lambda r: 1),
+        "seq": _SequentialKPI("seq", lambda r: 1),
+    }
+    evaluate_kpis(kpis, _result(), max_workers=2)
+    assert kpis["seq"].thread == threading.get_ident()
+    assert kpis["seq"].value == 1
+
+
+def test_failures_surface_after_all_kpis_are_attempted():
+    kpis = {
+        "bad": _FailingKPI("bad", lambda r: 1),
+        "good": _ContextKPI("good", lambda r: 3),
+        "seq": _SequentialKPI("seq", lambda r: 3),
+    }
+    with pytest.raises(KpiError, match="bad"):
+        evaluate_kpis(kpis, _result(), max_workers=2)
+    assert kpis["good"].value == 3
+    assert kpis["seq"].value == 3
+
+
+def test_kpi_context_concurrent_get_computes_once():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_factory(result):
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    context = KpiContext(_result())
+    values = []
+    threads = [
+        threading.Thread(target=lambda: values.append(context.get("k", slow_factory)))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    started.wait(timeout=5)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert calls == [1]
+    assert values == ["value"] * 3
+
+
+def test_scenario_manager_computes_kpis_with_workers(mock_configs, quiet_logger):
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=quiet_logger,
+        kpi_workers=2,
+    )
+    try:
+        sm.debug_load_data("example_data")
+        scenario = sm.debug_create_and_run_scenario(
+            "kpis", "example_data", "Slow", {"duration": 1}
+        )
+        assert scenario.status == ScenarioStatus.COMPLETE
+        assert all(kpi.value is not None for kpi in scenario.kpis.values())
+    finally:
+        sm.shutdown_processing()
+
+
+@pytest.mark.parametrize("kpi_workers", [0, -1, 1.5, True])
+def test_core_config_rejects_invalid_kpi_workers(mock_configs, kpi_workers):
+    cfg = dict(mock_configs, autocreate=False, kpi_workers=kpi_workers)
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
@@ -21,10 +21,18 @@ import sqlalchemy as sa
 
 from algomancy_data import DataSource, DataClassification
 from algomancy_data.database.database_manager import DatabaseDataManager
+from algomancy_data.database.lazy_tables import LazySqlTables
 from algomancy_data.database.models import metadata as data_meta
-from algomancy_scenario import Scenario, ScenarioStatus, ScenarioResult
+from algomancy_scenario import (
+    CoreConfig,
+    Scenario,
+    ScenarioResult,
+    ScenarioStatus,
+    SessionManager,
+)
 from algomancy_scenario.persistence.models import metadata as scenario_meta
 from algomancy_scenario.persistence.sql_repository import SqlScenarioRepository
+from algomancy_utils.metrics import REGISTRY
 from algomancy_utils.unit import Measurement
 
 _CONFTEST = pathlib.Path(__file__).resolve().parent / "conftest.py"
@@ -206,6 +214,30 @@ def test_lru_eviction_bounds_cache(engine):
         assert len(repo._hydrated) <= 2
 
 
+def test_cache_hits_misses_and_evictions_are_counted(engine):
+    def counts(cache):
+        return [
+            REGISTRY.get(f"algomancy_cache_{event}_total").value(cache=cache)
+            for event in ("hits", "misses", "evictions")
+        ]
+
+    dm = _make_dm(engine, cache_size=1)
+    _add_dataset(dm)
+    repo = _make_repo(engine, dm, cache_size=1)
+    first = _persist_completed(repo, dm, "first")
+    _persist_completed(repo, dm, "second")  # evicts "first"
+    before = counts("scenario")
+
+    repo.get_by_id(first)  # miss, evicts "second"
+    repo.get_by_id(first)  # hit
+
+    hits, misses, evictions = (
+        after - prior for after, prior in zip(counts("scenario"), before)
+    )
+    assert (hits, misses, evictions) == (1, 1, 1)
+    assert sum(counts("datasource")) > 0
+
+
 def test_pinned_scenario_survives_eviction(engine):
     dm = _make_dm(engine, cache_size=1)
     _add_dataset(dm)
@@ -252,3 +284,58 @@ def test_failed_hydration_is_not_cached_and_retries(engine):
     scenario = repo.get_by_id(sid)
     assert scenario is not None
     assert sid in repo._hydrated
+
+
+# ------------------------------------------------------------------ #
+# Table-level lazy hydration through CoreConfig
+# ------------------------------------------------------------------ #
+
+
+def _database_config(mock_configs, tmp_path, **kwargs):
+    return CoreConfig(
+        **dict(
+            mock_configs,
+            data_path=str(tmp_path),
+            autocreate=False,
+            persistence_backend="database",
+            database_url=f"sqlite:///{tmp_path}/lazy.db",
+            **kwargs,
+        )
+    )
+
+
+def test_lazy_table_loading_reads_sub_tables_on_first_access(mock_configs, tmp_path):
+    config = _database_config(mock_configs, tmp_path, lazy_table_loading=True)
+    smgr = SessionManager.from_config(config)
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="shop")
+    ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+    ds.add_table("other", pd.DataFrame({"id": ["c"]}))
+    smgr.get_scenario_manager(smgr.start_session_id).add_datasource_from_json(
+        ds.to_json()
+    )
+    smgr.shutdown()
+
+    restarted = SessionManager.from_config(config)
+    try:
+        manager = restarted.get_scenario_manager(restarted.start_session_id)
+        loaded = manager.get_data("shop")
+        assert isinstance(loaded.tables, LazySqlTables)
+        assert loaded.get_table("item")["value"].tolist() == [1, 2]
+        assert loaded.tables.loaded_tables() == ["item"]
+    finally:
+        restarted.shutdown()
+
+
+def test_lazy_table_loading_requires_the_database_backend(mock_configs):
+    with pytest.raises(ValueError, match="lazy_table_loading"):
+        CoreConfig(**dict(mock_configs, autocreate=False, lazy_table_loading=True))
+    with pytest.raises(ValueError, match="lazy_table_loading"):
+        CoreConfig(
+            **dict(
+                mock_configs,
+                autocreate=False,
+                persistence_backend="database",
+                database_url="sqlite://",
+                lazy_table_loading="yes",
+            )
+        )
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+import pytest
+
+from algomancy_scenario import CoreConfig, ScenarioManager
+from algomancy_scenario.progressbus import ProgressEvent, ProgressEventBus
+
+
+def _build_manager(mock_configs, logger, **kwargs) -> ScenarioManager:
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=logger,
+        **kwargs,
+    )
+    sm.debug_load_data("example_data")
+    return sm
+
+
+def _event(status="processing", progress=0.0, scenario_id="s1", session_id="a"):
+    return ProgressEvent(session_id, scenario_id, "tag", status, progress, 0.0)
+
+
+def _drain(subscription):
+    events = []
+    while (event := subscription.get(timeout=0)) is not None:
+        events.append(event)
+    return events
+
+
+def test_progress_updates_are_throttled_but_status_changes_are_not():
+    bus = ProgressEventBus(min_interval=60)
+    sub = bus.subscribe()
+
+    assert bus.publish(_event(progress=10))
+    assert not bus.publish(_event(progress=20))
+    assert bus.publish(_event(status="complete", progress=100))
+
+    assert [(e.status, e.progress) for e in _drain(sub)] == [
+        ("processing", 10),
+        ("complete", 100),
+    ]
+
+
+def test_subscriptions_filter_by_session_and_scenario():
+    bus = ProgressEventBus(min_interval=0)
+    session_sub = bus.subscribe(session_id="a")
+    scenario_sub = bus.subscribe(session_id="a", scenario_id="s2")
+
+    bus.publish(_event(scenario_id="s1"))
+    bus.publish(_event(scenario_id="s2"))
+    bus.publish(_event(scenario_id="s2", session_id="b"))
+
+    assert [e.scenario_id for e in _drain(session_sub)] == ["s1", "s2"]
+    assert [(e.session_id, e.scenario_id) for e in _drain(scenario_sub)] == [
+        ("a", "s2")
+    ]
+
+
+def test_slow_subscriber_drops_oldest_events():
+    bus = ProgressEventBus(min_interval=0, max_queue=2)
+    sub = bus.subscribe()
+    for progress in (1, 2, 3):
+        bus.publish(_event(progress=progress))
+    assert [e.progress for e in _drain(sub)] == [2, 3]
+
+
+def test_closing_the_bus_wakes_waiting_subscribers():
+    bus = ProgressEventBus()
+    sub = bus.subscribe()
+    received = []
+    waiter = threading.Thread(target=lambda: received.append(sub.get(timeout=5)))
+    waiter.start()
+    bus.close()
+    waiter.join(timeout=5)
+
+    assert received == [None]
+    assert sub.closed
+    assert bus.subscriber_count == 0
+
+
+def test_awaiting_subscribers_are_woken_from_publishing_threads():
+    bus = ProgressEventBus(min_interval=0)
+    sub = bus.subscribe()
+
+    async def consume():
+        assert await sub.get_async(timeout=0.01) is None  # times out
+        timer = threading.Timer(0.05, bus.publish, [_event(progress=7)])
+        timer.start()
+        event = await sub.get_async(timeout=5)
+        threading.Timer(0.05, bus.close).start()
+        closed = await sub.get_async(timeout=5)
+        timer.join()
+        return event, closed
+
+    event, closed = asyncio.run(consume())
+    assert event.progress == 7
+    assert closed is None and sub.closed
+    assert sub._waiters == []
+
+
+def test_processor_pushes_the_scenario_lifecycle(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, progress_throttle=0)
+    try:
+        sub = sm.event_bus.subscribe(session_id=sm.session_key)
+        scenario = sm.debug_create_and_run_scenario(
+            "events", "example_data", "Slow", {"duration": 1}
+        )
+        events = _drain(sub)
+
+        assert {e.scenario_id for e in events} == {scenario.id}
+        statuses = [e.status for e in events]
+        assert statuses[0] == "queued"
+        assert statuses[-1] == "complete"
+        assert "processing" in statuses
+        # set_progress updates are pushed while processing.
+        assert [e.progress for e in events if e.status == "processing"][-1] == 100
+
+        sm.refresh_scenario(scenario.id)
+        assert [(e.status, e.progress) for e in _drain(sub)] == [("created", 0.0)]
+    finally:
+        sm.shutdown_processing()
+
+
+@pytest.mark.parametrize("progress_throttle", [-1, "fast", True])
+def test_core_config_rejects_invalid_progress_throttle(mock_configs, progress_throttle):
+    cfg = dict(mock_configs, autocreate=False, progress_throttle=progress_throttle)
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
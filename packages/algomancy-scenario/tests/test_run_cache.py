@@ -0,0 +1,119 @@
+import time
+
+import pytest
+import sqlalchemy as sa
+
+from algomancy_scenario import (
+    CoreConfig,
+    ScenarioManager,
+    ScenarioResult,
+    ScenarioStatus,
+)
+from algomancy_scenario.persistence import SqlRunCache
+from algomancy_scenario.runcache import CachedRun, RunCache
+
+
+def _build_manager(mock_configs, logger, **kwargs) -> ScenarioManager:
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=logger,
+        **kwargs,
+    )
+    sm.debug_load_data("example_data")
+    return sm
+
+
+def _kpi_values(scenario):
+    return {key: kpi.value for key, kpi in scenario.kpis.items()}
+
+
+def test_repeated_run_reuses_cached_result(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, run_cache_size=8)
+    try:
+        first = sm.debug_create_and_run_scenario(
+            "first", "example_data", "Slow", {"duration": 1}
+        )
+        started = time.monotonic()
+        repeat = sm.debug_create_and_run_scenario(
+            "repeat", "example_data", "Slow", {"duration": 1}
+        )
+
+        assert repeat.status == ScenarioStatus.COMPLETE
+        assert time.monotonic() - started < 0.5
+        # DelayKPI is random, so equal values mean they were reused.
+        assert _kpi_values(repeat) == _kpi_values(first)
+        assert repeat.result is first.result
+        assert repeat.progress == 100
+        assert (sm.run_cache.hits, sm.run_cache.misses) == (1, 1)
+    finally:
+        sm.shutdown_processing()
+
+
+def test_different_parameters_miss_the_cache(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, run_cache_size=8)
+    try:
+        sm.debug_create_and_run_scenario("one", "example_data", "Slow", {"duration": 1})
+        sm.debug_create_and_run_scenario("two", "example_data", "Slow", {"duration": 2})
+        assert sm.run_cache.hits == 0
+        assert len(sm.run_cache) == 2
+    finally:
+        sm.shutdown_processing()
+
+
+def test_run_cache_is_off_by_default(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        assert sm.run_cache is None
+    finally:
+        sm.shutdown_processing()
+
+
+def test_run_cache_evicts_least_recently_used():
+    cache = RunCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, CachedRun(result=key, kpi_values={}, progress=100))
+    assert cache.get("a") is not None  # "b" is now the oldest
+    cache.put("c", CachedRun(result="c", kpi_values={}, progress=100))
+
+    assert cache.get("b") is None
+    assert cache.get("a").result == "a"
+    assert cache.get("c").result == "c"
+
+
+def test_sql_store_survives_a_fresh_cache():
+    engine = sa.create_engine("sqlite:///:memory:")
+    store = SqlRunCache(engine, max_entries=1)
+    run = CachedRun(
+        result=ScenarioResult(data_id="d"), kpi_values={"k": 1.5}, progress=100
+    )
+    RunCache(store=store).put("key", run)
+
+    loaded = RunCache(store=store).get("key", ScenarioResult)
+    assert loaded.result.data_id == "d"
+    assert loaded.kpi_values == {"k": 1.5}
+
+    # Writing a second entry prunes the first beyond max_entries.
+    RunCache(store=store).put("other", run)
+    assert RunCache(store=store).get("key", ScenarioResult) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"run_cache_size": 0},
+        {"run_cache_size": 4, "persist_run_cache": True},
+        {"persist_run_cache": "yes"},
+    ],
+    ids=["zero-size", "persist-without-database", "non-bool-persist"],
+)
+def test_core_config_rejects_invalid_run_cache_settings(mock_configs, kwargs):
+    cfg = dict(mock_configs, autocreate=False, **kwargs)
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
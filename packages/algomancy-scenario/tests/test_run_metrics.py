@@ -0,0 +1,137 @@
+import time
+import tracemalloc
+
+import pytest
+
+from algomancy_scenario import RunMetrics, ScenarioManager, ScenarioStatus
+from algomancy_scenario.records import ScenarioRecord
+from algomancy_scenario.runmetrics import RunRecorder, process_peak_rss_bytes
+from algomancy_utils.metrics import REGISTRY
+
+
+def _build_manager(mock_configs, logger, **kwargs) -> ScenarioManager:
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=logger,
+        **kwargs,
+    )
+    sm.debug_load_data("example_data")
+    return sm
+
+
+def test_recorder_times_phases_and_accumulates_repeats():
+    recorder = RunRecorder().start()
+    with recorder.phase("run"):
+        time.sleep(0.02)
+    with recorder.phase("run"):
+        time.sleep(0.02)
+    metrics = recorder.stop()
+
+    assert metrics.phases["run"] >= 0.04
+    assert metrics.duration >= metrics.phases["run"]
+    assert metrics.profile is None and metrics.traced_peak_bytes is None
+
+
+def test_recorder_captures_profile_and_traced_peak():
+    recorder = RunRecorder(profile_cpu=True, trace_memory=True).start()
+    block = bytearray(2_000_000)
+    del block
+    metrics = recorder.stop()
+
+    assert metrics.traced_peak_bytes >= 2_000_000
+    assert not tracemalloc.is_tracing()
+    assert "cumulative" in metrics.profile
+
+
+def test_process_peak_rss_is_a_process_high_water_mark():
+    if process_peak_rss_bytes() is None:
+        pytest.skip("resource usage is not available on this platform")
+    large = RunRecorder().start()
+    block = bytearray(50_000_000)
+    block[::4096] = b"x" * len(block[::4096])  # touch the pages
+    del block
+    large_metrics = large.stop()
+    small_metrics = RunRecorder().start().stop()
+
+    # A later, smaller run still reports the earlier run's peak.
+    assert small_metrics.process_peak_rss_bytes >= large_metrics.process_peak_rss_bytes
+    assert small_metrics.process_peak_rss_bytes <= process_peak_rss_bytes()
+
+
+def test_run_metrics_round_trip():
+    recorder = RunRecorder().start()
+    with recorder.phase("run"):
+        pass
+    metrics = recorder.stop()
+
+    restored = RunMetrics.from_dict(metrics.to_dict())
+    assert restored == metrics
+    assert "profile" not in metrics.to_dict(include_profile=False)
+
+
+def test_scenario_run_records_metrics(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        scenario = sm.debug_create_and_run_scenario(
+            "timed", "example_data", "Slow", {"duration": 1}
+        )
+        metrics = scenario.metrics
+
+        assert scenario.status == ScenarioStatus.COMPLETE
+        assert set(metrics.phases) == {"set_data_params", "run", "compute_kpis"}
+        assert metrics.phases["run"] >= 1.0
+        assert metrics.profile is None
+        record = ScenarioRecord.from_scenario(scenario)
+        assert record.run_started_at == metrics.started_at
+        assert record.run_finished_at == metrics.finished_at
+
+        sm.refresh_scenario(scenario.id)
+        assert scenario.metrics is None
+    finally:
+        sm.shutdown_processing()
+
+
+def test_runs_are_counted_per_algorithm(mock_configs, quiet_logger):
+    started = REGISTRY.get("algomancy_runs_started_total")
+    completed = REGISTRY.get("algomancy_runs_completed_total")
+    duration = REGISTRY.get("algomancy_run_duration_seconds")
+    before = (
+        started.value(algorithm="Slow"),
+        completed.value(algorithm="Slow"),
+        duration.count(algorithm="Slow", status="complete"),
+    )
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        sm.debug_create_and_run_scenario(
+            "counted", "example_data", "Slow", {"duration": 1}
+        )
+    finally:
+        sm.shutdown_processing()
+
+    assert started.value(algorithm="Slow") == before[0] + 1
+    assert completed.value(algorithm="Slow") == before[1] + 1
+    assert duration.count(algorithm="Slow", status="complete") == before[2] + 1
+
+
+def test_process_pool_runs_are_profiled_in_the_worker(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, executor="process", max_workers=1)
+    try:
+        scenario = sm.create_scenario(
+            "profiled", "example_data", "Slow", {"duration": 1}
+        )
+        scenario.set_profiling(cpu=True)
+        sm.process_scenario_async(scenario)
+        sm.wait_for_processing()
+
+        assert scenario.status == ScenarioStatus.COMPLETE
+        assert scenario.metrics.phases["run"] >= 1.0
+        assert "run" in scenario.metrics.profile
+    finally:
+        sm.shutdown_processing()
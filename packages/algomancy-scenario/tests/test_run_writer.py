@@ -0,0 +1,289 @@
+"""Tests for the background group-commit run writer (``async_persistence=True``)."""
+
+import importlib.util
+import pathlib
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="requires algomancy-scenario[database]")
+
+import pandas as pd
+import sqlalchemy as sa
+
+from algomancy_data import DataClassification, DataSource
+from algomancy_data.database.database_manager import DatabaseDataManager
+from algomancy_data.database.models import metadata as data_meta
+from algomancy_scenario import CoreConfig, Scenario, ScenarioStatus, SessionManager
+from algomancy_scenario.persistence import RunWriter, SqlScenarioRepository
+from algomancy_scenario.persistence.models import metadata as scenario_meta
+from algomancy_scenario.persistence.models import (
+    kpi_measurements_table,
+    scenario_runs_table,
+    scenarios_table,
+)
+
+_CONFTEST = pathlib.Path(__file__).resolve().parent / "conftest.py"
+_spec = importlib.util.spec_from_file_location("_scenario_test_shared", _CONFTEST)
+_shared = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_shared)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A file database: the writer thread gets its own connection.
+    engine = sa.create_engine(f"sqlite:///{tmp_path}/runs.db")
+    data_meta.create_all(engine, checkfirst=True)
+    scenario_meta.create_all(engine, checkfirst=True)
+    return engine
+
+
+@pytest.fixture
+def writer(engine):
+    writer = RunWriter(engine, max_batch=10)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def repo(engine, writer):
+    dm = DatabaseDataManager(
+        etl_factory=_shared.ExampleETLFactory,
+        schemas=_shared.example_schemas,
+        engine=engine,
+        session_id="test_session",
+        data_object_type=DataSource,
+    )
+    dm.startup()
+    ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="test_data")
+    ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+    dm.add_data_source(ds)
+    repo = SqlScenarioRepository(
+        engine=engine,
+        session_id="test_session",
+        algorithms=_shared.algorithms,
+        kpis=_shared.kpis,
+        data_manager=dm,
+        run_writer=writer,
+    )
+    repo.startup()
+    return repo
+
+
+def _finished_scenario(repo, tag):
+    scenario = Scenario(
+        tag=tag,
+        input_data=repo._data_manager.get_data("test_data"),
+        kpis={"Delay": _shared.DelayKPI()},
+        algorithm=_shared.SlowAlgorithm(_shared.SlowAlgorithmParams()),
+    )
+    repo.add(scenario)
+    repo.pin(scenario.id)
+    scenario.status = ScenarioStatus.COMPLETE
+    scenario.result = {"data_id": "test_data"}
+    return scenario
+
+
+def _count(engine, table):
+    with engine.connect() as conn:
+        return conn.execute(sa.select(sa.func.count()).select_from(table)).scalar()
+
+
+def test_runs_finished_during_a_commit_share_the_next_transaction(repo, engine):
+    released = threading.Event()
+    batches = []
+    write_runs = repo._write_runs
+
+    def blocking_write(conn, runs, existing_tables):
+        batches.append(len(runs))
+        released.wait(5)
+        write_runs(conn, runs, existing_tables)
+
+    repo._write_runs = blocking_write
+    first = repo.persist_run(_finished_scenario(repo, "first"))
+    while not batches:
+        time.sleep(0.01)
+    others = [repo.persist_run(_finished_scenario(repo, f"s{i}")) for i in range(3)]
+    assert not first.done()
+
+    released.set()
+    run_ids = [future.result(5) for future in [first, *others]]
+
+    assert batches == [1, 3]
+    assert _count(engine, scenario_runs_table) == 4
+    assert _count(engine, kpi_measurements_table) == 4
+    with engine.connect() as conn:
+        stored = conn.execute(sa.select(scenario_runs_table.c.run_id)).scalars()
+        assert set(stored) == set(run_ids)
+
+
+def test_record_and_pin_follow_the_acknowledgement(repo):
+    scenario = _finished_scenario(repo, "acked")
+    future = repo.persist_run(scenario)
+    future.result(5)
+
+    record = repo.get_record(scenario.id)
+    assert record.status == ScenarioStatus.COMPLETE
+    assert record.result_available
+    assert scenario.id not in repo._pinned
+
+
+def test_repeated_runs_in_one_batch_are_coalesced(repo, engine, writer):
+    scenario = _finished_scenario(repo, "twice")
+    with writer._cond:
+        # Hold the writer so both runs land in the same batch.
+        first = repo.persist_run(scenario)
+        scenario.result = {"data_id": "second"}
+        second = repo.persist_run(scenario)
+
+    assert first.result(5) == second.result(5)
+    with engine.connect() as conn:
+        rows = conn.execute(scenario_runs_table.select()).fetchall()
+    assert [row.result_blob for row in rows] == ['{"data_id": "second"}']
+
+
+def test_a_failing_run_does_not_fail_its_batch(repo, engine, writer):
+    good = _finished_scenario(repo, "good")
+    bad = _finished_scenario(repo, "bad")
+    bad_run = repo._capture_run(bad)
+    # Two KPI rows with the same primary key violate the insert.
+    bad_run.kpi_rows.append(dict(bad_run.kpi_rows[0]))
+
+    with writer._cond:
+        good_future = repo.persist_run(good)
+        bad_future = writer.submit(repo, bad_run)
+
+    assert good_future.result(5)
+    with pytest.raises(sa.exc.IntegrityError):
+        bad_future.result(5)
+    assert _count(engine, scenario_runs_table) == 1
+    assert bad.id not in repo._pinned
+
+
+def test_close_commits_queued_runs_and_refuses_new_ones(repo, engine, writer):
+    futures = [repo.persist_run(_finished_scenario(repo, f"c{i}")) for i in range(5)]
+    writer.close()
+
+    assert all(future.done() for future in futures)
+    assert _count(engine, scenario_runs_table) == 5
+    with pytest.raises(RuntimeError):
+        repo.persist_run(_finished_scenario(repo, "late"))
+
+
+def test_refresh_waits_for_the_queued_run(repo, engine, writer):
+    scenario = _finished_scenario(repo, "refreshed")
+    with writer._cond:
+        repo.persist_run(scenario)
+    assert repo.refresh(scenario.id)
+    assert _count(engine, scenario_runs_table) == 0
+
+
+# ------------------------------------------------------------------ #
+# SessionManager integration
+# ------------------------------------------------------------------ #
+
+
+def _config(mock_configs, tmp_path, **kwargs):
+    return CoreConfig(
+        data_path=str(tmp_path),
+        has_persistent_state=True,
+        save_type="json",
+        data_object_type=mock_configs["data_object_type"],
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        schemas=mock_configs["schemas"],
+        autocreate=False,
+        autorun=False,
+        persistence_backend="database",
+        database_url=f"sqlite:///{tmp_path}/scenario.db",
+        **kwargs,
+    )
+
+
+def test_session_manager_acknowledges_runs_before_ending_their_jobs(
+    mock_configs, tmp_path
+):
+    smgr = SessionManager.from_config(
+        _config(mock_configs, tmp_path, async_persistence=True, durable_queue=True)
+    )
+    try:
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="test_data")
+        ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+        manager.add_datasource_from_json(ds.to_json())
+        scenario = manager.create_scenario(
+            "async", "test_data", "Slow", {"duration": 1}
+        )
+
+        manager.process_scenario_async(scenario)
+        manager.wait_for_processing()
+
+        assert smgr.job_runner.queue.depth() == 0
+        assert smgr.run_writer.pending == 0
+        record = manager.get_record(scenario.id)
+        assert record.status == ScenarioStatus.COMPLETE
+        assert "persist" in record.run_metrics.phases
+    finally:
+        smgr.shutdown()
+
+
+@pytest.mark.parametrize("broken", ["_write", "submit"])
+def test_a_job_whose_run_is_not_persisted_is_not_completed(
+    mock_configs, tmp_path, monkeypatch, broken
+):
+    smgr = SessionManager.from_config(
+        _config(
+            mock_configs,
+            tmp_path,
+            async_persistence=True,
+            durable_queue=True,
+            job_max_attempts=1,
+        )
+    )
+    try:
+        manager = smgr.get_scenario_manager(smgr.start_session_id)
+        ds = DataSource(ds_type=DataClassification.MASTER_DATA, name="test_data")
+        ds.add_table("item", pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+        manager.add_datasource_from_json(ds.to_json())
+        scenario = manager.create_scenario("lost", "test_data", "Slow", {"duration": 1})
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        # "_write" fails the commit (the future's exception); "submit" makes
+        # on_processed itself raise.
+        monkeypatch.setattr(smgr.run_writer, broken, fail)
+        manager.process_scenario_async(scenario)
+        manager.wait_for_processing()
+
+        # Not completed as if it had run: retried, and here out of attempts.
+        assert smgr.job_runner.queue.depth() == 0
+        engine = sa.create_engine(f"sqlite:///{tmp_path}/scenario.db")
+        with engine.connect() as conn:
+            status = conn.execute(
+                sa.select(scenarios_table.c.status).where(
+                    scenarios_table.c.id == scenario.id
+                )
+            ).scalar()
+        assert status == str(ScenarioStatus.FAILED)
+    finally:
+        smgr.shutdown()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"async_persistence": "yes"},
+        {"async_persistence": True, "persistence_backend": "none"},
+        {"async_persistence": True, "persist_batch_size": 0},
+        {"async_persistence": True, "persist_batch_size": True},
+    ],
+)
+def test_core_config_rejects_invalid_async_persistence_settings(mock_configs, kwargs):
+    cfg = dict(mock_configs, autocreate=False, **kwargs)
+    if cfg.get("persistence_backend") != "none":
+        cfg.update(persistence_backend="database", database_url="sqlite://")
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
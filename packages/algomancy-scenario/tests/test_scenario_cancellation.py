@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from algomancy_scenario import AlgorithmCancelled, ScenarioManager, ScenarioStatus
+
+
+def _build_manager(mock_configs, logger, **processor_kwargs) -> ScenarioManager:
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=logger,
+        **processor_kwargs,
+    )
+    sm.debug_load_data("example_data")
+    return sm
+
+
+def _wait_for_status(scenario, status, timeout_seconds: float = 5.0):
+    deadline = time.monotonic() + timeout_seconds
+    while scenario.status != status and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert scenario.status == status
+
+
+def test_cancel_queued_scenario_returns_it_to_created(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        running = sm.create_scenario("busy", "example_data", "Slow", {"duration": 2})
+        queued = sm.create_scenario("waiting", "example_data", "Slow", {"duration": 1})
+        sm.process_scenario_async(running)
+        _wait_for_status(running, ScenarioStatus.PROCESSING)
+        sm.process_scenario_async(queued)
+        assert queued.status == ScenarioStatus.QUEUED
+        assert sm.queue_depth == 1
+
+        assert sm.cancel_scenario(queued.id) is queued
+        assert queued.status == ScenarioStatus.CREATED
+        assert sm.queue_depth == 0
+
+        sm.cancel_scenario(running.id)
+        sm.wait_for_processing()
+        assert queued.status == ScenarioStatus.CREATED
+    finally:
+        sm.shutdown_processing()
+
+
+def test_cancel_running_scenario_marks_it_failed(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        scenario = sm.create_scenario("stop", "example_data", "Slow", {"duration": 5})
+        started = time.monotonic()
+        sm.process_scenario_async(scenario)
+        _wait_for_status(scenario, ScenarioStatus.PROCESSING)
+
+        sm.cancel_scenario(scenario.id)
+        sm.wait_for_processing()
+
+        assert scenario.status == ScenarioStatus.FAILED
+        assert scenario.result == {"error": "Scenario cancelled."}
+        assert time.monotonic() - started < 3
+
+        # A cancelled scenario can be reset and run again.
+        sm.refresh_scenario(scenario.id)
+        assert not scenario._algorithm.is_cancelled
+    finally:
+        sm.shutdown_processing()
+
+
+def test_cancel_ignores_finished_scenarios(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger)
+    try:
+        scenario = sm.debug_create_and_run_scenario(
+            "done", "example_data", "Slow", {"duration": 1}
+        )
+        assert sm.cancel_scenario(scenario.id) is scenario
+        assert scenario.status == ScenarioStatus.COMPLETE
+        assert sm.cancel_scenario("unknown") is None
+    finally:
+        sm.shutdown_processing()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_exceeding_timeout_fails(mock_configs, quiet_logger, executor):
+    sm = _build_manager(mock_configs, quiet_logger, executor=executor)
+    try:
+        scenario = sm.create_scenario("slow", "example_data", "Slow", {"duration": 2})
+        scenario._algorithm.timeout = 0.5
+        started = time.monotonic()
+        sm.process_scenario_async(scenario)
+        sm.wait_for_processing()
+
+        assert scenario.status == ScenarioStatus.FAILED
+        assert "timed out" in scenario.result["error"]
+        assert time.monotonic() - started < 1.5
+    finally:
+        sm.shutdown_processing()
+
+
+def test_check_cancelled_raises_after_request(mock_configs):
+    algorithm = mock_configs["algorithms"]["Slow"](
+        mock_configs["algorithms"]["Slow"].initialize_parameters()
+    )
+    algorithm.check_cancelled()
+    algorithm.request_cancel(reason="stop")
+    with pytest.raises(AlgorithmCancelled, match="stop"):
+        algorithm.set_progress(10)
+    algorithm.reset_cancellation()
+    algorithm.set_progress(20)
+    assert algorithm.get_progress == 20
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from algomancy_scenario import CoreConfig, ScenarioManager, ScenarioStatus
+from algomancy_scenario.scenarioprocessor import ScenarioProcessor
+
+
+def _build_manager(mock_configs, logger, **processor_kwargs) -> ScenarioManager:
+    sm = ScenarioManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        data_folder=mock_configs["data_path"],
+        schemas=mock_configs["schemas"],
+        has_persistent_state=mock_configs["has_persistent_state"],
+        save_type=mock_configs["save_type"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=logger,
+        **processor_kwargs,
+    )
+    sm.debug_load_data("example_data")
+    return sm
+
+
+def test_process_executor_returns_result_and_kpis(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, executor="process", max_workers=1)
+    try:
+        scenario = sm.debug_create_and_run_scenario(
+            "proc1", "example_data", "Slow", {"duration": 1}
+        )
+        assert scenario.is_completed()
+        assert scenario.result is not None
+        assert scenario.progress == 100
+        assert all(kpi.value is not None for kpi in scenario.kpis.values())
+    finally:
+        sm.shutdown_processing()
+
+
+def test_thread_executor_runs_scenarios_concurrently(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, executor="thread", max_workers=2)
+    try:
+        first = sm.create_scenario("t1", "example_data", "Slow", {"duration": 1})
+        second = sm.create_scenario("t2", "example_data", "Slow", {"duration": 1})
+        started = time.monotonic()
+        sm.process_scenario_async(first)
+        sm.process_scenario_async(second)
+        sm.wait_for_processing()
+        elapsed = time.monotonic() - started
+
+        assert first.status == ScenarioStatus.COMPLETE
+        assert second.status == ScenarioStatus.COMPLETE
+        assert elapsed < 1.9
+        assert sm.currently_processing is None
+    finally:
+        sm.shutdown_processing()
+
+
+def test_process_executor_failure_marks_scenario_failed(mock_configs, quiet_logger):
+    sm = _build_manager(mock_configs, quiet_logger, executor="process")
+    try:
+        scenario = sm.create_scenario("bad", "example_data", "Slow", {"duration": 1})
+        # Force a failure inside the worker: SlowAlgorithm reads ``data.id``.
+        scenario._input_data = None
+        sm.process_scenario_async(scenario)
+        sm.wait_for_processing()
+        assert scenario.status == ScenarioStatus.FAILED
+        assert "error" in scenario.result
+    finally:
+        sm.shutdown_processing()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"executor": "fork"}, {"max_workers": 0}],
+    ids=["unknown-executor", "zero-workers"],
+)
+def test_processor_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        ScenarioProcessor(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"executor": "fork"}, {"max_workers": 0}, {"max_workers": True}],
+    ids=["unknown-executor", "zero-workers", "bool-workers"],
+)
+def test_core_config_rejects_invalid_executor_settings(mock_configs, kwargs):
+    cfg = dict(mock_configs, autocreate=False, **kwargs)
+    with pytest.raises(ValueError):
+        CoreConfig(**cfg)
+
+
+def test_core_config_exports_executor_settings(mock_configs):
+    cfg = CoreConfig(
+        **dict(mock_configs, autocreate=False, executor="process", max_workers=4)
+    )
+    assert cfg.as_dict()["executor"] == "process"
+    assert cfg.as_dict()["max_workers"] == 4
@@ -0,0 +1,111 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from algomancy_scenario import SessionManager
+from algomancy_scenario.scenarioscheduler import ScenarioScheduler
+
+
+def _blocking_scheduler(**kwargs):
+    """Scheduler whose first job blocks until ``gate`` is set, so the rest queue up."""
+    scheduler = ScenarioScheduler(**kwargs)
+    gate = threading.Event()
+    started = threading.Event()
+    order = []
+    lock = threading.Lock()
+
+    def hold(scenario):
+        started.set()
+        gate.wait(timeout=5)
+
+    def record(scenario):
+        with lock:
+            order.append(scenario.tag)
+
+    scheduler.submit("blocker", SimpleNamespace(tag="blocker"), hold)
+    assert started.wait(timeout=5)
+    return scheduler, gate, order, record
+
+
+def test_round_robin_between_sessions():
+    scheduler, gate, order, record = _blocking_scheduler(max_concurrent_runs=1)
+    for i in range(3):
+        scheduler.submit("a", SimpleNamespace(tag=f"a{i}"), record)
+    for i in range(2):
+        scheduler.submit("b", SimpleNamespace(tag=f"b{i}"), record)
+    assert scheduler.queue_depth() == 5
+    assert scheduler.queue_depth("a") == 3
+
+    gate.set()
+    scheduler.shutdown()
+
+    assert order == ["a0", "b0", "a1", "b1", "a2"]
+
+
+def test_priority_wins_over_round_robin():
+    scheduler, gate, order, record = _blocking_scheduler(max_concurrent_runs=1)
+    scheduler.submit("a", SimpleNamespace(tag="a-low"), record)
+    scheduler.submit("b", SimpleNamespace(tag="b-low"), record)
+    scheduler.submit("b", SimpleNamespace(tag="b-high"), record, priority=5)
+
+    gate.set()
+    scheduler.shutdown()
+
+    assert order == ["b-high", "a-low", "b-low"]
+
+
+def test_session_quota_caps_runs_per_session():
+    scheduler = ScenarioScheduler(max_concurrent_runs=3, session_quota=1)
+    gate = threading.Event()
+    peak = {"a": 0}
+    lock = threading.Lock()
+
+    def run(scenario):
+        with lock:
+            peak["a"] = max(peak["a"], scheduler.running_count("a"))
+        gate.wait(timeout=0.2)
+
+    for i in range(4):
+        scheduler.submit("a", SimpleNamespace(tag=f"a{i}"), run)
+    scheduler.shutdown()
+
+    assert peak["a"] == 1
+    assert scheduler.running_count() == 0
+
+
+def test_submit_after_shutdown_raises():
+    scheduler = ScenarioScheduler()
+    scheduler.shutdown()
+    with pytest.raises(RuntimeError):
+        scheduler.submit("a", SimpleNamespace(tag="late"), lambda s: None)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_concurrent_runs": 0}, {"session_quota": 0}, {"executor": "fork"}],
+    ids=["zero-runs", "zero-quota", "unknown-executor"],
+)
+def test_scheduler_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        ScenarioScheduler(**kwargs)
+
+
+def test_session_manager_shares_one_scheduler(mock_configs, quiet_logger):
+    session_manager = SessionManager(
+        etl_factory=mock_configs["etl_factory"],
+        kpis=mock_configs["kpis"],
+        algorithms=mock_configs["algorithms"],
+        schemas=mock_configs["schemas"],
+        data_object_type=mock_configs["data_object_type"],
+        logger=quiet_logger,
+        max_concurrent_runs=2,
+        session_quota=1,
+    )
+    second_id = session_manager.create_new_session("second")
+    first = session_manager.get_scenario_manager(session_manager.start_session_id)
+    second = session_manager.get_scenario_manager(second_id)
+
+    assert session_manager.scheduler is not None
+    assert first._processor.scheduler is session_manager.scheduler
+    assert second._processor.scheduler is session_manager.scheduler
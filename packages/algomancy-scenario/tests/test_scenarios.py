@@ -1,6 +1,7 @@
 import pytest
 
-from algomancy_scenario import ScenarioManager
+from algomancy_scenario import ScenarioManager, ScenarioStatus
+from algomancy_utils.baseparameterset import ParameterError
 
 
 @pytest.mark.parametrize(
@@ -32,3 +33,76 @@ def test_scenario_execution(
 
     # check if the scenario was completed successfully
     assert scenario.is_completed()
+
+
+def test_parameter_sweep_creates_one_scenario_per_point(
+    mock_scenario_manager_with_data: ScenarioManager,
+):
+    sm = mock_scenario_manager_with_data
+
+    scenarios = sm.create_parameter_sweep(
+        "Slow", "example_data", {"duration": [1, 2, 3]}, tag_prefix="sweep"
+    )
+
+    assert [s.tag for s in scenarios] == [
+        "sweep [duration=1]",
+        "sweep [duration=2]",
+        "sweep [duration=3]",
+    ]
+    assert all(sm.get_by_id(s.id) is s for s in scenarios)
+    assert all(s.status == ScenarioStatus.CREATED for s in scenarios)
+
+
+def test_batch_enqueue_runs_every_scenario(
+    mock_scenario_manager_with_data: ScenarioManager,
+):
+    sm = mock_scenario_manager_with_data
+
+    scenarios = sm.create_scenarios_batch(
+        [
+            {
+                "tag": f"b{i}",
+                "dataset_key": "example_data",
+                "algo_name": "Slow",
+                "algo_params": {"duration": 1},
+            }
+            for i in range(2)
+        ],
+        enqueue=True,
+    )
+    sm.wait_for_processing()
+
+    assert all(s.is_completed() for s in scenarios)
+
+
+@pytest.mark.parametrize(
+    "specs, error",
+    [
+        pytest.param(
+            [{"tag": "dup"}, {"tag": "dup"}], ValueError, id="duplicate-in-batch"
+        ),
+        pytest.param(
+            [{"tag": "ok"}, {"tag": "bad", "algo_params": {"duration": 1000}}],
+            ParameterError,
+            id="invalid-params",
+        ),
+    ],
+)
+def test_batch_validates_everything_before_storing(
+    mock_scenario_manager_with_data: ScenarioManager, specs, error
+):
+    sm = mock_scenario_manager_with_data
+    specs = [
+        {
+            "dataset_key": "example_data",
+            "algo_name": "Slow",
+            "algo_params": {"duration": 1},
+            **spec,
+        }
+        for spec in specs
+    ]
+
+    with pytest.raises(error):
+        sm.create_scenarios_batch(specs)
+
+    assert sm.list_scenarios() == []
@@ -12,6 +12,7 @@ pytest.importorskip("sqlalchemy", reason="requires algomancy-scenario[database]"
 
 import importlib.util
 import pathlib
+from datetime import datetime
 
 import pytest
 import pandas as pd
@@ -20,9 +21,16 @@ import sqlalchemy as sa
 from algomancy_data import DataSource, DataClassification
 from algomancy_data.database.database_manager import DatabaseDataManager
 from algomancy_scenario.persistence.sql_repository import SqlScenarioRepository
-from algomancy_scenario.persistence.models import metadata as scenario_meta
+from algomancy_data.database.migrations import MigrationRunner
+from algomancy_scenario.persistence.migrations import SCENARIO_MIGRATIONS
+from algomancy_scenario.persistence.models import (
+    SCENARIO_COL,
+    SESSION_COL,
+    metadata as scenario_meta,
+)
 from algomancy_data.database.models import metadata as data_meta
 from algomancy_scenario import (
+    RunMetrics,
     Scenario,
     ScenarioStatus,
 )
@@ -144,6 +152,23 @@ class TestSqlScenarioRepositoryCRUD:
         repo.add(s)
         assert "test_data" in repo.used_datasets()
 
+    def test_add_many_is_one_transaction(self, repo, dm, engine):
+        batch = [_make_scenario(dm, f"batch{i}") for i in range(3)]
+        repo.add_many(batch)
+        assert all(repo.get_by_tag(f"batch{i}") is batch[i] for i in range(3))
+
+        # A clashing id rolls back the whole insert and leaves the index alone.
+        clash = _make_scenario(dm, "clash")
+        clash.id = batch[0].id
+        with pytest.raises(sa.exc.IntegrityError):
+            repo.add_many([_make_scenario(dm, "fresh"), clash])
+        assert not repo.has_tag("fresh")
+        with engine.connect() as conn:
+            count = conn.execute(
+                sa.text("SELECT COUNT(*) FROM algomancy_scenarios")
+            ).scalar()
+        assert count == 3
+
 
 class TestSqlScenarioRepositoryPersistence:
     def test_rehydration_after_restart(self, engine, dm):
@@ -206,6 +231,88 @@ class TestSqlScenarioRepositoryPersistence:
         loaded = repo2.get_by_tag("run_scenario")
         assert loaded.status == ScenarioStatus.COMPLETE
 
+    def test_persist_run_stores_run_metrics(self, repo, engine, dm):
+        """Run timestamps and metrics come from the scenario, plus a persist phase."""
+        s = _make_scenario(dm, tag="timed")
+        repo.add(s)
+        s.status = ScenarioStatus.COMPLETE
+        s.result = {"data_id": "test_data"}
+        s.metrics = RunMetrics(
+            started_at=datetime(2026, 1, 1, 12, 0, 0),
+            finished_at=datetime(2026, 1, 1, 12, 0, 5),
+            phases={"run": 4.5},
+            process_peak_rss_bytes=1024,
+        )
+        repo.persist_run(s)
+        assert "persist" in s.metrics.phases
+
+        repo2 = SqlScenarioRepository(
+            engine=engine,
+            session_id="test_session",
+            algorithms=algorithms,
+            kpis=kpis,
+            data_manager=dm,
+        )
+        repo2.startup()
+        record = repo2.get_record(s.id)
+        assert record.run_started_at == datetime(2026, 1, 1, 12, 0, 0)
+        assert record.run_finished_at == datetime(2026, 1, 1, 12, 0, 5)
+        assert record.run_metrics.duration == 5.0
+        assert record.run_metrics.phases["run"] == 4.5
+        assert set(record.run_metrics.phases) == {"run", "persist"}
+        assert record.run_metrics.process_peak_rss_bytes == 1024
+        assert repo2.get_by_id(s.id).metrics.phases["run"] == 4.5
+
+    def test_startup_adds_metrics_column_to_old_runs_table(self, engine, dm):
+        scenario_meta.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            conn.execute(
+                sa.text("ALTER TABLE algomancy_scenario_runs DROP COLUMN metrics")
+            )
+        repo = SqlScenarioRepository(
+            engine=engine,
+            session_id="test_session",
+            algorithms=algorithms,
+            kpis=kpis,
+            data_manager=dm,
+        )
+        repo.startup()
+        columns = {
+            col["name"]
+            for col in sa.inspect(engine).get_columns("algomancy_scenario_runs")
+        }
+        assert "metrics" in columns
+
+    def test_startup_indexes_runs_kpis_and_results_of_an_old_database(self, engine, dm):
+        scenario_meta.create_all(engine, checkfirst=True)
+        with engine.begin() as conn:
+            conn.execute(sa.text("DROP INDEX ix_algomancy_scenario_runs_scenario_id"))
+            conn.execute(sa.text("DROP INDEX ix_algomancy_kpi_measurements_run_id"))
+        pd.DataFrame(
+            {SESSION_COL: ["test_session"], SCENARIO_COL: ["x"], "value": [1]}
+        ).to_sql("algomancy_result__rows", engine, index=False)
+
+        repo = SqlScenarioRepository(
+            engine=engine,
+            session_id="test_session",
+            algorithms=algorithms,
+            kpis=kpis,
+            data_manager=dm,
+        )
+        repo.startup()
+
+        def indexed_columns(table_name):
+            inspector = sa.inspect(engine)
+            return [i["column_names"] for i in inspector.get_indexes(table_name)]
+
+        assert indexed_columns("algomancy_scenario_runs") == [["scenario_id"]]
+        assert indexed_columns("algomancy_kpi_measurements") == [["run_id"]]
+        assert indexed_columns("algomancy_result__rows") == [
+            [SESSION_COL, SCENARIO_COL]
+        ]
+        runner = MigrationRunner(engine, "scenario", SCENARIO_MIGRATIONS)
+        assert runner.pending() == []
+
     def test_session_isolation(self, engine):
         """Repositories for different sessions must not see each other's scenarios."""
         data_meta.create_all(engine, checkfirst=True)
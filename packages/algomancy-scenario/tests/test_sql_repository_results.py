@@ -29,6 +29,7 @@ from algomancy_data.database.database_manager import DatabaseDataManager
 from algomancy_data.database.models import metadata as data_meta
 from algomancy_scenario import (
     BaseAlgorithm,
+    CoreConfig,
     Scenario,
     ScenarioResult,
     ScenarioStatus,
@@ -341,6 +342,33 @@ def test_sql_layout_path_roundtrips_typed_result(engine, repo, dm):
     )
 
 
+@pytest.mark.parametrize("bulk_writer", ["pandas", "multirow", "executemany"])
+def test_sql_layout_path_roundtrips_with_every_bulk_writer(engine, dm, bulk_writer):
+    scenario_meta.create_all(engine, checkfirst=True)
+    repo = SqlScenarioRepository(
+        engine=engine,
+        session_id="test_session",
+        algorithms=algorithms_local,
+        kpis=kpis_local,
+        data_manager=dm,
+        bulk_writer=bulk_writer,
+    )
+    repo.startup()
+    s = _make_scenario(dm, TabularAlgorithm, tag="tab_bulk")
+    repo.add(s)
+    s.result = s._algorithm.run(s._input_data)
+    s.status = ScenarioStatus.COMPLETE
+    repo.persist_run(s)
+
+    # The result's own frames are written as they are, not widened.
+    assert list(s.result.rows.columns) == ["item", "value"]
+    loaded = _fresh_repo(engine, dm).get_by_tag("tab_bulk")
+    pd.testing.assert_frame_equal(
+        loaded.result.rows.reset_index(drop=True),
+        pd.DataFrame({"item": ["a", "b"], "value": [1, 2]}),
+    )
+
+
 def _scenario_row_count(engine, sub_table: str, scenario_id: str) -> int:
     """Count rows the scenario owns in a given shared result sub-table."""
     table_name = _result_table_name(sub_table)
@@ -483,6 +511,18 @@ def test_shared_layout_reuses_one_table_per_subname(engine, repo, dm):
     assert {row[0] for row in scenario_ids} == {s.id for s in scenarios}
 
 
+def test_new_result_tables_get_a_discriminator_index(engine, repo, dm):
+    s = _make_scenario(dm, TabularAlgorithm, tag="indexed")
+    repo.add(s)
+    s.result = s._algorithm.run(s._input_data)
+    s.status = ScenarioStatus.COMPLETE
+    repo.persist_run(s)
+
+    for sub_table in ("rows", "summary", "_meta"):
+        indexes = sa.inspect(engine).get_indexes(_result_table_name(sub_table))
+        assert [i["column_names"] for i in indexes] == [[SESSION_COL, SCENARIO_COL]]
+
+
 def test_dict_result_falls_back_to_json_dump(engine, repo, dm):
     """Legacy code paths that set scenario.result to a bare dict must still
     persist (json.dumps) — the contract added in this PR must not break this.
@@ -503,3 +543,15 @@ def test_dict_result_falls_back_to_json_dump(engine, repo, dm):
         ).fetchone()
     assert row.result_blob is not None
     assert json.loads(row.result_blob) == {"raw": "payload"}
+
+
+def test_core_config_rejects_unknown_bulk_write_method(mock_configs):
+    cfg = dict(
+        mock_configs,
+        autocreate=False,
+        persistence_backend="database",
+        database_url="sqlite://",
+    )
+    assert CoreConfig(**cfg).bulk_write_method == "auto"
+    with pytest.raises(ValueError, match="bulk_write_method"):
+        CoreConfig(**cfg, bulk_write_method="bcp")
@@ -703,6 +703,18 @@ class BaseParameterSet(ABC, metaclass=PostInitMeta):
         """
         return self._parameters[key].value
 
+    def __setstate__(self, state):
+        """
+        Restores instance attributes when unpickling.
+
+        Required because ``__dict__`` is overridden above, so the default
+        unpickling path (``instance.__dict__.update(state)``) cannot be used.
+        Parameter sets are pickled when algorithms are shipped to
+        process-pool workers.
+        """
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
     def _post_init(self):
         """
         Internal method called after initialization to lock the parameter set structure.
@@ -0,0 +1,273 @@
+"""
+metrics.py - In-process counters, gauges and histograms
+
+A small, dependency-free metrics registry that renders the Prometheus text
+exposition format (version 0.0.4), so any Prometheus-compatible scraper can
+read it without extra services or packages.
+
+Library code records into the shared ``REGISTRY``::
+
+    RUNS = REGISTRY.counter("algomancy_runs_total", "Runs.", ["algorithm"])
+    RUNS.inc(algorithm="Slow")
+
+Asking the registry twice for the same name returns the same metric, so
+several modules can share one. ``REGISTRY.render()`` returns the exposition
+text; ``algomancy_api`` serves it at ``/metrics``.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+#: Content type of ``MetricsRegistry.render`` output.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Histogram bucket upper bounds, in seconds, suited to request and run times.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    inner = ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs)
+    return "{" + inner + "}"
+
+
+class Metric:
+    """Base class: a named metric with a fixed set of label names."""
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {list(self.labelnames)}; "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        doc = self.documentation.replace("\\", r"\\").replace("\n", r"\n")
+        return [f"# HELP {self.name} {doc}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A value that only goes up, e.g. the number of finished runs."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError(f"Counter '{self.name}' cannot decrease")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self._header()
+        for key, value in values:
+            labels = _format_labels(list(zip(self.labelnames, key)))
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """A value that goes up and down, e.g. a queue depth."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Counts observations (e.g. durations) into cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        if "le" in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # key -> (per-bucket counts incl. +Inf, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((k, (list(c), s)) for k, (c, s) in self._series.items())
+        lines = self._header()
+        for key, (counts, total) in series:
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(pairs + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(pairs)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """A named collection of metrics, rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+                return metric
+        if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+            raise ValueError(
+                f"Metric '{name}' is already registered as a "
+                f"{existing.kind} with labels {list(existing.labelnames)}"
+            )
+        return existing
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Metric | None:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self, extra: Iterable[Metric] = ()) -> str:
+        """Exposition text of every registered metric plus ``extra`` ones."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in list(metrics) + list(extra):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+#: The process-wide registry the Algomancy packages record into.
+REGISTRY = MetricsRegistry()
+
+#: Hits, misses and evictions of the Algomancy caches, labelled by ``cache``
+#: (e.g. ``"datasource"``, ``"table"``, ``"scenario"``, ``"etl_snapshot"``).
+CACHE_HITS = REGISTRY.counter("algomancy_cache_hits_total", "Cache hits.", ["cache"])
+CACHE_MISSES = REGISTRY.counter(
+    "algomancy_cache_misses_total", "Cache misses.", ["cache"]
+)
+CACHE_EVICTIONS = REGISTRY.counter(
+    "algomancy_cache_evictions_total", "Cache evictions.", ["cache"]
+)
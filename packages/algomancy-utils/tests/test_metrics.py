@@ -0,0 +1,83 @@
+import pytest
+
+from algomancy_utils.metrics import (
+    CACHE_EVICTIONS,
+    CACHE_HITS,
+    CACHE_MISSES,
+    REGISTRY,
+    MetricsRegistry,
+)
+
+
+def test_counter_renders_one_sample_per_label_set():
+    registry = MetricsRegistry()
+    runs = registry.counter("runs_total", "Runs.", ["algorithm"])
+    runs.inc(algorithm="a")
+    runs.inc(2, algorithm="b")
+    runs.inc(algorithm="a")
+
+    assert runs.value(algorithm="a") == 2
+    assert registry.render() == (
+        "# HELP runs_total Runs.\n"
+        "# TYPE runs_total counter\n"
+        'runs_total{algorithm="a"} 2.0\n'
+        'runs_total{algorithm="b"} 2.0\n'
+    )
+
+
+def test_counter_rejects_decrements_and_wrong_labels():
+    counter = MetricsRegistry().counter("c", "C.", ["x"])
+    with pytest.raises(ValueError):
+        counter.inc(-1, x="a")
+    with pytest.raises(ValueError):
+        counter.inc(y="a")
+
+
+def test_gauge_goes_up_and_down():
+    gauge = MetricsRegistry().gauge("depth", "Depth.")
+    gauge.set(3)
+    gauge.dec()
+    assert gauge.value() == 2
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    hist = registry.histogram("latency", "Latency.", ["stage"], buckets=[0.1, 1])
+    for value in (0.05, 0.5, 5):
+        hist.observe(value, stage="load")
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'latency_bucket{stage="load",le="0.1"} 1',
+        'latency_bucket{stage="load",le="1.0"} 2',
+        'latency_bucket{stage="load",le="+Inf"} 3',
+        'latency_sum{stage="load"} 5.55',
+        'latency_count{stage="load"} 3',
+    ]
+    assert hist.count(stage="load") == 3
+
+
+def test_registry_returns_the_same_metric_for_the_same_name():
+    registry = MetricsRegistry()
+    first = registry.counter("shared_total", "Shared.", ["cache"])
+    assert registry.counter("shared_total", "Shared.", ["cache"]) is first
+    with pytest.raises(ValueError):
+        registry.gauge("shared_total", "Shared.", ["cache"])
+    with pytest.raises(ValueError):
+        registry.counter("shared_total", "Shared.", ["other"])
+
+
+def test_cache_counters_are_registered_once():
+    for name, metric in [
+        ("algomancy_cache_hits_total", CACHE_HITS),
+        ("algomancy_cache_misses_total", CACHE_MISSES),
+        ("algomancy_cache_evictions_total", CACHE_EVICTIONS),
+    ]:
+        assert REGISTRY.get(name) is metric
+        assert metric.labelnames == ("cache",)
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("c", "C.", ["name"]).inc(name='a"b\\c\nd')
+    assert 'c{name="a\\"b\\\\c\\nd"} 1.0' in registry.render()
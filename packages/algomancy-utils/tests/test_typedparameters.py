@@ -224,3 +224,16 @@ def test_base_algorithm_parameters_copy():
     params_copy.set_values({"mode": "slow"})
     assert params["mode"] == "fast", "original value has changed"
     assert params_copy["mode"] == "slow", "copy value was not updated"
+
+
+def test_base_algorithm_parameters_pickle_roundtrip():
+    import pickle
+
+    params = DummyParams()
+    params.set_values({"mode": "slow", "retries": 7})
+
+    restored = pickle.loads(pickle.dumps(params))
+
+    assert restored is not params
+    assert restored.name == params.name
+    assert restored.get_values() == params.get_values()